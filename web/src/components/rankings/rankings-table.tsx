@@ -59,8 +59,31 @@ interface RankingsTableProps {
 interface RankingSSEEvent {
   type: string;
   timeframe?: Timeframe;
+  version?: number;
   rankings?: RankingSnapshot[];
   computedAt?: string;
+  // ranking_delta fields
+  baseVersion?: number;
+  runId?: string;
+  changed?: Record<string, Partial<RankingSnapshot>>;
+  added?: RankingSnapshot[];
+  removed?: string[];
+}
+
+/** Apply a ranking_delta event to the rows of its base version. */
+function applyRankingDelta(snapshots: RankingSnapshot[], event: RankingSSEEvent): RankingSnapshot[] {
+  const removed = new Set(event.removed ?? []);
+  const changed = event.changed ?? {};
+  const next = snapshots
+    .filter((s) => !removed.has(s.symbol))
+    .map((s) => ({
+      ...s,
+      ...changed[s.symbol],
+      computedAt: event.computedAt ?? s.computedAt,
+      runId: event.runId ?? s.runId,
+    }));
+  next.push(...(event.added ?? []));
+  return next.sort((a, b) => a.rank - b.rank);
 }
 
 const WORKER_URL = process.env.NEXT_PUBLIC_WORKER_URL;
@@ -76,6 +99,8 @@ export function RankingsTable({ data, initialTimeframe, initialData, className }
   const [pageSize, setPageSize] = useState(50);
   const [loadingTf, setLoadingTf] = useState(!data && !initialData);
   const fetchedRef = useRef<Set<string>>(new Set());
+  // Stream version each timeframe's rows are at (deltas apply on top of it)
+  const versionsRef = useRef<Partial<Record<Timeframe, number>>>({});
 
   // Build initial state from either full data or single-timeframe data
   const buildInitialData = (): Partial<AllTimeframeRankings> => {
@@ -105,15 +130,46 @@ export function RankingsTable({ data, initialTimeframe, initialData, className }
   }, [timeframe, rankingsData]);
 
   const handleSSEMessage = useCallback((event: RankingSSEEvent) => {
-    if (event.type === "ranking_update" && event.timeframe && event.rankings) {
+    const tf = event.timeframe;
+    if (!tf) return;
+
+    if (event.type === "ranking_update" && event.rankings) {
+      versionsRef.current[tf] = event.version;
       setRankingsData((prev) => ({
         ...prev,
-        [event.timeframe!]: {
-          timeframe: event.timeframe!,
+        [tf]: {
+          timeframe: tf,
           snapshots: event.rankings!,
           computedAt: event.computedAt ?? null,
         } satisfies RankingsData,
       }));
+    } else if (event.type === "ranking_delta") {
+      if (versionsRef.current[tf] !== event.baseVersion) {
+        // Missed the base version: reload this timeframe over REST
+        versionsRef.current[tf] = event.version;
+        fetch(`${WORKER_URL}/rankings/${tf}?slim=1`)
+          .then((res) => res.json())
+          .then((result: RankingsData) => {
+            setRankingsData((prev) => ({ ...prev, [tf]: result }));
+          })
+          .catch(() => {
+            versionsRef.current[tf] = undefined;
+          });
+        return;
+      }
+      versionsRef.current[tf] = event.version;
+      setRankingsData((prev) => {
+        const current = prev[tf];
+        if (!current) return prev;
+        return {
+          ...prev,
+          [tf]: {
+            timeframe: tf,
+            snapshots: applyRankingDelta(current.snapshots, event),
+            computedAt: event.computedAt ?? current.computedAt,
+          } satisfies RankingsData,
+        };
+      });
     }
   }, []);
 
@@ -20,7 +20,8 @@ interface UseSSEReturn {
  * React hook for Server-Sent Events with automatic reconnection.
  *
  * Connects to the given SSE URL, parses JSON events, and calls onMessage.
- * Automatically reconnects on error up to maxReconnectAttempts times.
+ * Automatically reconnects on error up to maxReconnectAttempts times,
+ * passing the last received event id so the worker replays missed events.
  */
 export function useSSE<T>({
   url,
@@ -36,6 +37,7 @@ export function useSSE<T>({
   const eventSourceRef = useRef<EventSource | null>(null);
   const reconnectTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const reconnectCountRef = useRef(0);
+  const lastEventIdRef = useRef<string | null>(null);
   const onMessageRef = useRef(onMessage);
 
   // Keep onMessage ref current to avoid stale closures
@@ -62,7 +64,12 @@ export function useSSE<T>({
     function connect() {
       cleanup();
 
-      const es = new EventSource(url);
+      let streamUrl = url;
+      if (lastEventIdRef.current) {
+        const sep = url.includes("?") ? "&" : "?";
+        streamUrl = `${url}${sep}lastEventId=${encodeURIComponent(lastEventIdRef.current)}`;
+      }
+      const es = new EventSource(streamUrl);
       eventSourceRef.current = es;
 
       es.onopen = () => {
@@ -73,6 +80,7 @@ export function useSSE<T>({
       };
 
       es.onmessage = (event) => {
+        if (event.lastEventId) lastEventIdRef.current = event.lastEventId;
         try {
           const data = JSON.parse(event.data) as T;
           onMessageRef.current(data);
@@ -98,6 +106,8 @@ export function useSSE<T>({
       };
     }
 
+    // A new URL is a new stream: don't resume from the old one's position
+    lastEventIdRef.current = null;
     connect();
 
     return cleanup;
@@ -0,0 +1,73 @@
+"""Add backtest_sweeps table and sweep/SL-TP columns on backtest_runs.
+
+A sweep runs a grid of strategies x symbols x timeframes x SL/TP settings;
+each combination is a backtest_runs row linked by sweep_id.
+
+Revision ID: 033
+Revises: 032
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "033"
+down_revision = "032"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "backtest_sweeps",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("strategies", JSONB, nullable=False),
+        sa.Column("symbols", JSONB, nullable=False),
+        sa.Column("timeframes", JSONB, nullable=False),
+        sa.Column("sl_tp_grid", JSONB, nullable=False),
+        sa.Column("start_date", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("end_date", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column(
+            "initial_balance",
+            sa.Numeric(14, 2),
+            nullable=False,
+            server_default="10000.00",
+        ),
+        sa.Column("total_combinations", sa.Integer, nullable=False),
+        sa.Column("completed_combinations", sa.Integer, server_default="0"),
+        sa.Column(
+            "status",
+            sa.String(20),
+            nullable=False,
+            server_default="pending",
+        ),
+        sa.Column("error_message", sa.Text, nullable=True),
+        sa.Column(
+            "started_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("completed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+
+    op.add_column(
+        "backtest_runs",
+        sa.Column(
+            "sweep_id",
+            sa.Integer,
+            sa.ForeignKey("backtest_sweeps.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+    )
+    op.add_column("backtest_runs", sa.Column("stop_loss_pct", sa.Numeric(6, 4), nullable=True))
+    op.add_column("backtest_runs", sa.Column("take_profit_pct", sa.Numeric(6, 4), nullable=True))
+    op.create_index("idx_backtest_runs_sweep", "backtest_runs", ["sweep_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_backtest_runs_sweep", table_name="backtest_runs")
+    op.drop_column("backtest_runs", "take_profit_pct")
+    op.drop_column("backtest_runs", "stop_loss_pct")
+    op.drop_column("backtest_runs", "sweep_id")
+    op.drop_table("backtest_sweeps")
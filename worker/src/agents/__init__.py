@@ -20,7 +20,7 @@ from src.agents.schemas import (
     TradeAction,
     ValidationResult,
 )
-from src.agents.context import ContextBuilder
+from src.agents.context import AgentHistory, ContextBuilder, MarketSnapshot
 from src.agents.executor import AgentExecutor, estimate_cost
 from src.agents.portfolio import PortfolioManager
 from src.agents.orchestrator import AgentOrchestrator
@@ -40,7 +40,9 @@ __all__ = [
     "TradeAction",
     "ValidationResult",
     # Classes
+    "AgentHistory",
     "ContextBuilder",
+    "MarketSnapshot",
     "AgentExecutor",
     "PortfolioManager",
     "AgentOrchestrator",
@@ -6,8 +6,15 @@ Assembles all data an agent needs to make a decision:
 - Cross-timeframe confluence signals
 - Recent memory entries
 - Current prices for open positions
+
+Market-wide data (rankings, regimes, confluence, fleet lessons) is identical
+for every agent in a cycle, so the orchestrator builds it once as a
+MarketSnapshot and shares it read-only; per-agent performance and memory can
+be prefetched for all agents of a cycle in two queries.
 """
 
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any
@@ -42,6 +49,47 @@ from src.agents.schemas import (
     TweetSignalContext,
     Direction,
 )
+from src.agents.strategies.table import SignalTable
+
+# Timeframes compared for cross-timeframe confluence
+CONFLUENCE_TIMEFRAMES = ["15m", "30m", "1h", "4h", "1d"]
+
+# Top-ranked symbols included per timeframe
+RANKINGS_LIMIT = 50
+
+MEMORY_LIMIT = 20
+FLEET_LESSONS_LIMIT = 15
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Market-wide context shared read-only by every agent in a cycle."""
+
+    rankings: dict[str, list[RankingContext]]
+    confluence: dict[str, Any]
+    regime: CrossTimeframeContext | None
+    fleet_lessons: dict[str, list[str]]
+    built_at: datetime
+    _signal_tables: dict[str, SignalTable] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def signal_table(self, timeframe: str) -> SignalTable:
+        """Columnar view of a timeframe's rankings, built on first use."""
+        table = self._signal_tables.get(timeframe)
+        if table is None:
+            table = self._signal_tables[timeframe] = SignalTable(
+                self.rankings.get(timeframe, [])
+            )
+        return table
+
+
+@dataclass(frozen=True)
+class AgentHistory:
+    """Per-agent performance and recent memory, prefetched for a cycle."""
+
+    performance: PerformanceStats
+    memory: list[str]
 
 
 class ContextBuilder:
@@ -55,6 +103,8 @@ class ContextBuilder:
         agent: Agent,
         current_prices: dict[str, Decimal] | None = None,
         tweet_context: TweetContext | None = None,
+        snapshot: MarketSnapshot | None = None,
+        history: AgentHistory | None = None,
     ) -> AgentContext:
         """Build complete context for an agent.
 
@@ -64,20 +114,29 @@ class ContextBuilder:
                             If not provided, uses last close from rankings.
             tweet_context: Pre-built tweet context (avoids redundant DB queries
                            when multiple agents share the same timeframe).
+            snapshot: Pre-built market snapshot for this cycle. Built on the
+                      fly for this agent alone if not provided.
+            history: Prefetched performance and memory for this agent.
+                     Fetched individually if not provided.
 
         Returns:
             AgentContext with all data needed for decision-making.
         """
+        if snapshot is None:
+            snapshot = await self.build_snapshot(
+                [agent.timeframe], [agent.strategy_archetype]
+            )
+
         # Fetch portfolio and positions
         portfolio = await self._get_portfolio_summary(
             agent.id, current_prices or {}
         )
 
-        # Fetch performance stats
-        performance = await self._get_performance_stats(agent.id)
-
-        # Fetch rankings for agent's timeframe
-        rankings = await self._get_rankings(agent.timeframe)
+        if history is None:
+            history = AgentHistory(
+                performance=await self._get_performance_stats(agent.id),
+                memory=await self._get_recent_memory(agent.id, limit=MEMORY_LIMIT),
+            )
 
         # Build current prices map from rankings if not provided
         if not current_prices:
@@ -85,20 +144,6 @@ class ContextBuilder:
             # Rankings don't include price directly, would need to fetch from exchange
             # For now, leave empty - executor will fetch if needed
 
-        # Fetch recent memory
-        memory = await self._get_recent_memory(agent.id, limit=20)
-
-        # Fetch fleet lessons (gated by feature flag)
-        fleet_lessons: list[str] = []
-        if settings.fleet_lessons_in_context:
-            fleet_lessons = await self._get_fleet_lessons(agent.strategy_archetype)
-
-        # Build cross-timeframe confluence (optional enhancement)
-        confluence = await self._get_cross_timeframe_confluence(agent.timeframe)
-
-        # Build regime context from persisted regime labels
-        regime_context = await self._get_regime_context(agent.timeframe)
-
         # Build tweet context for tweet/hybrid agents (use pre-built if provided)
         source = getattr(agent, "source", "technical")
         if tweet_context is None and source in ("tweet", "hybrid"):
@@ -110,17 +155,93 @@ class ContextBuilder:
             strategy_archetype=agent.strategy_archetype,
             primary_timeframe=agent.timeframe,
             portfolio=portfolio,
-            performance=performance,
-            primary_timeframe_rankings=rankings,
-            cross_timeframe_confluence=confluence,
-            cross_timeframe_regime=regime_context,
+            performance=history.performance,
+            primary_timeframe_rankings=snapshot.rankings.get(agent.timeframe, []),
+            cross_timeframe_confluence=snapshot.confluence,
+            cross_timeframe_regime=snapshot.regime,
             tweet_context=tweet_context,
             current_prices=current_prices,
-            recent_memory=memory,
-            fleet_lessons=fleet_lessons,
+            recent_memory=history.memory,
+            fleet_lessons=snapshot.fleet_lessons.get(agent.strategy_archetype, []),
             context_built_at=datetime.now(timezone.utc),
         )
 
+    async def build_snapshot(
+        self,
+        timeframes: Iterable[str],
+        archetypes: Iterable[str],
+    ) -> MarketSnapshot:
+        """Build the market-wide part of agent context once for a cycle.
+
+        Args:
+            timeframes: Primary timeframes of the agents that will share the
+                        snapshot (confluence timeframes are always included).
+            archetypes: Strategy archetypes to load fleet lessons for.
+
+        Returns:
+            MarketSnapshot with rankings, confluence, regimes and fleet lessons.
+        """
+        all_timeframes = list(dict.fromkeys([*CONFLUENCE_TIMEFRAMES, *timeframes]))
+        rankings = await self._get_latest_rankings(all_timeframes)
+
+        fleet_lessons: dict[str, list[str]] = {}
+        if settings.fleet_lessons_in_context:
+            fleet_lessons = await self._get_fleet_lessons_batch(set(archetypes))
+
+        return MarketSnapshot(
+            rankings=rankings,
+            confluence=self._cross_timeframe_confluence(rankings),
+            regime=await self._get_regime_context(),
+            fleet_lessons=fleet_lessons,
+            built_at=datetime.now(timezone.utc),
+        )
+
+    async def prefetch_histories(self, agent_ids: Sequence[int]) -> dict[int, AgentHistory]:
+        """Fetch performance and recent memory for many agents in two queries.
+
+        Args:
+            agent_ids: Agents to prefetch.
+
+        Returns:
+            Dict mapping agent id to AgentHistory (every requested id is present).
+        """
+        if not agent_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(AgentTrade).where(AgentTrade.agent_id.in_(agent_ids))
+        )
+        trades_by_agent: dict[int, list[AgentTrade]] = {agent_id: [] for agent_id in agent_ids}
+        for trade in result.scalars().all():
+            trades_by_agent[trade.agent_id].append(trade)
+
+        row_num = (
+            func.row_number()
+            .over(partition_by=AgentMemory.agent_id, order_by=AgentMemory.created_at.desc())
+            .label("row_num")
+        )
+        recent = (
+            select(AgentMemory.agent_id, AgentMemory.lesson, row_num)
+            .where(AgentMemory.agent_id.in_(agent_ids))
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(recent.c.agent_id, recent.c.lesson)
+            .where(recent.c.row_num <= MEMORY_LIMIT)
+            .order_by(recent.c.agent_id, recent.c.row_num)
+        )
+        memory_by_agent: dict[int, list[str]] = {agent_id: [] for agent_id in agent_ids}
+        for agent_id, lesson in result.all():
+            memory_by_agent[agent_id].append(lesson)
+
+        return {
+            agent_id: AgentHistory(
+                performance=self._performance_from_trades(trades_by_agent[agent_id]),
+                memory=memory_by_agent[agent_id],
+            )
+            for agent_id in agent_ids
+        }
+
     async def _get_portfolio_summary(
         self,
         agent_id: int,
@@ -207,8 +328,11 @@ class ContextBuilder:
         result = await self.session.execute(
             select(AgentTrade).where(AgentTrade.agent_id == agent_id)
         )
-        trades = result.scalars().all()
+        return self._performance_from_trades(result.scalars().all())
 
+    @staticmethod
+    def _performance_from_trades(trades: Sequence[AgentTrade]) -> PerformanceStats:
+        """Compute performance statistics from an agent's closed trades."""
         if not trades:
             return PerformanceStats(
                 total_trades=0,
@@ -255,26 +379,31 @@ class ContextBuilder:
             avg_trade_duration_hours=avg_duration_hours,
         )
 
-    async def _get_rankings(self, timeframe: str) -> list[RankingContext]:
-        """Get latest rankings for a timeframe."""
-        # Get latest computation time
-        subquery = (
-            select(func.max(Snapshot.computed_at))
-            .where(Snapshot.timeframe == timeframe)
-            .scalar_subquery()
+    async def _get_latest_rankings(
+        self, timeframes: Sequence[str]
+    ) -> dict[str, list[RankingContext]]:
+        """Get the latest top-ranked symbols for several timeframes in one query."""
+        latest = (
+            select(Snapshot.timeframe, func.max(Snapshot.computed_at).label("computed_at"))
+            .where(Snapshot.timeframe.in_(timeframes))
+            .group_by(Snapshot.timeframe)
+            .subquery()
         )
 
         result = await self.session.execute(
             select(Snapshot, Symbol)
             .join(Symbol, Snapshot.symbol_id == Symbol.id)
-            .where(Snapshot.timeframe == timeframe)
-            .where(Snapshot.computed_at == subquery)
-            .order_by(Snapshot.rank)
-            .limit(50)  # Top 50 symbols
+            .join(
+                latest,
+                (Snapshot.timeframe == latest.c.timeframe)
+                & (Snapshot.computed_at == latest.c.computed_at),
+            )
+            .where(Snapshot.rank <= RANKINGS_LIMIT)
+            .order_by(Snapshot.timeframe, Snapshot.rank)
         )
         rows = result.all()
 
-        rankings: list[RankingContext] = []
+        rankings: dict[str, list[RankingContext]] = {tf: [] for tf in timeframes}
         for snap, sym in rows:
             # Convert indicator_signals from dict-keyed format to list format
             raw_signals = snap.indicator_signals or {}
@@ -286,7 +415,7 @@ class ContextBuilder:
             else:
                 signals_list = raw_signals
 
-            rankings.append(
+            rankings[snap.timeframe].append(
                 RankingContext(
                     symbol=sym.symbol,
                     rank=snap.rank,
@@ -311,9 +440,7 @@ class ContextBuilder:
 
         return [m.lesson for m in memories]
 
-    async def _get_regime_context(
-        self, primary_timeframe: str
-    ) -> CrossTimeframeContext | None:
+    async def _get_regime_context(self) -> CrossTimeframeContext | None:
         """Build cross-timeframe regime context from persisted regime labels.
 
         Queries all rows from timeframe_regimes, builds RegimeLabel per TF,
@@ -460,24 +587,21 @@ class ContextBuilder:
         except Exception:
             return None
 
-    async def _get_cross_timeframe_confluence(
-        self, primary_timeframe: str
-    ) -> dict[str, Any] | None:
+    @staticmethod
+    def _cross_timeframe_confluence(
+        rankings: dict[str, list[RankingContext]],
+    ) -> dict[str, Any]:
         """Detect cross-timeframe confluence signals.
 
         Compares signals across timeframes to find:
         - Confluence: same direction across multiple timeframes
         - Divergence: conflicting signals
         """
-        # Define timeframe hierarchy
-        timeframes = ["15m", "30m", "1h", "4h", "1d"]
-
         # Get top 10 from each timeframe
         confluence_data: dict[str, dict[str, float]] = {}
 
-        for tf in timeframes:
-            rankings = await self._get_rankings(tf)
-            for r in rankings[:10]:
+        for tf in CONFLUENCE_TIMEFRAMES:
+            for r in rankings.get(tf, [])[:10]:
                 if r.symbol not in confluence_data:
                     confluence_data[r.symbol] = {}
                 confluence_data[r.symbol][tf] = r.bullish_score
@@ -501,16 +625,25 @@ class ContextBuilder:
         return {
             "bullish_confluence": bullish_confluence[:5],
             "bearish_confluence": bearish_confluence[:5],
-            "timeframes_analyzed": len(timeframes),
+            "timeframes_analyzed": len(CONFLUENCE_TIMEFRAMES),
             "symbol_tf_scores": confluence_data,
         }
 
-    async def _get_fleet_lessons(self, archetype: str) -> list[str]:
-        """Get active fleet lessons for a given strategy archetype."""
+    async def _get_fleet_lessons_batch(
+        self, archetypes: Iterable[str]
+    ) -> dict[str, list[str]]:
+        """Get active fleet lessons for several strategy archetypes in one query."""
+        archetypes = list(archetypes)
+        lessons: dict[str, list[str]] = {archetype: [] for archetype in archetypes}
+        if not archetypes:
+            return lessons
+
         result = await self.session.execute(
             select(FleetLesson)
-            .where(FleetLesson.archetype == archetype, FleetLesson.is_active.is_(True))
+            .where(FleetLesson.archetype.in_(archetypes), FleetLesson.is_active.is_(True))
             .order_by(FleetLesson.created_at.desc())
-            .limit(15)
         )
-        return [f"[{l.category}] {l.lesson}" for l in result.scalars().all()]
+        for l in result.scalars().all():
+            if len(lessons[l.archetype]) < FLEET_LESSONS_LIMIT:
+                lessons[l.archetype].append(f"[{l.category}] {l.lesson}")
+        return lessons
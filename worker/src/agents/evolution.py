@@ -59,9 +59,16 @@ Guidelines:
 class EvolutionManager:
     """Manages prompt evolution and auto-revert logic."""
 
-    def __init__(self, session: AsyncSession, api_key: str | None = None):
+    def __init__(
+        self,
+        session: AsyncSession,
+        api_key: str | None = None,
+        client: anthropic.AsyncAnthropic | None = None,
+    ):
         self.session = session
-        self.client = anthropic.Anthropic(api_key=api_key or settings.anthropic_api_key)
+        self.client = client or anthropic.AsyncAnthropic(
+            api_key=api_key or settings.anthropic_api_key
+        )
 
     async def check_evolution_trigger(self, agent_id: int) -> bool:
         """Check if an agent should trigger evolution.
@@ -141,7 +148,7 @@ class EvolutionManager:
 
         # Call Claude API to generate improved prompt
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=agent.evolution_model,
                 max_tokens=2048,
                 system=EVOLUTION_SYSTEM_PROMPT,
@@ -83,8 +83,14 @@ TRADE_ACTION_TOOL = {
 class AgentExecutor:
     """Executes agent decisions via Claude API."""
 
-    def __init__(self, api_key: str | None = None):
-        self.client = anthropic.Anthropic(api_key=api_key or settings.anthropic_api_key)
+    def __init__(
+        self,
+        api_key: str | None = None,
+        client: anthropic.AsyncAnthropic | None = None,
+    ):
+        self.client = client or anthropic.AsyncAnthropic(
+            api_key=api_key or settings.anthropic_api_key
+        )
 
     async def decide(
         self,
@@ -115,7 +121,7 @@ class AgentExecutor:
 
         for attempt in range(max_retries + 1):
             try:
-                response = self.client.messages.create(
+                response = await self.client.messages.create(
                     model=model,
                     max_tokens=1024,
                     system=system_prompt,
@@ -0,0 +1,134 @@
+"""In-process leaderboard aggregates (trade counts, wins, token cost per agent).
+
+The SSE leaderboard broadcast used to run two aggregate queries per agent
+every time it fired. Instead, the aggregates are loaded once with two
+grouped queries and then kept current incrementally:
+
+- writers (PortfolioManager closing trades, token-usage upserts) stage a
+  delta on their session with record_trade / record_token_cost;
+- staged deltas are applied when that session commits and dropped if it
+  rolls back, so the cache never counts work that was not persisted.
+
+Bulk writes that bypass the ORM helpers (e.g. season resets) call
+invalidate() and the next read reloads from the database.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, replace
+from decimal import Decimal
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.models.db import AgentTokenUsage, AgentTrade
+
+logger = logging.getLogger(__name__)
+
+# session.info key holding deltas staged by the current transaction
+_PENDING_KEY = "leaderboard_deltas"
+
+
+@dataclass
+class AgentAggregates:
+    """Running totals for one agent."""
+
+    trade_count: int = 0
+    wins: int = 0
+    token_cost: Decimal = Decimal("0")
+
+
+class LeaderboardCache:
+    """Per-agent aggregates, loaded lazily and updated on commit."""
+
+    def __init__(self) -> None:
+        self._aggregates: dict[int, AgentAggregates] = {}
+        self._loaded = False
+        self._commits = 0
+        self._lock = asyncio.Lock()
+
+    def record_trade(self, session: AsyncSession, agent_id: int, pnl: Decimal) -> None:
+        """Stage a closed trade; counted once the session commits."""
+        self._pending(session).append((agent_id, 1, 1 if pnl > 0 else 0, Decimal("0")))
+
+    def record_token_cost(self, session: AsyncSession, agent_id: int, cost: Decimal) -> None:
+        """Stage token spend; counted once the session commits."""
+        self._pending(session).append((agent_id, 0, 0, cost))
+
+    def invalidate(self) -> None:
+        """Drop the aggregates; the next get_all() reloads them."""
+        self._loaded = False
+
+    async def get_all(self, session: AsyncSession) -> dict[int, AgentAggregates]:
+        """Aggregates for every agent with trades or token usage.
+
+        Args:
+            session: Session used to (re)load the aggregates when needed.
+
+        Returns:
+            Dict mapping agent id to a copy of its aggregates.
+        """
+        if not self._loaded:
+            async with self._lock:
+                if not self._loaded:
+                    await self._load(session)
+        return {agent_id: replace(agg) for agent_id, agg in self._aggregates.items()}
+
+    async def _load(self, session: AsyncSession) -> None:
+        commits_before = self._commits
+
+        aggregates: dict[int, AgentAggregates] = {}
+        result = await session.execute(
+            select(
+                AgentTrade.agent_id,
+                func.count().label("total"),
+                func.count().filter(AgentTrade.pnl > 0).label("wins"),
+            ).group_by(AgentTrade.agent_id)
+        )
+        for agent_id, total, wins in result.all():
+            aggregates[agent_id] = AgentAggregates(trade_count=total, wins=wins)
+
+        result = await session.execute(
+            select(
+                AgentTokenUsage.agent_id,
+                func.coalesce(func.sum(AgentTokenUsage.estimated_cost_usd), 0),
+            ).group_by(AgentTokenUsage.agent_id)
+        )
+        for agent_id, cost in result.all():
+            aggregates.setdefault(agent_id, AgentAggregates()).token_cost = Decimal(cost)
+
+        self._aggregates = aggregates
+        # A commit landing mid-load may or may not be in the snapshot: serve
+        # it now, but reload on the next read so it is counted exactly once.
+        self._loaded = self._commits == commits_before
+        logger.debug(f"Loaded leaderboard aggregates for {len(aggregates)} agents")
+
+    def _apply(self, deltas: list[tuple[int, int, int, Decimal]]) -> None:
+        self._commits += 1
+        if not self._loaded:
+            return
+        for agent_id, trades, wins, cost in deltas:
+            agg = self._aggregates.setdefault(agent_id, AgentAggregates())
+            agg.trade_count += trades
+            agg.wins += wins
+            agg.token_cost += cost
+
+    @staticmethod
+    def _pending(session: AsyncSession) -> list[tuple[int, int, int, Decimal]]:
+        return session.info.setdefault(_PENDING_KEY, [])
+
+
+leaderboard = LeaderboardCache()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    deltas = session.info.pop(_PENDING_KEY, None)
+    if deltas:
+        leaderboard._apply(deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
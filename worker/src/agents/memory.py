@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.config import settings
 from src.models.db import Agent, AgentMemory, AgentTokenUsage, AgentTrade, Symbol
 from src.agents.executor import estimate_cost, MODEL_PRICING
+from src.agents.leaderboard import leaderboard
 from src.llm_settings import is_enabled
 
 logger = logging.getLogger(__name__)
@@ -36,9 +37,16 @@ Be specific and actionable. Focus on the "why" behind the outcome."""
 class MemoryManager:
     """Manages agent memory generation and retrieval."""
 
-    def __init__(self, session: AsyncSession, api_key: str | None = None):
+    def __init__(
+        self,
+        session: AsyncSession,
+        api_key: str | None = None,
+        client: anthropic.AsyncAnthropic | None = None,
+    ):
         self.session = session
-        self.client = anthropic.Anthropic(api_key=api_key or settings.anthropic_api_key)
+        self.client = client or anthropic.AsyncAnthropic(
+            api_key=api_key or settings.anthropic_api_key
+        )
 
     async def generate_memory(
         self,
@@ -71,7 +79,7 @@ class MemoryManager:
 
         # Call Claude API (use scan_model for cost efficiency)
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=agent.scan_model,
                 max_tokens=256,
                 system=MEMORY_SYSTEM_PROMPT,
@@ -131,6 +139,7 @@ class MemoryManager:
             },
         )
         await self.session.execute(stmt)
+        leaderboard.record_token_cost(self.session, agent.id, cost)
 
         logger.info(
             f"Generated memory for agent {agent.name}: {lesson[:100]}... "
@@ -9,16 +9,20 @@ Handles:
 - Integration with pipeline
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone, date
 from decimal import Decimal
 from typing import Any
 
+import anthropic
 from sqlalchemy import func, select, update
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 
+from src.cache import tiered_cache
+from src.config import settings
 from src.models.db import (
     Agent,
     AgentDecision,
@@ -33,8 +37,9 @@ from src.agents.schemas import (
     AgentDecisionResult,
     ExecutionResult,
 )
-from src.agents.context import ContextBuilder
+from src.agents.context import AgentHistory, ContextBuilder, MarketSnapshot
 from src.agents.executor import AgentExecutor
+from src.agents.leaderboard import leaderboard
 from src.agents.rule_executor import RuleBasedExecutor
 from src.agents.portfolio import PortfolioManager
 from src.agents.memory import MemoryManager
@@ -63,16 +68,34 @@ PRUNING_WEIGHT_WIN_RATE = 0.40
 
 
 class AgentOrchestrator:
-    """Orchestrates agent decision cycles."""
-
-    def __init__(self, session: AsyncSession):
+    """Orchestrates agent decision cycles.
+
+    Args:
+        session: Session for cycle-level queries (and for every agent when
+                 no session factory is given).
+        session_factory: Optional session factory. When set and
+                         settings.agent_cycle_concurrency > 1, agents are
+                         processed concurrently, each in its own session
+                         and transaction.
+        client: Anthropic client shared by the executor, memory and
+                evolution managers (one is created if not given).
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        client: anthropic.AsyncAnthropic | None = None,
+    ):
         self.session = session
+        self.session_factory = session_factory
+        self.client = client or anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
         self.context_builder = ContextBuilder(session)
-        self.executor = AgentExecutor()
+        self.executor = AgentExecutor(client=self.client)
         self.rule_executor = RuleBasedExecutor()
         self.portfolio_manager = PortfolioManager(session)
-        self.memory_manager = MemoryManager(session)
-        self.evolution_manager = EvolutionManager(session)
+        self.memory_manager = MemoryManager(session, client=self.client)
+        self.evolution_manager = EvolutionManager(session, client=self.client)
         self.notification_service = NotificationService(session)
 
     async def run_cycle(
@@ -124,38 +147,26 @@ class AgentOrchestrator:
                     f"avg_sentiment={hybrid_tweet_context.avg_sentiment:.2f}"
                 )
 
-        for agent in agents:
-            try:
-                tweet_ctx = hybrid_tweet_context if getattr(agent, "source", "") == "hybrid" else None
-                agent_result = await self._process_agent(
-                    agent, current_prices, candle_data, tweet_context=tweet_ctx
-                )
-                results["agents_processed"] += 1
-                results["decisions"].append(agent_result["decision"])
-
-                if agent_result.get("execution"):
-                    results["executions"].append(agent_result["execution"])
-
-                if agent_result.get("memory_generated"):
-                    results["memories_generated"] += 1
-
-                if agent_result.get("evolution_triggered"):
-                    results["evolutions_triggered"] += 1
-
-                results["total_tokens"]["input"] += agent_result["decision"].input_tokens
-                results["total_tokens"]["output"] += agent_result["decision"].output_tokens
-                results["total_cost_usd"] += agent_result["decision"].estimated_cost_usd
+        # SL/TP and unrealized PnL for every agent first, so context sees the result
+        settled = await self.portfolio_manager.settle_positions(
+            [a.id for a in agents], candle_data, current_prices
+        )
+        snapshot, histories = await self._prepare_cycle_context(agents)
 
-            except Exception as e:
-                logger.exception(f"Error processing agent {agent.name}: {e}")
-                results["errors"].append({
-                    "agent_id": agent.id,
-                    "agent_name": agent.name,
-                    "error": str(e),
-                })
+        tweet_contexts = {
+            a.id: hybrid_tweet_context for a in agents if getattr(a, "source", "") == "hybrid"
+        }
+        outcomes = await self._process_agents(
+            agents, current_prices, settled, tweet_contexts, snapshot, histories
+        )
+        for agent, outcome in zip(agents, outcomes):
+            self._collect_outcome(results, agent, outcome)
 
         # Commit all changes
         await self.session.commit()
+        if agents:
+            # Trades and equity changed: /analytics responses are stale
+            await tiered_cache.invalidate("analytics")
 
         elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
         logger.info(
@@ -171,20 +182,147 @@ class AgentOrchestrator:
 
         return results
 
+    async def _process_agents(
+        self,
+        agents: list[Agent],
+        current_prices: dict[str, Decimal],
+        settled: dict[int, list[ExecutionResult]],
+        tweet_contexts: dict[int, Any],
+        snapshot: MarketSnapshot | None,
+        histories: dict[int, AgentHistory],
+    ) -> list[dict[str, Any] | Exception]:
+        """Process agents, concurrently when a session factory is configured.
+
+        Failures are logged and returned in place of the agent's result, so a
+        single agent never aborts the cycle.
+
+        Args:
+            settled: SL/TP close results per agent from settle_positions.
+
+        Returns:
+            One result dict or exception per agent, in the same order as agents.
+        """
+        concurrency = settings.agent_cycle_concurrency
+        if self.session_factory is None or concurrency <= 1 or len(agents) <= 1:
+            outcomes: list[dict[str, Any] | Exception] = []
+            for agent in agents:
+                try:
+                    outcomes.append(await self._process_agent(
+                        agent, current_prices, settled.get(agent.id, []),
+                        tweet_context=tweet_contexts.get(agent.id),
+                        snapshot=snapshot, history=histories.get(agent.id),
+                    ))
+                except Exception as e:
+                    logger.exception(f"Error processing agent {agent.name}: {e}")
+                    outcomes.append(e)
+            return outcomes
+
+        # Agents use their own sessions; release the cycle session's connection
+        await self.session.commit()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(agent: Agent) -> dict[str, Any] | Exception:
+            async with semaphore:
+                try:
+                    return await self._process_agent_in_session(
+                        agent.id, current_prices, settled.get(agent.id, []),
+                        tweet_context=tweet_contexts.get(agent.id),
+                        snapshot=snapshot, history=histories.get(agent.id),
+                    )
+                except Exception as e:
+                    logger.exception(f"Error processing agent {agent.name}: {e}")
+                    return e
+
+        return list(await asyncio.gather(*(run_one(agent) for agent in agents)))
+
+    async def _process_agent_in_session(
+        self, agent_id: int, *args: Any, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Process one agent in its own session and commit its changes.
+
+        The agent is re-loaded in the new session so its updates (status,
+        last_cycle_at) are committed with the rest of its transaction.
+        Arguments after agent_id are passed through to _process_agent.
+        """
+        async with self.session_factory() as session:
+            agent = await session.get(Agent, agent_id)
+            if agent is None:
+                raise ValueError(f"Agent {agent_id} not found")
+            orchestrator = AgentOrchestrator(session, client=self.client)
+            result = await orchestrator._process_agent(agent, *args, **kwargs)
+            await session.commit()
+            return result
+
+    @staticmethod
+    def _collect_outcome(
+        results: dict[str, Any],
+        agent: Agent,
+        outcome: dict[str, Any] | Exception,
+    ) -> None:
+        """Add one agent's result (or failure) to the cycle summary."""
+        if isinstance(outcome, Exception):
+            results["errors"].append({
+                "agent_id": agent.id,
+                "agent_name": agent.name,
+                "error": str(outcome),
+            })
+            return
+
+        results["agents_processed"] += 1
+        results["decisions"].append(outcome["decision"])
+
+        if outcome.get("execution"):
+            results["executions"].append(outcome["execution"])
+        if outcome.get("memory_generated"):
+            results["memories_generated"] += 1
+        if outcome.get("evolution_triggered"):
+            results["evolutions_triggered"] += 1
+
+        decision = outcome["decision"]
+        if decision:
+            results["total_tokens"]["input"] += decision.input_tokens
+            results["total_tokens"]["output"] += decision.output_tokens
+            results["total_cost_usd"] += decision.estimated_cost_usd
+
+    async def _prepare_cycle_context(
+        self, agents: list[Agent]
+    ) -> tuple[MarketSnapshot | None, dict[int, AgentHistory]]:
+        """Build the shared market snapshot and prefetch per-agent history.
+
+        Args:
+            agents: Agents that will be processed in this cycle.
+
+        Returns:
+            Tuple of (snapshot, histories by agent id). Empty when there are no agents.
+        """
+        if not agents:
+            return None, {}
+
+        snapshot = await self.context_builder.build_snapshot(
+            {a.timeframe for a in agents}, {a.strategy_archetype for a in agents}
+        )
+        histories = await self.context_builder.prefetch_histories([a.id for a in agents])
+        return snapshot, histories
+
     async def _process_agent(
         self,
         agent: Agent,
         current_prices: dict[str, Decimal],
-        candle_data: dict[str, dict[str, Decimal]] | None,
+        sl_tp_results: list[ExecutionResult],
         tweet_context: Any = None,
+        snapshot: MarketSnapshot | None = None,
+        history: AgentHistory | None = None,
     ) -> dict[str, Any]:
         """Process a single agent.
 
         Args:
             agent: The agent to process.
             current_prices: Dict of symbol -> current price.
-            candle_data: Optional candle data for SL/TP checks.
+            sl_tp_results: Positions of this agent already closed by SL/TP
+                           (see PortfolioManager.settle_positions).
             tweet_context: Pre-built tweet context to avoid redundant queries.
+            snapshot: Market snapshot shared by all agents in the cycle.
+            history: Prefetched performance and memory for this agent.
 
         Returns:
             Dict with decision and optional execution result.
@@ -198,26 +336,19 @@ class AgentOrchestrator:
             "evolution_triggered": False,
         }
 
-        # First, check stop loss / take profit
+        # Positions closed by stop loss / take profit this cycle
         closed_trades: list[AgentTrade] = []
-        if candle_data:
-            sl_tp_results = await self.portfolio_manager.check_stop_loss_take_profit(
-                agent.id, candle_data
+        for sl_tp_result in sl_tp_results:
+            logger.info(
+                f"Agent {agent.name}: {sl_tp_result.action.value} {sl_tp_result.symbol} "
+                f"({sl_tp_result.details.get('exit_reason')})"
             )
-            for sl_tp_result in sl_tp_results:
-                logger.info(
-                    f"Agent {agent.name}: {sl_tp_result.action.value} {sl_tp_result.symbol} "
-                    f"({sl_tp_result.details.get('exit_reason')})"
-                )
-                # Get the trade that was just closed
-                if sl_tp_result.trade_id:
-                    trade = await self._get_trade(sl_tp_result.trade_id)
-                    if trade:
-                        closed_trades.append(trade)
-                        await self._notify_trade_closed(agent, trade)
-
-        # Update unrealized PnL
-        await self.portfolio_manager.update_unrealized_pnl(agent.id, current_prices)
+            # Get the trade that was just closed
+            if sl_tp_result.trade_id:
+                trade = await self._get_trade(sl_tp_result.trade_id)
+                if trade:
+                    closed_trades.append(trade)
+                    await self._notify_trade_closed(agent, trade)
 
         # Check LLM settings — skip if section disabled
         if agent.engine == "rule" and not is_enabled("rule_trade_decisions"):
@@ -231,7 +362,8 @@ class AgentOrchestrator:
 
         # Build context
         context = await self.context_builder.build(
-            agent, current_prices, tweet_context=tweet_context
+            agent, current_prices, tweet_context=tweet_context,
+            snapshot=snapshot, history=history,
         )
 
         # Execute decision — branch on engine type
@@ -241,6 +373,7 @@ class AgentOrchestrator:
                 agent_name=agent.name,
                 strategy_archetype=agent.strategy_archetype,
                 prompt_version=1,
+                table=snapshot.signal_table(agent.timeframe) if snapshot else None,
             )
         else:
             prompt = await self._get_active_prompt(agent.id)
@@ -545,35 +678,21 @@ class AgentOrchestrator:
             "total_cost_usd": Decimal("0.00"),
         }
 
-        for agent in agents:
-            try:
-                agent_result = await self._process_agent(
-                    agent, current_prices, None, tweet_context=tweet_context
-                )
-                results["agents_processed"] += 1
-                results["decisions"].append(agent_result["decision"])
-
-                if agent_result.get("execution"):
-                    results["executions"].append(agent_result["execution"])
-                if agent_result.get("memory_generated"):
-                    results["memories_generated"] += 1
-                if agent_result.get("evolution_triggered"):
-                    results["evolutions_triggered"] += 1
-
-                if agent_result["decision"]:
-                    results["total_tokens"]["input"] += agent_result["decision"].input_tokens
-                    results["total_tokens"]["output"] += agent_result["decision"].output_tokens
-                    results["total_cost_usd"] += agent_result["decision"].estimated_cost_usd
-
-            except Exception as e:
-                logger.exception(f"Error processing tweet agent {agent.name}: {e}")
-                results["errors"].append({
-                    "agent_id": agent.id,
-                    "agent_name": agent.name,
-                    "error": str(e),
-                })
+        settled = await self.portfolio_manager.settle_positions(
+            [a.id for a in agents], current_prices=current_prices
+        )
+        snapshot, histories = await self._prepare_cycle_context(agents)
+
+        outcomes = await self._process_agents(
+            agents, current_prices, settled,
+            {a.id: tweet_context for a in agents}, snapshot, histories,
+        )
+        for agent, outcome in zip(agents, outcomes):
+            self._collect_outcome(results, agent, outcome)
 
         await self.session.commit()
+        if agents:
+            await tiered_cache.invalidate("analytics")
 
         elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
         logger.info(
@@ -699,6 +818,7 @@ class AgentOrchestrator:
             },
         )
         await self.session.execute(stmt)
+        leaderboard.record_token_cost(self.session, agent_id, cost)
 
     # =========================================================================
     # Notification helpers (fire-and-forget, never propagate errors)
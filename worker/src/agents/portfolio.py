@@ -6,9 +6,14 @@ Handles:
 - PnL calculations
 - Stop-loss and take-profit checks
 - Fee calculations
+
+SL/TP checks and unrealized PnL are settled for all agents of a cycle at
+once (settle_positions): one query loads every open position with its
+symbol, and the resulting closes and equity updates go out in one flush.
 """
 
 import logging
+from collections.abc import Collection, Sequence
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
@@ -16,6 +21,7 @@ from typing import Any
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agents.leaderboard import leaderboard
 from src.models.db import (
     Agent,
     AgentPortfolio,
@@ -339,18 +345,50 @@ class PortfolioManager:
                 error_message=f"No open position found for {symbol}",
             )
 
-        # Get portfolio
+        # Get portfolio and per-timeframe season number
         portfolio = await self._get_portfolio(agent_id)
+        seasons = await self._get_season_numbers([agent_id])
 
-        # Calculate PnL
-        if position.direction == "long":
-            pnl = (exit_price - position.entry_price) * (
-                position.position_size / position.entry_price
-            )
-        else:
-            pnl = (position.entry_price - exit_price) * (
-                position.position_size / position.entry_price
-            )
+        trade, details = self._build_close(
+            position, portfolio, exit_price, exit_reason, seasons[agent_id], decision_id
+        )
+        self.session.add(trade)
+        leaderboard.record_trade(self.session, agent_id, trade.pnl)
+
+        # Delete position
+        await self.session.delete(position)
+        await self.session.flush()
+
+        logger.info(
+            f"Closed {position.direction} position for agent {agent_id}: "
+            f"{symbol} @ {exit_price}, PnL=${trade.pnl:.2f} ({exit_reason})"
+        )
+
+        return ExecutionResult(
+            success=True,
+            action=ActionType.CLOSE,
+            symbol=symbol,
+            trade_id=trade.id,
+            details=details,
+        )
+
+    def _build_close(
+        self,
+        position: AgentPosition,
+        portfolio: AgentPortfolio,
+        exit_price: Decimal,
+        exit_reason: str,
+        season_num: int,
+        decision_id: int | None = None,
+    ) -> tuple[AgentTrade, dict[str, Any]]:
+        """Create the trade for closing a position and credit the portfolio.
+
+        The trade is not added to the session and the position is not deleted.
+
+        Returns:
+            Tuple of (trade, execution details).
+        """
+        pnl = self._position_pnl(position, exit_price)
 
         # Calculate exit fee
         exit_fee = position.position_size * TRADING_FEE_PCT
@@ -363,26 +401,10 @@ class PortfolioManager:
             (datetime.now(timezone.utc) - position.opened_at).total_seconds() / 60
         )
 
-        # Look up per-timeframe season number
-        season_num = 2  # fallback default
-        agent_result = await self.session.execute(
-            select(Agent.timeframe).where(Agent.id == agent_id)
-        )
-        agent_tf = agent_result.scalar_one_or_none()
-        if agent_tf and agent_tf != "cross":
-            season_result = await self.session.execute(
-                select(TimeframeSeason.current_season).where(
-                    TimeframeSeason.timeframe == agent_tf
-                )
-            )
-            season_val = season_result.scalar_one_or_none()
-            if season_val is not None:
-                season_num = season_val
-
         # Create trade record
         trade = AgentTrade(
-            agent_id=agent_id,
-            symbol_id=symbol_id,
+            agent_id=position.agent_id,
+            symbol_id=position.symbol_id,
             direction=position.direction,
             entry_price=position.entry_price,
             exit_price=exit_price,
@@ -396,7 +418,6 @@ class PortfolioManager:
             decision_id=decision_id,
             season=season_num,
         )
-        self.session.add(trade)
 
         # Update portfolio
         portfolio.cash_balance += position.position_size + net_pnl
@@ -405,30 +426,178 @@ class PortfolioManager:
         portfolio.total_equity = portfolio.cash_balance  # Will be updated with unrealized
         portfolio.updated_at = datetime.now(timezone.utc)
 
-        # Delete position
-        await self.session.delete(position)
-        await self.session.flush()
+        details = {
+            "entry_price": str(position.entry_price),
+            "exit_price": str(exit_price),
+            "position_size": str(position.position_size),
+            "pnl": str(net_pnl),
+            "exit_fee": str(exit_fee),
+            "duration_minutes": duration_minutes,
+            "exit_reason": exit_reason,
+        }
+        return trade, details
 
-        logger.info(
-            f"Closed {position.direction} position for agent {agent_id}: "
-            f"{symbol} @ {exit_price}, PnL=${net_pnl:.2f} ({exit_reason})"
+    @staticmethod
+    def _position_pnl(position: AgentPosition, price: Decimal) -> Decimal:
+        """Gross PnL of a position at a price (before exit fee)."""
+        if position.direction == "long":
+            return (price - position.entry_price) * (
+                position.position_size / position.entry_price
+            )
+        return (position.entry_price - price) * (
+            position.position_size / position.entry_price
         )
 
-        return ExecutionResult(
-            success=True,
-            action=ActionType.CLOSE,
-            symbol=symbol,
-            trade_id=trade.id,
-            details={
-                "entry_price": str(position.entry_price),
-                "exit_price": str(exit_price),
-                "position_size": str(position.position_size),
-                "pnl": str(net_pnl),
-                "exit_fee": str(exit_fee),
-                "duration_minutes": duration_minutes,
-                "exit_reason": exit_reason,
-            },
+    async def settle_positions(
+        self,
+        agent_ids: Sequence[int],
+        candle_data: dict[str, dict[str, Decimal]] | None = None,
+        current_prices: dict[str, Decimal] | None = None,
+    ) -> dict[int, list[ExecutionResult]]:
+        """Check SL/TP and update unrealized PnL for many agents at once.
+
+        Positions hit by their stop loss or take profit (checked against
+        candle_data) are closed; remaining positions are marked to
+        current_prices and each portfolio's equity is recomputed. All
+        inserts, deletes and updates are written in a single flush.
+
+        Args:
+            agent_ids: Agents to settle.
+            candle_data: Dict of symbol -> {high, low, close}. SL/TP is skipped if None.
+            current_prices: Dict of symbol -> current price. Unrealized PnL
+                            is not updated if None.
+
+        Returns:
+            Dict mapping every agent id to its SL/TP close results.
+        """
+        results: dict[int, list[ExecutionResult]] = {agent_id: [] for agent_id in agent_ids}
+        if not agent_ids:
+            return results
+
+        result = await self.session.execute(
+            select(AgentPosition, Symbol.symbol)
+            .join(Symbol, AgentPosition.symbol_id == Symbol.id)
+            .where(AgentPosition.agent_id.in_(agent_ids))
+            .order_by(AgentPosition.agent_id, AgentPosition.id)
+        )
+        rows = result.all()
+
+        result = await self.session.execute(
+            select(AgentPortfolio).where(AgentPortfolio.agent_id.in_(agent_ids))
+        )
+        portfolios = {p.agent_id: p for p in result.scalars().all()}
+
+        # Single pass: split positions into SL/TP hits and still-open ones
+        hits: list[tuple[AgentPosition, str, Decimal, str]] = []
+        still_open: list[tuple[AgentPosition, str]] = []
+        for position, symbol in rows:
+            exit_hit = None
+            if candle_data and position.agent_id in portfolios:
+                exit_hit = self._sl_tp_exit(position, candle_data.get(symbol))
+            if exit_hit:
+                hits.append((position, symbol, *exit_hit))
+            else:
+                still_open.append((position, symbol))
+
+        closed: list[tuple[str, AgentTrade, dict[str, Any]]] = []
+        if hits:
+            seasons = await self._get_season_numbers({p.agent_id for p, *_ in hits})
+            for position, symbol, exit_price, exit_reason in hits:
+                trade, details = self._build_close(
+                    position,
+                    portfolios[position.agent_id],
+                    exit_price,
+                    exit_reason,
+                    seasons[position.agent_id],
+                )
+                self.session.add(trade)
+                leaderboard.record_trade(self.session, trade.agent_id, trade.pnl)
+                await self.session.delete(position)
+                closed.append((symbol, trade, details))
+
+        if current_prices is not None:
+            now = datetime.now(timezone.utc)
+            totals = {agent_id: [Decimal("0.00"), Decimal("0.00")] for agent_id in agent_ids}
+            for position, symbol in still_open:
+                current_price = current_prices.get(symbol)
+                if not current_price:
+                    continue
+                unrealized = self._position_pnl(position, current_price)
+                position.unrealized_pnl = unrealized
+                totals[position.agent_id][0] += unrealized
+                totals[position.agent_id][1] += position.position_size
+
+            for agent_id, (total_unrealized, positions_value) in totals.items():
+                portfolio = portfolios.get(agent_id)
+                if portfolio:
+                    portfolio.total_equity = (
+                        portfolio.cash_balance + positions_value + total_unrealized
+                    )
+                    portfolio.updated_at = now
+
+        await self.session.flush()
+
+        for symbol, trade, details in closed:
+            logger.info(
+                f"Closed {trade.direction} position for agent {trade.agent_id}: "
+                f"{symbol} @ {trade.exit_price}, PnL=${trade.pnl:.2f} ({trade.exit_reason})"
+            )
+            results[trade.agent_id].append(
+                ExecutionResult(
+                    success=True,
+                    action=ActionType.CLOSE,
+                    symbol=symbol,
+                    trade_id=trade.id,
+                    details=details,
+                )
+            )
+
+        return results
+
+    @staticmethod
+    def _sl_tp_exit(
+        position: AgentPosition, candle: dict[str, Decimal] | None
+    ) -> tuple[Decimal, str] | None:
+        """Exit price and reason if a candle hits the position's SL or TP."""
+        if not candle:
+            return None
+
+        high = candle.get("high")
+        low = candle.get("low")
+        close = candle.get("close")
+
+        if not all([high, low, close]):
+            return None
+
+        # Check stop loss
+        if position.stop_loss:
+            if position.direction == "long" and low <= position.stop_loss:
+                return position.stop_loss, "stop_loss"
+            elif position.direction == "short" and high >= position.stop_loss:
+                return position.stop_loss, "stop_loss"
+
+        # Check take profit
+        if position.take_profit:
+            if position.direction == "long" and high >= position.take_profit:
+                return position.take_profit, "take_profit"
+            elif position.direction == "short" and low <= position.take_profit:
+                return position.take_profit, "take_profit"
+
+        return None
+
+    async def _get_season_numbers(self, agent_ids: Collection[int]) -> dict[int, int]:
+        """Current per-timeframe season number for each agent (2 if unknown)."""
+        season_num = 2  # fallback default
+        result = await self.session.execute(
+            select(Agent.id, TimeframeSeason.current_season)
+            .join(TimeframeSeason, TimeframeSeason.timeframe == Agent.timeframe)
+            .where(Agent.id.in_(agent_ids), Agent.timeframe != "cross")
         )
+        seasons = {agent_id: season_num for agent_id in agent_ids}
+        for agent_id, current_season in result.all():
+            if current_season is not None:
+                seasons[agent_id] = current_season
+        return seasons
 
     async def update_unrealized_pnl(
         self,
@@ -441,41 +610,7 @@ class PortfolioManager:
             agent_id: The agent to update.
             current_prices: Dict of symbol -> current price.
         """
-        positions = await self._get_open_positions(agent_id)
-        portfolio = await self._get_portfolio(agent_id)
-
-        total_unrealized = Decimal("0.00")
-        positions_value = Decimal("0.00")
-
-        for position in positions:
-            # Get symbol name
-            result = await self.session.execute(
-                select(Symbol).where(Symbol.id == position.symbol_id)
-            )
-            symbol = result.scalar_one()
-
-            current_price = current_prices.get(symbol.symbol)
-            if not current_price:
-                continue
-
-            # Calculate unrealized PnL
-            if position.direction == "long":
-                unrealized = (current_price - position.entry_price) * (
-                    position.position_size / position.entry_price
-                )
-            else:
-                unrealized = (position.entry_price - current_price) * (
-                    position.position_size / position.entry_price
-                )
-
-            position.unrealized_pnl = unrealized
-            total_unrealized += unrealized
-            positions_value += position.position_size
-
-        # Update portfolio equity
-        if portfolio:
-            portfolio.total_equity = portfolio.cash_balance + positions_value + total_unrealized
-            portfolio.updated_at = datetime.now(timezone.utc)
+        await self.settle_positions([agent_id], current_prices=current_prices)
 
     async def check_stop_loss_take_profit(
         self,
@@ -491,58 +626,8 @@ class PortfolioManager:
         Returns:
             List of execution results for closed positions.
         """
-        results: list[ExecutionResult] = []
-        positions = await self._get_open_positions(agent_id)
-
-        for position in positions:
-            # Get symbol
-            result = await self.session.execute(
-                select(Symbol).where(Symbol.id == position.symbol_id)
-            )
-            symbol = result.scalar_one()
-
-            candle = candle_data.get(symbol.symbol)
-            if not candle:
-                continue
-
-            high = candle.get("high")
-            low = candle.get("low")
-            close = candle.get("close")
-
-            if not all([high, low, close]):
-                continue
-
-            # Check stop loss
-            if position.stop_loss:
-                if position.direction == "long" and low <= position.stop_loss:
-                    result = await self.close_position(
-                        agent_id, symbol.symbol, position.stop_loss, "stop_loss"
-                    )
-                    results.append(result)
-                    continue
-                elif position.direction == "short" and high >= position.stop_loss:
-                    result = await self.close_position(
-                        agent_id, symbol.symbol, position.stop_loss, "stop_loss"
-                    )
-                    results.append(result)
-                    continue
-
-            # Check take profit
-            if position.take_profit:
-                if position.direction == "long" and high >= position.take_profit:
-                    result = await self.close_position(
-                        agent_id, symbol.symbol, position.take_profit, "take_profit"
-                    )
-                    results.append(result)
-                    continue
-                elif position.direction == "short" and low <= position.take_profit:
-                    result = await self.close_position(
-                        agent_id, symbol.symbol, position.take_profit, "take_profit"
-                    )
-                    results.append(result)
-                    continue
-
-        return results
+        results = await self.settle_positions([agent_id], candle_data=candle_data)
+        return results[agent_id]
 
     async def _get_portfolio(self, agent_id: int) -> AgentPortfolio | None:
         """Get portfolio for an agent."""
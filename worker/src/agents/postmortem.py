@@ -19,6 +19,7 @@ from src.config import settings
 from src.models.db import Agent, AgentTokenUsage, AgentTrade, FleetLesson, Symbol
 from src.agents.context import ContextBuilder
 from src.agents.executor import estimate_cost
+from src.agents.leaderboard import leaderboard
 from src.llm_settings import is_enabled
 
 logger = logging.getLogger(__name__)
@@ -164,6 +165,7 @@ Analyze this agent's history and extract lessons for future {agent.strategy_arch
                 },
             )
             await self.session.execute(stmt)
+            leaderboard.record_token_cost(self.session, agent.id, cost)
 
             # Parse tool response
             lessons_data = self._parse_response(response)
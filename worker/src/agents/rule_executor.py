@@ -16,6 +16,7 @@ from src.agents.schemas import (
 )
 from src.agents.strategies import STRATEGY_REGISTRY, CROSS_TF_STRATEGY_REGISTRY
 from src.agents.strategies.base import BaseRuleStrategy
+from src.agents.strategies.table import SignalTable
 
 logger = logging.getLogger(__name__)
 
@@ -39,15 +40,22 @@ class RuleBasedExecutor:
         agent_name: str,
         strategy_archetype: str,
         prompt_version: int,
+        table: SignalTable | None = None,
     ) -> AgentDecisionResult:
         """Run the rule-based strategy and return a decision.
 
+        Args:
+            table: SignalTable of context.primary_timeframe_rankings shared by
+                   all agents on the timeframe; built per call if not given.
+
         Returns AgentDecisionResult with zero tokens and zero cost.
         """
         strategy = self.get_strategy(agent_name, strategy_archetype)
 
         try:
-            action: TradeAction = strategy.evaluate(context)
+            if table is None:
+                table = SignalTable(context.primary_timeframe_rankings)
+            action: TradeAction = strategy.evaluate_table(context, table)
         except Exception as e:
             logger.exception(f"Rule strategy error for {agent_name}: {e}")
             action = TradeAction(action=ActionType.HOLD, confidence=0.0)
@@ -1,6 +1,6 @@
 """Rule-based trading strategy registry."""
 
-from src.agents.strategies.base import BaseRuleStrategy
+from src.agents.strategies.base import BaseRuleStrategy, TableScanStrategy
 from src.agents.strategies.momentum import MomentumStrategy
 from src.agents.strategies.mean_reversion import MeanReversionStrategy
 from src.agents.strategies.breakout import BreakoutStrategy
@@ -17,6 +17,7 @@ from src.agents.strategies.hybrid_momentum import HybridMomentumStrategy
 from src.agents.strategies.hybrid_mean_reversion import HybridMeanReversionStrategy
 from src.agents.strategies.hybrid_breakout import HybridBreakoutStrategy
 from src.agents.strategies.hybrid_swing import HybridSwingStrategy
+from src.agents.strategies.table import SignalTable
 
 # Archetype → strategy class (for timeframe-specific agents)
 STRATEGY_REGISTRY: dict[str, type[BaseRuleStrategy]] = {
@@ -44,8 +45,10 @@ CROSS_TF_STRATEGY_REGISTRY: dict[str, type[BaseRuleStrategy]] = {
 
 __all__ = [
     "BaseRuleStrategy",
+    "TableScanStrategy",
     "STRATEGY_REGISTRY",
     "CROSS_TF_STRATEGY_REGISTRY",
+    "SignalTable",
     "MomentumStrategy",
     "MeanReversionStrategy",
     "BreakoutStrategy",
@@ -3,12 +3,15 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+import numpy as np
+
 from src.agents.schemas import (
     ActionType,
     AgentContext,
     RankingContext,
     TradeAction,
 )
+from src.agents.strategies.table import SignalTable
 
 
 class BaseRuleStrategy(ABC):
@@ -28,6 +31,14 @@ class BaseRuleStrategy(ABC):
         """Generate a human-readable reasoning string for the decision."""
         ...
 
+    def evaluate_table(self, context: AgentContext, table: SignalTable) -> TradeAction:
+        """Evaluate against a SignalTable shared by all agents on the timeframe.
+
+        Strategies that scan the rankings override this with array operations
+        (see TableScanStrategy); the default ignores the table.
+        """
+        return self.evaluate(context)
+
     # ── Helpers ──────────────────────────────────────────────────────
 
     def _hold(self, confidence: float = 0.0) -> TradeAction:
@@ -84,3 +95,54 @@ class BaseRuleStrategy(ABC):
         if direction == "short" and regime.higher_tf_trend == "bull":
             return False
         return True
+
+
+class TableScanStrategy(BaseRuleStrategy):
+    """Rule strategy whose entries come from scanning the ranking table.
+
+    Subclasses implement evaluate_table() and describe their entry
+    conditions as column masks in _entry_masks(); evaluate() builds a
+    one-off table from the context.
+    """
+
+    def evaluate(self, context: AgentContext) -> TradeAction:
+        return self.evaluate_table(context, SignalTable(context.primary_timeframe_rankings))
+
+    @abstractmethod
+    def evaluate_table(self, context: AgentContext, table: SignalTable) -> TradeAction:
+        """Evaluate against a SignalTable shared by all agents on the timeframe."""
+        ...
+
+    @abstractmethod
+    def _entry_masks(self, table: SignalTable) -> tuple[np.ndarray, np.ndarray]:
+        """Rows meeting the long / short entry conditions.
+
+        Regime and open positions are applied later, per agent. The masks
+        depend only on the table, so they are computed once per table and
+        shared by every agent running this strategy.
+        """
+        ...
+
+    def _scan_entries(
+        self, context: AgentContext, table: SignalTable
+    ) -> tuple[RankingContext, ActionType] | None:
+        """First ranking (in rank order) with an entry signal for this agent.
+
+        Mirrors scanning primary_timeframe_rankings top-down: symbols already
+        held are skipped, and a long signal wins over a short on the same row.
+        """
+        long_mask, short_mask = table.memo(type(self), lambda: self._entry_masks(table))
+        if not self._regime_allows_direction(context, "long"):
+            long_mask = np.zeros_like(long_mask)
+        if not self._regime_allows_direction(context, "short"):
+            short_mask = np.zeros_like(short_mask)
+
+        held = [p.symbol for p in context.portfolio.open_positions]
+        candidates = (long_mask | short_mask) & ~table.symbol_mask(held)
+        rows = np.flatnonzero(candidates)
+        if rows.size == 0:
+            return None
+
+        row = int(rows[0])
+        action = ActionType.OPEN_LONG if long_mask[row] else ActionType.OPEN_SHORT
+        return table.rankings[row], action
@@ -3,14 +3,17 @@
 Mirrors the LLM breakout prompt from 003_seed_data.py.
 """
 
+import numpy as np
+
 from src.agents.schemas import ActionType, AgentContext, TradeAction
-from src.agents.strategies.base import BaseRuleStrategy
+from src.agents.strategies.base import TableScanStrategy
+from src.agents.strategies.table import SignalTable
 
 
-class BreakoutStrategy(BaseRuleStrategy):
+class BreakoutStrategy(TableScanStrategy):
     """Trade range breaks with volume confirmation."""
 
-    def evaluate(self, context: AgentContext) -> TradeAction:
+    def evaluate_table(self, context: AgentContext, table: SignalTable) -> TradeAction:
         # 1. Check exits (false breakout detection)
         close = self._check_exits(context)
         if close:
@@ -21,63 +24,54 @@ class BreakoutStrategy(BaseRuleStrategy):
             return self._hold(0.1)
 
         # 3. Scan for breakout setups
-        for r in context.primary_timeframe_rankings:
-            if self._has_position(context, r.symbol):
-                continue
-
-            bandwidth = self._raw(r, "bbands_20_2", "bandwidth")
-            pct_b = self._raw(r, "bbands_20_2", "percent_b")
-            obv_slope = self._raw(r, "obv", "slope_normalized")
-            adx = self._raw(r, "adx_14", "adx")
-            plus_di = self._raw(r, "adx_14", "plus_di")
-            minus_di = self._raw(r, "adx_14", "minus_di")
-
-            if not all(v is not None for v in [bandwidth, pct_b, obv_slope, adx]):
-                continue
-
-            # Squeeze condition: low bandwidth
-            is_squeeze = bandwidth < 5
-
-            # ── Long breakout ────────────────────────────────────
-            if (
-                is_squeeze
-                and pct_b > 1.0  # price above upper BB
-                and obv_slope > 2.0  # volume spike
-                and adx < 25  # trend emerging, not mature
-                and 0.55 <= r.bullish_score <= 0.75
-                and self._regime_allows_direction(context, "long")
-            ):
-                return TradeAction(
-                    action=ActionType.OPEN_LONG,
-                    symbol=r.symbol,
-                    position_size_pct=0.08,
-                    stop_loss_pct=0.05,
-                    take_profit_pct=0.10,
-                    confidence=0.65,
-                )
-
-            # ── Short breakout ───────────────────────────────────
-            if (
-                is_squeeze
-                and pct_b < 0.0  # price below lower BB
-                and obv_slope < -2.0  # volume spike down
-                and adx < 25
-                and plus_di is not None
-                and minus_di is not None
-                and minus_di > plus_di
-                and self._regime_allows_direction(context, "short")
-            ):
-                return TradeAction(
-                    action=ActionType.OPEN_SHORT,
-                    symbol=r.symbol,
-                    position_size_pct=0.08,
-                    stop_loss_pct=0.05,
-                    take_profit_pct=0.10,
-                    confidence=0.65,
-                )
+        entry = self._scan_entries(context, table)
+        if entry:
+            r, action = entry
+            return TradeAction(
+                action=action,
+                symbol=r.symbol,
+                position_size_pct=0.08,
+                stop_loss_pct=0.05,
+                take_profit_pct=0.10,
+                confidence=0.65,
+            )
 
         return self._hold(0.2)
 
+    def _entry_masks(self, table: SignalTable) -> tuple[np.ndarray, np.ndarray]:
+        bandwidth = table.raw("bbands_20_2", "bandwidth")
+        pct_b = table.raw("bbands_20_2", "percent_b")
+        obv_slope = table.raw("obv", "slope_normalized")
+        adx = table.raw("adx_14", "adx")
+        plus_di = table.raw("adx_14", "plus_di")
+        minus_di = table.raw("adx_14", "minus_di")
+        score = table.bullish_score
+
+        valid = table.has(
+            ("bbands_20_2", "bandwidth"), ("bbands_20_2", "percent_b"),
+            ("obv", "slope_normalized"), ("adx_14", "adx"),
+        )
+
+        # Squeeze condition: low bandwidth
+        is_squeeze = valid & (bandwidth < 5)
+
+        # ── Long breakout ────────────────────────────────────
+        long_mask = is_squeeze & (
+            (pct_b > 1.0)  # price above upper BB
+            & (obv_slope > 2.0)  # volume spike
+            & (adx < 25)  # trend emerging, not mature
+            & (score >= 0.55) & (score <= 0.75)
+        )
+
+        # ── Short breakout (NaN DI values compare False) ─────
+        short_mask = is_squeeze & (
+            (pct_b < 0.0)  # price below lower BB
+            & (obv_slope < -2.0)  # volume spike down
+            & (adx < 25)
+            & (minus_di > plus_di)
+        )
+        return long_mask, short_mask
+
     def _check_exits(self, context: AgentContext) -> TradeAction | None:
         """Exit if price re-enters BB (false breakout)."""
         for pos in context.portfolio.open_positions:
@@ -3,14 +3,17 @@
 Mirrors the LLM mean_reversion prompt from 003_seed_data.py.
 """
 
+import numpy as np
+
 from src.agents.schemas import ActionType, AgentContext, TradeAction
-from src.agents.strategies.base import BaseRuleStrategy
+from src.agents.strategies.base import TableScanStrategy
+from src.agents.strategies.table import SignalTable
 
 
-class MeanReversionStrategy(BaseRuleStrategy):
+class MeanReversionStrategy(TableScanStrategy):
     """Buy dips in uptrends, short rallies in downtrends."""
 
-    def evaluate(self, context: AgentContext) -> TradeAction:
+    def evaluate_table(self, context: AgentContext, table: SignalTable) -> TradeAction:
         # 1. Check exits first
         close = self._check_exits(context)
         if close:
@@ -21,57 +24,51 @@ class MeanReversionStrategy(BaseRuleStrategy):
             return self._hold(0.1)
 
         # 3. Scan rankings
-        for r in context.primary_timeframe_rankings:
-            if self._has_position(context, r.symbol):
-                continue
-
-            rsi = self._raw(r, "rsi_14", "value")
-            pve200 = self._raw(r, "ema_200", "price_vs_ema_pct")
-            pct_b = self._raw(r, "bbands_20_2", "percent_b")
-            stoch_k = self._raw(r, "stoch_14_3_3", "k")
-            stoch_d = self._raw(r, "stoch_14_3_3", "d")
-            obv_slope = self._raw(r, "obv", "slope_normalized")
-
-            if not all(v is not None for v in [rsi, pve200, pct_b, stoch_k, stoch_d]):
-                continue
-
-            # ── Long entry: uptrend + oversold ───────────────────
-            if (
-                pve200 > 0  # uptrend
-                and (rsi < 30 or pct_b < 0.05)  # oversold
-                and stoch_k < 20
-                and stoch_k > stoch_d  # turning up
-                and 0.20 <= r.bullish_score <= 0.45
-                and self._regime_allows_direction(context, "long")
-            ):
-                return TradeAction(
-                    action=ActionType.OPEN_LONG,
-                    symbol=r.symbol,
-                    position_size_pct=0.10,
-                    stop_loss_pct=0.03,
-                    take_profit_pct=0.06,
-                    confidence=0.6,
-                )
-
-            # ── Short entry: downtrend + overbought ──────────────
-            if (
-                pve200 < 0  # downtrend
-                and (rsi > 70 or pct_b > 0.95)  # overbought
-                and stoch_k > 80
-                and stoch_k < stoch_d  # turning down
-                and self._regime_allows_direction(context, "short")
-            ):
-                return TradeAction(
-                    action=ActionType.OPEN_SHORT,
-                    symbol=r.symbol,
-                    position_size_pct=0.10,
-                    stop_loss_pct=0.03,
-                    take_profit_pct=0.06,
-                    confidence=0.6,
-                )
+        entry = self._scan_entries(context, table)
+        if entry:
+            r, action = entry
+            return TradeAction(
+                action=action,
+                symbol=r.symbol,
+                position_size_pct=0.10,
+                stop_loss_pct=0.03,
+                take_profit_pct=0.06,
+                confidence=0.6,
+            )
 
         return self._hold(0.2)
 
+    def _entry_masks(self, table: SignalTable) -> tuple[np.ndarray, np.ndarray]:
+        rsi = table.raw("rsi_14", "value")
+        pve200 = table.raw("ema_200", "price_vs_ema_pct")
+        pct_b = table.raw("bbands_20_2", "percent_b")
+        stoch_k = table.raw("stoch_14_3_3", "k")
+        stoch_d = table.raw("stoch_14_3_3", "d")
+        score = table.bullish_score
+
+        valid = table.has(
+            ("rsi_14", "value"), ("ema_200", "price_vs_ema_pct"), ("bbands_20_2", "percent_b"),
+            ("stoch_14_3_3", "k"), ("stoch_14_3_3", "d"),
+        )
+
+        # ── Long entry: uptrend + oversold ───────────────────
+        long_mask = valid & (
+            (pve200 > 0)  # uptrend
+            & ((rsi < 30) | (pct_b < 0.05))  # oversold
+            & (stoch_k < 20)
+            & (stoch_k > stoch_d)  # turning up
+            & (score >= 0.20) & (score <= 0.45)
+        )
+
+        # ── Short entry: downtrend + overbought ──────────────
+        short_mask = valid & (
+            (pve200 < 0)  # downtrend
+            & ((rsi > 70) | (pct_b > 0.95))  # overbought
+            & (stoch_k > 80)
+            & (stoch_k < stoch_d)  # turning down
+        )
+        return long_mask, short_mask
+
     def _check_exits(self, context: AgentContext) -> TradeAction | None:
         """Exit when price returns to mean (EMA20) or RSI normalizes."""
         for pos in context.portfolio.open_positions:
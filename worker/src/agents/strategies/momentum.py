@@ -3,14 +3,17 @@
 Mirrors the LLM momentum prompt from 003_seed_data.py.
 """
 
+import numpy as np
+
 from src.agents.schemas import ActionType, AgentContext, TradeAction
-from src.agents.strategies.base import BaseRuleStrategy
+from src.agents.strategies.base import TableScanStrategy
+from src.agents.strategies.table import SignalTable
 
 
-class MomentumStrategy(BaseRuleStrategy):
+class MomentumStrategy(TableScanStrategy):
     """Follow the trend — strong moves tend to continue."""
 
-    def evaluate(self, context: AgentContext) -> TradeAction:
+    def evaluate_table(self, context: AgentContext, table: SignalTable) -> TradeAction:
         # 1. Check exit conditions for open positions
         close = self._check_exits(context)
         if close:
@@ -21,68 +24,65 @@ class MomentumStrategy(BaseRuleStrategy):
             return self._hold(0.1)
 
         # 3. Scan rankings for entry signals
-        for r in context.primary_timeframe_rankings:
-            if self._has_position(context, r.symbol):
-                continue
+        entry = self._scan_entries(context, table)
+        if entry:
+            r, action = entry
+            size = 0.15 if r.confidence >= 75 else 0.08
+            return TradeAction(
+                action=action,
+                symbol=r.symbol,
+                position_size_pct=size,
+                stop_loss_pct=0.03,
+                take_profit_pct=0.08,
+                confidence=(
+                    r.bullish_score if action == ActionType.OPEN_LONG else 1.0 - r.bullish_score
+                ),
+            )
 
-            rsi = self._raw(r, "rsi_14", "value")
-            macd_hist = self._raw(r, "macd_12_26_9", "histogram")
-            adx = self._raw(r, "adx_14", "adx")
-            plus_di = self._raw(r, "adx_14", "plus_di")
-            minus_di = self._raw(r, "adx_14", "minus_di")
-            obv_slope = self._raw(r, "obv", "slope_normalized")
-            pve50 = self._raw(r, "ema_50", "price_vs_ema_pct")
-            pve200 = self._raw(r, "ema_200", "price_vs_ema_pct")
-
-            if not all(v is not None for v in [rsi, macd_hist, adx, plus_di, minus_di, obv_slope, pve50, pve200]):
-                continue
+        return self._hold(0.2)
 
-            # ── Long entry ───────────────────────────────────────
-            if (
-                r.bullish_score >= 0.70
-                and r.confidence >= 60
-                and 50 <= rsi <= 70
-                and macd_hist > 0
-                and adx > 25
-                and plus_di > minus_di
-                and pve50 > 0
-                and pve200 > 0
-                and obv_slope > 0
-                and self._regime_allows_direction(context, "long")
-            ):
-                size = 0.15 if r.confidence >= 75 else 0.08
-                return TradeAction(
-                    action=ActionType.OPEN_LONG,
-                    symbol=r.symbol,
-                    position_size_pct=size,
-                    stop_loss_pct=0.03,
-                    take_profit_pct=0.08,
-                    confidence=r.bullish_score,
-                )
-
-            # ── Short entry ──────────────────────────────────────
-            if (
-                r.bullish_score <= 0.30
-                and r.confidence >= 60
-                and 30 <= rsi <= 50
-                and macd_hist < 0
-                and adx > 25
-                and minus_di > plus_di
-                and pve50 < 0
-                and pve200 < 0
-                and self._regime_allows_direction(context, "short")
-            ):
-                size = 0.15 if r.confidence >= 75 else 0.08
-                return TradeAction(
-                    action=ActionType.OPEN_SHORT,
-                    symbol=r.symbol,
-                    position_size_pct=size,
-                    stop_loss_pct=0.03,
-                    take_profit_pct=0.08,
-                    confidence=1.0 - r.bullish_score,
-                )
+    def _entry_masks(self, table: SignalTable) -> tuple[np.ndarray, np.ndarray]:
+        rsi = table.raw("rsi_14", "value")
+        macd_hist = table.raw("macd_12_26_9", "histogram")
+        adx = table.raw("adx_14", "adx")
+        plus_di = table.raw("adx_14", "plus_di")
+        minus_di = table.raw("adx_14", "minus_di")
+        obv_slope = table.raw("obv", "slope_normalized")
+        pve50 = table.raw("ema_50", "price_vs_ema_pct")
+        pve200 = table.raw("ema_200", "price_vs_ema_pct")
+        score, conf = table.bullish_score, table.confidence
+
+        valid = table.has(
+            ("rsi_14", "value"), ("macd_12_26_9", "histogram"), ("adx_14", "adx"),
+            ("adx_14", "plus_di"), ("adx_14", "minus_di"), ("obv", "slope_normalized"),
+            ("ema_50", "price_vs_ema_pct"), ("ema_200", "price_vs_ema_pct"),
+        )
 
-        return self._hold(0.2)
+        # ── Long entry ───────────────────────────────────────
+        long_mask = valid & (
+            (score >= 0.70)
+            & (conf >= 60)
+            & (rsi >= 50) & (rsi <= 70)
+            & (macd_hist > 0)
+            & (adx > 25)
+            & (plus_di > minus_di)
+            & (pve50 > 0)
+            & (pve200 > 0)
+            & (obv_slope > 0)
+        )
+
+        # ── Short entry ──────────────────────────────────────
+        short_mask = valid & (
+            (score <= 0.30)
+            & (conf >= 60)
+            & (rsi >= 30) & (rsi <= 50)
+            & (macd_hist < 0)
+            & (adx > 25)
+            & (minus_di > plus_di)
+            & (pve50 < 0)
+            & (pve200 < 0)
+        )
+        return long_mask, short_mask
 
     def _check_exits(self, context: AgentContext) -> TradeAction | None:
         """Exit long: RSI > 75 or price < EMA20. Short inverse."""
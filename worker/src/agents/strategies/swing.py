@@ -3,14 +3,17 @@
 Mirrors the LLM swing prompt from 003_seed_data.py.
 """
 
+import numpy as np
+
 from src.agents.schemas import ActionType, AgentContext, TradeAction
-from src.agents.strategies.base import BaseRuleStrategy
+from src.agents.strategies.base import TableScanStrategy
+from src.agents.strategies.table import SignalTable
 
 
-class SwingStrategy(BaseRuleStrategy):
+class SwingStrategy(TableScanStrategy):
     """Capture multi-candle swings in trending markets."""
 
-    def evaluate(self, context: AgentContext) -> TradeAction:
+    def evaluate_table(self, context: AgentContext, table: SignalTable) -> TradeAction:
         # 1. Check exits first
         close = self._check_exits(context)
         if close:
@@ -21,71 +24,67 @@ class SwingStrategy(BaseRuleStrategy):
             return self._hold(0.1)
 
         # 3. Scan rankings
-        for r in context.primary_timeframe_rankings:
-            if self._has_position(context, r.symbol):
-                continue
-
-            rsi = self._raw(r, "rsi_14", "value")
-            adx = self._raw(r, "adx_14", "adx")
-            pve50 = self._raw(r, "ema_50", "price_vs_ema_pct")
-            pve200 = self._raw(r, "ema_200", "price_vs_ema_pct")
-            ema50_val = self._raw(r, "ema_50", "ema")
-            ema200_val = self._raw(r, "ema_200", "ema")
-            stoch_k = self._raw(r, "stoch_14_3_3", "k")
-            stoch_d = self._raw(r, "stoch_14_3_3", "d")
+        entry = self._scan_entries(context, table)
+        if entry:
+            r, action = entry
+            size = 0.20 if r.confidence >= 70 else 0.12
+            return TradeAction(
+                action=action,
+                symbol=r.symbol,
+                position_size_pct=size,
+                stop_loss_pct=0.04,
+                take_profit_pct=0.08,
+                confidence=(
+                    r.bullish_score if action == ActionType.OPEN_LONG else 1.0 - r.bullish_score
+                ),
+            )
 
-            if not all(v is not None for v in [rsi, adx, pve50, pve200, ema50_val, ema200_val, stoch_k, stoch_d]):
-                continue
+        return self._hold(0.2)
 
-            # Skip ranging markets
-            if adx < 20:
-                continue
+    def _entry_masks(self, table: SignalTable) -> tuple[np.ndarray, np.ndarray]:
+        rsi = table.raw("rsi_14", "value")
+        adx = table.raw("adx_14", "adx")
+        pve50 = table.raw("ema_50", "price_vs_ema_pct")
+        pve200 = table.raw("ema_200", "price_vs_ema_pct")
+        ema50_val = table.raw("ema_50", "ema")
+        ema200_val = table.raw("ema_200", "ema")
+        stoch_k = table.raw("stoch_14_3_3", "k")
+        stoch_d = table.raw("stoch_14_3_3", "d")
+        score, conf = table.bullish_score, table.confidence
+
+        valid = table.has(
+            ("rsi_14", "value"), ("adx_14", "adx"), ("ema_50", "price_vs_ema_pct"),
+            ("ema_200", "price_vs_ema_pct"), ("ema_50", "ema"), ("ema_200", "ema"),
+            ("stoch_14_3_3", "k"), ("stoch_14_3_3", "d"),
+        )
 
-            # ── Long swing entry ─────────────────────────────────
-            if (
-                pve50 > 0
-                and pve200 > 0
-                and ema50_val > ema200_val  # EMA alignment
-                and r.bullish_score >= 0.55
-                and r.confidence >= 65
-                and 40 <= rsi <= 55  # pulled back
-                and stoch_k < 50
-                and stoch_k > stoch_d  # turning up
-                and self._regime_allows_direction(context, "long")
-            ):
-                size = 0.20 if r.confidence >= 70 else 0.12
-                return TradeAction(
-                    action=ActionType.OPEN_LONG,
-                    symbol=r.symbol,
-                    position_size_pct=size,
-                    stop_loss_pct=0.04,
-                    take_profit_pct=0.08,
-                    confidence=r.bullish_score,
-                )
-
-            # ── Short swing entry ────────────────────────────────
-            if (
-                pve50 < 0
-                and pve200 < 0
-                and ema50_val < ema200_val
-                and r.bullish_score <= 0.45
-                and r.confidence >= 65
-                and 45 <= rsi <= 60  # rallied from oversold
-                and stoch_k > 50
-                and stoch_k < stoch_d  # turning down
-                and self._regime_allows_direction(context, "short")
-            ):
-                size = 0.20 if r.confidence >= 70 else 0.12
-                return TradeAction(
-                    action=ActionType.OPEN_SHORT,
-                    symbol=r.symbol,
-                    position_size_pct=size,
-                    stop_loss_pct=0.04,
-                    take_profit_pct=0.08,
-                    confidence=1.0 - r.bullish_score,
-                )
+        # Skip ranging markets
+        trending = valid & (adx >= 20)
+
+        # ── Long swing entry ─────────────────────────────────
+        long_mask = trending & (
+            (pve50 > 0)
+            & (pve200 > 0)
+            & (ema50_val > ema200_val)  # EMA alignment
+            & (score >= 0.55)
+            & (conf >= 65)
+            & (rsi >= 40) & (rsi <= 55)  # pulled back
+            & (stoch_k < 50)
+            & (stoch_k > stoch_d)  # turning up
+        )
 
-        return self._hold(0.2)
+        # ── Short swing entry ────────────────────────────────
+        short_mask = trending & (
+            (pve50 < 0)
+            & (pve200 < 0)
+            & (ema50_val < ema200_val)
+            & (score <= 0.45)
+            & (conf >= 65)
+            & (rsi >= 45) & (rsi <= 60)  # rallied from oversold
+            & (stoch_k > 50)
+            & (stoch_k < stoch_d)  # turning down
+        )
+        return long_mask, short_mask
 
     def _check_exits(self, context: AgentContext) -> TradeAction | None:
         """Exit on RSI extreme or trend break (price vs EMA200)."""
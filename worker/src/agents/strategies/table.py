@@ -0,0 +1,89 @@
+"""Columnar view of a timeframe's rankings for vectorized rule evaluation.
+
+Every rule agent on a timeframe scans the same top-N RankingContext list.
+SignalTable walks the indicator signals once and stores each raw indicator
+field as a float array (one row per symbol, NaN where missing), so strategies
+can express their entry conditions as array operations. Strategy-level masks
+are memoized on the table and reused by every agent of the same strategy.
+"""
+
+import math
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+import numpy as np
+
+from src.agents.schemas import RankingContext
+
+T = TypeVar("T")
+
+
+class SignalTable:
+    """Rankings materialized as symbols x indicator-field columns.
+
+    Args:
+        rankings: Rankings in rank order (row i is rankings[i]).
+    """
+
+    def __init__(self, rankings: list[RankingContext]) -> None:
+        self.rankings = list(rankings)
+        self.symbols = [r.symbol for r in self.rankings]
+        self.bullish_score = np.array([r.bullish_score for r in self.rankings], dtype=np.float64)
+        self.confidence = np.array([r.confidence for r in self.rankings], dtype=np.float64)
+        self._rows = {symbol: i for i, symbol in reversed(list(enumerate(self.symbols)))}
+        self._columns: dict[tuple[str, str], np.ndarray] = {}
+        self._memo: dict[Any, Any] = {}
+
+        n = len(self.rankings)
+        for i, r in enumerate(self.rankings):
+            seen: set[str] = set()
+            for sig in r.indicator_signals:
+                if not isinstance(sig, dict):
+                    continue
+                name = sig.get("name")
+                # Same lookup as BaseRuleStrategy._raw: first signal with the name wins
+                if name in seen:
+                    continue
+                seen.add(name)
+                values = sig.get("rawValues") if "rawValues" in sig else sig.get("raw")
+                if not isinstance(values, dict):
+                    continue
+                for field, value in values.items():
+                    if not isinstance(value, (int, float)) or math.isnan(value):
+                        continue
+                    column = self._columns.get((name, field))
+                    if column is None:
+                        column = self._columns[(name, field)] = np.full(n, np.nan)
+                    column[i] = value
+
+    def __len__(self) -> int:
+        return len(self.rankings)
+
+    def raw(self, indicator: str, field: str) -> np.ndarray:
+        """Raw indicator values for every symbol (NaN where missing)."""
+        column = self._columns.get((indicator, field))
+        if column is None:
+            column = self._columns[(indicator, field)] = np.full(len(self.rankings), np.nan)
+        return column
+
+    def has(self, *columns: tuple[str, str]) -> np.ndarray:
+        """Rows where every given (indicator, field) value is present."""
+        mask = np.ones(len(self.rankings), dtype=bool)
+        for indicator, field in columns:
+            mask &= ~np.isnan(self.raw(indicator, field))
+        return mask
+
+    def row(self, symbol: str) -> int | None:
+        """Row index of the first ranking for a symbol."""
+        return self._rows.get(symbol)
+
+    def symbol_mask(self, symbols: Iterable[str]) -> np.ndarray:
+        """Rows whose symbol is in the given set."""
+        wanted = set(symbols)
+        return np.array([s in wanted for s in self.symbols], dtype=bool)
+
+    def memo(self, key: Any, compute: Callable[[], T]) -> T:
+        """Compute a value once per table (e.g. a strategy's entry masks)."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
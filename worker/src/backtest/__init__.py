@@ -1,5 +1,6 @@
 """Backtesting framework for Alpha Board strategies."""
 
 from src.backtest.engine import BacktestEngine
+from src.backtest.sweep import BacktestSweepEngine, SweepConfig
 
-__all__ = ["BacktestEngine"]
+__all__ = ["BacktestEngine", "BacktestSweepEngine", "SweepConfig"]
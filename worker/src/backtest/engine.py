@@ -1,13 +1,16 @@
 """Bar-by-bar backtest engine reusing existing indicators and strategies.
 
 Replays historical Binance candles through the full
-indicator -> scoring -> strategy pipeline.
+indicator -> scoring -> strategy pipeline. Indicator series and scores are
+computed once over the whole history; only strategy evaluation and portfolio
+bookkeeping run per bar.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -17,8 +20,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.backtest.portfolio import SimPortfolio
 from src.exchange.client import BinanceClient
 from src.exchange.types import Candle, candles_to_dataframe
-from src.indicators.registry import create_default_registry
+from src.indicators.registry import IndicatorRegistry, create_default_registry
 from src.models.db import BacktestRun, BacktestTrade
+from src.pipeline.offload import ComputePool
 from src.scoring.scorer import BullishScorer
 from src.scoring.confidence import ConfidenceScorer
 from src.scoring.ranker import Ranker, SymbolData
@@ -49,6 +53,9 @@ class BacktestConfig:
     start_date: datetime
     end_date: datetime
     initial_balance: float = 10000.0
+    # SL/TP overrides (fractions of entry price); None keeps the strategy's own
+    stop_loss_pct: float | None = None
+    take_profit_pct: float | None = None
 
 
 @dataclass
@@ -61,8 +68,92 @@ class BacktestResult:
     error: str | None = None
 
 
+def precompute_rankings(
+    symbol: str,
+    candles: list[Candle],
+    registry: IndicatorRegistry | None = None,
+) -> list[RankingContext]:
+    """Derive the strategy-independent ranking context for every simulated bar.
+
+    Indicator series are computed once over the full history instead of
+    rebuilding a DataFrame and recomputing indicators per bar, so the cost
+    is linear in the number of candles.
+
+    Args:
+        symbol: Symbol being backtested.
+        candles: Historical candles including the warmup window.
+        registry: Indicator registry (default: create_default_registry()).
+
+    Returns:
+        One RankingContext per bar from WARMUP_BARS to the last candle.
+    """
+    registry = registry or create_default_registry()
+    scorer = BullishScorer()
+    confidence_scorer = ConfidenceScorer()
+
+    history = registry.compute_history(candles_to_dataframe(candles), start=WARMUP_BARS)
+
+    rankings: list[RankingContext] = []
+    for indicators in history:
+        # Extract indicator signals in same format as context builder
+        signals_list = []
+        for name, output in indicators.items():
+            sig = output["signal"]
+            signals_list.append({
+                "name": name,
+                "signal": sig["signal"],
+                "label": sig["label"],
+                "raw": output["raw"],
+                "rawValues": output["raw"],
+            })
+
+        rankings.append(RankingContext(
+            symbol=symbol,
+            rank=1,
+            bullish_score=scorer.score(indicators),
+            confidence=int(round(confidence_scorer.score(indicators) * 100)),
+            highlights=[],
+            indicator_signals=signals_list,
+        ))
+    return rankings
+
+
+def simulate_backtest(
+    config: BacktestConfig,
+    candles: list[Candle],
+    rankings: list[RankingContext] | None = None,
+) -> SimPortfolio:
+    """Run a full simulation synchronously (process-pool entry point)."""
+    portfolio = SimPortfolio(config.initial_balance)
+    for _ in BacktestEngine()._simulate(config, candles, portfolio, rankings):
+        pass
+    return portfolio
+
+
+def apply_stats(run: BacktestRun, stats: dict) -> None:
+    """Copy SimPortfolio.get_stats() summary metrics onto a BacktestRun row."""
+    run.final_equity = Decimal(str(stats["final_equity"]))
+    run.total_pnl = Decimal(str(stats["total_pnl"]))
+    run.total_trades = stats["total_trades"]
+    run.winning_trades = stats["winning_trades"]
+    run.max_drawdown_pct = Decimal(str(stats["max_drawdown_pct"]))
+    run.sharpe_ratio = (
+        Decimal(str(stats["sharpe_ratio"]))
+        if stats["sharpe_ratio"] is not None
+        else None
+    )
+
+
 class BacktestEngine:
-    """Bar-by-bar backtest engine reusing existing indicators and strategies."""
+    """Bar-by-bar backtest engine reusing existing indicators and strategies.
+
+    Args:
+        compute_pool: Worker processes to run the simulation in, keeping the
+            event loop free (default: simulate in-process).
+    """
+
+    def __init__(self, compute_pool: ComputePool | None = None) -> None:
+        self.compute_pool = compute_pool
 
     async def run(
         self, config: BacktestConfig, session: AsyncSession,
@@ -96,6 +187,14 @@ class BacktestEngine:
                 start_date=config.start_date,
                 end_date=config.end_date,
                 initial_balance=Decimal(str(config.initial_balance)),
+                stop_loss_pct=(
+                    Decimal(str(config.stop_loss_pct))
+                    if config.stop_loss_pct is not None else None
+                ),
+                take_profit_pct=(
+                    Decimal(str(config.take_profit_pct))
+                    if config.take_profit_pct is not None else None
+                ),
                 status="running",
             )
             session.add(run)
@@ -120,129 +219,26 @@ class BacktestEngine:
                 f"{config.symbol} {config.timeframe}"
             )
 
-            # 2. Initialize components
-            portfolio = SimPortfolio(config.initial_balance)
-            registry = create_default_registry()
-            strategy_cls = STRATEGY_REGISTRY.get(config.strategy)
-            if not strategy_cls:
+            # 2. Simulate bar by bar, in a worker process when a pool is configured
+            if config.strategy not in STRATEGY_REGISTRY:
                 raise ValueError(f"Unknown strategy: {config.strategy}")
-            strategy = strategy_cls()
 
-            scorer = BullishScorer()
-            confidence_scorer = ConfidenceScorer()
-
-            # 3. Bar-by-bar loop (starting after warmup)
-            for i in range(WARMUP_BARS, len(candles)):
-                # Periodic cancellation check — yields to event loop
-                if i % 50 == 0:
-                    await asyncio.sleep(0)
-
-                candle = candles[i]
-                timestamp = candle.open_time
-                close_price = float(candle.close)
-                prices = {config.symbol: close_price}
-
-                # a. Build rolling window DataFrame
-                window = candles[: i + 1]
-                df = candles_to_dataframe(window)
-
-                # b. Compute indicators
-                indicators = registry.compute_all(df)
-
-                # c. Score the symbol
-                bullish_score = scorer.score(indicators)
-                confidence = confidence_scorer.score(indicators)
-
-                # d. Build ranking context
-                # Extract indicator signals in same format as context builder
-                signals_list = []
-                for name, output in indicators.items():
-                    sig = output["signal"]
-                    signals_list.append({
-                        "name": name,
-                        "signal": sig["signal"],
-                        "label": sig["label"],
-                        "raw": output["raw"],
-                        "rawValues": output["raw"],
-                    })
-
-                ranking = RankingContext(
-                    symbol=config.symbol,
-                    rank=1,
-                    bullish_score=bullish_score,
-                    confidence=int(round(confidence * 100)),
-                    highlights=[],
-                    indicator_signals=signals_list,
-                )
-
-                # e. Check SL/TP against current candle
-                candle_data = {
-                    config.symbol: {
-                        "high": float(candle.high),
-                        "low": float(candle.low),
-                        "close": close_price,
-                    }
-                }
-                portfolio.check_sl_tp(candle_data, timestamp)
-
-                # f. Build minimal AgentContext
-                context = self._build_context(
-                    config, portfolio, [ranking], prices,
+            if self.compute_pool is not None:
+                portfolio = await self.compute_pool.run(
+                    simulate_backtest, config, candles
                 )
+            else:
+                portfolio = SimPortfolio(config.initial_balance)
+                for _ in self._simulate(config, candles, portfolio):
+                    # Periodic cancellation check — yields to event loop
+                    await asyncio.sleep(0)
 
-                # g. Evaluate strategy
-                action = strategy.evaluate(context)
-
-                # h. Execute action
-                if action.action in (ActionType.OPEN_LONG, ActionType.OPEN_SHORT):
-                    if action.symbol and action.symbol == config.symbol:
-                        direction = (
-                            "long" if action.action == ActionType.OPEN_LONG
-                            else "short"
-                        )
-                        portfolio.open_position(
-                            symbol=config.symbol,
-                            direction=direction,
-                            price=close_price,
-                            size_pct=action.position_size_pct or 0.10,
-                            sl_pct=action.stop_loss_pct,
-                            tp_pct=action.take_profit_pct,
-                            timestamp=timestamp,
-                            prices=prices,
-                        )
-                elif action.action == ActionType.CLOSE:
-                    if action.symbol and action.symbol == config.symbol:
-                        portfolio.close_position(
-                            config.symbol, close_price,
-                            "strategy", timestamp,
-                        )
-
-                # i. Snapshot equity
-                portfolio.update_equity(prices, timestamp)
-
-            # 4. Force-close remaining positions at last candle price
-            last_candle = candles[-1]
-            last_price = float(last_candle.close)
-            last_ts = last_candle.open_time
-            for symbol in list(portfolio.positions.keys()):
-                portfolio.close_position(symbol, last_price, "backtest_end", last_ts)
-            portfolio.update_equity({config.symbol: last_price}, last_ts)
-
-            # 5. Compute stats
+            # 3. Compute stats
             stats = portfolio.get_stats()
 
-            # 6. Persist results
+            # 4. Persist results
             run.status = "completed"
-            run.final_equity = Decimal(str(stats["final_equity"]))
-            run.total_pnl = Decimal(str(stats["total_pnl"]))
-            run.total_trades = stats["total_trades"]
-            run.winning_trades = stats["winning_trades"]
-            run.max_drawdown_pct = Decimal(str(stats["max_drawdown_pct"]))
-            run.sharpe_ratio = (
-                Decimal(str(stats["sharpe_ratio"]))
-                if stats["sharpe_ratio"] is not None
-                else None
-            )
+            apply_stats(run, stats)
             run.equity_curve = stats["equity_curve"]
             run.completed_at = datetime.now(timezone.utc)
 
@@ -288,6 +284,108 @@ class BacktestEngine:
             await session.commit()
             return BacktestResult(run_id=run_id, status="failed", error=str(e))
 
+    def _simulate(
+        self,
+        config: BacktestConfig,
+        candles: list[Candle],
+        portfolio: SimPortfolio,
+        rankings: list[RankingContext] | None = None,
+    ) -> Iterator[None]:
+        """Replay candles through the strategy and simulated portfolio.
+
+        Indicator series, scores and ranking contexts are derived once for
+        the whole history (see precompute_rankings); the loop itself only
+        does strategy evaluation and portfolio bookkeeping. Mutates
+        ``portfolio`` in place and yields every 50 bars so an in-process
+        caller can hand control back to the event loop.
+
+        Args:
+            config: Backtest configuration.
+            candles: Historical candles including the warmup window.
+            portfolio: Simulated portfolio to trade on.
+            rankings: Precomputed per-bar ranking contexts for these candles
+                (computed here if omitted).
+        """
+        strategy_cls = STRATEGY_REGISTRY.get(config.strategy)
+        if not strategy_cls:
+            raise ValueError(f"Unknown strategy: {config.strategy}")
+        strategy = strategy_cls()
+
+        if rankings is None:
+            rankings = precompute_rankings(config.symbol, candles)
+
+        # Bar-by-bar loop (starting after warmup)
+        for i in range(WARMUP_BARS, len(candles)):
+            if i % 50 == 0:
+                yield
+
+            candle = candles[i]
+            timestamp = candle.open_time
+            close_price = float(candle.close)
+            prices = {config.symbol: close_price}
+            ranking = rankings[i - WARMUP_BARS]
+
+            # Check SL/TP against current candle
+            candle_data = {
+                config.symbol: {
+                    "high": float(candle.high),
+                    "low": float(candle.low),
+                    "close": close_price,
+                }
+            }
+            portfolio.check_sl_tp(candle_data, timestamp)
+
+            # Build minimal AgentContext
+            context = self._build_context(
+                config, portfolio, [ranking], prices,
+            )
+
+            # Evaluate strategy
+            action = strategy.evaluate(context)
+
+            # Execute action
+            if action.action in (ActionType.OPEN_LONG, ActionType.OPEN_SHORT):
+                if action.symbol and action.symbol == config.symbol:
+                    direction = (
+                        "long" if action.action == ActionType.OPEN_LONG
+                        else "short"
+                    )
+                    portfolio.open_position(
+                        symbol=config.symbol,
+                        direction=direction,
+                        price=close_price,
+                        size_pct=action.position_size_pct or 0.10,
+                        sl_pct=(
+                            config.stop_loss_pct
+                            if config.stop_loss_pct is not None
+                            else action.stop_loss_pct
+                        ),
+                        tp_pct=(
+                            config.take_profit_pct
+                            if config.take_profit_pct is not None
+                            else action.take_profit_pct
+                        ),
+                        timestamp=timestamp,
+                        prices=prices,
+                    )
+            elif action.action == ActionType.CLOSE:
+                if action.symbol and action.symbol == config.symbol:
+                    portfolio.close_position(
+                        config.symbol, close_price,
+                        "strategy", timestamp,
+                    )
+
+            # Snapshot equity
+            portfolio.update_equity(prices, timestamp)
+
+        # Force-close remaining positions at last candle price
+        last_candle = candles[-1]
+        last_price = float(last_candle.close)
+        last_ts = last_candle.open_time
+        for symbol in list(portfolio.positions.keys()):
+            portfolio.close_position(symbol, last_price, "backtest_end", last_ts)
+        portfolio.update_equity({config.symbol: last_price}, last_ts)
+
     async def _fetch_candles(
         self,
         symbol: str,
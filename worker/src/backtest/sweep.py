@@ -0,0 +1,221 @@
+"""Batch backtests over a strategy x symbol x timeframe x SL/TP grid.
+
+Candles are fetched once per (symbol, timeframe) and the strategy-independent
+per-bar rankings are computed once from them; every strategy / SL/TP
+combination for that pair then reuses both. With a compute pool the
+combinations are split across worker processes; without one they run on the
+event loop, yielding between bars.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.agents.schemas import RankingContext
+from src.backtest.engine import (
+    WARMUP_BARS,
+    BacktestConfig,
+    BacktestEngine,
+    apply_stats,
+    precompute_rankings,
+    simulate_backtest,
+)
+from src.backtest.portfolio import SimPortfolio
+from src.exchange.types import Candle
+from src.models.db import BacktestRun, BacktestSweep
+
+logger = logging.getLogger(__name__)
+
+MAX_SWEEP_COMBINATIONS = 1000
+
+
+@dataclass
+class SweepConfig:
+    """Grid of backtests sharing one date range and starting balance."""
+
+    strategies: list[str]
+    symbols: list[str]
+    timeframes: list[str]
+    start_date: datetime
+    end_date: datetime
+    # (stop_loss_pct, take_profit_pct) pairs; None keeps the strategy's own value
+    sl_tp_grid: list[tuple[float | None, float | None]] = field(
+        default_factory=lambda: [(None, None)]
+    )
+    initial_balance: float = 10000.0
+
+    @property
+    def total_combinations(self) -> int:
+        return (
+            len(self.strategies) * len(self.symbols)
+            * len(self.timeframes) * len(self.sl_tp_grid)
+        )
+
+    def groups(self) -> list[tuple[str, str, list[BacktestConfig]]]:
+        """Combinations grouped by the (symbol, timeframe) candles they share."""
+        groups = []
+        for symbol, timeframe in itertools.product(self.symbols, self.timeframes):
+            configs = [
+                BacktestConfig(
+                    strategy=strategy,
+                    timeframe=timeframe,
+                    symbol=symbol,
+                    start_date=self.start_date,
+                    end_date=self.end_date,
+                    initial_balance=self.initial_balance,
+                    stop_loss_pct=sl,
+                    take_profit_pct=tp,
+                )
+                for strategy, (sl, tp) in itertools.product(self.strategies, self.sl_tp_grid)
+            ]
+            groups.append((symbol, timeframe, configs))
+        return groups
+
+
+def simulate_group(
+    configs: list[BacktestConfig],
+    candles: list[Candle],
+    rankings: list[RankingContext],
+) -> list[dict]:
+    """Simulate several configs over shared candles (process-pool entry point).
+
+    Returns:
+        One ``{"stats": ...}`` or ``{"error": ...}`` dict per config, in order.
+    """
+    results = []
+    for config in configs:
+        try:
+            portfolio = simulate_backtest(config, candles, rankings)
+            results.append({"stats": portfolio.get_stats()})
+        except Exception as e:
+            results.append({"error": str(e)})
+    return results
+
+
+class BacktestSweepEngine(BacktestEngine):
+    """Runs a SweepConfig and stores one BacktestRun per combination."""
+
+    async def run_sweep(
+        self, sweep_id: int, config: SweepConfig, session: AsyncSession
+    ) -> None:
+        """Execute every combination of a sweep and persist the results matrix.
+
+        Args:
+            sweep_id: Existing BacktestSweep row id.
+            config: Sweep grid.
+            session: Database session for persisting results.
+        """
+        result = await session.execute(
+            select(BacktestSweep).where(BacktestSweep.id == sweep_id)
+        )
+        sweep = result.scalar_one()
+        sweep.status = "running"
+        await session.commit()
+
+        try:
+            for symbol, timeframe, configs in config.groups():
+                results = await self._run_group(symbol, timeframe, configs)
+                now = datetime.now(timezone.utc)
+                for cfg, outcome in zip(configs, results):
+                    run = BacktestRun(
+                        agent_name=f"bt-{cfg.strategy}",
+                        strategy_archetype=cfg.strategy,
+                        timeframe=cfg.timeframe,
+                        symbol=cfg.symbol,
+                        start_date=cfg.start_date,
+                        end_date=cfg.end_date,
+                        initial_balance=Decimal(str(cfg.initial_balance)),
+                        sweep_id=sweep_id,
+                        stop_loss_pct=_to_decimal(cfg.stop_loss_pct),
+                        take_profit_pct=_to_decimal(cfg.take_profit_pct),
+                        completed_at=now,
+                    )
+                    if "stats" in outcome:
+                        run.status = "completed"
+                        apply_stats(run, outcome["stats"])
+                    else:
+                        run.status = "failed"
+                        run.error_message = outcome["error"][:2000]
+                    session.add(run)
+
+                sweep.completed_combinations = (sweep.completed_combinations or 0) + len(configs)
+                await session.commit()
+
+            sweep.status = "completed"
+            sweep.completed_at = datetime.now(timezone.utc)
+            await session.commit()
+            logger.info(
+                f"Backtest sweep {sweep_id} completed: {config.total_combinations} combinations"
+            )
+
+        except asyncio.CancelledError:
+            logger.info(f"Backtest sweep {sweep_id} cancelled by user")
+            await session.rollback()
+            sweep.status = "cancelled"
+            sweep.error_message = "Cancelled by user"
+            sweep.completed_at = datetime.now(timezone.utc)
+            await session.commit()
+
+        except Exception as e:
+            logger.exception(f"Backtest sweep {sweep_id} failed: {e}")
+            await session.rollback()
+            sweep.status = "failed"
+            sweep.error_message = str(e)[:2000]
+            sweep.completed_at = datetime.now(timezone.utc)
+            await session.commit()
+
+    async def _run_group(
+        self, symbol: str, timeframe: str, configs: list[BacktestConfig]
+    ) -> list[dict]:
+        """Fetch candles once and simulate every config for one symbol/timeframe."""
+        first = configs[0]
+        try:
+            candles = await self._fetch_candles(
+                symbol, timeframe, first.start_date, first.end_date
+            )
+        except Exception as e:
+            return [{"error": f"Candle fetch failed: {e}"}] * len(configs)
+
+        if len(candles) < WARMUP_BARS + 10:
+            error = (
+                f"Insufficient candles: got {len(candles)}, "
+                f"need at least {WARMUP_BARS + 10}"
+            )
+            return [{"error": error}] * len(configs)
+
+        if self.compute_pool is None:
+            # Indicator history has no yield points, so it runs off the loop;
+            # each simulation yields every 50 bars like a single backtest does.
+            rankings = await asyncio.to_thread(precompute_rankings, symbol, candles)
+            results = []
+            for cfg in configs:
+                try:
+                    portfolio = SimPortfolio(cfg.initial_balance)
+                    for _ in self._simulate(cfg, candles, portfolio, rankings):
+                        await asyncio.sleep(0)
+                    results.append({"stats": portfolio.get_stats()})
+                except Exception as e:
+                    results.append({"error": str(e)})
+            return results
+
+        rankings = await self.compute_pool.run(precompute_rankings, symbol, candles)
+        n_chunks = min(self.compute_pool.max_workers, len(configs))
+        size = -(-len(configs) // n_chunks)
+        chunks = [configs[i:i + size] for i in range(0, len(configs), size)]
+        chunk_results = await asyncio.gather(*[
+            self.compute_pool.run(simulate_group, chunk, candles, rankings)
+            for chunk in chunks
+        ])
+        return [outcome for chunk in chunk_results for outcome in chunk]
+
+
+def _to_decimal(value: float | None) -> Decimal | None:
+    return Decimal(str(value)) if value is not None else None
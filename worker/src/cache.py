@@ -2,9 +2,26 @@
 
 All operations are fail-open: if Redis is down or unconfigured,
 the system works exactly as before.
+
+cache_get/cache_set are plain Redis calls. Hot read paths go through
+tiered_cache, which adds an in-process tier, single-flight loading and
+stale-while-revalidate on top.
+
+Invalidation uses versioned namespaces instead of deleting keys: each
+namespace (e.g. ``timeframe:1h``) has a generation counter in Redis that is
+embedded in its keys. bump_namespace() INCRs the counter, after which the
+old keys are unreachable and simply age out via their TTL — O(1) however
+many keys the namespace has.
 """
 
+import asyncio
+import json
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
 
 from redis.asyncio import Redis
 
@@ -45,15 +62,235 @@ async def cache_set(key: str, value: str, ttl: int) -> None:
         logger.warning(f"Cache SET failed for {key}: {e}")
 
 
-async def cache_delete(pattern: str) -> None:
+async def cache_delete(*keys: str) -> None:
+    """Delete exact keys (e.g. web-side keys the worker cannot version)."""
     r = await get_redis()
-    if not r:
+    if not r or not keys:
         return
     try:
-        keys = []
-        async for key in r.scan_iter(match=pattern):
-            keys.append(key)
-        if keys:
-            await r.delete(*keys)
+        await r.delete(*keys)
     except Exception as e:
-        logger.warning(f"Cache DELETE failed for {pattern}: {e}")
+        logger.warning(f"Cache DELETE failed for {', '.join(keys)}: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Versioned namespaces
+# ---------------------------------------------------------------------------
+
+# Local copy of each namespace generation. The worker runs as a single
+# instance and every bump goes through bump_namespace(), so after the first
+# read from Redis the local copy stays current without further round trips.
+_namespace_versions: dict[str, int] = {}
+
+
+async def namespace_version(namespace: str) -> int:
+    """Current generation of a namespace (0 if never bumped)."""
+    version = _namespace_versions.get(namespace)
+    if version is not None:
+        return version
+    r = await get_redis()
+    version = 0
+    if r:
+        try:
+            version = int(await r.get(f"cache_ns:{namespace}") or 0)
+        except Exception as e:
+            logger.warning(f"Cache namespace read failed for {namespace}: {e}")
+            return 0
+    # A bump may have landed while reading; never move backwards
+    version = max(version, _namespace_versions.get(namespace, 0))
+    _namespace_versions[namespace] = version
+    return version
+
+
+async def bump_namespace(namespace: str) -> int:
+    """Invalidate every key in a namespace by advancing its generation.
+
+    Returns:
+        The new generation.
+    """
+    version = _namespace_versions.get(namespace, 0) + 1
+    r = await get_redis()
+    if r:
+        try:
+            version = max(version, await r.incr(f"cache_ns:{namespace}"))
+        except Exception as e:
+            logger.warning(f"Cache namespace bump failed for {namespace}: {e}")
+    _namespace_versions[namespace] = version
+    return version
+
+
+# ---------------------------------------------------------------------------
+# Two-tier cache: in-process TTL/LRU in front of Redis
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Entry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+    namespace: str | None
+
+
+class TieredCache:
+    """Read-through cache with an in-process LRU tier in front of Redis.
+
+    - Hits on the local tier never leave the process.
+    - Concurrent misses for one key share a single load (single-flight).
+    - Entries past their TTL are served for ``stale_ttl`` more seconds
+      while one background load refreshes them (stale-while-revalidate).
+    - Keys can live in a versioned namespace; invalidate() bumps it, so
+      both tiers (and loads still in flight) move to fresh keys at once.
+
+    Values round-trip through JSON, so callers see the same shapes whether
+    they hit either tier or the loader; treat them as read-only.
+
+    Args:
+        max_entries: Local tier size; least recently used entries go first.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        *,
+        namespace: str | None = None,
+        stale_ttl: int = 0,
+        negative_ttl: int | None = None,
+    ) -> Any:
+        """Return the cached value for a key, loading it on a miss.
+
+        Args:
+            key: Cache key (also the Redis key, plus the namespace version).
+            loader: Coroutine function producing a JSON-serializable value.
+            ttl: Seconds the value is fresh.
+            namespace: Versioned namespace the key belongs to.
+            stale_ttl: Extra seconds an expired value may be served while
+                it is refreshed in the background.
+            negative_ttl: Seconds an empty value (a miss upstream) is cached
+                for instead of ``ttl``.
+        """
+        scope = None
+        if namespace is not None:
+            scope = (namespace, await namespace_version(namespace))
+            key = f"{key}:v{scope[1]}"
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            if now < entry.fresh_until:
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self._start_load(
+                    key, loader, ttl, stale_ttl, negative_ttl, scope, use_redis=False
+                )
+                return entry.value
+            del self._entries[key]
+
+        task = self._start_load(
+            key, loader, ttl, stale_ttl, negative_ttl, scope, use_redis=True
+        )
+        # Shield the shared load from callers that disconnect mid-request
+        return await asyncio.shield(task)
+
+    async def invalidate(self, namespace: str) -> None:
+        """Invalidate every key in a namespace, in both tiers."""
+        await bump_namespace(namespace)
+        # Old local entries are unreachable now; free their slots early
+        for key in [k for k, e in self._entries.items() if e.namespace == namespace]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop the local tier (Redis is left untouched)."""
+        self._entries.clear()
+        self._inflight.clear()
+
+    def _start_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        negative_ttl: int | None,
+        scope: tuple[str, int] | None,
+        use_redis: bool,
+    ) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._load(key, loader, ttl, stale_ttl, negative_ttl, scope, use_redis)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_load(key, t))
+        return task
+
+    def _finish_load(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Cache load failed for {key}: {task.exception()}")
+
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        negative_ttl: int | None,
+        scope: tuple[str, int] | None,
+        use_redis: bool,
+    ) -> Any:
+        if use_redis:
+            payload, remaining = await _get_with_ttl(key)
+            if payload is not None:
+                value = json.loads(payload)
+                self._store(key, value, remaining or ttl, stale_ttl, scope)
+                return value
+
+        payload = json.dumps(await loader(), default=str)
+        value = json.loads(payload)
+        if not value and negative_ttl is not None:
+            ttl = negative_ttl
+        self._store(key, value, ttl, stale_ttl, scope)
+        await cache_set(key, payload, ttl)
+        return value
+
+    def _store(
+        self, key: str, value: Any, ttl: float, stale_ttl: int, scope: tuple[str, int] | None
+    ) -> None:
+        namespace = None
+        if scope is not None:
+            namespace, version = scope
+            if _namespace_versions.get(namespace) != version:
+                # Invalidated while loading: the key is already unreachable
+                return
+        now = time.monotonic()
+        self._entries[key] = _Entry(value, now + ttl, now + ttl + stale_ttl, namespace)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+async def _get_with_ttl(key: str) -> tuple[str | None, int | None]:
+    """Redis value and its remaining TTL in seconds."""
+    r = await get_redis()
+    if not r:
+        return None, None
+    try:
+        pipe = r.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.ttl(key)
+        payload, remaining = await pipe.execute()
+        return payload, remaining if remaining and remaining > 0 else None
+    except Exception as e:
+        logger.warning(f"Cache GET failed for {key}: {e}")
+        return None, None
+
+
+tiered_cache = TieredCache(max_entries=settings.cache_local_max_entries)
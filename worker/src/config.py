@@ -9,6 +9,14 @@ class Settings(BaseSettings):
     binance_base_url: str = "https://api.binance.com"
     min_volume_usd: float = 1_000_000  # Minimum 24h volume for symbol inclusion
     top_symbols_limit: int = 100  # Max symbols to process per pipeline run (0 = unlimited)
+    binance_weight_limit_per_minute: int = 6000  # IP request-weight limit (REQUEST_WEIGHT 1m)
+    binance_max_concurrent_requests: int = 20  # In-flight cap while used weight is low
+
+    # Indicators
+    indicator_streaming_enabled: bool = True  # Fold new candles into per-symbol state
+    indicator_checkpoint_bars: int = 96  # Full rebuild after this many folded candles
+    # Worker processes for indicators/ranking/backtests (0 = in-process)
+    compute_pool_workers: int = 0
 
     # Anthropic
     anthropic_api_key: str = ""
@@ -22,7 +30,14 @@ class Settings(BaseSettings):
     telegram_chat_id: str = ""
 
     # Redis (Upstash)
-    redis_url: str = ""  # Empty = caching disabled
+    redis_url: str = ""  # Empty = Redis tier disabled (in-process tier still active)
+    cache_local_max_entries: int = 512  # In-process LRU tier in front of Redis
+
+    # Outbound HTTP pool (one keep-alive client per API host)
+    http_max_connections_per_host: int = 20
+    http_max_keepalive_per_host: int = 10
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = True  # Negotiated via ALPN; falls back to HTTP/1.1 per host
 
     # Exchange (Binance copy-trade)
     exchange_encryption_key: str = ""
@@ -46,6 +61,7 @@ class Settings(BaseSettings):
 
     # Memecoins
     helius_api_key: str = ""
+    helius_requests_per_second: int = 10  # Free tier limit, shared by every HeliusClient
     memecoin_enabled: bool = False
     memecoin_wallet_poll_minutes: int = 360  # wallet cross-ref refresh: every 6h
     memecoin_twitter_enabled: bool = False
@@ -59,6 +75,10 @@ class Settings(BaseSettings):
     fleet_lessons_in_context: bool = False
     tweet_filter_enabled: bool = False
 
+    # Agent cycles
+    # Agents processed in parallel (each holds a DB connection); 1 = sequential
+    agent_cycle_concurrency: int = 4
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
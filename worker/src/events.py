@@ -2,62 +2,209 @@
 
 Simple fan-out to all subscribers per topic. No Redis needed — single
 worker instance on Fly.io.
+
+Each event is serialized to JSON once in publish() and gets a monotonic
+per-topic id (``<epoch>-<seq>``, the epoch changing on every worker start).
+The last REPLAY_SIZE events of each topic are kept in a ring buffer, so:
+
+- a browser reconnecting with Last-Event-ID is replayed what it missed;
+- a subscriber whose queue overflows is paused and caught up from the
+  buffer once it has drained its queue, instead of losing events.
+
+Topics that stream deltas (rankings) also register baseline events. They
+are sent to new subscribers and to anyone too far behind for the buffer.
 """
 
 import asyncio
 import itertools
+import json
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+QUEUE_SIZE = 10
+REPLAY_SIZE = 200
+
+# (event_id, serialized payload)
+Event = tuple[str, str]
+
+
+@dataclass
+class Subscription:
+    """One subscriber's queue and delivery position."""
+
+    id: int
+    topic: str
+    queue: asyncio.Queue[Event]
+    # Seq of the last event put on the queue (or covered by its backlog)
+    last_seq: int = 0
+    # Set when the queue overflowed; publish() skips the subscriber until
+    # catch_up() replays the missed events from the buffer
+    lagged: bool = False
+
+
+@dataclass
+class _Topic:
+    subscribers: dict[int, Subscription] = field(default_factory=dict)
+    buffer: deque[tuple[int, str]] = field(default_factory=lambda: deque(maxlen=REPLAY_SIZE))
+    baselines: dict[str, str] = field(default_factory=dict)
+    seq: int = 0
+    published: int = 0
+    replayed: int = 0
+    resynced: int = 0
+    dropped: int = 0
+
 
 class EventBus:
-    """Asyncio pub/sub with per-subscriber queues."""
+    """Asyncio pub/sub with per-subscriber queues and per-topic replay buffers."""
 
     def __init__(self) -> None:
-        self._subscribers: dict[str, dict[int, asyncio.Queue]] = {}
+        self._topics: dict[str, _Topic] = {}
         self._id_counter = itertools.count()
+        self._epoch = format(time.time_ns() // 1_000_000, "x")
 
-    def subscribe(self, topic: str) -> tuple[int, asyncio.Queue]:
-        """Subscribe to a topic. Returns (subscriber_id, queue)."""
-        if topic not in self._subscribers:
-            self._subscribers[topic] = {}
+    def subscribe(
+        self, topic: str, last_event_id: str | None = None
+    ) -> tuple[Subscription, list[Event]]:
+        """Subscribe to a topic.
 
+        Args:
+            topic: Topic name.
+            last_event_id: Id of the last event the client saw, if resuming.
+
+        Returns:
+            (subscription, backlog) — events to send before reading the
+            queue: the missed events when resuming, otherwise the topic's
+            baselines.
+        """
+        state = self._topics.setdefault(topic, _Topic())
         sub_id = next(self._id_counter)
-        queue: asyncio.Queue = asyncio.Queue(maxsize=10)
-        self._subscribers[topic][sub_id] = queue
+        sub = Subscription(sub_id, topic, asyncio.Queue(maxsize=QUEUE_SIZE), last_seq=state.seq)
+
+        backlog = None
+        if last_event_id is not None:
+            backlog = self._replay(state, self._parse_id(last_event_id))
+            if backlog is not None:
+                state.replayed += len(backlog)
+        if backlog is None:
+            backlog = self._baselines(state)
+
+        state.subscribers[sub_id] = sub
         logger.debug(f"SSE subscriber {sub_id} joined topic '{topic}'")
-        return sub_id, queue
+        return sub, backlog
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        """Remove a subscriber from its topic."""
+        state = self._topics.get(sub.topic)
+        if state and state.subscribers.pop(sub.id, None):
+            logger.debug(f"SSE subscriber {sub.id} left topic '{sub.topic}'")
+
+    def catch_up(self, sub: Subscription) -> list[Event]:
+        """Events a lagged subscriber missed; call once its queue is empty.
+
+        Falls back to the topic baselines (or skips ahead, counting the lost
+        events as dropped) when the buffer no longer reaches back that far.
+        """
+        state = self._topics[sub.topic]
+        sub.lagged = False
+        backlog = self._replay(state, sub.last_seq)
+        if backlog is not None:
+            state.replayed += len(backlog)
+        else:
+            backlog = self._baselines(state)
+            if not backlog:
+                oldest = state.buffer[0][0] if state.buffer else state.seq + 1
+                state.dropped += oldest - sub.last_seq - 1
+                backlog = [(self._event_id(s), p) for s, p in state.buffer]
+        sub.last_seq = state.seq
+        return backlog
+
+    def set_baseline(self, topic: str, key: str, data: dict) -> None:
+        """Store the full-state event for one key of a delta-encoded topic.
 
-    def unsubscribe(self, topic: str, sub_id: int) -> None:
-        """Remove a subscriber from a topic."""
-        subs = self._subscribers.get(topic)
-        if subs and sub_id in subs:
-            del subs[sub_id]
-            logger.debug(f"SSE subscriber {sub_id} left topic '{topic}'")
+        Args:
+            topic: Topic the baseline belongs to.
+            key: Baseline slot within the topic (e.g. a timeframe).
+            data: Full-state event sent to new and lagging subscribers.
+        """
+        state = self._topics.setdefault(topic, _Topic())
+        state.baselines[key] = json.dumps(data)
 
     async def publish(self, topic: str, data: dict) -> None:
-        """Fan out data to all subscribers on a topic.
+        """Buffer an event and fan it out to all subscribers on a topic.
 
-        Uses put_nowait with backpressure — slow clients drop events
-        rather than blocking the publisher.
+        Uses put_nowait with backpressure — a slow client never blocks the
+        publisher. When its queue is full it is marked lagged and receives
+        the missed events from the replay buffer once it catches up.
         """
-        subs = self._subscribers.get(topic, {})
-        if not subs:
-            return
+        state = self._topics.setdefault(topic, _Topic())
+        state.seq += 1
+        state.published += 1
+        payload = json.dumps(data)
+        state.buffer.append((state.seq, payload))
+        event = (self._event_id(state.seq), payload)
 
-        dropped = 0
-        for queue in subs.values():
+        lagging = 0
+        for sub in state.subscribers.values():
+            if sub.lagged:
+                continue
             try:
-                queue.put_nowait(data)
+                sub.queue.put_nowait(event)
+                sub.last_seq = state.seq
             except asyncio.QueueFull:
-                dropped += 1
+                sub.lagged = True
+                lagging += 1
 
-        if dropped:
+        if lagging:
             logger.warning(
-                f"SSE topic '{topic}': dropped event for {dropped}/{len(subs)} slow subscribers"
+                f"SSE topic '{topic}': {lagging}/{len(state.subscribers)} subscribers "
+                f"fell behind, replaying from buffer"
             )
 
+    def stats(self) -> dict[str, dict]:
+        """Per-topic delivery metrics."""
+        return {
+            topic: {
+                "subscribers": len(state.subscribers),
+                "lagging": sum(1 for s in state.subscribers.values() if s.lagged),
+                "published": state.published,
+                "buffered": len(state.buffer),
+                "replayed": state.replayed,
+                "resynced": state.resynced,
+                "dropped": state.dropped,
+            }
+            for topic, state in self._topics.items()
+        }
+
+    def _replay(self, state: _Topic, after_seq: int | None) -> list[Event] | None:
+        """Buffered events after a seq, or None if the buffer can't cover it."""
+        if after_seq is None or after_seq > state.seq:
+            return None
+        oldest = state.buffer[0][0] if state.buffer else state.seq + 1
+        if after_seq < oldest - 1:
+            return None
+        return [(self._event_id(s), p) for s, p in state.buffer if s > after_seq]
+
+    def _baselines(self, state: _Topic) -> list[Event]:
+        if not state.baselines:
+            return []
+        state.resynced += 1
+        event_id = self._event_id(state.seq)
+        return [(event_id, payload) for payload in state.baselines.values()]
+
+    def _event_id(self, seq: int) -> str:
+        return f"{self._epoch}-{seq}"
+
+    def _parse_id(self, event_id: str) -> int | None:
+        """Seq of an event id from this process, else None."""
+        epoch, _, seq = event_id.partition("-")
+        if epoch != self._epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
 
 # Module-level singleton
 event_bus = EventBus()
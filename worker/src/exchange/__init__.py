@@ -1,5 +1,6 @@
 """Binance exchange client for fetching market data."""
 
+from src.exchange.candle_store import CandleStore
 from src.exchange.client import BinanceAPIError, BinanceClient
 from src.exchange.types import (
     Candle,
@@ -13,6 +14,7 @@ from src.exchange.types import (
 __all__ = [
     "BinanceClient",
     "BinanceAPIError",
+    "CandleStore",
     "Symbol",
     "Candle",
     "OHLCVDataFrame",
@@ -0,0 +1,123 @@
+"""In-process OHLCV candle store for delta fetching.
+
+Keeps the most recent klines per (symbol, interval) as compact NumPy
+structured arrays so BinanceClient only has to request candles newer than
+the last stored open_time instead of the full window on every run.
+
+The newest stored candle is usually still open; it is replaced when the
+next delta fetch (which starts at its open_time) returns the final values.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+
+from src.exchange.types import Candle
+
+# Milliseconds per candle for each supported interval
+INTERVAL_MS: dict[str, int] = {
+    "15m": 15 * 60 * 1000,
+    "30m": 30 * 60 * 1000,
+    "1h": 60 * 60 * 1000,
+    "4h": 4 * 60 * 60 * 1000,
+    "1d": 24 * 60 * 60 * 1000,
+    "1w": 7 * 24 * 60 * 60 * 1000,
+}
+
+CANDLE_DTYPE = np.dtype([
+    ("open_time", "i8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+    ("close_time", "i8"),
+    ("quote_volume", "f8"),
+    ("trades", "i8"),
+])
+
+
+def rows_to_array(rows: list[list]) -> np.ndarray:
+    """Convert raw Binance kline rows to a CANDLE_DTYPE array."""
+    return np.array(
+        [
+            (
+                int(r[0]), float(r[1]), float(r[2]), float(r[3]), float(r[4]),
+                float(r[5]), int(r[6]), float(r[7]), int(r[8]),
+            )
+            for r in rows
+        ],
+        dtype=CANDLE_DTYPE,
+    )
+
+
+def array_to_candles(arr: np.ndarray) -> list[Candle]:
+    """Convert a CANDLE_DTYPE array back to Candle objects."""
+    return [
+        Candle(
+            open_time=datetime.fromtimestamp(open_time / 1000, tz=timezone.utc),
+            open=Decimal(repr(open_)),
+            high=Decimal(repr(high)),
+            low=Decimal(repr(low)),
+            close=Decimal(repr(close)),
+            volume=Decimal(repr(volume)),
+            close_time=datetime.fromtimestamp(close_time / 1000, tz=timezone.utc),
+            quote_volume=Decimal(repr(quote_volume)),
+            trades=trades,
+        )
+        for (
+            open_time, open_, high, low, close, volume, close_time, quote_volume, trades
+        ) in arr.tolist()
+    ]
+
+
+class CandleStore:
+    """Append-only ring of recent candles per (symbol, interval).
+
+    Args:
+        max_candles: Candles retained per key; older ones are dropped.
+    """
+
+    def __init__(self, max_candles: int = 500) -> None:
+        self.max_candles = max_candles
+        self._data: dict[tuple[str, str], np.ndarray] = {}
+
+    def get(self, symbol: str, interval: str, limit: int | None = None) -> np.ndarray | None:
+        """Return the newest ``limit`` stored candles (all if None)."""
+        arr = self._data.get((symbol, interval))
+        if arr is None:
+            return None
+        return arr if limit is None else arr[-limit:]
+
+    def last_open_time(self, symbol: str, interval: str) -> int | None:
+        """Open time (ms) of the newest stored candle."""
+        arr = self._data.get((symbol, interval))
+        if arr is None or len(arr) == 0:
+            return None
+        return int(arr["open_time"][-1])
+
+    def replace(self, symbol: str, interval: str, rows: list[list]) -> None:
+        """Store a full window, discarding anything held for the key."""
+        self._data[(symbol, interval)] = rows_to_array(rows)[-self.max_candles:]
+
+    def merge(self, symbol: str, interval: str, rows: list[list]) -> None:
+        """Append newer candles, overwriting stored ones from the first new open_time."""
+        if not rows:
+            return
+        new = rows_to_array(rows)
+        existing = self._data.get((symbol, interval))
+        if existing is None:
+            self._data[(symbol, interval)] = new[-self.max_candles:]
+            return
+
+        keep = np.searchsorted(existing["open_time"], new["open_time"][0], side="left")
+        merged = np.concatenate([existing[:keep], new])
+        self._data[(symbol, interval)] = merged[-self.max_candles:]
+
+    def clear(self) -> None:
+        """Drop all stored candles."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
@@ -11,24 +12,18 @@ import httpx
 
 from src.cache import cache_get, cache_set
 from src.config import settings
+from src.exchange.candle_store import INTERVAL_MS, CandleStore, array_to_candles
+from src.exchange.rate_limiter import WeightRateLimiter, binance_rate_limiter, request_weight
 from src.exchange.types import (
     Candle,
     OHLCVDataFrame,
     Symbol,
     candles_to_dataframe,
 )
+from src.http_pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
-# TTL for klines cache by interval
-KLINES_TTL: dict[str, int] = {
-    "15m": 120,
-    "30m": 300,
-    "1h": 600,
-    "4h": 1800,
-    "1d": 7200,
-}
-
 FUTURES_BASE_URL = "https://fapi.binance.com"
 
 BLOCKED_BASE_ASSETS = {
@@ -54,18 +49,17 @@ class BinanceClient:
     """HTTP client for Binance REST API with rate limiting.
 
     Rate limits:
-    - 1200 requests per minute (weight-based, most endpoints weight=1)
-    - We use a semaphore to limit concurrent requests
-    - We add a small delay between requests to stay well under the limit
+    - Binance limits request weight per IP per minute
+    - Requests go through a shared WeightRateLimiter that charges endpoint
+      weight from a token bucket and adapts concurrency to the
+      X-MBX-USED-WEIGHT-1M response header
 
     Retry logic:
     - 3 retries with exponential backoff for timeouts and 5xx errors
-    - Respect Retry-After header for 429 (rate limit) responses
+    - Respect Retry-After header for 429/418 responses, pausing the shared limiter
     """
 
-    # Rate limiting configuration
-    MAX_CONCURRENT_REQUESTS = 10
-    REQUEST_DELAY_SECONDS = 0.05  # 50ms between requests = max 1200/min
+    # Retry configuration
     MAX_RETRIES = 3
     BASE_RETRY_DELAY = 1.0  # Base delay in seconds for exponential backoff
 
@@ -75,17 +69,25 @@ class BinanceClient:
     TICKER_PRICE_ENDPOINT = "/api/v3/ticker/price"
     KLINES_ENDPOINT = "/api/v3/klines"
 
-    def __init__(self, base_url: str | None = None, timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 30.0,
+        candle_store: CandleStore | None = None,
+        rate_limiter: WeightRateLimiter | None = None,
+    ):
         """Initialize the Binance client.
 
         Args:
             base_url: Binance API base URL. Defaults to settings.binance_base_url.
             timeout: Request timeout in seconds.
+            candle_store: Store used for delta kline fetches (default: new one).
+            rate_limiter: Weight limiter (default: the process-wide shared one).
         """
         self.base_url = base_url or settings.binance_base_url
         self.timeout = timeout
-        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
-        self._last_request_time: float = 0
+        self.candle_store = candle_store or CandleStore()
+        self.rate_limiter = rate_limiter or binance_rate_limiter
 
     async def _request(
         self, method: str, endpoint: str, params: dict[str, Any] | None = None
@@ -104,57 +106,55 @@ class BinanceClient:
             BinanceAPIError: If the API returns an error after all retries
         """
         url = f"{self.base_url}{endpoint}"
+        weight = request_weight(endpoint, params)
 
         for attempt in range(self.MAX_RETRIES + 1):
-            async with self._semaphore:
-                # Rate limiting: ensure minimum delay between requests
-                now = asyncio.get_event_loop().time()
-                elapsed = now - self._last_request_time
-                if elapsed < self.REQUEST_DELAY_SECONDS:
-                    await asyncio.sleep(self.REQUEST_DELAY_SECONDS - elapsed)
-                self._last_request_time = asyncio.get_event_loop().time()
-
+            async with self.rate_limiter.slot(weight):
                 try:
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        response = await client.request(method, url, params=params)
-
-                        if response.status_code == 200:
-                            return response.json()
-
-                        # Handle rate limiting
-                        if response.status_code == 429:
-                            retry_after = int(
-                                response.headers.get("Retry-After", 60)
+                    client = get_http_client(url)
+                    response = await client.request(
+                        method, url, params=params, timeout=self.timeout
+                    )
+                    self.rate_limiter.observe(response.headers)
+
+                    if response.status_code == 200:
+                        return response.json()
+
+                    # Handle rate limiting (418 = IP auto-banned after ignoring 429s).
+                    # Pausing the shared limiter holds back every other caller too.
+                    if response.status_code in (418, 429):
+                        retry_after = int(
+                            response.headers.get("Retry-After", 60)
+                        )
+                        self.rate_limiter.pause(retry_after)
+                        if attempt < self.MAX_RETRIES:
+                            logger.warning(
+                                f"Rate limited, waiting {retry_after}s before retry"
                             )
-                            if attempt < self.MAX_RETRIES:
-                                logger.warning(
-                                    f"Rate limited, waiting {retry_after}s before retry"
-                                )
-                                await asyncio.sleep(retry_after)
-                                continue
-                            raise BinanceAPIError(
-                                429, "Rate limit exceeded", retry_after
+                            continue
+                        raise BinanceAPIError(
+                            response.status_code, "Rate limit exceeded", retry_after
+                        )
+
+                    # Handle server errors with retry
+                    if response.status_code >= 500:
+                        if attempt < self.MAX_RETRIES:
+                            delay = self.BASE_RETRY_DELAY * (2**attempt)
+                            logger.warning(
+                                f"Server error {response.status_code}, "
+                                f"retrying in {delay}s (attempt {attempt + 1})"
                             )
+                            await asyncio.sleep(delay)
+                            continue
 
-                        # Handle server errors with retry
-                        if response.status_code >= 500:
-                            if attempt < self.MAX_RETRIES:
-                                delay = self.BASE_RETRY_DELAY * (2**attempt)
-                                logger.warning(
-                                    f"Server error {response.status_code}, "
-                                    f"retrying in {delay}s (attempt {attempt + 1})"
-                                )
-                                await asyncio.sleep(delay)
-                                continue
-
-                        # Parse error response
-                        try:
-                            error_data = response.json()
-                            message = error_data.get("msg", response.text)
-                        except Exception:
-                            message = response.text
-
-                        raise BinanceAPIError(response.status_code, message)
+                    # Parse error response
+                    try:
+                        error_data = response.json()
+                        message = error_data.get("msg", response.text)
+                    except Exception:
+                        message = response.text
+
+                    raise BinanceAPIError(response.status_code, message)
 
                 except httpx.TimeoutException:
                     if attempt < self.MAX_RETRIES:
@@ -315,6 +315,10 @@ class BinanceClient:
     ) -> list[Candle]:
         """Fetch OHLCV candles for a single symbol.
 
+        When the candle store already holds a full window for the symbol,
+        only candles from the newest stored open_time onward are requested
+        (that candle may have been open when stored) and merged in.
+
         Args:
             symbol: Trading pair symbol, e.g., "BTCUSDT"
             interval: Candle interval: 15m, 30m, 1h, 4h, 1d
@@ -323,25 +327,40 @@ class BinanceClient:
         Returns:
             List of Candle objects, ordered by open_time ascending.
         """
-        # Check cache first (TTL varies by interval)
-        cache_key = f"klines:{symbol}:{interval}"
-        cached = await cache_get(cache_key)
-        if cached:
-            raw = json.loads(cached)
-            logger.debug(f"Cache HIT: {cache_key}")
-            return self._parse_klines(raw)
+        limit = min(limit, 1000)
+        store = self.candle_store
+
+        last_open_ms = store.last_open_time(symbol, interval)
+        stored = store.get(symbol, interval)
+        interval_ms = INTERVAL_MS.get(interval)
+        if (
+            last_open_ms is not None
+            and interval_ms is not None
+            and len(stored) >= limit
+            and limit <= store.max_candles
+        ):
+            now_ms = int(time.time() * 1000)
+            missing = max(0, (now_ms - last_open_ms) // interval_ms) + 1
+            if missing < limit:
+                params = {
+                    "symbol": symbol,
+                    "interval": interval,
+                    "startTime": last_open_ms,
+                    "limit": missing + 1,
+                }
+                data = await self._request("GET", self.KLINES_ENDPOINT, params)
+                store.merge(symbol, interval, data)
+                logger.debug(f"Delta fetch {symbol} {interval}: {len(data)} candles")
+                return array_to_candles(store.get(symbol, interval, limit))
 
         params = {
             "symbol": symbol,
             "interval": interval,
-            "limit": min(limit, 1000),
+            "limit": limit,
         }
 
         data = await self._request("GET", self.KLINES_ENDPOINT, params)
-
-        # Cache the raw Binance response (before Decimal parsing)
-        ttl = KLINES_TTL.get(interval, 300)
-        await cache_set(cache_key, json.dumps(data), ttl)
+        store.replace(symbol, interval, data)
 
         return self._parse_klines(data)
 
@@ -364,12 +383,12 @@ class BinanceClient:
         url = f"{FUTURES_BASE_URL}/fapi/v1/premiumIndex"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                if response.status_code != 200:
-                    logger.warning(f"Funding rates request failed: {response.status_code}")
-                    return {}
-                raw = response.json()
+            client = get_http_client(url)
+            response = await client.get(url, timeout=self.timeout)
+            if response.status_code != 200:
+                logger.warning(f"Funding rates request failed: {response.status_code}")
+                return {}
+            raw = response.json()
         except Exception as e:
             logger.warning(f"Failed to fetch funding rates: {e}")
             return {}
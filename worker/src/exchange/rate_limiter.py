@@ -0,0 +1,191 @@
+"""Weight-aware token-bucket rate limiter for the Binance REST API.
+
+Binance limits each IP by request *weight*, not request count, over a rolling
+one-minute window. Each response reports the server's view of that window in
+the ``X-MBX-USED-WEIGHT-1M`` header. This limiter:
+
+- refills a token bucket at ``weight_limit`` tokens per minute and charges each
+  request its endpoint weight before it is sent;
+- pulls the bucket down to match the server-reported usage, so weight spent
+  by other clients on the same IP (or a previous process) is accounted for;
+- shrinks the number of in-flight requests as reported usage approaches the
+  limit, and restores it as usage falls;
+- pauses all callers after a 429/418 until the ``Retry-After`` deadline.
+
+A single module-level instance (``binance_rate_limiter``) is shared by every
+``BinanceClient``, so overlapping timeframe jobs and backtest fetches draw
+from the same budget.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from typing import Any
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+USED_WEIGHT_HEADER = "x-mbx-used-weight-1m"
+
+# Request weights for the spot endpoints we call, per Binance's current
+# spot REST API reference (developers.binance.com, "Market Data endpoints").
+# Klines are a flat 2 regardless of `limit`; the older 1/2/5/10 tiers no
+# longer apply.
+ENDPOINT_WEIGHTS: dict[str, int] = {
+    "/api/v3/klines": 2,
+    "/api/v3/exchangeInfo": 20,
+    "/api/v3/ticker/24hr": 80,  # all symbols
+    "/api/v3/ticker/price": 4,  # all symbols
+}
+
+
+def request_weight(endpoint: str, params: Mapping[str, Any] | None = None) -> int:
+    """Binance request weight for an endpoint call.
+
+    Args:
+        endpoint: API path, e.g. ``/api/v3/klines``.
+        params: Query parameters. None of the endpoints we call currently
+            has a parameter-dependent weight.
+
+    Returns:
+        The weight charged by Binance (1 for unknown endpoints).
+    """
+    return ENDPOINT_WEIGHTS.get(endpoint, 1)
+
+
+class WeightRateLimiter:
+    """Token bucket over Binance request weight with adaptive concurrency.
+
+    Args:
+        weight_limit: Weight allowed per window by Binance.
+        window_seconds: Length of the rate-limit window.
+        max_concurrency: In-flight request cap while usage is low.
+        min_concurrency: In-flight request cap as usage nears the limit.
+        safety_ratio: Fraction of ``weight_limit`` the bucket may spend.
+        throttle_ratio: Reported usage fraction at which concurrency starts
+            shrinking linearly towards ``min_concurrency``.
+    """
+
+    def __init__(
+        self,
+        weight_limit: int = 6000,
+        window_seconds: float = 60.0,
+        max_concurrency: int = 20,
+        min_concurrency: int = 2,
+        safety_ratio: float = 0.9,
+        throttle_ratio: float = 0.5,
+    ) -> None:
+        self.weight_limit = weight_limit
+        self.capacity = weight_limit * safety_ratio
+        self.refill_per_second = self.capacity / window_seconds
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.safety_ratio = safety_ratio
+        self.throttle_ratio = throttle_ratio
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._concurrency = max_concurrency
+        self._in_flight = 0
+        self.used_weight: int | None = None
+
+        self._bucket_lock = asyncio.Lock()
+        self._slots = asyncio.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        """Current in-flight request cap."""
+        return self._concurrency
+
+    @property
+    def tokens(self) -> float:
+        """Weight currently available (after refill)."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.refill_per_second
+        )
+        self._updated = now
+
+    async def _take(self, weight: int) -> None:
+        """Wait until ``weight`` tokens are available and spend them."""
+        weight = min(weight, self.capacity)
+
+        # The lock queues waiters so a heavy request is not starved by light ones
+        async with self._bucket_lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill()
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                await asyncio.sleep((weight - self._tokens) / self.refill_per_second)
+
+    @asynccontextmanager
+    async def slot(self, weight: int = 1) -> AsyncIterator[None]:
+        """Hold a concurrency slot and spend ``weight`` tokens for one request."""
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._in_flight < self._concurrency)
+            self._in_flight += 1
+        try:
+            await self._take(weight)
+            yield
+        finally:
+            async with self._slots:
+                self._in_flight -= 1
+                self._slots.notify_all()
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Sync the bucket and concurrency with a response's used-weight header."""
+        raw = headers.get(USED_WEIGHT_HEADER) or headers.get(USED_WEIGHT_HEADER.upper())
+        if raw is None:
+            return
+        try:
+            used = int(raw)
+        except (TypeError, ValueError):
+            return
+
+        self.used_weight = used
+        self._refill()
+        self._tokens = max(0.0, min(self._tokens, self.capacity - used))
+
+        usage = used / self.weight_limit
+        if usage <= self.throttle_ratio:
+            target = self.max_concurrency
+        elif usage >= self.safety_ratio:
+            target = self.min_concurrency
+        else:
+            span = (usage - self.throttle_ratio) / (self.safety_ratio - self.throttle_ratio)
+            target = round(
+                self.max_concurrency - span * (self.max_concurrency - self.min_concurrency)
+            )
+        if target != self._concurrency:
+            logger.debug(
+                f"Binance used weight {used}/{self.weight_limit}, "
+                f"concurrency {self._concurrency} -> {target}"
+            )
+            self._concurrency = target
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds`` (after a 429/418) and drain the bucket."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self._concurrency = self.min_concurrency
+
+
+# Module-level singleton shared by every BinanceClient
+binance_rate_limiter = WeightRateLimiter(
+    weight_limit=settings.binance_weight_limit_per_minute,
+    max_concurrency=settings.binance_max_concurrent_requests,
+)
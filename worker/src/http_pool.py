@@ -0,0 +1,72 @@
+"""Process-wide pooled HTTP clients for outbound API calls.
+
+Every external API client (Binance, Helius, DexScreener, X) used to open a
+fresh ``httpx.AsyncClient`` per request, paying a TCP + TLS handshake each
+time. This module keeps one long-lived client per host so connections are
+reused (keep-alive plus HTTP/2 multiplexing via ``httpx[http2]``), with
+connection limits applied per host.
+
+Clients are created lazily on first use and closed on app shutdown via
+``close_http_clients()``.
+"""
+
+import logging
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _origin(url: str) -> str:
+    """Reduce a URL to scheme://host[:port] for pool keying."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Return the shared client for the host of ``url``.
+
+    The returned client must not be closed by callers; pass a per-request
+    ``timeout=`` to override the pool default.
+
+    Args:
+        url: Any URL on the target host (full request URL or base URL).
+
+    Returns:
+        A pooled ``httpx.AsyncClient`` bound to that host's connection limits.
+    """
+    origin = _origin(url)
+    client = _clients.get(origin)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections_per_host,
+                max_keepalive_connections=settings.http_max_keepalive_per_host,
+                keepalive_expiry=settings.http_keepalive_expiry_seconds,
+            ),
+            http2=settings.http2_enabled,
+        )
+        _clients[origin] = client
+        logger.debug(f"Opened pooled HTTP client for {origin}")
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every pooled client (called on app shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled HTTP client: {e}")
+    if clients:
+        logger.info(f"Closed {len(clients)} pooled HTTP clients")
@@ -4,6 +4,17 @@ Provides computation, signal normalization, and highlight generation
 for 9 technical indicators used in the rankings engine.
 """
 
+from src.indicators.batch import (
+    OHLCVBatch,
+    adx_batch,
+    bollinger_batch,
+    ema_batch,
+    group_frames,
+    macd_batch,
+    obv_batch,
+    rsi_batch,
+    stochastic_batch,
+)
 from src.indicators.compute import (
     ADXResult,
     BollingerResult,
@@ -42,6 +53,11 @@ from src.indicators.signals import (
     normalize_rsi,
     normalize_stochastic,
 )
+from src.indicators.streaming import (
+    Bar,
+    IndicatorState,
+    IndicatorStream,
+)
 
 __all__ = [
     # Compute functions
@@ -60,6 +76,16 @@ __all__ = [
     "OBVResult",
     "BollingerResult",
     "EMAResult",
+    # Batched (cross-symbol) compute
+    "OHLCVBatch",
+    "group_frames",
+    "rsi_batch",
+    "macd_batch",
+    "stochastic_batch",
+    "adx_batch",
+    "obv_batch",
+    "bollinger_batch",
+    "ema_batch",
     # Signal normalization
     "SignalResult",
     "normalize_rsi",
@@ -75,6 +101,10 @@ __all__ = [
     "IndicatorOutput",
     "create_default_registry",
     "default_registry",
+    # Streaming state
+    "Bar",
+    "IndicatorState",
+    "IndicatorStream",
     # Highlights
     "HighlightChip",
     "generate_highlights",
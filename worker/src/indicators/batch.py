@@ -0,0 +1,351 @@
+"""Vectorized cross-symbol indicator computation.
+
+Stacks the OHLCV series of many symbols into 2-D arrays (symbols x bars)
+and computes each indicator column-wise in a single pass instead of going
+through pandas-ta once per symbol.
+
+The math mirrors the pandas-ta implementations wrapped by compute.py
+(SMA-seeded EMA, Wilder RMA, ATR with pre-NaN true range, ...) so the
+results match the per-symbol path up to floating-point noise. Each batch
+function returns full series of shape (symbols, bars); values for bars
+where the matching compute_* function would refuse to run (too few
+candles) are NaN.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+_EPSILON = np.finfo(float).eps
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass
+class OHLCVBatch:
+    """OHLCV data for several symbols stacked into (symbols, bars) arrays.
+
+    All symbols in a batch share the same number of bars, so bar ``i`` is
+    column ``i`` for every row.
+    """
+
+    symbols: list[str]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @property
+    def n_bars(self) -> int:
+        """Number of bars per symbol."""
+        return self.close.shape[1]
+
+    @classmethod
+    def from_frames(cls, frames: dict[str, pd.DataFrame]) -> "OHLCVBatch":
+        """Stack equal-length OHLCV DataFrames into a batch.
+
+        Args:
+            frames: Dict mapping symbol to OHLCV DataFrame. All frames must
+                have the same number of rows.
+
+        Returns:
+            OHLCVBatch with one row per symbol, in dict order.
+        """
+        symbols = list(frames)
+        arrays = {
+            col: np.vstack([frames[s][col].to_numpy(dtype=float) for s in symbols])
+            for col in OHLCV_COLUMNS
+        }
+        return cls(symbols=symbols, **arrays)
+
+
+def group_frames(
+    frames: dict[str, pd.DataFrame],
+) -> tuple[list[OHLCVBatch], dict[str, pd.DataFrame]]:
+    """Split OHLCV frames into equal-length batches.
+
+    Frames with non-finite OHLCV values cannot share the NaN layout the
+    batch kernels rely on, so they are returned separately for the
+    per-symbol path.
+
+    Args:
+        frames: Dict mapping symbol to OHLCV DataFrame.
+
+    Returns:
+        Tuple of (batches grouped by bar count, frames left for per-symbol compute).
+    """
+    by_length: dict[int, dict[str, pd.DataFrame]] = {}
+    leftovers: dict[str, pd.DataFrame] = {}
+
+    for symbol, df in frames.items():
+        if len(df) == 0:
+            leftovers[symbol] = df
+            continue
+        values = df[list(OHLCV_COLUMNS)].to_numpy(dtype=float)
+        if not np.isfinite(values).all():
+            leftovers[symbol] = df
+            continue
+        by_length.setdefault(len(df), {})[symbol] = df
+
+    batches = [OHLCVBatch.from_frames(group) for group in by_length.values()]
+    return batches, leftovers
+
+
+# =============================================================================
+# Series primitives (operate along axis 1)
+# =============================================================================
+
+
+def _shift(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Shift each row right by ``periods`` bars, filling with NaN."""
+    out = np.full_like(x, np.nan)
+    out[:, periods:] = x[:, :-periods]
+    return out
+
+
+def _ewm(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponentially weighted mean matching ``Series.ewm(alpha, adjust=False)``.
+
+    Leading NaNs are skipped; interior NaNs decay the old weight without
+    contributing, exactly like pandas with ``ignore_na=False``.
+    """
+    n_rows, n_bars = x.shape
+    out = np.full_like(x, np.nan)
+    weighted = np.full(n_rows, np.nan)
+    old_wt = np.ones(n_rows)
+    beta = 1.0 - alpha
+
+    for i in range(n_bars):
+        cur = x[:, i]
+        observed = ~np.isnan(cur)
+        started = ~np.isnan(weighted)
+
+        old_wt = np.where(started, old_wt * beta, old_wt)
+        update = started & observed
+        with np.errstate(invalid="ignore"):
+            blended = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        weighted = np.where(update, blended, weighted)
+        old_wt = np.where(update, 1.0, old_wt)
+        weighted = np.where(~started & observed, cur, weighted)
+
+        out[:, i] = weighted
+
+    return out
+
+
+def _rma(x: np.ndarray, length: int) -> np.ndarray:
+    """Wilder's moving average (pandas-ta ``rma``)."""
+    return _ewm(x, 1.0 / length)
+
+
+def _ema(x: np.ndarray, length: int) -> np.ndarray:
+    """EMA seeded with the SMA of the first ``length`` values (pandas-ta ``ema``)."""
+    if x.shape[1] < length:
+        return np.full_like(x, np.nan)
+    seeded = x.copy()
+    with np.errstate(invalid="ignore"):
+        seeded[:, length - 1] = np.nanmean(x[:, :length], axis=1)
+    seeded[:, : length - 1] = np.nan
+    return _ewm(seeded, 2.0 / (length + 1))
+
+
+def _from_first_valid(x: np.ndarray, fn, *args) -> np.ndarray:
+    """Apply ``fn`` to the columns from the first fully valid bar onward.
+
+    Mirrors pandas-ta's ``series.loc[series.first_valid_index():]`` slicing
+    before chaining a second moving average.
+    """
+    valid_cols = np.flatnonzero(~np.isnan(x).any(axis=0))
+    out = np.full_like(x, np.nan)
+    if len(valid_cols) == 0:
+        return out
+    start = valid_cols[0]
+    out[:, start:] = fn(x[:, start:], *args)
+    return out
+
+
+def _rolling(x: np.ndarray, length: int, reducer) -> np.ndarray:
+    """Apply a window reducer over trailing windows; first ``length - 1`` bars are NaN."""
+    out = np.full_like(x, np.nan)
+    if x.shape[1] < length:
+        return out
+    windows = sliding_window_view(x, length, axis=1)
+    out[:, length - 1 :] = reducer(windows, axis=-1)
+    return out
+
+
+def _sma(x: np.ndarray, length: int) -> np.ndarray:
+    """Simple moving average; NaNs propagate through the window."""
+    return _rolling(x, length, np.mean)
+
+
+def _rolling_std(x: np.ndarray, length: int, ddof: int = 1) -> np.ndarray:
+    """Rolling sample standard deviation."""
+    return _rolling(x, length, lambda w, axis: np.std(w, axis=axis, ddof=ddof))
+
+
+def _non_zero_range(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """``x - y`` with epsilon added to rows that contain an exact zero."""
+    diff = x - y
+    has_zero = (diff == 0).any(axis=1, keepdims=True)
+    return np.where(has_zero, diff + _EPSILON, diff)
+
+
+def _mask_short(values: dict[str, np.ndarray], min_bars: int) -> dict[str, np.ndarray]:
+    """NaN out bars where fewer than ``min_bars`` candles would be available."""
+    for arr in values.values():
+        arr[:, : min(min_bars - 1, arr.shape[1])] = np.nan
+    return values
+
+
+# =============================================================================
+# Indicator kernels
+# =============================================================================
+
+
+def rsi_batch(batch: OHLCVBatch, period: int = 14) -> dict[str, np.ndarray]:
+    """Batched equivalent of ``compute_rsi``."""
+    diff = batch.close - _shift(batch.close)
+    positive = np.where(diff < 0, 0.0, diff)
+    negative = np.where(diff > 0, 0.0, diff)
+
+    positive_avg = _rma(positive, period)
+    negative_avg = _rma(negative, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 * positive_avg / (positive_avg + np.abs(negative_avg))
+
+    return _mask_short({"value": rsi}, period + 1)
+
+
+def macd_batch(
+    batch: OHLCVBatch, fast: int = 12, slow: int = 26, signal: int = 9
+) -> dict[str, np.ndarray]:
+    """Batched equivalent of ``compute_macd``."""
+    macd = _ema(batch.close, fast) - _ema(batch.close, slow)
+    signal_line = _from_first_valid(macd, _ema, signal)
+    histogram = macd - signal_line
+
+    return _mask_short(
+        {"macd": macd, "signal": signal_line, "histogram": histogram},
+        slow + signal,
+    )
+
+
+def stochastic_batch(
+    batch: OHLCVBatch, k: int = 14, d: int = 3, smooth: int = 3
+) -> dict[str, np.ndarray]:
+    """Batched equivalent of ``compute_stochastic``."""
+    lowest = _rolling(batch.low, k, np.min)
+    highest = _rolling(batch.high, k, np.max)
+
+    stoch = 100 * (batch.close - lowest) / _non_zero_range(highest, lowest)
+    stoch_k = _sma(stoch, smooth) if smooth > 1 else stoch
+    stoch_d = _sma(stoch_k, d)
+
+    return _mask_short({"k": stoch_k, "d": stoch_d}, k + d + smooth)
+
+
+def adx_batch(batch: OHLCVBatch, period: int = 14) -> dict[str, np.ndarray]:
+    """Batched equivalent of ``compute_adx``."""
+    high, low, close = batch.high, batch.low, batch.close
+    prev_close = _shift(close)
+
+    # True range with the first bar blanked (pandas-ta prenan=True)
+    true_range = np.fmax(
+        np.abs(_non_zero_range(high, low)),
+        np.fmax(np.abs(high - prev_close), np.abs(prev_close - low)),
+    )
+    true_range[:, 0] = np.nan
+
+    # ATR: SMA seed at bar period-1, then Wilder smoothing
+    if true_range.shape[1] >= period:
+        with np.errstate(invalid="ignore"):
+            true_range[:, period - 1] = np.nanmean(true_range[:, :period], axis=1)
+        true_range[:, : period - 1] = np.nan
+    atr = _rma(true_range, period)
+
+    up = high - _shift(high)
+    down = _shift(low) - low
+    pos = np.where(np.isnan(up), np.nan, np.where((up > down) & (up > 0), up, 0.0))
+    neg = np.where(np.isnan(down), np.nan, np.where((down > up) & (down > 0), down, 0.0))
+    pos = np.where(np.abs(pos) < _EPSILON, 0.0, pos)
+    neg = np.where(np.abs(neg) < _EPSILON, 0.0, neg)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = 100 / atr
+        plus_di = scale * _rma(pos, period)
+        minus_di = scale * _rma(neg, period)
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+    adx = _rma(dx, period)
+
+    return _mask_short(
+        {"adx": adx, "plus_di": plus_di, "minus_di": minus_di},
+        period * 2,
+    )
+
+
+def obv_batch(batch: OHLCVBatch, slope_period: int = 10) -> dict[str, np.ndarray]:
+    """Batched equivalent of ``compute_obv``."""
+    direction = np.sign(batch.close - _shift(batch.close))
+    obv = np.nancumsum(direction * batch.volume, axis=1)
+    obv[:, 0] = np.nan
+
+    slope = np.full_like(obv, np.nan)
+    slope_normalized = np.full_like(obv, np.nan)
+    if obv.shape[1] >= slope_period:
+        windows = sliding_window_view(obv, slope_period, axis=1)
+        x = np.arange(slope_period) - (slope_period - 1) / 2
+        window_mean = windows.mean(axis=-1)
+        fitted = ((windows - window_mean[..., None]) * x).sum(axis=-1) / (x**2).sum()
+        avg_obv = np.abs(window_mean)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = np.where(avg_obv > 0, fitted / avg_obv * 100, 0.0)
+        normalized = np.where(np.isnan(window_mean), np.nan, normalized)
+        slope[:, slope_period - 1 :] = fitted
+        slope_normalized[:, slope_period - 1 :] = normalized
+
+    return _mask_short(
+        {"obv": obv, "slope": slope, "slope_normalized": slope_normalized},
+        slope_period + 1,
+    )
+
+
+def bollinger_batch(
+    batch: OHLCVBatch, period: int = 20, std: float = 2.0
+) -> dict[str, np.ndarray]:
+    """Batched equivalent of ``compute_bollinger``."""
+    close = batch.close
+    deviation = std * _rolling_std(close, period)
+    middle = _sma(close, period)
+    lower = middle - deviation
+    upper = middle + deviation
+
+    band_range = _non_zero_range(upper, lower)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bandwidth = 100 * band_range / middle
+        percent_b = _non_zero_range(close, lower) / band_range
+
+    return _mask_short(
+        {
+            "upper": upper,
+            "middle": middle,
+            "lower": lower,
+            "bandwidth": bandwidth,
+            "percent_b": percent_b,
+        },
+        period,
+    )
+
+
+def ema_batch(batch: OHLCVBatch, period: int) -> dict[str, np.ndarray]:
+    """Batched equivalent of ``compute_ema``."""
+    ema = _ema(batch.close, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price_vs_ema_pct = np.where(
+            ema > 0, (batch.close - ema) / ema * 100, np.nan
+        )
+
+    return _mask_short({"ema": ema, "price_vs_ema_pct": price_vs_ema_pct}, period)
@@ -1,14 +1,29 @@
 """Indicator registry for centralized indicator management.
 
 The registry holds all indicator definitions and provides methods to compute
-all indicators for a given OHLCV DataFrame.
+all indicators for a given OHLCV DataFrame, for many symbols at once via
+the vectorized kernels in batch.py, or incrementally from per-symbol
+streaming state (streaming.py).
 """
 
+import logging
 from dataclasses import dataclass
-from typing import Any, Callable, TypedDict
+from typing import Any, Callable, Mapping, TypedDict
 
+import numpy as np
 import pandas as pd
 
+from src.indicators.batch import (
+    OHLCVBatch,
+    adx_batch,
+    bollinger_batch,
+    ema_batch,
+    group_frames,
+    macd_batch,
+    obv_batch,
+    rsi_batch,
+    stochastic_batch,
+)
 from src.indicators.compute import (
     compute_adx,
     compute_bollinger,
@@ -28,6 +43,20 @@ from src.indicators.signals import (
     normalize_rsi,
     normalize_stochastic,
 )
+from src.indicators.streaming import (
+    ADXStream,
+    BollingerStream,
+    EMAStream,
+    IndicatorState,
+    IndicatorStream,
+    MACDStream,
+    OBVStream,
+    RSIStream,
+    StochasticStream,
+    iter_bars,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class IndicatorOutput(TypedDict):
@@ -52,6 +81,8 @@ class IndicatorDefinition:
     config: dict[str, Any]
     compute_fn: Callable[[pd.DataFrame], dict[str, Any]]
     normalize_fn: Callable[[dict[str, Any], dict[str, Any]], SignalResult]
+    batch_fn: Callable[[OHLCVBatch], dict[str, np.ndarray]] | None = None
+    stream_fn: Callable[[], IndicatorStream] | None = None
 
 
 class IndicatorRegistry:
@@ -74,6 +105,8 @@ class IndicatorRegistry:
         config: dict[str, Any],
         compute_fn: Callable[[pd.DataFrame], dict[str, Any]],
         normalize_fn: Callable[[dict[str, Any], dict[str, Any]], SignalResult],
+        batch_fn: Callable[[OHLCVBatch], dict[str, np.ndarray]] | None = None,
+        stream_fn: Callable[[], IndicatorStream] | None = None,
     ) -> None:
         """Register an indicator.
 
@@ -85,6 +118,9 @@ class IndicatorRegistry:
             config: Indicator-specific configuration.
             compute_fn: Function to compute raw values from DataFrame.
             normalize_fn: Function to normalize raw values to signal.
+            batch_fn: Optional vectorized equivalent of compute_fn that
+                returns full (symbols, bars) series for an OHLCVBatch.
+            stream_fn: Optional factory for an incremental IndicatorStream.
         """
         self._indicators[name] = IndicatorDefinition(
             name=name,
@@ -94,6 +130,8 @@ class IndicatorRegistry:
             config=config,
             compute_fn=compute_fn,
             normalize_fn=normalize_fn,
+            batch_fn=batch_fn,
+            stream_fn=stream_fn,
         )
 
     def get(self, name: str) -> IndicatorDefinition | None:
@@ -156,6 +194,185 @@ class IndicatorRegistry:
 
         return results
 
+    def compute_all_batch(
+        self, frames: dict[str, pd.DataFrame]
+    ) -> dict[str, dict[str, IndicatorOutput]]:
+        """Compute all registered indicators for many symbols at once.
+
+        Equal-length frames are stacked into (symbols, bars) arrays and every
+        indicator with a batch_fn runs once per stack. Indicators without a
+        batch_fn, and frames that cannot be stacked, fall back to compute_fn.
+
+        Args:
+            frames: Dict mapping symbol to OHLCV DataFrame.
+
+        Returns:
+            Dict mapping symbol to the same output compute_all would return.
+            Symbols whose indicators raised are omitted.
+        """
+        results: dict[str, dict[str, IndicatorOutput]] = {}
+        batches, leftovers = group_frames(frames)
+
+        for batch in batches:
+            try:
+                results.update(self.compute_batch(batch, frames))
+            except Exception as e:
+                logger.warning(
+                    f"Batched indicators failed for {len(batch.symbols)} symbols "
+                    f"({batch.n_bars} bars), falling back per symbol: {e}"
+                )
+                leftovers.update({symbol: frames[symbol] for symbol in batch.symbols})
+
+        for symbol, df in leftovers.items():
+            try:
+                results[symbol] = self.compute_all(df)
+            except Exception as e:
+                logger.warning(f"Indicator computation failed for {symbol}: {e}")
+
+        return results
+
+    def compute_batch(
+        self, batch: OHLCVBatch, frames: Mapping[str, pd.DataFrame]
+    ) -> dict[str, dict[str, IndicatorOutput]]:
+        """Compute all indicators for one equal-length batch.
+
+        Args:
+            batch: Stacked OHLCV arrays.
+            frames: Per-symbol DataFrames, only read for indicators without
+                a batch_fn.
+
+        Returns:
+            Dict mapping symbol to indicator outputs.
+        """
+        raw_by_symbol: dict[str, dict[str, dict[str, Any]]] = {
+            symbol: {} for symbol in batch.symbols
+        }
+        for name, ind in self._indicators.items():
+            if ind.batch_fn is None:
+                for symbol in batch.symbols:
+                    raw_by_symbol[symbol][name] = ind.compute_fn(frames[symbol])
+                continue
+            series = ind.batch_fn(batch)
+            for row, symbol in enumerate(batch.symbols):
+                raw_by_symbol[symbol][name] = {
+                    field: float(values[row, -1]) for field, values in series.items()
+                }
+
+        return {symbol: self._build_outputs(raws) for symbol, raws in raw_by_symbol.items()}
+
+    def compute_history(
+        self, df: pd.DataFrame, start: int = 0
+    ) -> list[dict[str, IndicatorOutput]]:
+        """Compute indicator outputs for every bar of one symbol's history.
+
+        Each batch_fn runs once over the full series; since every indicator
+        is causal, the value at bar ``i`` equals what compute_all would return
+        for ``df.iloc[: i + 1]``. Indicators without a batch_fn are computed
+        on each prefix.
+
+        Args:
+            df: OHLCV DataFrame for one symbol.
+            start: First bar to produce outputs for.
+
+        Returns:
+            List of compute_all-style outputs for bars ``start`` .. ``len(df) - 1``.
+        """
+        batch = OHLCVBatch.from_frames({"": df})
+        series = {
+            name: ind.batch_fn(batch)
+            for name, ind in self._indicators.items()
+            if ind.batch_fn is not None
+        }
+
+        history: list[dict[str, IndicatorOutput]] = []
+        for i in range(start, len(df)):
+            raws: dict[str, dict[str, Any]] = {}
+            for name, ind in self._indicators.items():
+                if name in series:
+                    raws[name] = {
+                        field: float(values[0, i]) for field, values in series[name].items()
+                    }
+                else:
+                    raws[name] = ind.compute_fn(df.iloc[: i + 1])
+            history.append(self._build_outputs(raws))
+        return history
+
+    def new_state(self) -> IndicatorState | None:
+        """Create empty streaming state, or None if any indicator can't stream."""
+        if any(ind.stream_fn is None for ind in self._indicators.values()):
+            return None
+        return IndicatorState(
+            {name: ind.stream_fn() for name, ind in self._indicators.items()}
+        )
+
+    def compute_incremental(
+        self,
+        state: IndicatorState | None,
+        df: pd.DataFrame,
+        checkpoint_bars: int = 96,
+    ) -> tuple[IndicatorState | None, dict[str, IndicatorOutput]]:
+        """Compute all indicators by advancing streaming state.
+
+        The last row of ``df`` is treated as the still-open candle and only
+        peeked; earlier rows are closed candles. Closed candles newer than
+        the state's last open_time are folded in one by one. The state is
+        rebuilt from the full window when it is missing, no longer overlaps
+        the window, or has folded ``checkpoint_bars`` candles since its last
+        rebuild (bounding drift from the windowed computation).
+
+        Args:
+            state: Existing state for this symbol, or None.
+            df: OHLCV DataFrame with an open_time column.
+            checkpoint_bars: Candles to fold before forcing a full rebuild.
+
+        Returns:
+            Tuple of (state to keep for the next call, indicator outputs).
+            Falls back to compute_all (and no state) when streaming isn't
+            possible for this registry or frame.
+        """
+        if len(df) == 0 or "open_time" not in df.columns:
+            return None, self.compute_all(df)
+
+        open_times = df["open_time"]
+        closed = len(df) - 1
+
+        start: int | None = None
+        if state is not None and state.bars_since_checkpoint < checkpoint_bars:
+            # Scan back from the newest closed candle; usually 0-1 steps
+            for i in range(closed - 1, -1, -1):
+                if open_times.iat[i] == state.last_open_time:
+                    start = i + 1
+                    break
+
+        if start is None:
+            state = self.new_state()
+            if state is None:
+                return None, self.compute_all(df)
+            start = 0
+
+        bars = iter_bars(df, start)
+        for offset, bar in enumerate(bars[:-1]):
+            state.update(bar, open_times.iat[start + offset])
+        if start == 0:
+            state.bars_since_checkpoint = 0
+
+        return state, self._build_outputs(state.peek(bars[-1]))
+
+    def _build_outputs(self, raws: dict[str, dict[str, Any]]) -> dict[str, IndicatorOutput]:
+        """Normalize raw values and wrap them as IndicatorOutput dicts."""
+        outputs: dict[str, IndicatorOutput] = {}
+        for name, ind in self._indicators.items():
+            raw = raws[name]
+            outputs[name] = {
+                "name": ind.name,
+                "display_name": ind.display_name,
+                "category": ind.category,
+                "weight": ind.weight,
+                "raw": raw,
+                "signal": ind.normalize_fn(raw, ind.config),
+            }
+        return outputs
+
     def total_weight(self) -> float:
         """Get the sum of all indicator weights."""
         return sum(ind.weight for ind in self._indicators.values())
@@ -181,6 +398,8 @@ def create_default_registry() -> IndicatorRegistry:
         config={"period": 14, "oversold": 30, "overbought": 70},
         compute_fn=lambda df: compute_rsi(df, period=14),
         normalize_fn=normalize_rsi,
+        batch_fn=lambda b: rsi_batch(b, period=14),
+        stream_fn=lambda: RSIStream(period=14),
     )
 
     # MACD (12, 26, 9)
@@ -192,6 +411,8 @@ def create_default_registry() -> IndicatorRegistry:
         config={"fast": 12, "slow": 26, "signal": 9},
         compute_fn=lambda df: compute_macd(df, fast=12, slow=26, signal=9),
         normalize_fn=normalize_macd,
+        batch_fn=lambda b: macd_batch(b, fast=12, slow=26, signal=9),
+        stream_fn=lambda: MACDStream(fast=12, slow=26, signal=9),
     )
 
     # Stochastic (14, 3, 3)
@@ -203,6 +424,8 @@ def create_default_registry() -> IndicatorRegistry:
         config={"k": 14, "d": 3, "smooth": 3},
         compute_fn=lambda df: compute_stochastic(df, k=14, d=3, smooth=3),
         normalize_fn=normalize_stochastic,
+        batch_fn=lambda b: stochastic_batch(b, k=14, d=3, smooth=3),
+        stream_fn=lambda: StochasticStream(k=14, d=3, smooth=3),
     )
 
     # ADX (14)
@@ -214,6 +437,8 @@ def create_default_registry() -> IndicatorRegistry:
         config={"period": 14, "trend_threshold": 25},
         compute_fn=lambda df: compute_adx(df, period=14),
         normalize_fn=normalize_adx,
+        batch_fn=lambda b: adx_batch(b, period=14),
+        stream_fn=lambda: ADXStream(period=14),
     )
 
     # OBV
@@ -225,6 +450,8 @@ def create_default_registry() -> IndicatorRegistry:
         config={"slope_period": 10},
         compute_fn=lambda df: compute_obv(df, slope_period=10),
         normalize_fn=normalize_obv,
+        batch_fn=lambda b: obv_batch(b, slope_period=10),
+        stream_fn=lambda: OBVStream(slope_period=10),
     )
 
     # Bollinger Bands (20, 2)
@@ -236,6 +463,8 @@ def create_default_registry() -> IndicatorRegistry:
         config={"period": 20, "std": 2},
         compute_fn=lambda df: compute_bollinger(df, period=20, std=2.0),
         normalize_fn=normalize_bollinger,
+        batch_fn=lambda b: bollinger_batch(b, period=20, std=2.0),
+        stream_fn=lambda: BollingerStream(period=20, std=2.0),
     )
 
     # EMA (20)
@@ -247,6 +476,8 @@ def create_default_registry() -> IndicatorRegistry:
         config={"period": 20, "neutral_pct": 0.5},
         compute_fn=lambda df: compute_ema(df, period=20),
         normalize_fn=normalize_ema,
+        batch_fn=lambda b: ema_batch(b, period=20),
+        stream_fn=lambda: EMAStream(period=20),
     )
 
     # EMA (50)
@@ -258,6 +489,8 @@ def create_default_registry() -> IndicatorRegistry:
         config={"period": 50, "neutral_pct": 1.0},
         compute_fn=lambda df: compute_ema(df, period=50),
         normalize_fn=normalize_ema,
+        batch_fn=lambda b: ema_batch(b, period=50),
+        stream_fn=lambda: EMAStream(period=50),
     )
 
     # EMA (200)
@@ -269,6 +502,8 @@ def create_default_registry() -> IndicatorRegistry:
         config={"period": 200, "neutral_pct": 1.5},
         compute_fn=lambda df: compute_ema(df, period=200),
         normalize_fn=normalize_ema,
+        batch_fn=lambda b: ema_batch(b, period=200),
+        stream_fn=lambda: EMAStream(period=200),
     )
 
     return registry
@@ -0,0 +1,463 @@
+"""Incremental (streaming) indicator state.
+
+Each stream keeps the accumulators an indicator needs (Wilder smoothing,
+EMA seeds, OBV running sum, short rolling windows) so a new closed candle
+is folded in with O(1) work instead of recomputing the whole window.
+
+Streams follow the same pandas-ta conventions as compute.py and batch.py
+(SMA-seeded EMA, RMA starting at the first observation, ATR seeded from
+the mean true range), so replaying a window bar by bar reproduces the
+full computation. ``peek`` evaluates a provisional (still-open) candle
+without committing it.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+from typing import Any, NamedTuple
+
+import pandas as pd
+
+_EPSILON = 2.220446049250313e-16
+_NAN = float("nan")
+
+
+class Bar(NamedTuple):
+    """A single OHLCV candle as plain floats."""
+
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+def _non_zero(diff: float) -> float:
+    """Mirror pandas-ta's non_zero_range guard for a single difference."""
+    return diff + _EPSILON if diff == 0 else diff
+
+
+class _Ewm:
+    """Running ``ewm(alpha, adjust=False).mean()`` with pandas NaN semantics."""
+
+    __slots__ = ("alpha", "value", "old_wt")
+
+    def __init__(self, alpha: float) -> None:
+        self.alpha = alpha
+        self.value = _NAN
+        self.old_wt = 1.0
+
+    def clone(self) -> "_Ewm":
+        c = _Ewm(self.alpha)
+        c.value = self.value
+        c.old_wt = self.old_wt
+        return c
+
+    def update(self, x: float) -> None:
+        if math.isnan(self.value):
+            if not math.isnan(x):
+                self.value = x
+            return
+        self.old_wt *= 1.0 - self.alpha
+        if not math.isnan(x):
+            self.value = (self.old_wt * self.value + self.alpha * x) / (
+                self.old_wt + self.alpha
+            )
+            self.old_wt = 1.0
+
+
+class _SeededEma:
+    """EMA seeded with the SMA of its first ``length`` inputs."""
+
+    __slots__ = ("length", "count", "seed_sum", "ewm")
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+        self.count = 0
+        self.seed_sum = 0.0
+        self.ewm = _Ewm(2.0 / (length + 1))
+
+    def clone(self) -> "_SeededEma":
+        c = _SeededEma(self.length)
+        c.count = self.count
+        c.seed_sum = self.seed_sum
+        c.ewm = self.ewm.clone()
+        return c
+
+    @property
+    def value(self) -> float:
+        return self.ewm.value if self.count >= self.length else _NAN
+
+    def update(self, x: float) -> None:
+        self.count += 1
+        if self.count < self.length:
+            self.seed_sum += x
+        elif self.count == self.length:
+            self.ewm.update((self.seed_sum + x) / self.length)
+        else:
+            self.ewm.update(x)
+
+
+class IndicatorStream(ABC):
+    """Base class for a single indicator's incremental state."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    @abstractmethod
+    def update(self, bar: Bar) -> None:
+        """Fold a closed candle into the state."""
+        ...
+
+    @abstractmethod
+    def raw(self) -> dict[str, Any]:
+        """Raw values as of the last folded candle (same keys as compute_*)."""
+        ...
+
+    @abstractmethod
+    def clone(self) -> "IndicatorStream":
+        """Independent copy of the state."""
+        ...
+
+    def peek(self, bar: Bar) -> dict[str, Any]:
+        """Raw values as if ``bar`` were folded in, without committing it."""
+        c = self.clone()
+        c.update(bar)
+        return c.raw()
+
+
+class RSIStream(IndicatorStream):
+    """Streaming equivalent of ``compute_rsi``."""
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__()
+        self.period = period
+        self.prev_close = _NAN
+        self.gain = _Ewm(1.0 / period)
+        self.loss = _Ewm(1.0 / period)
+
+    def clone(self) -> "RSIStream":
+        c = RSIStream(self.period)
+        c.count = self.count
+        c.prev_close = self.prev_close
+        c.gain = self.gain.clone()
+        c.loss = self.loss.clone()
+        return c
+
+    def update(self, bar: Bar) -> None:
+        self.count += 1
+        if not math.isnan(self.prev_close):
+            diff = bar.close - self.prev_close
+            self.gain.update(max(diff, 0.0))
+            self.loss.update(min(diff, 0.0))
+        self.prev_close = bar.close
+
+    def raw(self) -> dict[str, Any]:
+        if self.count < self.period + 1:
+            return {"value": _NAN}
+        denom = self.gain.value + abs(self.loss.value)
+        value = 100 * self.gain.value / denom if denom != 0 else _NAN
+        return {"value": value}
+
+
+class MACDStream(IndicatorStream):
+    """Streaming equivalent of ``compute_macd``."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
+        super().__init__()
+        self.fast, self.slow, self.signal = fast, slow, signal
+        self.fast_ema = _SeededEma(fast)
+        self.slow_ema = _SeededEma(slow)
+        self.signal_ema = _SeededEma(signal)
+        self.macd = _NAN
+
+    def clone(self) -> "MACDStream":
+        c = MACDStream(self.fast, self.slow, self.signal)
+        c.count = self.count
+        c.fast_ema = self.fast_ema.clone()
+        c.slow_ema = self.slow_ema.clone()
+        c.signal_ema = self.signal_ema.clone()
+        c.macd = self.macd
+        return c
+
+    def update(self, bar: Bar) -> None:
+        self.count += 1
+        self.fast_ema.update(bar.close)
+        self.slow_ema.update(bar.close)
+        self.macd = self.fast_ema.value - self.slow_ema.value
+        if not math.isnan(self.macd):
+            self.signal_ema.update(self.macd)
+
+    def raw(self) -> dict[str, Any]:
+        if self.count < self.slow + self.signal:
+            return {"macd": _NAN, "signal": _NAN, "histogram": _NAN}
+        signal = self.signal_ema.value
+        return {"macd": self.macd, "signal": signal, "histogram": self.macd - signal}
+
+
+class StochasticStream(IndicatorStream):
+    """Streaming equivalent of ``compute_stochastic``."""
+
+    def __init__(self, k: int = 14, d: int = 3, smooth: int = 3) -> None:
+        super().__init__()
+        self.k, self.d, self.smooth = k, d, smooth
+        self.highs: deque[float] = deque(maxlen=k)
+        self.lows: deque[float] = deque(maxlen=k)
+        self.raw_k: deque[float] = deque(maxlen=smooth)
+        self.smooth_k: deque[float] = deque(maxlen=d)
+
+    def clone(self) -> "StochasticStream":
+        c = StochasticStream(self.k, self.d, self.smooth)
+        c.count = self.count
+        c.highs.extend(self.highs)
+        c.lows.extend(self.lows)
+        c.raw_k.extend(self.raw_k)
+        c.smooth_k.extend(self.smooth_k)
+        return c
+
+    def update(self, bar: Bar) -> None:
+        self.count += 1
+        self.highs.append(bar.high)
+        self.lows.append(bar.low)
+        if len(self.highs) < self.k:
+            return
+        lowest = min(self.lows)
+        self.raw_k.append(100 * (bar.close - lowest) / _non_zero(max(self.highs) - lowest))
+        if len(self.raw_k) < self.smooth:
+            return
+        self.smooth_k.append(sum(self.raw_k) / self.smooth)
+
+    def raw(self) -> dict[str, Any]:
+        if self.count < self.k + self.d + self.smooth:
+            return {"k": _NAN, "d": _NAN}
+        return {"k": self.smooth_k[-1], "d": sum(self.smooth_k) / self.d}
+
+
+class ADXStream(IndicatorStream):
+    """Streaming equivalent of ``compute_adx``."""
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__()
+        self.period = period
+        self.prev: Bar | None = None
+        self.tr_seed_sum = 0.0
+        self.atr = _Ewm(1.0 / period)
+        self.plus_dm = _Ewm(1.0 / period)
+        self.minus_dm = _Ewm(1.0 / period)
+        self.adx = _Ewm(1.0 / period)
+        self.plus_di = _NAN
+        self.minus_di = _NAN
+
+    def clone(self) -> "ADXStream":
+        c = ADXStream(self.period)
+        c.count = self.count
+        c.prev = self.prev
+        c.tr_seed_sum = self.tr_seed_sum
+        c.atr = self.atr.clone()
+        c.plus_dm = self.plus_dm.clone()
+        c.minus_dm = self.minus_dm.clone()
+        c.adx = self.adx.clone()
+        c.plus_di = self.plus_di
+        c.minus_di = self.minus_di
+        return c
+
+    def update(self, bar: Bar) -> None:
+        self.count += 1
+        prev, self.prev = self.prev, bar
+        if prev is None:
+            return
+
+        true_range = max(
+            abs(_non_zero(bar.high - bar.low)),
+            abs(bar.high - prev.close),
+            abs(prev.close - bar.low),
+        )
+        # ATR is seeded with the mean of the first period-1 true ranges
+        # (the first bar has none), then Wilder-smoothed.
+        if self.count < self.period:
+            self.tr_seed_sum += true_range
+        elif self.count == self.period:
+            self.atr.update((self.tr_seed_sum + true_range) / (self.period - 1))
+        else:
+            self.atr.update(true_range)
+
+        up = bar.high - prev.high
+        down = prev.low - bar.low
+        pos = up if up > down and up > 0 else 0.0
+        neg = down if down > up and down > 0 else 0.0
+        self.plus_dm.update(0.0 if abs(pos) < _EPSILON else pos)
+        self.minus_dm.update(0.0 if abs(neg) < _EPSILON else neg)
+
+        atr = self.atr.value
+        if math.isnan(atr):
+            return
+        scale = 100 / atr if atr != 0 else math.inf
+        self.plus_di = _safe_mul(scale, self.plus_dm.value)
+        self.minus_di = _safe_mul(scale, self.minus_dm.value)
+        di_sum = self.plus_di + self.minus_di
+        dx = 100 * abs(self.plus_di - self.minus_di) / di_sum if di_sum != 0 else _NAN
+        self.adx.update(dx)
+
+    def raw(self) -> dict[str, Any]:
+        if self.count < self.period * 2:
+            return {"adx": _NAN, "plus_di": _NAN, "minus_di": _NAN}
+        return {"adx": self.adx.value, "plus_di": self.plus_di, "minus_di": self.minus_di}
+
+
+def _safe_mul(a: float, b: float) -> float:
+    """Multiply with numpy semantics for inf * 0 (NaN instead of raising)."""
+    if math.isinf(a) and b == 0:
+        return _NAN
+    return a * b
+
+
+class OBVStream(IndicatorStream):
+    """Streaming equivalent of ``compute_obv``."""
+
+    def __init__(self, slope_period: int = 10) -> None:
+        super().__init__()
+        self.slope_period = slope_period
+        self.prev_close = _NAN
+        self.obv = _NAN
+        self.recent: deque[float] = deque(maxlen=slope_period)
+
+    def clone(self) -> "OBVStream":
+        c = OBVStream(self.slope_period)
+        c.count = self.count
+        c.prev_close = self.prev_close
+        c.obv = self.obv
+        c.recent.extend(self.recent)
+        return c
+
+    def update(self, bar: Bar) -> None:
+        self.count += 1
+        if not math.isnan(self.prev_close):
+            diff = bar.close - self.prev_close
+            direction = (diff > 0) - (diff < 0)
+            self.obv = (0.0 if math.isnan(self.obv) else self.obv) + direction * bar.volume
+        self.prev_close = bar.close
+        self.recent.append(self.obv)
+
+    def raw(self) -> dict[str, Any]:
+        if self.count < self.slope_period + 1:
+            return {"obv": _NAN, "slope": _NAN, "slope_normalized": _NAN}
+
+        n = self.slope_period
+        x_mean = (n - 1) / 2
+        y_mean = sum(self.recent) / n
+        sxx = sum((i - x_mean) ** 2 for i in range(n))
+        slope = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(self.recent)) / sxx
+        avg_obv = abs(y_mean)
+        slope_normalized = slope / avg_obv * 100 if avg_obv > 0 else 0.0
+        return {"obv": self.obv, "slope": slope, "slope_normalized": slope_normalized}
+
+
+class BollingerStream(IndicatorStream):
+    """Streaming equivalent of ``compute_bollinger``."""
+
+    def __init__(self, period: int = 20, std: float = 2.0) -> None:
+        super().__init__()
+        self.period = period
+        self.std = std
+        self.closes: deque[float] = deque(maxlen=period)
+
+    def clone(self) -> "BollingerStream":
+        c = BollingerStream(self.period, self.std)
+        c.count = self.count
+        c.closes.extend(self.closes)
+        return c
+
+    def update(self, bar: Bar) -> None:
+        self.count += 1
+        self.closes.append(bar.close)
+
+    def raw(self) -> dict[str, Any]:
+        if self.count < self.period:
+            return {
+                "upper": _NAN,
+                "middle": _NAN,
+                "lower": _NAN,
+                "bandwidth": _NAN,
+                "percent_b": _NAN,
+            }
+
+        middle = sum(self.closes) / self.period
+        variance = sum((c - middle) ** 2 for c in self.closes) / (self.period - 1)
+        deviation = self.std * math.sqrt(variance)
+        upper = middle + deviation
+        lower = middle - deviation
+        band_range = _non_zero(upper - lower)
+        return {
+            "upper": upper,
+            "middle": middle,
+            "lower": lower,
+            "bandwidth": 100 * band_range / middle if middle != 0 else _NAN,
+            "percent_b": _non_zero(self.closes[-1] - lower) / band_range,
+        }
+
+
+class EMAStream(IndicatorStream):
+    """Streaming equivalent of ``compute_ema``."""
+
+    def __init__(self, period: int) -> None:
+        super().__init__()
+        self.period = period
+        self.ema = _SeededEma(period)
+        self.last_close = _NAN
+
+    def clone(self) -> "EMAStream":
+        c = EMAStream(self.period)
+        c.count = self.count
+        c.ema = self.ema.clone()
+        c.last_close = self.last_close
+        return c
+
+    def update(self, bar: Bar) -> None:
+        self.count += 1
+        self.ema.update(bar.close)
+        self.last_close = bar.close
+
+    def raw(self) -> dict[str, Any]:
+        if self.count < self.period:
+            return {"ema": _NAN, "price_vs_ema_pct": _NAN}
+        ema = self.ema.value
+        pct = (self.last_close - ema) / ema * 100 if ema > 0 else _NAN
+        return {"ema": ema, "price_vs_ema_pct": pct}
+
+
+def iter_bars(df: pd.DataFrame, start: int = 0) -> list[Bar]:
+    """Convert OHLCV DataFrame rows from ``start`` onward to Bar tuples."""
+    columns = [
+        df[col].to_numpy(dtype=float)[start:].tolist()
+        for col in ("open", "high", "low", "close", "volume")
+    ]
+    return [Bar(*row) for row in zip(*columns)]
+
+
+class IndicatorState:
+    """Streaming state for every indicator of one (symbol, timeframe).
+
+    Tracks the open time of the last committed (closed) candle so a fresh
+    OHLCV window can be aligned against it, and how many candles have been
+    folded since the last full rebuild.
+
+    Args:
+        streams: Dict mapping indicator name to a fresh IndicatorStream.
+    """
+
+    def __init__(self, streams: dict[str, IndicatorStream]) -> None:
+        self.streams = streams
+        self.last_open_time: datetime | None = None
+        self.bars_since_checkpoint = 0
+
+    def update(self, bar: Bar, open_time: datetime | None = None) -> None:
+        """Commit a closed candle to every stream."""
+        for stream in self.streams.values():
+            stream.update(bar)
+        self.last_open_time = open_time
+        self.bars_since_checkpoint += 1
+
+    def peek(self, bar: Bar) -> dict[str, dict[str, Any]]:
+        """Raw values for every indicator including a provisional candle."""
+        return {name: stream.peek(bar) for name, stream in self.streams.items()}
@@ -14,6 +14,7 @@ import logging
 import time
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from typing import Annotated
 
 import uvicorn
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -21,22 +22,26 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel as PydanticBaseModel
+from pydantic import BaseModel as PydanticBaseModel, Field
 from sqlalchemy import select, func, text
 
 from src.agents.context import ContextBuilder
+from src.agents.leaderboard import AgentAggregates, leaderboard
 from src.agents.orchestrator import AgentOrchestrator
 from src.agents.rule_executor import RuleBasedExecutor
-from src.cache import cache_delete, get_redis
+from src.cache import cache_delete, get_redis, tiered_cache
 from src.config import settings
 from src.db import async_session, engine
+from src.http_pool import close_http_clients, get_http_client
 from src.llm_settings import load_llm_settings
 from src.events import event_bus
+from src.memecoins.watched_wallets import WatchedWallet, watched_wallets
+from src.memecoins.webhook_ingest import webhook_ingestor
 from src.models.db import (
-    Agent, AgentPortfolio, AgentPosition, AgentTrade, AgentTokenUsage,
-    BacktestRun, BacktestTrade, MemecoinToken, MemecoinTweet,
+    Agent, AgentPortfolio, AgentPosition,
+    BacktestRun, BacktestSweep, BacktestTrade, MemecoinToken, MemecoinTweet,
     MemecoinTweetSignal, MemecoinTweetToken, MemecoinTwitterAccount,
-    Snapshot, Symbol, TimeframeSeason, Tweet, TweetSignal, TwitterAccount,
+    Symbol, TimeframeSeason, Tweet, TweetSignal, TwitterAccount,
     TokenTracker, TokenTrackerSnapshot,
     WatchWallet, WatchWalletActivity,
 )
@@ -44,7 +49,8 @@ from src.notifications.digest import send_daily_digest_job
 from src.seasons.checker import check_and_advance_seasons
 from src.health.routes import router as status_router
 from src.notifications.routes import router as notifications_router
-from src.pipeline import TIMEFRAME_CONFIG, PipelineRunner, compute_and_persist_regime
+from src.pipeline import TIMEFRAME_CONFIG, ComputePool, PipelineRunner, compute_and_persist_regime
+from src.ranking_stream import ranking_stream
 from src.exchange.routes import router as exchange_router
 from src.routers.agents import router as agents_router
 from src.routers.analytics import router as analytics_router
@@ -91,9 +97,17 @@ app.include_router(status_router)
 scheduler = AsyncIOScheduler()
 
 # Pipeline runner instance
+# Worker processes for CPU-bound stages (None = run on the event loop)
+compute_pool = (
+    ComputePool(settings.compute_pool_workers) if settings.compute_pool_workers > 0 else None
+)
+
 runner = PipelineRunner(
     min_volume_usd=settings.min_volume_usd,
     top_symbols_limit=settings.top_symbols_limit,
+    streaming_indicators=settings.indicator_streaming_enabled,
+    checkpoint_bars=settings.indicator_checkpoint_bars,
+    compute_pool=compute_pool,
 )
 
 # Track last run times and results for each timeframe
@@ -120,68 +134,19 @@ class _DecimalEncoder(json.JSONEncoder):
 
 
 async def _broadcast_ranking_update(timeframe: str) -> None:
-    """Query latest rankings for a timeframe and publish to SSE subscribers."""
-    try:
-        async with async_session() as session:
-            # Same query logic as web/src/lib/queries/rankings.ts getTimeframeRankings
-            subquery = (
-                select(func.max(Snapshot.computed_at))
-                .where(Snapshot.timeframe == timeframe)
-                .scalar_subquery()
-            )
-            result = await session.execute(
-                select(Snapshot, Symbol)
-                .join(Symbol, Symbol.id == Snapshot.symbol_id)
-                .where(
-                    Snapshot.timeframe == timeframe,
-                    Snapshot.computed_at == subquery,
-                )
-                .order_by(Snapshot.rank.asc())
-            )
-            rows = result.all()
+    """Publish the latest rankings for a timeframe to SSE subscribers.
 
-            if not rows:
-                return
-
-            computed_at = rows[0][0].computed_at.isoformat()
-            rankings = []
-            for snap, sym in rows:
-                # Build indicator_signals in the same camelCase format as the frontend
-                indicator_signals = []
-                if snap.indicator_signals:
-                    for name, data in snap.indicator_signals.items():
-                        indicator_signals.append({
-                            "name": name,
-                            "displayName": name.replace("_", " ").title(),
-                            "signal": float(data.get("signal", 0)),
-                            "label": data.get("label", "neutral"),
-                            "description": str(data.get("label", "neutral")),
-                            "rawValues": data.get("raw", {}),
-                        })
-
-                rankings.append({
-                    "id": snap.id,
-                    "symbol": sym.symbol,
-                    "symbolId": sym.id,
-                    "baseAsset": sym.base_asset,
-                    "quoteAsset": sym.quote_asset,
-                    "timeframe": snap.timeframe,
-                    "bullishScore": float(snap.bullish_score),
-                    "confidence": int(snap.confidence),
-                    "rank": int(snap.rank),
-                    "highlights": snap.highlights or [],
-                    "indicatorSignals": indicator_signals,
-                    "computedAt": snap.computed_at.isoformat(),
-                    "runId": str(snap.run_id),
-                })
+    Reads the slim rankings response (warm in Redis right after the pipeline
+    run) and hands it to the ranking stream, which sends per-symbol diffs.
+    """
+    try:
+        from src.routers.rankings import _get_rankings_for_timeframe
+        data = await _get_rankings_for_timeframe(timeframe, slim=True)
+        if not data["snapshots"]:
+            return
 
-            await event_bus.publish("rankings", {
-                "type": "ranking_update",
-                "timeframe": timeframe,
-                "rankings": rankings,
-                "computedAt": computed_at,
-            })
-            logger.info(f"Broadcast ranking update for {timeframe}: {len(rankings)} symbols")
+        await ranking_stream.publish(timeframe, data["snapshots"], data["computedAt"])
+        logger.info(f"Broadcast ranking update for {timeframe}: {len(data['snapshots'])} symbols")
     except Exception as e:
         logger.exception(f"Failed to broadcast ranking update for {timeframe}: {e}")
 
@@ -198,7 +163,11 @@ async def _fetch_live_prices() -> dict[str, Decimal]:
 
 
 async def _broadcast_agent_update() -> None:
-    """Query agent leaderboard with live PnL and publish to SSE subscribers."""
+    """Build agent leaderboard with live PnL and publish to SSE subscribers.
+
+    Trade counts, wins and token cost come from the in-process leaderboard
+    aggregates; only agents/portfolios and open positions are queried.
+    """
     try:
         # Fetch live prices from Binance for unrealized PnL calculation
         live_prices = await _fetch_live_prices()
@@ -223,25 +192,14 @@ async def _broadcast_agent_update() -> None:
             for pos, sym in all_positions:
                 positions_by_agent.setdefault(pos.agent_id, []).append((pos, sym))
 
+            aggregates = await leaderboard.get_all(session)
+
             agents = []
             for agent, portfolio in rows:
-                # Count trades and wins
-                trade_result = await session.execute(
-                    select(
-                        func.count().label("total"),
-                        func.count().filter(AgentTrade.pnl > 0).label("wins"),
-                    ).where(AgentTrade.agent_id == agent.id)
-                )
-                trade_row = trade_result.first()
-                trade_count = trade_row[0] if trade_row else 0
-                wins = trade_row[1] if trade_row else 0
-
-                # Token cost
-                cost_result = await session.execute(
-                    select(func.coalesce(func.sum(AgentTokenUsage.estimated_cost_usd), 0))
-                    .where(AgentTokenUsage.agent_id == agent.id)
-                )
-                total_token_cost = float(cost_result.scalar() or 0)
+                agg = aggregates.get(agent.id, AgentAggregates())
+                trade_count = agg.trade_count
+                wins = agg.wins
+                total_token_cost = float(agg.token_cost)
 
                 # Calculate live unrealized PnL from open positions + current prices
                 agent_positions = positions_by_agent.get(agent.id, [])
@@ -321,13 +279,9 @@ async def run_timeframe_pipeline(timeframe: str):
                 f"Completed {timeframe}: {result.get('symbols', 0)} symbols"
             )
 
-            # Invalidate klines cache for this timeframe so next run gets fresh data
-            await cache_delete(f"klines:*:{timeframe}")
-
             # Invalidate rankings caches (worker-side and web-side) so next request gets fresh data
-            await cache_delete(f"rankings_resp:{timeframe}")
-            await cache_delete(f"rankings:{timeframe}")
-            await cache_delete(f"rankings:slim:{timeframe}")
+            await tiered_cache.invalidate(f"timeframe:{timeframe}")
+            await cache_delete(f"rankings:{timeframe}", f"rankings:slim:{timeframe}")
 
             # Pre-warm the rankings cache so the first web request hits warm Redis
             try:
@@ -350,7 +304,7 @@ async def run_timeframe_pipeline(timeframe: str):
                 if current_prices:
                     try:
                         async with async_session() as session:
-                            orchestrator = AgentOrchestrator(session)
+                            orchestrator = AgentOrchestrator(session, session_factory=async_session)
                             await orchestrator.run_cycle(timeframe, current_prices, candle_data)
                     except Exception as e:
                         logger.exception(f"Agent cycle failed for {timeframe}: {e}")
@@ -358,7 +312,9 @@ async def run_timeframe_pipeline(timeframe: str):
                     # Run cross-TF agents after every pipeline cycle
                     try:
                         async with async_session() as session:
-                            cross_orchestrator = AgentOrchestrator(session)
+                            cross_orchestrator = AgentOrchestrator(
+                                session, session_factory=async_session
+                            )
                             await cross_orchestrator.run_cycle("cross", current_prices, candle_data)
                     except Exception as e:
                         logger.exception(f"Cross-TF agent cycle failed after {timeframe}: {e}")
@@ -473,6 +429,8 @@ async def health():
         },
         "agents": agent_stats,
         "twitter": twitter_stats,
+        "sse": event_bus.stats(),
+        "heliusWebhooks": webhook_ingestor.stats(),
     }
 
 
@@ -611,6 +569,9 @@ async def debug_agents(timeframe: str):
             # 3. Build context and dry-run each agent
             context_builder = ContextBuilder(session)
             rule_executor = RuleBasedExecutor()
+            snapshot = await context_builder.build_snapshot(
+                {a.timeframe for a in agents}, {a.strategy_archetype for a in agents}
+            )
 
             for agent in agents:
                 agent_diag: dict = {
@@ -635,7 +596,7 @@ async def debug_agents(timeframe: str):
                     }
 
                     # Build full context (same as real orchestrator)
-                    context = await context_builder.build(agent, {})
+                    context = await context_builder.build(agent, {}, snapshot=snapshot)
 
                     agent_diag["portfolio"]["open_positions"] = context.portfolio.position_count
                     agent_diag["portfolio"]["can_open_new"] = (
@@ -757,7 +718,7 @@ async def _run_backtest(run_id: int, config_dict: dict) -> None:
     from src.backtest.engine import BacktestEngine, BacktestConfig
 
     config = BacktestConfig(**config_dict)
-    bt_engine = BacktestEngine()
+    bt_engine = BacktestEngine(compute_pool=compute_pool)
 
     async with async_session() as session:
         await bt_engine.run(config, session, run_id=run_id)
@@ -860,10 +821,11 @@ async def cancel_backtest(run_id: int):
 
 @app.get("/backtest")
 async def list_backtests():
-    """List all backtest runs, most recent first."""
+    """List standalone backtest runs, most recent first."""
     async with async_session() as session:
         result = await session.execute(
             select(BacktestRun)
+            .where(BacktestRun.sweep_id.is_(None))  # sweep results live under /backtest/sweeps
             .order_by(BacktestRun.started_at.desc())
             .limit(50)
         )
@@ -954,6 +916,208 @@ async def get_backtest(run_id: int):
         }
 
 
+SweepStopLoss = Annotated[float | None, Field(ge=0.01, le=0.20)]
+SweepTakeProfit = Annotated[float | None, Field(ge=0.01, le=0.50)]
+
+
+class BacktestSweepRequest(PydanticBaseModel):
+    """Request body for a batch backtest over a parameter grid."""
+
+    strategies: list[str]
+    symbols: list[str]
+    timeframes: list[str]
+    start_date: str  # ISO date or datetime string
+    end_date: str
+    # [stop_loss_pct, take_profit_pct] pairs; null keeps the strategy's own value.
+    # Bounds match TradeAction so results stay comparable with live agents.
+    sl_tp_grid: list[tuple[SweepStopLoss, SweepTakeProfit]] = [(None, None)]
+    initial_balance: float = Field(default=10000.0, gt=0)
+
+
+# Track running sweep asyncio tasks by sweep_id
+_running_sweep_tasks: dict[int, asyncio.Task] = {}
+
+
+async def _run_backtest_sweep(sweep_id: int, config) -> None:
+    """Background task that executes a backtest sweep."""
+    from src.backtest.sweep import BacktestSweepEngine
+
+    sweep_engine = BacktestSweepEngine(compute_pool=compute_pool)
+    async with async_session() as session:
+        await sweep_engine.run_sweep(sweep_id, config, session)
+
+
+@app.post("/backtest/sweeps")
+async def create_backtest_sweep(request: BacktestSweepRequest):
+    """Launch a grid of backtests as one background job. Returns sweep_id immediately."""
+    from src.agents.strategies import STRATEGY_REGISTRY
+    from src.backtest.sweep import MAX_SWEEP_COMBINATIONS, SweepConfig
+
+    unknown = [s for s in request.strategies if s not in STRATEGY_REGISTRY]
+    if not request.strategies or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown strategies {unknown}. Must be from: {list(STRATEGY_REGISTRY.keys())}",
+        )
+
+    valid_timeframes = ["15m", "30m", "1h", "4h", "1d"]
+    if not request.timeframes or any(tf not in valid_timeframes for tf in request.timeframes):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid timeframes. Must be from: {valid_timeframes}",
+        )
+
+    if not request.symbols or not request.sl_tp_grid:
+        raise HTTPException(status_code=400, detail="symbols and sl_tp_grid must not be empty")
+
+    try:
+        start_dt = datetime.fromisoformat(request.start_date.replace("Z", "+00:00"))
+        end_dt = datetime.fromisoformat(request.end_date.replace("Z", "+00:00"))
+        if start_dt.tzinfo is None:
+            start_dt = start_dt.replace(tzinfo=timezone.utc)
+        if end_dt.tzinfo is None:
+            end_dt = end_dt.replace(tzinfo=timezone.utc)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use ISO format.")
+
+    if end_dt <= start_dt:
+        raise HTTPException(status_code=400, detail="end_date must be after start_date")
+
+    config = SweepConfig(
+        strategies=list(dict.fromkeys(request.strategies)),
+        symbols=list(dict.fromkeys(s.upper() for s in request.symbols)),
+        timeframes=list(dict.fromkeys(request.timeframes)),
+        start_date=start_dt,
+        end_date=end_dt,
+        sl_tp_grid=list(dict.fromkeys(request.sl_tp_grid)),
+        initial_balance=request.initial_balance,
+    )
+    if config.total_combinations > MAX_SWEEP_COMBINATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Sweep has {config.total_combinations} combinations, "
+                f"max is {MAX_SWEEP_COMBINATIONS}"
+            ),
+        )
+
+    async with async_session() as session:
+        sweep = BacktestSweep(
+            strategies=config.strategies,
+            symbols=config.symbols,
+            timeframes=config.timeframes,
+            sl_tp_grid=[list(pair) for pair in config.sl_tp_grid],
+            start_date=start_dt,
+            end_date=end_dt,
+            initial_balance=Decimal(str(request.initial_balance)),
+            total_combinations=config.total_combinations,
+            status="pending",
+        )
+        session.add(sweep)
+        await session.commit()
+        await session.refresh(sweep)
+        sweep_id = sweep.id
+
+    task = asyncio.create_task(_run_backtest_sweep(sweep_id, config))
+    _running_sweep_tasks[sweep_id] = task
+    task.add_done_callback(lambda t: _running_sweep_tasks.pop(sweep_id, None))
+
+    return {
+        "sweep_id": sweep_id,
+        "status": "pending",
+        "total_combinations": config.total_combinations,
+    }
+
+
+@app.post("/backtest/sweeps/{sweep_id}/cancel")
+async def cancel_backtest_sweep(sweep_id: int):
+    """Cancel a running backtest sweep (finished combinations are kept)."""
+    task = _running_sweep_tasks.get(sweep_id)
+    if not task:
+        async with async_session() as session:
+            result = await session.execute(
+                select(BacktestSweep).where(BacktestSweep.id == sweep_id)
+            )
+            sweep = result.scalar_one_or_none()
+            if not sweep:
+                raise HTTPException(404, "Backtest sweep not found")
+            if sweep.status in ("completed", "failed", "cancelled"):
+                return {"status": sweep.status, "message": "Already finished"}
+            sweep.status = "cancelled"
+            sweep.error_message = "Cancelled by user"
+            sweep.completed_at = datetime.now(timezone.utc)
+            await session.commit()
+            return {"status": "cancelled"}
+
+    task.cancel()
+    try:
+        await asyncio.wait_for(asyncio.shield(task), timeout=5.0)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        pass
+    return {"status": "cancelled"}
+
+
+def _opt_float(value) -> float | None:
+    """Serialize a nullable Numeric column as a float."""
+    return float(value) if value is not None else None
+
+
+@app.get("/backtest/sweeps/{sweep_id}")
+async def get_backtest_sweep(sweep_id: int):
+    """Get a sweep's progress and results matrix, best total PnL first."""
+    async with async_session() as session:
+        result = await session.execute(
+            select(BacktestSweep).where(BacktestSweep.id == sweep_id)
+        )
+        sweep = result.scalar_one_or_none()
+
+        if not sweep:
+            raise HTTPException(status_code=404, detail="Backtest sweep not found")
+
+        runs_result = await session.execute(
+            select(BacktestRun)
+            .where(BacktestRun.sweep_id == sweep_id)
+            .order_by(BacktestRun.total_pnl.desc().nulls_last())
+        )
+        runs = runs_result.scalars().all()
+
+        return {
+            "id": sweep.id,
+            "strategies": sweep.strategies,
+            "symbols": sweep.symbols,
+            "timeframes": sweep.timeframes,
+            "sl_tp_grid": sweep.sl_tp_grid,
+            "start_date": sweep.start_date.isoformat(),
+            "end_date": sweep.end_date.isoformat(),
+            "initial_balance": float(sweep.initial_balance),
+            "total_combinations": sweep.total_combinations,
+            "completed_combinations": sweep.completed_combinations,
+            "status": sweep.status,
+            "error_message": sweep.error_message,
+            "started_at": sweep.started_at.isoformat(),
+            "completed_at": sweep.completed_at.isoformat() if sweep.completed_at else None,
+            "results": [
+                {
+                    "run_id": r.id,
+                    "strategy_archetype": r.strategy_archetype,
+                    "symbol": r.symbol,
+                    "timeframe": r.timeframe,
+                    "stop_loss_pct": _opt_float(r.stop_loss_pct),
+                    "take_profit_pct": _opt_float(r.take_profit_pct),
+                    "status": r.status,
+                    "final_equity": _opt_float(r.final_equity),
+                    "total_pnl": _opt_float(r.total_pnl),
+                    "total_trades": r.total_trades,
+                    "winning_trades": r.winning_trades,
+                    "max_drawdown_pct": _opt_float(r.max_drawdown_pct),
+                    "sharpe_ratio": _opt_float(r.sharpe_ratio),
+                    "error_message": r.error_message,
+                }
+                for r in runs
+            ],
+        }
+
+
 # =============================================================================
 # Twitter Endpoints
 # =============================================================================
@@ -995,7 +1159,7 @@ async def run_twitter_poll():
                 for tf in ["15m", "30m", "1h", "4h", "1d"]:
                     try:
                         async with async_session() as session:
-                            orchestrator = AgentOrchestrator(session)
+                            orchestrator = AgentOrchestrator(session, session_factory=async_session)
                             await orchestrator.run_tweet_cycle(tf, current_prices)
                     except Exception as e:
                         logger.exception(f"Tweet agent cycle failed for {tf}: {e}")
@@ -1511,7 +1675,7 @@ async def trigger_twitter():
                 for tf in ["15m", "30m", "1h", "4h", "1d"]:
                     try:
                         async with async_session() as session:
-                            orchestrator = AgentOrchestrator(session)
+                            orchestrator = AgentOrchestrator(session, session_factory=async_session)
                             tf_result = await orchestrator.run_tweet_cycle(tf, current_prices)
                             tweet_results[tf] = {
                                 "agents_processed": tf_result["agents_processed"],
@@ -1937,6 +2101,9 @@ async def add_watch_wallet(request: MemecoinWalletRequest):
         session.add(wallet)
         await session.commit()
         await session.refresh(wallet)
+        watched_wallets.add(
+            WatchedWallet(wallet.id, wallet.address, wallet.label, float(wallet.score))
+        )
 
         return {
             "id": wallet.id,
@@ -1961,6 +2128,7 @@ async def delete_watch_wallet(address: str):
 
         wallet.is_active = False
         await session.commit()
+        watched_wallets.remove(address)
         return {"status": "deactivated", "address": address}
 
 
@@ -2158,21 +2326,18 @@ async def list_cross_reference_checks():
 
 @app.post("/webhooks/helius/wallet-activity")
 async def helius_webhook(request_data: list[dict] | dict = []):
-    """Helius webhook handler for wallet swap activity. Always returns 200."""
-    from src.memecoins.wallet_monitor import WalletMonitor
+    """Helius webhook handler for wallet swap activity. Always returns 200.
 
+    Events from fee payers outside the wallet index are dropped right away;
+    the rest are queued and processed in micro-batches in the background.
+    """
     events = request_data if isinstance(request_data, list) else [request_data]
     if not events:
-        return {"processed": 0}
+        return {"queued": 0}
 
-    try:
-        async with async_session() as session:
-            monitor = WalletMonitor(session)
-            result = await monitor.handle_webhook(events)
-            return result
-    except Exception as e:
-        logger.exception(f"Webhook processing failed: {e}")
-        return {"processed": 0, "error": str(e)}
+    relevant = [e for e in events if not watched_wallets.rejects(e.get("feePayer", ""))]
+    queued = webhook_ingestor.enqueue(relevant) if relevant else 0
+    return {"queued": queued, "rejected": len(events) - len(relevant), "total": len(events)}
 
 
 MEMECOIN_TWITTER_CATEGORIES = ["caller", "influencer", "degen", "news"]
@@ -2651,6 +2816,10 @@ async def retention_cleanup():
 @app.on_event("startup")
 async def on_startup():
     """Start the scheduler on app startup."""
+    # Open the Binance connection pool up front so the first pipeline run
+    # reuses warm keep-alive connections instead of handshaking per request.
+    get_http_client(settings.binance_base_url)
+
     # Schedule each timeframe as an independent job.
     # This ensures slow/failing timeframes never block others.
     # Stagger initial runs by 10s each to avoid Binance API rate limits on startup.
@@ -2800,9 +2969,13 @@ async def on_startup():
 
 @app.on_event("shutdown")
 async def on_shutdown():
-    """Stop the scheduler on app shutdown."""
+    """Stop the scheduler, drain queued webhooks and close pooled HTTP connections."""
     scheduler.shutdown(wait=False)
     logger.info("Scheduler stopped")
+    await webhook_ingestor.stop()
+    await close_http_clients()
+    if compute_pool is not None:
+        compute_pool.shutdown()
 
 
 if __name__ == "__main__":
@@ -11,8 +11,8 @@ from decimal import Decimal
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.memecoins.dexscreener_client import DexScreenerClient
 from src.memecoins.helius_client import HeliusClient
+from src.memecoins.token_resolver import TokenResolver, token_resolver
 from src.models.db import (
     AnalyzedWallet,
     CrossReferenceCheck,
@@ -43,11 +43,11 @@ class CrossReferenceChecker:
         self,
         session: AsyncSession,
         helius: HeliusClient | None = None,
-        dex: DexScreenerClient | None = None,
+        resolver: TokenResolver | None = None,
     ):
         self.session = session
         self.helius = helius or HeliusClient()
-        self.dex = dex or DexScreenerClient()
+        self.resolver = resolver or token_resolver
 
     async def check_token(self, mint: str) -> dict:
         """Check a new token's buyers against our wallet database.
@@ -59,7 +59,7 @@ class CrossReferenceChecker:
         token_name = None
         market_cap = None
         try:
-            pairs = await self.dex.get_token_pairs(mint)
+            pairs = await self.resolver.get_token_pairs(mint)
             if pairs:
                 best = pairs[0]
                 token_symbol = best.get("baseToken", {}).get("symbol")
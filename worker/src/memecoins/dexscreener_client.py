@@ -11,11 +11,14 @@ from typing import Any
 import httpx
 
 from src.cache import cache_get, cache_set
+from src.http_pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.dexscreener.com"
 CACHE_TTL_SECONDS = 60
+# The multi-token endpoint accepts up to 30 comma-separated addresses
+MAX_ADDRESSES_PER_REQUEST = 30
 
 
 class DexScreenerAPIError(Exception):
@@ -41,27 +44,27 @@ class DexScreenerClient:
         for attempt in range(self.MAX_RETRIES + 1):
             async with self._semaphore:
                 try:
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        response = await client.get(url, params=params)
+                    client = get_http_client(url)
+                    response = await client.get(url, params=params, timeout=self.timeout)
 
-                        if response.status_code == 200:
-                            return response.json()
+                    if response.status_code == 200:
+                        return response.json()
 
-                        if response.status_code == 429:
-                            if attempt < self.MAX_RETRIES:
-                                delay = self.BASE_RETRY_DELAY * (2 ** attempt)
-                                logger.warning(f"DexScreener rate limited, waiting {delay}s")
-                                await asyncio.sleep(delay)
-                                continue
-                            raise DexScreenerAPIError(429, "Rate limit exceeded")
+                    if response.status_code == 429:
+                        if attempt < self.MAX_RETRIES:
+                            delay = self.BASE_RETRY_DELAY * (2 ** attempt)
+                            logger.warning(f"DexScreener rate limited, waiting {delay}s")
+                            await asyncio.sleep(delay)
+                            continue
+                        raise DexScreenerAPIError(429, "Rate limit exceeded")
 
-                        if response.status_code >= 500:
-                            if attempt < self.MAX_RETRIES:
-                                delay = self.BASE_RETRY_DELAY * (2 ** attempt)
-                                await asyncio.sleep(delay)
-                                continue
+                    if response.status_code >= 500:
+                        if attempt < self.MAX_RETRIES:
+                            delay = self.BASE_RETRY_DELAY * (2 ** attempt)
+                            await asyncio.sleep(delay)
+                            continue
 
-                        raise DexScreenerAPIError(response.status_code, response.text[:200])
+                    raise DexScreenerAPIError(response.status_code, response.text[:200])
 
                 except httpx.TimeoutException:
                     if attempt < self.MAX_RETRIES:
@@ -77,16 +80,25 @@ class DexScreenerClient:
 
         raise DexScreenerAPIError(0, "Max retries exceeded")
 
-    async def search_tokens(self, query: str) -> list[dict]:
-        """Search for tokens by name/symbol. Returns pairs."""
+    async def search_tokens(self, query: str, use_cache: bool = True) -> list[dict]:
+        """Search for tokens by name/symbol. Returns pairs.
+
+        Args:
+            query: Search text.
+            use_cache: Read and write the Redis cache (TokenResolver passes
+                False and caches results under its own keys).
+        """
         cache_key = f"dex:search:{query.lower()}"
-        cached = await cache_get(cache_key)
-        if cached:
-            return json.loads(cached)
+        if use_cache:
+            cached = await cache_get(cache_key)
+            if cached:
+                return json.loads(cached)
 
         url = f"{BASE_URL}/latest/dex/search"
         data = await self._request(url, params={"q": query})
         pairs = data.get("pairs", []) if isinstance(data, dict) else []
+        if not use_cache:
+            return pairs
 
         try:
             await cache_set(cache_key, json.dumps(pairs), CACHE_TTL_SECONDS)
@@ -113,6 +125,17 @@ class DexScreenerClient:
 
         return pairs
 
+    async def get_tokens_pairs(self, mints: list[str]) -> list[dict]:
+        """Get trading pairs for up to MAX_ADDRESSES_PER_REQUEST mints in one call.
+
+        Uncached — callers go through TokenResolver, which caches per mint.
+        """
+        if len(mints) > MAX_ADDRESSES_PER_REQUEST:
+            raise ValueError(f"At most {MAX_ADDRESSES_PER_REQUEST} addresses per request")
+        url = f"{BASE_URL}/latest/dex/tokens/{','.join(mints)}"
+        data = await self._request(url)
+        return (data.get("pairs") or []) if isinstance(data, dict) else []
+
     async def get_top_boosts(self) -> list[dict]:
         """Get top boosted tokens (trending)."""
         cache_key = "dex:top_boosts"
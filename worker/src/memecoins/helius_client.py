@@ -1,7 +1,9 @@
 """Helius API client (free tier) for Solana token/wallet data.
 
 Free tier: 1M credits/mo, 10 RPS.
-Uses same httpx + semaphore + backoff pattern as TwitterClient.
+Uses same httpx + backoff pattern as TwitterClient. Rate-limited calls go
+through one module-level token bucket, so concurrent analyses, discovery
+runs and enrichment workers share the account's request budget.
 """
 
 import asyncio
@@ -13,12 +15,23 @@ import httpx
 
 from src.cache import cache_get, cache_set
 from src.config import settings
+from src.exchange.rate_limiter import WeightRateLimiter
+from src.http_pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.helius.xyz/v0"
 RPC_URL = "https://mainnet.helius-rpc.com"
 CACHE_TTL_SECONDS = 300  # 5 minutes
+MAX_CONCURRENT_REQUESTS = 5
+
+# Module-level singleton shared by every HeliusClient (one request = weight 1)
+helius_rate_limiter = WeightRateLimiter(
+    weight_limit=settings.helius_requests_per_second,
+    window_seconds=1.0,
+    max_concurrency=MAX_CONCURRENT_REQUESTS,
+    min_concurrency=MAX_CONCURRENT_REQUESTS,
+)
 
 
 class HeliusAPIError(Exception):
@@ -31,14 +44,18 @@ class HeliusAPIError(Exception):
 class HeliusClient:
     """HTTP client for Helius API with rate limiting and caching."""
 
-    MAX_CONCURRENT_REQUESTS = 5
     MAX_RETRIES = 3
     BASE_RETRY_DELAY = 1.0
 
-    def __init__(self, api_key: str | None = None, timeout: float = 30.0):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        timeout: float = 30.0,
+        rate_limiter: WeightRateLimiter | None = None,
+    ):
         self.api_key = api_key or settings.helius_api_key
         self.timeout = timeout
-        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._rate_limiter = rate_limiter or helius_rate_limiter
 
     async def _request(
         self,
@@ -53,36 +70,40 @@ class HeliusClient:
         params["api-key"] = self.api_key
 
         for attempt in range(self.MAX_RETRIES + 1):
-            async with self._semaphore:
+            async with self._rate_limiter.slot():
                 try:
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        if method == "GET":
-                            response = await client.get(url, params=params)
-                        else:
-                            response = await client.post(url, params=params, json=json_body)
-
-                        if response.status_code == 200:
-                            return response.json()
-
-                        if response.status_code == 429:
-                            if attempt < self.MAX_RETRIES:
-                                delay = self.BASE_RETRY_DELAY * (2 ** attempt)
-                                logger.warning(f"Helius rate limited, waiting {delay}s")
-                                await asyncio.sleep(delay)
-                                continue
-                            raise HeliusAPIError(429, "Rate limit exceeded")
-
-                        if response.status_code >= 500:
-                            if attempt < self.MAX_RETRIES:
-                                delay = self.BASE_RETRY_DELAY * (2 ** attempt)
-                                logger.warning(
-                                    f"Helius server error {response.status_code}, "
-                                    f"retrying in {delay}s (attempt {attempt + 1})"
-                                )
-                                await asyncio.sleep(delay)
-                                continue
-
-                        raise HeliusAPIError(response.status_code, response.text[:200])
+                    client = get_http_client(url)
+                    if method == "GET":
+                        response = await client.get(url, params=params, timeout=self.timeout)
+                    else:
+                        response = await client.post(
+                            url, params=params, json=json_body, timeout=self.timeout
+                        )
+
+                    if response.status_code == 200:
+                        return response.json()
+
+                    if response.status_code == 429:
+                        if attempt < self.MAX_RETRIES:
+                            delay = self.BASE_RETRY_DELAY * (2 ** attempt)
+                            logger.warning(f"Helius rate limited, waiting {delay}s")
+                            # Back off every caller sharing the budget, not just this one
+                            self._rate_limiter.pause(delay)
+                            await asyncio.sleep(delay)
+                            continue
+                        raise HeliusAPIError(429, "Rate limit exceeded")
+
+                    if response.status_code >= 500:
+                        if attempt < self.MAX_RETRIES:
+                            delay = self.BASE_RETRY_DELAY * (2 ** attempt)
+                            logger.warning(
+                                f"Helius server error {response.status_code}, "
+                                f"retrying in {delay}s (attempt {attempt + 1})"
+                            )
+                            await asyncio.sleep(delay)
+                            continue
+
+                    raise HeliusAPIError(response.status_code, response.text[:200])
 
                 except httpx.TimeoutException:
                     if attempt < self.MAX_RETRIES:
@@ -110,18 +131,19 @@ class HeliusClient:
             return json.loads(cached)
 
         url = f"{RPC_URL}/?api-key={self.api_key}"
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": "ab-meta",
-                    "method": "getAsset",
-                    "params": {"id": mint},
-                },
-            )
-            data = response.json()
-            result = data.get("result", {})
+        client = get_http_client(url)
+        response = await client.post(
+            url,
+            json={
+                "jsonrpc": "2.0",
+                "id": "ab-meta",
+                "method": "getAsset",
+                "params": {"id": mint},
+            },
+            timeout=self.timeout,
+        )
+        data = response.json()
+        result = data.get("result", {})
 
         try:
             await cache_set(cache_key, json.dumps(result), CACHE_TTL_SECONDS)
@@ -166,30 +188,45 @@ class HeliusClient:
         url = f"{RPC_URL}/?api-key={self.api_key}"
 
         try:
-            async with self._semaphore:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    while total < max_holders:
-                        params: dict = {"mint": mint, "limit": 1000}
-                        if cursor:
-                            params["cursor"] = cursor
+            client = get_http_client(url)
+            attempt = 0
+            while total < max_holders:
+                params: dict = {"mint": mint, "limit": 1000}
+                if cursor:
+                    params["cursor"] = cursor
+
+                # One slot per page, so a long crawl pays for every request
+                async with self._rate_limiter.slot():
+                    response = await client.post(
+                        url,
+                        json={
+                            "jsonrpc": "2.0",
+                            "id": "ab-holder-count",
+                            "method": "getTokenAccounts",
+                            "params": params,
+                        },
+                        timeout=self.timeout,
+                    )
 
-                        response = await client.post(
-                            url,
-                            json={
-                                "jsonrpc": "2.0",
-                                "id": "ab-holder-count",
-                                "method": "getTokenAccounts",
-                                "params": params,
-                            },
-                        )
-                        data = response.json()
-                        result = data.get("result", {})
-                        accounts = result.get("token_accounts", [])
-                        total += len(accounts)
+                if response.status_code == 429:
+                    if attempt >= self.MAX_RETRIES:
+                        raise HeliusAPIError(429, "Rate limit exceeded")
+                    delay = self.BASE_RETRY_DELAY * (2 ** attempt)
+                    logger.warning(f"Helius rate limited counting holders, waiting {delay}s")
+                    self._rate_limiter.pause(delay)
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+                attempt = 0
 
-                        cursor = result.get("cursor")
-                        if not cursor or len(accounts) < 1000:
-                            break
+                data = response.json()
+                result = data.get("result", {})
+                accounts = result.get("token_accounts", [])
+                total += len(accounts)
+
+                cursor = result.get("cursor")
+                if not cursor or len(accounts) < 1000:
+                    break
 
             try:
                 await cache_set(cache_key, str(total), 60)
@@ -204,18 +241,19 @@ class HeliusClient:
     async def get_token_holders(self, mint: str) -> list[dict]:
         """Get token holder list via DAS API."""
         url = f"{RPC_URL}/?api-key={self.api_key}"
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": "ab-holders",
-                    "method": "getTokenAccounts",
-                    "params": {"mint": mint, "limit": 100},
-                },
-            )
-            data = response.json()
-            return data.get("result", {}).get("token_accounts", [])
+        client = get_http_client(url)
+        response = await client.post(
+            url,
+            json={
+                "jsonrpc": "2.0",
+                "id": "ab-holders",
+                "method": "getTokenAccounts",
+                "params": {"mint": mint, "limit": 100},
+            },
+            timeout=self.timeout,
+        )
+        data = response.json()
+        return data.get("result", {}).get("token_accounts", [])
 
     async def register_webhook(
         self, addresses: list[str], webhook_url: str
@@ -238,11 +276,11 @@ class HeliusClient:
         """Delete a webhook by ID."""
         url = f"{BASE_URL}/webhooks/{webhook_id}"
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.delete(
-                    url, params={"api-key": self.api_key}
-                )
-                return response.status_code == 200
+            client = get_http_client(url)
+            response = await client.delete(
+                url, params={"api-key": self.api_key}, timeout=self.timeout
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.warning(f"Failed to delete webhook {webhook_id}: {e}")
             return False
@@ -256,16 +294,16 @@ class HeliusClient:
             "method": method,
             "params": params,
         }
-        async with self._semaphore:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=body)
-                data = response.json()
-                if "error" in data:
-                    raise HeliusAPIError(
-                        response.status_code,
-                        data["error"].get("message", str(data["error"])),
-                    )
-                return data.get("result")
+        async with self._rate_limiter.slot():
+            client = get_http_client(url)
+            response = await client.post(url, json=body, timeout=self.timeout)
+            data = response.json()
+            if "error" in data:
+                raise HeliusAPIError(
+                    response.status_code,
+                    data["error"].get("message", str(data["error"])),
+                )
+            return data.get("result")
 
     async def get_sol_balance(self, address: str) -> float:
         """Get SOL balance for a wallet in SOL (not lamports)."""
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.memecoins.dexscreener_client import DexScreenerClient
 from src.memecoins.helius_client import HeliusClient
+from src.memecoins.watched_wallets import watched_wallets
 from src.models.db import (
     AnalyzedWallet,
     TokenAnalysis,
@@ -40,6 +41,9 @@ EXCLUDED_ADDRESSES = {
 
 PAGE_SIZE = 100
 MAX_PAGES = 50  # Safety limit: 50 pages * 100 txs = 5000 txs max
+CHECKPOINT_EVERY_PAGES = 5  # Commit pagination progress every N pages
+ENRICH_CONCURRENCY = 5  # Wallets enriched in parallel (Helius budget is shared)
+ENRICH_BATCH_SIZE = 25  # Enriched wallets upserted per statement
 
 
 class TokenAnalyzer:
@@ -155,188 +159,87 @@ class TokenAnalyzer:
 
             # Collect unique buyer wallets
             buyers: list[dict] = []
-            seen_wallets: set[str] = set()
 
             # Resume: reload already-found wallets
-            existing_entries = await session.execute(
-                select(WalletTokenEntry).where(
-                    WalletTokenEntry.analysis_id == analysis_id
-                )
+            existing = await session.execute(
+                select(AnalyzedWallet.address)
+                .join(WalletTokenEntry, WalletTokenEntry.wallet_id == AnalyzedWallet.id)
+                .where(WalletTokenEntry.analysis_id == analysis_id)
             )
-            for entry in existing_entries.scalars().all():
-                wallet_result = await session.execute(
-                    select(AnalyzedWallet).where(AnalyzedWallet.id == entry.wallet_id)
-                )
-                wallet = wallet_result.scalar_one_or_none()
-                if wallet:
-                    seen_wallets.add(wallet.address)
+            seen_wallets: set[str] = set(existing.scalars().all())
 
             logger.info(
                 f"Analysis #{analysis_id}: starting from page {pages_fetched}, "
                 f"{len(seen_wallets)} wallets already found"
             )
 
-            # Paginate through token transactions
-            for page in range(pages_fetched, MAX_PAGES):
-                if len(buyers) + len(seen_wallets) >= target:
-                    break
-
-                try:
-                    txs = await self.helius.get_wallet_transactions(
-                        mint, limit=PAGE_SIZE, before=last_sig
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to fetch page {page} for {mint}: {e}")
-                    # Save checkpoint and pause
-                    analysis.status = "paused"
-                    analysis.error_message = f"Paused at page {page}: {e}"
-                    analysis.progress = {
-                        "last_signature": last_sig,
-                        "pages_fetched": page,
-                        "total_txs_scanned": total_scanned,
-                    }
-                    await session.commit()
-                    return
-
-                if not txs:
-                    break  # No more transactions
-
-                for tx in txs:
-                    if len(buyers) + len(seen_wallets) >= target:
-                        break
+            # Paginate through token transactions. Each page's cursor is the
+            # last signature of the previous one, so the next page is fetched
+            # while the current one is being parsed.
+            next_page = None
+            if len(seen_wallets) < target and pages_fetched < MAX_PAGES:
+                next_page = asyncio.create_task(self._fetch_page(mint, last_sig))
 
-                    fee_payer = tx.get("feePayer", "")
-                    if (
-                        not fee_payer
-                        or fee_payer in seen_wallets
-                        or fee_payer in EXCLUDED_ADDRESSES
-                    ):
-                        continue
-
-                    tx_type = tx.get("type", "")
-                    if tx_type not in ("SWAP", "TRANSFER"):
-                        continue
-
-                    seen_wallets.add(fee_payer)
-
-                    # Extract SOL amount from native transfers or token transfers
-                    amount_sol = Decimal("0")
-                    for transfer in tx.get("nativeTransfers", []):
-                        if transfer.get("fromUserAccount") == fee_payer:
-                            lamports = transfer.get("amount", 0)
-                            amount_sol += Decimal(str(lamports)) / Decimal("1000000000")
-
-                    block_time = tx.get("timestamp", 0)
-                    block_dt = (
-                        datetime.fromtimestamp(block_time, tz=timezone.utc)
-                        if block_time
-                        else None
-                    )
-
-                    buyers.append({
-                        "wallet": fee_payer,
-                        "entry_rank": len(seen_wallets),
-                        "tx_signature": tx.get("signature", ""),
-                        "block_time": block_dt,
-                        "amount_sol": amount_sol,
-                    })
+            checkpointed_page = pages_fetched
+            page = pages_fetched
+            try:
+                while next_page is not None:
+                    try:
+                        txs = await next_page
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch page {page} for {mint}: {e}")
+                        # Save checkpoint and pause
+                        analysis.status = "paused"
+                        analysis.error_message = f"Paused at page {page}: {e}"
+                        analysis.progress = {
+                            "last_signature": last_sig,
+                            "pages_fetched": page,
+                            "total_txs_scanned": total_scanned,
+                        }
+                        await session.commit()
+                        return
+                    next_page = None
 
-                    total_scanned += 1
+                    if not txs:
+                        break  # No more transactions
 
-                # Update last signature for pagination
-                if txs:
+                    # Update last signature for pagination and prefetch the next page
                     last_sig = txs[-1].get("signature")
+                    page += 1
+                    if page < MAX_PAGES:
+                        next_page = asyncio.create_task(self._fetch_page(mint, last_sig))
 
-                # Save checkpoint after each page
-                analysis.progress = {
-                    "last_signature": last_sig,
-                    "pages_fetched": page + 1,
-                    "total_txs_scanned": total_scanned,
-                }
-                analysis.found_buyers = len(seen_wallets)
-                await session.commit()
+                    total_scanned += self._collect_buyers(txs, buyers, seen_wallets, target)
+                    if len(seen_wallets) >= target:
+                        break
 
-                # Brief pause to respect rate limits
-                await asyncio.sleep(0.15)
+                    # Save checkpoint every few pages
+                    if page - checkpointed_page >= CHECKPOINT_EVERY_PAGES:
+                        analysis.progress = {
+                            "last_signature": last_sig,
+                            "pages_fetched": page,
+                            "total_txs_scanned": total_scanned,
+                        }
+                        analysis.found_buyers = len(seen_wallets)
+                        await session.commit()
+                        checkpointed_page = page
+            finally:
+                if next_page is not None:
+                    next_page.cancel()
+
+            analysis.progress = {
+                "last_signature": last_sig,
+                "pages_fetched": page,
+                "total_txs_scanned": total_scanned,
+            }
+            await session.commit()
 
             logger.info(
                 f"Analysis #{analysis_id}: found {len(buyers)} new buyers, "
                 f"enriching wallet profiles"
             )
 
-            # Enrich and persist each buyer wallet
-            for i, buyer in enumerate(buyers):
-                try:
-                    wallet_data = await self._enrich_wallet(buyer["wallet"])
-
-                    # Upsert analyzed wallet
-                    stmt = pg_insert(AnalyzedWallet).values(
-                        address=buyer["wallet"],
-                        sol_balance=wallet_data.get("sol_balance"),
-                        usdc_balance=wallet_data.get("usdc_balance"),
-                        first_tx_at=wallet_data.get("first_tx_at"),
-                        total_tx_count=wallet_data.get("total_tx_count"),
-                        estimated_pnl_sol=wallet_data.get("estimated_pnl_sol"),
-                        win_rate=wallet_data.get("win_rate"),
-                        tokens_traded=wallet_data.get("tokens_traded"),
-                        current_holdings=wallet_data.get("current_holdings", []),
-                        tags=wallet_data.get("tags", []),
-                        last_enriched_at=datetime.now(timezone.utc),
-                    ).on_conflict_do_update(
-                        index_elements=["address"],
-                        set_={
-                            "sol_balance": wallet_data.get("sol_balance"),
-                            "usdc_balance": wallet_data.get("usdc_balance"),
-                            "first_tx_at": wallet_data.get("first_tx_at"),
-                            "total_tx_count": wallet_data.get("total_tx_count"),
-                            "estimated_pnl_sol": wallet_data.get("estimated_pnl_sol"),
-                            "win_rate": wallet_data.get("win_rate"),
-                            "tokens_traded": wallet_data.get("tokens_traded"),
-                            "current_holdings": wallet_data.get("current_holdings", []),
-                            "tags": wallet_data.get("tags", []),
-                            "last_enriched_at": datetime.now(timezone.utc),
-                        },
-                    )
-                    result = await session.execute(stmt)
-
-                    # Get the wallet ID
-                    wallet_result = await session.execute(
-                        select(AnalyzedWallet).where(
-                            AnalyzedWallet.address == buyer["wallet"]
-                        )
-                    )
-                    wallet = wallet_result.scalar_one()
-
-                    # Insert wallet-token entry
-                    entry_stmt = pg_insert(WalletTokenEntry).values(
-                        wallet_id=wallet.id,
-                        analysis_id=analysis_id,
-                        mint_address=mint,
-                        token_symbol=analysis.token_symbol,
-                        entry_rank=buyer["entry_rank"],
-                        entry_tx_signature=buyer["tx_signature"],
-                        entry_block_time=buyer["block_time"],
-                        amount_sol=buyer["amount_sol"],
-                        token_mcap_at_entry=analysis.market_cap_usd,
-                        token_peak_mcap=analysis.market_cap_usd,
-                    ).on_conflict_do_nothing(
-                        constraint="uq_wallet_token_entry"
-                    )
-                    await session.execute(entry_stmt)
-
-                    # Update progress
-                    analysis.found_buyers = len(seen_wallets) - len(buyers) + i + 1
-                    if (i + 1) % 5 == 0:
-                        await session.commit()
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to enrich wallet {buyer['wallet']}: {e}"
-                    )
-                    continue
-
-                # Rate limit between enrichments
-                await asyncio.sleep(0.2)
+            await self._enrich_buyers(session, analysis, buyers, len(seen_wallets))
 
             # Mark completed
             analysis.status = "completed"
@@ -346,6 +249,172 @@ class TokenAnalyzer:
 
             logger.info(f"Analysis #{analysis_id} completed: {len(seen_wallets)} wallets")
 
+    async def _fetch_page(self, mint: str, before: str | None) -> list[dict]:
+        return await self.helius.get_wallet_transactions(mint, limit=PAGE_SIZE, before=before)
+
+    @staticmethod
+    def _collect_buyers(
+        txs: list[dict], buyers: list[dict], seen_wallets: set[str], target: int
+    ) -> int:
+        """Append first-time buyers from one page; returns how many were added."""
+        added = 0
+        for tx in txs:
+            if len(seen_wallets) >= target:
+                break
+
+            fee_payer = tx.get("feePayer", "")
+            if (
+                not fee_payer
+                or fee_payer in seen_wallets
+                or fee_payer in EXCLUDED_ADDRESSES
+            ):
+                continue
+
+            tx_type = tx.get("type", "")
+            if tx_type not in ("SWAP", "TRANSFER"):
+                continue
+
+            seen_wallets.add(fee_payer)
+
+            # Extract SOL amount from native transfers or token transfers
+            amount_sol = Decimal("0")
+            for transfer in tx.get("nativeTransfers", []):
+                if transfer.get("fromUserAccount") == fee_payer:
+                    lamports = transfer.get("amount", 0)
+                    amount_sol += Decimal(str(lamports)) / Decimal("1000000000")
+
+            block_time = tx.get("timestamp", 0)
+            block_dt = (
+                datetime.fromtimestamp(block_time, tz=timezone.utc)
+                if block_time
+                else None
+            )
+
+            buyers.append({
+                "wallet": fee_payer,
+                "entry_rank": len(seen_wallets),
+                "tx_signature": tx.get("signature", ""),
+                "block_time": block_dt,
+                "amount_sol": amount_sol,
+            })
+            added += 1
+        return added
+
+    async def _enrich_buyers(
+        self,
+        session: AsyncSession,
+        analysis: TokenAnalysis,
+        buyers: list[dict],
+        total_found: int,
+    ) -> None:
+        """Enrich buyer wallets concurrently and persist them in batches.
+
+        Helius calls from all workers share the client's rate budget; database
+        writes stay on this coroutine, one bulk upsert per batch.
+        """
+        if not buyers:
+            return
+
+        # Captured up front: a failed batch rolls back and expires `analysis`
+        analysis_id = analysis.id
+        token_fields = {
+            "analysis_id": analysis_id,
+            "mint_address": analysis.mint_address,
+            "token_symbol": analysis.token_symbol,
+            "token_mcap_at_entry": analysis.market_cap_usd,
+            "token_peak_mcap": analysis.market_cap_usd,
+        }
+        semaphore = asyncio.Semaphore(ENRICH_CONCURRENCY)
+
+        async def enrich(buyer: dict) -> tuple[dict, dict | None]:
+            async with semaphore:
+                try:
+                    return buyer, await self._enrich_wallet(buyer["wallet"])
+                except Exception as e:
+                    logger.warning(f"Failed to enrich wallet {buyer['wallet']}: {e}")
+                    return buyer, None
+
+        tasks = [asyncio.create_task(enrich(buyer)) for buyer in buyers]
+        batch: list[tuple[dict, dict]] = []
+        processed = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                buyer, wallet_data = await next_done
+                processed += 1
+                if wallet_data is not None:
+                    batch.append((buyer, wallet_data))
+                if len(batch) >= ENRICH_BATCH_SIZE or processed == len(buyers):
+                    try:
+                        await self._persist_wallets(session, token_fields, batch)
+                    except Exception as e:
+                        await session.rollback()
+                        logger.warning(
+                            f"Failed to persist {len(batch)} wallets for "
+                            f"analysis #{analysis_id}: {e}"
+                        )
+                    batch = []
+                    # Update progress
+                    analysis.found_buyers = total_found - len(buyers) + processed
+                    await session.commit()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    async def _persist_wallets(
+        session: AsyncSession, token_fields: dict, batch: list[tuple[dict, dict]]
+    ) -> None:
+        """Upsert enriched wallets and their entries for this token in bulk.
+
+        Args:
+            session: Database session.
+            token_fields: WalletTokenEntry columns shared by the whole analysis.
+            batch: (buyer, enriched wallet data) pairs.
+        """
+        if not batch:
+            return
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "address": buyer["wallet"],
+                "sol_balance": wallet_data.get("sol_balance"),
+                "usdc_balance": wallet_data.get("usdc_balance"),
+                "first_tx_at": wallet_data.get("first_tx_at"),
+                "total_tx_count": wallet_data.get("total_tx_count"),
+                "estimated_pnl_sol": wallet_data.get("estimated_pnl_sol"),
+                "win_rate": wallet_data.get("win_rate"),
+                "tokens_traded": wallet_data.get("tokens_traded"),
+                "current_holdings": wallet_data.get("current_holdings", []),
+                "tags": wallet_data.get("tags", []),
+                "last_enriched_at": now,
+            }
+            for buyer, wallet_data in batch
+        ]
+        stmt = pg_insert(AnalyzedWallet).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["address"],
+            set_={col: stmt.excluded[col] for col in rows[0] if col != "address"},
+        ).returning(AnalyzedWallet.address, AnalyzedWallet.id)
+        result = await session.execute(stmt)
+        wallet_ids = dict(result.all())
+
+        entry_stmt = pg_insert(WalletTokenEntry).values([
+            {
+                **token_fields,
+                "wallet_id": wallet_ids[buyer["wallet"]],
+                "entry_rank": buyer["entry_rank"],
+                "entry_tx_signature": buyer["tx_signature"],
+                "entry_block_time": buyer["block_time"],
+                "amount_sol": buyer["amount_sol"],
+            }
+            for buyer, _ in batch
+        ]).on_conflict_do_nothing(constraint="uq_wallet_token_entry")
+        await session.execute(entry_stmt)
+        # A rolled-back batch leaves extra addresses behind, which only costs
+        # the notification lookup a wasted query
+        watched_wallets.add_analyzed(wallet_ids)
+
     async def _enrich_wallet(self, address: str) -> dict:
         """Fetch rich wallet data from Helius."""
         data: dict = {}
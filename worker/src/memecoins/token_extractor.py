@@ -11,7 +11,7 @@ from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.memecoins.dexscreener_client import DexScreenerClient
+from src.memecoins.token_resolver import TokenResolver, token_resolver
 from src.models.db import MemecoinTweetToken
 
 logger = logging.getLogger(__name__)
@@ -63,111 +63,124 @@ MAX_TOKEN_AGE_DAYS = 30  # only match tokens created within 30 days
 class TokenExtractor:
     """Extract token tickers from tweets and match against DexScreener."""
 
-    def __init__(self, dex: DexScreenerClient | None = None):
-        self.dex = dex or DexScreenerClient()
+    def __init__(self, resolver: TokenResolver | None = None):
+        self.resolver = resolver or token_resolver
 
     async def extract_and_match(
         self, session: AsyncSession, tweet_db_id: int, text: str
     ) -> list[dict]:
-        """Extract tickers from tweet text and search DexScreener.
+        """Extract tickers from one tweet and search DexScreener.
 
-        Two-phase approach:
+        See extract_and_match_batch.
+        """
+        results = await self.extract_and_match_batch(session, [(tweet_db_id, text)])
+        return results[tweet_db_id]
+
+    async def extract_and_match_batch(
+        self, session: AsyncSession, tweets: list[tuple[int, str]]
+    ) -> dict[int, list[dict]]:
+        """Extract tickers from a batch of tweets and search DexScreener.
+
+        Two-phase approach, each phase resolved for the whole batch at once:
         1. CA/URL lookups — highest confidence, exact token resolution
         2. Symbol search — only for tickers NOT already resolved via Phase 1
 
         Args:
             session: DB session for persisting matches.
-            tweet_db_id: The memecoin_tweets.id for FK reference.
-            text: The tweet text to parse.
+            tweets: (memecoin_tweets.id, text) pairs.
 
         Returns:
-            List of matched token dicts.
+            Dict mapping each tweet id to its list of matched token dicts.
         """
-        matches: list[dict] = []
-        seen_mints: set[str] = set()
-        seen_symbols: set[str] = set()
+        contract_addresses = {
+            tweet_db_id: self._extract_contract_addresses(text) for tweet_db_id, text in tweets
+        }
+        pairs_by_mint = await self.resolver.resolve_mints(
+            [mint for mints in contract_addresses.values() for mint in mints]
+        )
+
+        matches: dict[int, list[dict]] = {}
+        seen_mints: dict[int, set[str]] = {}
+        seen_symbols: dict[int, set[str]] = {}
+        tickers: dict[int, list[str]] = {}
 
         # Phase 1: Contract address / URL lookups
-        contract_addresses = self._extract_contract_addresses(text)
-        for mint in contract_addresses:
-            if mint in seen_mints:
-                continue
+        for tweet_db_id, text in tweets:
+            tweet_matches = matches[tweet_db_id] = []
+            mints = seen_mints[tweet_db_id] = set()
+            symbols = seen_symbols[tweet_db_id] = set()
 
-            try:
-                pairs = await self.dex.get_token_pairs(mint)
-                for pair in self._filter_pairs(pairs):
+            for mint in contract_addresses[tweet_db_id]:
+                if mint in mints:
+                    continue
+
+                for pair in self._filter_pairs(pairs_by_mint.get(mint, [])):
                     token_data = self._pair_to_match(pair)
                     token_mint = token_data.get("token_mint")
                     token_symbol = token_data.get("token_symbol", "").upper()
 
-                    if token_mint and token_mint in seen_mints:
+                    if token_mint and token_mint in mints:
                         continue
 
-                    match = MemecoinTweetToken(
-                        tweet_id=tweet_db_id,
-                        token_mint=token_data.get("token_mint"),
-                        token_symbol=token_data["token_symbol"],
-                        token_name=token_data.get("token_name"),
-                        source="keyword",
-                        dexscreener_url=token_data.get("dexscreener_url"),
-                        market_cap_usd=token_data.get("market_cap_usd"),
-                        price_usd=token_data.get("price_usd"),
-                        liquidity_usd=token_data.get("liquidity_usd"),
-                    )
-                    session.add(match)
-                    matches.append(token_data)
+                    self._add_match(session, tweet_db_id, token_data)
+                    tweet_matches.append(token_data)
 
                     if token_mint:
-                        seen_mints.add(token_mint)
+                        mints.add(token_mint)
                     if token_symbol:
-                        seen_symbols.add(token_symbol)
+                        symbols.add(token_symbol)
                     break  # Take first valid match per mint
 
-            except Exception as e:
-                logger.debug(f"DexScreener lookup failed for mint {mint}: {e}")
+            tickers[tweet_db_id] = [
+                t for t in self._extract_tickers(text) if t not in symbols
+            ]
 
         # Phase 2: Symbol search (existing ticker extraction)
-        tickers = self._extract_tickers(text)
+        pairs_by_ticker = await self.resolver.search_tickers(
+            [ticker for batch in tickers.values() for ticker in batch]
+        )
 
-        for ticker in tickers:
-            if ticker in seen_symbols:
-                continue
-            seen_symbols.add(ticker)
+        for tweet_db_id, _ in tweets:
+            mints = seen_mints[tweet_db_id]
+            symbols = seen_symbols[tweet_db_id]
+
+            for ticker in tickers[tweet_db_id]:
+                if ticker in symbols:
+                    continue
+                symbols.add(ticker)
 
-            try:
-                pairs = await self.dex.search_tokens(ticker)
-                for pair in self._filter_pairs(pairs):
+                for pair in self._filter_pairs(pairs_by_ticker.get(ticker, [])):
                     token_data = self._pair_to_match(pair)
                     token_mint = token_data.get("token_mint")
 
-                    if token_mint and token_mint in seen_mints:
+                    if token_mint and token_mint in mints:
                         continue
-                    if token_data["token_symbol"].upper() in seen_symbols and token_data["token_symbol"].upper() != ticker:
+                    if token_data["token_symbol"].upper() in symbols and token_data["token_symbol"].upper() != ticker:
                         continue
 
-                    match = MemecoinTweetToken(
-                        tweet_id=tweet_db_id,
-                        token_mint=token_data.get("token_mint"),
-                        token_symbol=token_data["token_symbol"],
-                        token_name=token_data.get("token_name"),
-                        source="keyword",
-                        dexscreener_url=token_data.get("dexscreener_url"),
-                        market_cap_usd=token_data.get("market_cap_usd"),
-                        price_usd=token_data.get("price_usd"),
-                        liquidity_usd=token_data.get("liquidity_usd"),
-                    )
-                    session.add(match)
-                    matches.append(token_data)
+                    self._add_match(session, tweet_db_id, token_data)
+                    matches[tweet_db_id].append(token_data)
 
                     if token_mint:
-                        seen_mints.add(token_mint)
+                        mints.add(token_mint)
                     break  # Take first valid match per ticker
 
-            except Exception as e:
-                logger.debug(f"DexScreener search failed for {ticker}: {e}")
-
         return matches
 
+    @staticmethod
+    def _add_match(session: AsyncSession, tweet_db_id: int, token_data: dict) -> None:
+        session.add(MemecoinTweetToken(
+            tweet_id=tweet_db_id,
+            token_mint=token_data.get("token_mint"),
+            token_symbol=token_data["token_symbol"],
+            token_name=token_data.get("token_name"),
+            source="keyword",
+            dexscreener_url=token_data.get("dexscreener_url"),
+            market_cap_usd=token_data.get("market_cap_usd"),
+            price_usd=token_data.get("price_usd"),
+            liquidity_usd=token_data.get("liquidity_usd"),
+        ))
+
     def _extract_contract_addresses(self, text: str) -> list[str]:
         """Extract contract addresses from URLs first, then raw CAs.
 
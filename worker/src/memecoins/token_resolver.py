@@ -0,0 +1,150 @@
+"""Shared DexScreener token resolution with batching and caching.
+
+Tweet extraction, wallet-activity enrichment and cross-reference checks all
+resolve the same popular mints and tickers over and over. TokenResolver puts
+one cache in front of DexScreener for all of them:
+
+- pairs are cached per mint (``dex:mint:<mint>``) and per ticker
+  (``dex:ticker:<TICKER>``) in an in-process tier and in Redis;
+- misses are cached too, for a shorter time, so unknown tickers and
+  not-yet-listed mints are not searched again on every poll;
+- mint lookups issued within BATCH_WINDOW_SECONDS of each other are
+  coalesced into DexScreener's multi-token endpoint, 30 addresses per call;
+- resolve_mints / search_tickers resolve a whole poll batch concurrently.
+"""
+
+import asyncio
+import logging
+
+from src.cache import TieredCache
+from src.memecoins.dexscreener_client import (
+    CACHE_TTL_SECONDS,
+    MAX_ADDRESSES_PER_REQUEST,
+    DexScreenerClient,
+)
+
+logger = logging.getLogger(__name__)
+
+NEGATIVE_TTL_SECONDS = 20
+LOCAL_CACHE_ENTRIES = 2048
+BATCH_WINDOW_SECONDS = 0.01
+
+# The multi-token endpoint returns at most this many pairs in total; a full
+# response may have crowded out some of the requested mints
+MULTI_RESPONSE_PAIR_CAP = 30
+
+
+class TokenResolver:
+    """Cached, batched DexScreener lookups by mint and by ticker."""
+
+    def __init__(
+        self,
+        dex: DexScreenerClient | None = None,
+        cache: TieredCache | None = None,
+    ):
+        self.dex = dex or DexScreenerClient()
+        self._cache = cache or TieredCache(max_entries=LOCAL_CACHE_ENTRIES)
+        self._pending: dict[str, asyncio.Future] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def get_token_pairs(self, mint: str) -> list[dict]:
+        """Trading pairs for a mint (empty if DexScreener doesn't list it)."""
+        return await self._cache.get_or_load(
+            f"dex:mint:{mint}",
+            lambda: self._queue(mint),
+            CACHE_TTL_SECONDS,
+            negative_ttl=NEGATIVE_TTL_SECONDS,
+        )
+
+    async def search_ticker(self, ticker: str) -> list[dict]:
+        """Search results for a ticker symbol (case-insensitive)."""
+        ticker = ticker.upper()
+        return await self._cache.get_or_load(
+            f"dex:ticker:{ticker}",
+            lambda: self.dex.search_tokens(ticker, use_cache=False),
+            CACHE_TTL_SECONDS,
+            negative_ttl=NEGATIVE_TTL_SECONDS,
+        )
+
+    async def resolve_mints(self, mints: list[str]) -> dict[str, list[dict]]:
+        """Resolve many mints concurrently.
+
+        Returns:
+            Dict mapping each mint to its pairs. Mints whose lookup failed
+            are left out (and not cached), so callers can retry later.
+        """
+        return await self._resolve_many(mints, self.get_token_pairs, "mint")
+
+    async def search_tickers(self, tickers: list[str]) -> dict[str, list[dict]]:
+        """Search many tickers concurrently; keys are the upper-cased tickers."""
+        tickers = [t.upper() for t in tickers]
+        return await self._resolve_many(tickers, self.search_ticker, "ticker")
+
+    @staticmethod
+    async def _resolve_many(keys, lookup, kind: str) -> dict[str, list[dict]]:
+        unique = list(dict.fromkeys(keys))
+        results = await asyncio.gather(*(lookup(k) for k in unique), return_exceptions=True)
+        resolved: dict[str, list[dict]] = {}
+        for key, result in zip(unique, results):
+            if isinstance(result, BaseException):
+                logger.debug(f"DexScreener lookup failed for {kind} {key}: {result}")
+                continue
+            resolved[key] = result
+        return resolved
+
+    def _queue(self, mint: str) -> asyncio.Future:
+        """Add a mint to the next multi-token request."""
+        future = self._pending.get(mint)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[mint] = future
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        return future
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(BATCH_WINDOW_SECONDS)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+
+        mints = list(pending)
+        chunks = [
+            mints[i:i + MAX_ADDRESSES_PER_REQUEST]
+            for i in range(0, len(mints), MAX_ADDRESSES_PER_REQUEST)
+        ]
+        results = await asyncio.gather(
+            *(self._fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+        for chunk, result in zip(chunks, results):
+            for mint in chunk:
+                future = pending[mint]
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result[mint])
+
+    async def _fetch_chunk(self, mints: list[str]) -> dict[str, list[dict]]:
+        pairs = await self.dex.get_tokens_pairs(mints)
+        found: dict[str, list[dict]] = {mint: [] for mint in mints}
+        for pair in pairs:
+            # The per-token endpoint lists pairs on either side; keep that
+            for side in ("baseToken", "quoteToken"):
+                address = (pair.get(side) or {}).get("address")
+                if address in found:
+                    found[address].append(pair)
+
+        if len(mints) > 1 and len(pairs) >= MULTI_RESPONSE_PAIR_CAP:
+            # Truncated response: confirm misses one by one before caching them
+            missing = [mint for mint in mints if not found[mint]]
+            refetched = await asyncio.gather(
+                *(self.dex.get_tokens_pairs([mint]) for mint in missing)
+            )
+            found.update(zip(missing, refetched))
+
+        return found
+
+
+# Module-level singleton shared by every DexScreener consumer
+token_resolver = TokenResolver()
@@ -22,6 +22,7 @@ from src.models.db import (
     TokenTracker,
 )
 from src.twitter.client import TwitterClient
+from src.twitter.store import insert_new_tweets
 from src.memecoins.token_extractor import TokenExtractor
 from src.memecoins.vip_analyzer import VipTokenAnalyzer
 
@@ -80,61 +81,33 @@ class MemecoinTwitterPoller:
                 "errors": [str(e)],
             }
 
-        # 4. Persist new tweets
-        new_count = 0
-        new_tweet_ids: list[int] = []  # DB IDs of newly inserted tweets
-        new_tweet_data: list[dict] = []  # For SSE broadcast
-
-        for tweet_data in raw_tweets:
-            author_handle = tweet_data.get("author_handle", "").lower()
-            account = handle_to_account.get(author_handle)
-            if not account:
-                continue
-
-            metrics = tweet_data.get("metrics", {})
-            media_urls = tweet_data.get("media_urls", [])
-            if media_urls:
-                metrics["media_urls"] = media_urls
-
-            stmt = (
-                pg_insert(MemecoinTweet)
-                .values(
-                    account_id=account.id,
-                    tweet_id=tweet_data["tweet_id"],
-                    text=tweet_data["text"],
-                    created_at=tweet_data["created_at"],
-                    metrics=metrics,
-                )
-                .on_conflict_do_nothing(index_elements=["tweet_id"])
-                .returning(MemecoinTweet.id)
-            )
-
-            result = await self.session.execute(stmt)
-            row = result.first()
-            if row:
-                new_count += 1
-                db_id = row[0]
-                new_tweet_ids.append(db_id)
-                new_tweet_data.append({
-                    "db_id": db_id,
-                    "text": tweet_data["text"],
-                    "account": account,
-                    "tweet_data": tweet_data,
-                })
+        # 4. Persist new tweets (one bulk INSERT ... ON CONFLICT DO NOTHING RETURNING)
+        new_tweets = await insert_new_tweets(
+            self.session, MemecoinTweet, "account_id", raw_tweets, handle_to_account
+        )
+        new_count = len(new_tweets)
+        new_tweet_data: list[dict] = [  # For extraction, analysis and SSE broadcast
+            {
+                "db_id": tweet.id,
+                "text": tweet.data["text"],
+                "account": tweet.account,
+                "tweet_data": tweet.data,
+            }
+            for tweet in new_tweets
+        ]
 
         await self.session.commit()
 
         # 5. Run token extraction on new tweets
         token_match_count = 0
-        for item in new_tweet_data:
-            try:
-                matches = await self.extractor.extract_and_match(
-                    self.session, item["db_id"], item["text"]
-                )
-                token_match_count += len(matches)
-            except Exception as e:
-                logger.warning(f"Token extraction failed: {e}")
-                errors.append(f"extraction: {e}")
+        try:
+            matches = await self.extractor.extract_and_match_batch(
+                self.session, [(item["db_id"], item["text"]) for item in new_tweet_data]
+            )
+            token_match_count = sum(len(m) for m in matches.values())
+        except Exception as e:
+            logger.warning(f"Token extraction failed: {e}")
+            errors.append(f"extraction: {e}")
 
         # 5b. Auto-discover tokens into token_tracker
         await self._upsert_tracker_tokens(new_tweet_data)
@@ -4,6 +4,7 @@ Finds wallets that were provably early on multiple successful memecoins,
 scores them, and builds a leaderboard.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -14,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.memecoins.dexscreener_client import DexScreenerClient
 from src.memecoins.helius_client import HeliusClient
+from src.memecoins.watched_wallets import WatchedWallet, watched_wallets
 from src.models.db import MemecoinToken, WatchWallet
 
 logger = logging.getLogger(__name__)
@@ -29,6 +31,18 @@ SWAP_PROGRAM_IDS = {
 MIN_HITS = 2
 EARLY_BUYERS_PER_TOKEN = 50
 
+# Rows per multi-row upsert (keeps bind parameters well under the 65535 limit)
+UPSERT_CHUNK_SIZE = 1000
+# Columns refreshed when a discovered wallet already exists
+UPSERT_UPDATE_COLUMNS = (
+    "score",
+    "hit_count",
+    "total_tokens_traded",
+    "avg_entry_rank",
+    "tokens_summary",
+    "last_refreshed_at",
+)
+
 
 class WalletDiscoveryPipeline:
     """Cross-reference pipeline for discovering smart wallets."""
@@ -58,21 +72,28 @@ class WalletDiscoveryPipeline:
         if not tokens:
             return {"tokens_found": 0, "wallets_discovered": 0, "status": "no_tokens"}
 
-        # Step 2: Get early buyers per token
-        early_buyers: dict[str, list[dict]] = {}  # wallet -> [{mint, entry_rank}]
-        for token in tokens:
-            try:
-                buyers = await self._get_early_buyers(token["mint_address"])
-                for buyer in buyers:
-                    addr = buyer["wallet"]
-                    early_buyers.setdefault(addr, []).append({
-                        "mint": token["mint_address"],
-                        "symbol": token.get("symbol", "???"),
-                        "entry_rank": buyer["entry_rank"],
-                        "peak_mcap": token.get("peak_mcap_usd"),
-                    })
-            except Exception as e:
-                logger.warning(f"Failed to get early buyers for {token.get('symbol')}: {e}")
+        # Step 2: Get early buyers per token, all tokens at once (the Helius
+        # client's shared rate budget paces the requests)
+        results = await asyncio.gather(
+            *[self._get_early_buyers(token["mint_address"]) for token in tokens],
+            return_exceptions=True,
+        )
+
+        # Inverted index: wallet -> [{mint, symbol, entry_rank, peak_mcap}]
+        early_buyers: dict[str, list[dict]] = {}
+        for token, buyers in zip(tokens, results):
+            if isinstance(buyers, BaseException):
+                logger.warning(
+                    f"Failed to get early buyers for {token.get('symbol')}: {buyers}"
+                )
+                continue
+            for buyer in buyers:
+                early_buyers.setdefault(buyer["wallet"], []).append({
+                    "mint": token["mint_address"],
+                    "symbol": token.get("symbol", "???"),
+                    "entry_rank": buyer["entry_rank"],
+                    "peak_mcap": token.get("peak_mcap_usd"),
+                })
 
         logger.info(f"Step 2: {len(early_buyers)} unique wallets found across all tokens")
 
@@ -85,49 +106,36 @@ class WalletDiscoveryPipeline:
         logger.info(f"Step 3: {len(smart_wallets)} wallets with {MIN_HITS}+ hits")
 
         # Step 4: Score and persist
-        upserted = 0
-        for address, entries in smart_wallets.items():
-            score = self._compute_score(entries)
-            hit_count = len(entries)
-            avg_rank = (
-                sum(e["entry_rank"] for e in entries) // hit_count if hit_count else 0
-            )
-
-            tokens_summary = [
-                {
-                    "symbol": e["symbol"],
-                    "mint": e["mint"],
-                    "entry_rank": e["entry_rank"],
-                    "peak_mcap": float(e["peak_mcap"]) if e["peak_mcap"] else None,
-                }
-                for e in entries
-            ]
-
-            stmt = pg_insert(WatchWallet).values(
-                address=address,
-                source="on_chain",
-                score=Decimal(str(round(score, 2))),
-                hit_count=hit_count,
-                total_tokens_traded=hit_count,
-                avg_entry_rank=avg_rank,
-                tokens_summary=tokens_summary,
-                is_active=True,
-                last_refreshed_at=datetime.now(timezone.utc),
-            ).on_conflict_do_update(
+        now = datetime.now(timezone.utc)
+        rows = [
+            self._wallet_row(address, entries, now)
+            for address, entries in smart_wallets.items()
+        ]
+        upserted_wallets: list[WatchedWallet] = []
+        for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            chunk = rows[i:i + UPSERT_CHUNK_SIZE]
+            stmt = pg_insert(WatchWallet).values(chunk)
+            stmt = stmt.on_conflict_do_update(
                 index_elements=["address"],
-                set_={
-                    "score": Decimal(str(round(score, 2))),
-                    "hit_count": hit_count,
-                    "total_tokens_traded": hit_count,
-                    "avg_entry_rank": avg_rank,
-                    "tokens_summary": tokens_summary,
-                    "last_refreshed_at": datetime.now(timezone.utc),
-                },
+                set_={col: stmt.excluded[col] for col in UPSERT_UPDATE_COLUMNS},
+            ).returning(
+                WatchWallet.id,
+                WatchWallet.address,
+                WatchWallet.label,
+                WatchWallet.score,
+                WatchWallet.is_active,
+            )
+            result = await self.session.execute(stmt)
+            upserted_wallets.extend(
+                WatchedWallet(id, address, label, float(score))
+                for id, address, label, score, is_active in result.all()
+                if is_active
             )
-            await self.session.execute(stmt)
-            upserted += 1
 
         await self.session.commit()
+        for wallet in upserted_wallets:
+            watched_wallets.add(wallet)
+        upserted = len(rows)
         logger.info(f"Step 4: Upserted {upserted} smart wallets")
 
         return {
@@ -137,6 +145,32 @@ class WalletDiscoveryPipeline:
             "status": "completed",
         }
 
+    def _wallet_row(self, address: str, entries: list[dict], now: datetime) -> dict:
+        """WatchWallet insert values for one cross-referenced wallet."""
+        hit_count = len(entries)
+        avg_rank = (
+            sum(e["entry_rank"] for e in entries) // hit_count if hit_count else 0
+        )
+        return {
+            "address": address,
+            "source": "on_chain",
+            "score": Decimal(str(round(self._compute_score(entries), 2))),
+            "hit_count": hit_count,
+            "total_tokens_traded": hit_count,
+            "avg_entry_rank": avg_rank,
+            "tokens_summary": [
+                {
+                    "symbol": e["symbol"],
+                    "mint": e["mint"],
+                    "entry_rank": e["entry_rank"],
+                    "peak_mcap": float(e["peak_mcap"]) if e["peak_mcap"] else None,
+                }
+                for e in entries
+            ],
+            "is_active": True,
+            "last_refreshed_at": now,
+        }
+
     async def _fetch_successful_tokens(self) -> list[dict]:
         """Get top Solana memecoins from DexScreener + DB."""
         tokens: list[dict] = []
@@ -1,20 +1,22 @@
 """Wallet activity monitor via Helius webhooks.
 
-Handles incoming webhook events for watched wallet swap activity,
-enriches with DexScreener data, and broadcasts via SSE.
+Processes micro-batches of Helius webhook events (queued by WebhookIngestor)
+for watched wallet swap activity, enriches with DexScreener data, and
+broadcasts via SSE.
 """
 
 import logging
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.events import event_bus
-from src.memecoins.dexscreener_client import DexScreenerClient
 from src.memecoins.helius_client import HeliusClient
+from src.memecoins.token_resolver import TokenResolver, token_resolver
+from src.memecoins.watched_wallets import WatchedWallet, watched_wallets
 from src.models.db import AnalyzedWallet, WalletTokenEntry, WatchWallet, WatchWalletActivity
 
 logger = logging.getLogger(__name__)
@@ -36,67 +38,126 @@ class WalletMonitor:
         self,
         session: AsyncSession,
         helius: HeliusClient | None = None,
-        dex: DexScreenerClient | None = None,
+        resolver: TokenResolver | None = None,
     ):
         self.session = session
         self.helius = helius or HeliusClient()
-        self.dex = dex or DexScreenerClient()
+        self.resolver = resolver or token_resolver
 
-    async def handle_webhook(self, events: list[dict]) -> dict:
-        """Process a batch of Helius webhook events.
+    async def process_batch(self, events: list[dict]) -> dict:
+        """Process a micro-batch of Helius enhanced transaction events.
 
-        Always returns quickly — errors logged, never raised.
-        Returns summary of processed events.
+        Events are filtered against the in-memory watched-wallet snapshot,
+        enriched with one batched DexScreener lookup and persisted with a
+        single multi-row insert. Errors are logged, never raised.
+
+        Returns:
+            Summary dict with processed, errors and total counts.
         """
-        processed = 0
-        errors = 0
+        wallets = await watched_wallets.get_all(self.session)
 
+        trades: dict[str, dict] = {}
+        errors = 0
         for event in events:
             try:
-                result = await self._process_event(event)
-                if result:
-                    processed += 1
+                trade = self._parse_event(event, wallets)
             except Exception as e:
-                logger.warning(f"Failed to process webhook event: {e}")
+                logger.warning(f"Failed to parse webhook event: {e}")
                 errors += 1
+                continue
+            if trade:
+                # Helius may deliver the same transaction more than once
+                trades.setdefault(trade["tx_signature"], trade)
+
+        if not trades:
+            return {"processed": 0, "errors": errors, "total": len(events)}
 
-        await self.session.commit()
+        # Enrich with DexScreener data (one resolver batch for all mints)
+        pairs_by_mint = await self.resolver.resolve_mints(
+            [t["token_mint"] for t in trades.values()]
+        )
+        for trade in trades.values():
+            pairs = pairs_by_mint.get(trade["token_mint"])
+            if pairs:
+                best = pairs[0]
+                trade["token_symbol"] = best.get("baseToken", {}).get("symbol", "")
+                trade["token_name"] = best.get("baseToken", {}).get("name", "")
+                price_str = best.get("priceUsd")
+                if price_str:
+                    trade["price_usd"] = Decimal(str(price_str))
 
-        return {"processed": processed, "errors": errors, "total": len(events)}
+        # Insert activity (ON CONFLICT DO NOTHING for idempotency)
+        stmt = (
+            pg_insert(WatchWalletActivity)
+            .values([
+                {k: v for k, v in t.items() if k != "wallet"} for t in trades.values()
+            ])
+            .on_conflict_do_nothing(index_elements=["tx_signature"])
+            .returning(WatchWalletActivity.tx_signature)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            inserted = [trades[sig] for sig in result.scalars().all()]
+            await self.session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist {len(trades)} wallet activity rows: {e}")
+            await self.session.rollback()
+            return {"processed": 0, "errors": errors + len(trades), "total": len(events)}
 
-    async def _process_event(self, event: dict) -> bool:
-        """Process a single enhanced transaction event.
+        await self._notify_buys(inserted)
 
-        Returns True if activity was recorded.
+        # Broadcast via SSE
+        for trade in inserted:
+            wallet = trade["wallet"]
+            await event_bus.publish("memecoins", {
+                "type": "wallet_activity",
+                "wallet": {
+                    "address": wallet.address,
+                    "label": wallet.label,
+                    "score": wallet.score,
+                },
+                "trade": {
+                    "tokenMint": trade["token_mint"],
+                    "tokenSymbol": trade["token_symbol"],
+                    "tokenName": trade["token_name"],
+                    "direction": trade["direction"],
+                    "amountSol": float(trade["amount_sol"]),
+                    "priceUsd": float(trade["price_usd"]) if trade["price_usd"] else None,
+                    "txSignature": trade["tx_signature"],
+                    "blockTime": trade["block_time"].isoformat(),
+                },
+            })
+
+        return {"processed": len(inserted), "errors": errors, "total": len(events)}
+
+    @staticmethod
+    def _parse_event(event: dict, wallets: dict[str, WatchedWallet]) -> dict | None:
+        """Parse a swap by a watched wallet into activity row values.
+
+        Returns None if the event is not a swap by a watched wallet.
         """
         fee_payer = event.get("feePayer", "")
         if not fee_payer:
-            return False
+            return None
 
         # Check if this wallet is one we're watching
-        result = await self.session.execute(
-            select(WatchWallet).where(
-                WatchWallet.address == fee_payer,
-                WatchWallet.is_active == True,  # noqa: E712
-            )
-        )
-        wallet = result.scalar_one_or_none()
+        wallet = wallets.get(fee_payer)
         if not wallet:
-            return False
+            return None
 
         # Parse swap details from token transfers
         tx_type = event.get("type", "")
         if tx_type != "SWAP":
-            return False
+            return None
 
         signature = event.get("signature", "")
         if not signature:
-            return False
+            return None
 
         # Extract token transfers
         token_transfers = event.get("tokenTransfers", [])
         if not token_transfers:
-            return False
+            return None
 
         # Determine direction and token
         token_mint = ""
@@ -117,102 +178,68 @@ class WalletMonitor:
                     direction = "buy"
 
         if not token_mint:
-            return False
-
-        # Enrich with DexScreener data
-        token_symbol = ""
-        token_name = ""
-        price_usd = None
-        try:
-            pairs = await self.dex.get_token_pairs(token_mint)
-            if pairs:
-                best = pairs[0]
-                token_symbol = best.get("baseToken", {}).get("symbol", "")
-                token_name = best.get("baseToken", {}).get("name", "")
-                price_str = best.get("priceUsd")
-                if price_str:
-                    price_usd = Decimal(str(price_str))
-        except Exception as e:
-            logger.debug(f"DexScreener enrichment failed for {token_mint}: {e}")
+            return None
 
         # Parse block time
         block_time_unix = event.get("timestamp", 0)
         block_time = datetime.fromtimestamp(block_time_unix, tz=timezone.utc) if block_time_unix else datetime.now(timezone.utc)
 
-        # Insert activity (ON CONFLICT DO NOTHING for idempotency)
-        stmt = pg_insert(WatchWalletActivity).values(
-            wallet_id=wallet.id,
-            token_mint=token_mint,
-            token_symbol=token_symbol,
-            token_name=token_name,
-            direction=direction,
-            amount_sol=amount_sol,
-            price_usd=price_usd,
-            tx_signature=signature,
-            block_time=block_time,
-        ).on_conflict_do_nothing(index_elements=["tx_signature"])
-
-        result = await self.session.execute(stmt)
-        if not result.rowcount:
-            return False  # Duplicate
-
-        # Broadcast via SSE
-        await event_bus.publish("memecoins", {
-            "type": "wallet_activity",
-            "wallet": {
-                "address": wallet.address,
-                "label": wallet.label,
-                "score": float(wallet.score),
-            },
-            "trade": {
-                "tokenMint": token_mint,
-                "tokenSymbol": token_symbol,
-                "tokenName": token_name,
-                "direction": direction,
-                "amountSol": float(amount_sol),
-                "priceUsd": float(price_usd) if price_usd else None,
-                "txSignature": signature,
-                "blockTime": block_time.isoformat(),
-            },
-        })
-
-        # Fire notification if wallet is in analyzed_wallets DB and direction is buy
-        if direction == "buy":
-            try:
-                analyzed_result = await self.session.execute(
-                    select(AnalyzedWallet).where(AnalyzedWallet.address == fee_payer)
-                )
-                analyzed_wallet = analyzed_result.scalar_one_or_none()
-                if analyzed_wallet:
-                    # Count past early entries
-                    from sqlalchemy import func as sa_func
-                    hits_result = await self.session.execute(
-                        select(sa_func.count()).select_from(WalletTokenEntry).where(
-                            WalletTokenEntry.wallet_id == analyzed_wallet.id
-                        )
-                    )
-                    past_hits = hits_result.scalar() or 0
-
-                    from src.notifications.models import MemecoinBuyEvent
-                    from src.notifications.service import NotificationService
-
-                    svc = NotificationService(self.session)
-                    await svc.notify_memecoin_buy(MemecoinBuyEvent(
-                        wallet_address=fee_payer,
-                        wallet_label=wallet.label,
-                        wallet_score=float(wallet.score),
-                        token_symbol=token_symbol,
-                        token_name=token_name,
-                        token_mint=token_mint,
-                        amount_sol=amount_sol,
-                        price_usd=price_usd,
-                        past_hits=past_hits,
-                        tx_signature=signature,
-                    ))
-            except Exception as e:
-                logger.debug(f"Memecoin buy notification failed: {e}")
+        return {
+            "wallet": wallet,
+            "wallet_id": wallet.id,
+            "token_mint": token_mint,
+            "token_symbol": "",
+            "token_name": "",
+            "direction": direction,
+            "amount_sol": amount_sol,
+            "price_usd": None,
+            "tx_signature": signature,
+            "block_time": block_time,
+        }
+
+    async def _notify_buys(self, trades: list[dict]) -> None:
+        """Fire notifications for buys by wallets in the analyzed_wallets DB."""
+        buys = [
+            t for t in trades
+            if t["direction"] == "buy" and watched_wallets.is_analyzed(t["wallet"].address)
+        ]
+        if not buys:
+            return
 
-        return True
+        try:
+            # Past early entries per analyzed wallet, in one query
+            hits_result = await self.session.execute(
+                select(AnalyzedWallet.address, func.count(WalletTokenEntry.id))
+                .outerjoin(WalletTokenEntry, WalletTokenEntry.wallet_id == AnalyzedWallet.id)
+                .where(AnalyzedWallet.address.in_({t["wallet"].address for t in buys}))
+                .group_by(AnalyzedWallet.address)
+            )
+            past_hits = dict(hits_result.all())
+            if not past_hits:
+                return
+
+            from src.notifications.models import MemecoinBuyEvent
+            from src.notifications.service import NotificationService
+
+            svc = NotificationService(self.session)
+            for trade in buys:
+                wallet = trade["wallet"]
+                if wallet.address not in past_hits:
+                    continue
+                await svc.notify_memecoin_buy(MemecoinBuyEvent(
+                    wallet_address=wallet.address,
+                    wallet_label=wallet.label,
+                    wallet_score=wallet.score,
+                    token_symbol=trade["token_symbol"],
+                    token_name=trade["token_name"],
+                    token_mint=trade["token_mint"],
+                    amount_sol=trade["amount_sol"],
+                    price_usd=trade["price_usd"],
+                    past_hits=past_hits[wallet.address],
+                    tx_signature=trade["tx_signature"],
+                ))
+        except Exception as e:
+            logger.debug(f"Memecoin buy notification failed: {e}")
 
     async def sync_webhooks(self) -> dict:
         """Register webhooks for all active watched wallets.
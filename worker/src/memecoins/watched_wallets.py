@@ -0,0 +1,130 @@
+"""In-memory index of watched and analyzed wallet addresses.
+
+Webhook processing used to look up watch_wallets (and analyzed_wallets, for
+buy notifications) once per Helius event, although most events are for
+wallets we don't track. Both sets are loaded once and then kept current
+incrementally by the code paths that change them:
+
+- the /memecoins/wallets endpoints add and deactivate watched wallets;
+- WalletDiscoveryPipeline upserts watched wallets in bulk;
+- TokenAnalyzer upserts analyzed wallets.
+
+Lookups are exact hash-set probes, so the webhook endpoint can drop events
+from unknown fee payers before they are even queued. Writes that bypass
+those paths call invalidate() and the next read reloads from the database.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.db import AnalyzedWallet, WatchWallet
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WatchedWallet:
+    """The WatchWallet fields webhook processing needs."""
+
+    id: int
+    address: str
+    label: str | None
+    score: float
+
+
+class WatchedWallets:
+    """Active watched wallets by address, plus the analyzed wallet addresses."""
+
+    def __init__(self) -> None:
+        self._wallets: dict[str, WatchedWallet] = {}
+        self._analyzed: set[str] = set()
+        self._loaded = False
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def rejects(self, address: str) -> bool:
+        """True if events from this fee payer can be dropped without a lookup.
+
+        Only answers once the index is loaded; before that nothing is rejected.
+        """
+        return self._loaded and address not in self._wallets
+
+    def is_analyzed(self, address: str) -> bool:
+        """Whether an address is in analyzed_wallets (index must be loaded)."""
+        return address in self._analyzed
+
+    def add(self, wallet: WatchedWallet) -> None:
+        """Track a newly added or reactivated wallet."""
+        self._generation += 1
+        self._wallets[wallet.address] = wallet
+
+    def remove(self, address: str) -> None:
+        """Stop tracking a deactivated wallet."""
+        self._generation += 1
+        self._wallets.pop(address, None)
+
+    def add_analyzed(self, addresses: Iterable[str]) -> None:
+        """Record addresses upserted into analyzed_wallets."""
+        self._generation += 1
+        self._analyzed.update(addresses)
+
+    def invalidate(self) -> None:
+        """Drop the index; the next get_all() reloads it."""
+        self._generation += 1
+        self._loaded = False
+
+    async def get_all(self, session: AsyncSession) -> dict[str, WatchedWallet]:
+        """Active watched wallets keyed by address.
+
+        Args:
+            session: Session used to (re)load the index when needed.
+        """
+        if not self._loaded:
+            async with self._lock:
+                if not self._loaded:
+                    await self._load(session)
+        return self._wallets
+
+    async def _load(self, session: AsyncSession) -> None:
+        generation = self._generation
+        result = await session.execute(
+            select(WatchWallet.id, WatchWallet.address, WatchWallet.label, WatchWallet.score)
+            .where(WatchWallet.is_active == True)  # noqa: E712
+        )
+        wallets = {
+            address: WatchedWallet(id, address, label, float(score))
+            for id, address, label, score in result.all()
+        }
+        analyzed = await self._load_analyzed(session)
+
+        self._wallets = wallets
+        self._analyzed = analyzed
+        # A change landing mid-load may not be in the snapshot: serve it
+        # now, but reload on the next read so it is picked up
+        self._loaded = self._generation == generation
+        logger.info(
+            f"Loaded wallet index: {len(wallets)} watched, {len(analyzed)} analyzed"
+        )
+
+    async def _load_analyzed(self, session: AsyncSession) -> set[str]:
+        """Addresses in analyzed_wallets (empty if migration 026b hasn't run).
+
+        Read inside a savepoint so a missing table doesn't abort the caller's
+        transaction.
+        """
+        try:
+            async with session.begin_nested():
+                result = await session.execute(select(AnalyzedWallet.address))
+                return set(result.scalars().all())
+        except ProgrammingError as e:
+            logger.warning(f"analyzed_wallets unavailable, buy notifications disabled: {e}")
+            return set()
+
+
+watched_wallets = WatchedWallets()
@@ -0,0 +1,123 @@
+"""In-process buffer between the Helius webhook endpoint and WalletMonitor.
+
+The webhook handler used to process every event before responding, which
+held Helius deliveries open for seconds during hot launches. Now it only
+enqueues the payload; a background consumer drains the queue in
+micro-batches (up to BATCH_SIZE events, collected for at most
+BATCH_WINDOW_SECONDS) and hands each batch to WalletMonitor.process_batch.
+
+The buffer is in memory: events still queued when the worker dies are lost,
+the same as events that were mid-processing before.
+"""
+
+import asyncio
+import logging
+
+from src.db import async_session
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = 10_000
+BATCH_SIZE = 200
+BATCH_WINDOW_SECONDS = 0.25
+SHUTDOWN_DRAIN_SECONDS = 5.0
+
+
+class WebhookIngestor:
+    """Bounded event queue with a single micro-batching consumer."""
+
+    def __init__(self, queue_size: int = QUEUE_SIZE) -> None:
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=queue_size)
+        self._task: asyncio.Task | None = None
+        self.received = 0
+        self.processed = 0
+        self.errors = 0
+        self.dropped = 0
+
+    def enqueue(self, events: list[dict]) -> int:
+        """Queue events for processing without waiting on them.
+
+        Starts the consumer on first use. Events that don't fit in the
+        queue are dropped (and counted) rather than blocking the webhook.
+
+        Returns:
+            Number of events accepted.
+        """
+        self._ensure_consumer()
+        accepted = 0
+        for event in events:
+            try:
+                self._queue.put_nowait(event)
+                accepted += 1
+            except asyncio.QueueFull:
+                break
+        self.received += accepted
+        if accepted < len(events):
+            self.dropped += len(events) - accepted
+            logger.warning(
+                f"Webhook queue full, dropped {len(events) - accepted}/{len(events)} events"
+            )
+        return accepted
+
+    async def stop(self) -> None:
+        """Give queued events a moment to drain, then stop the consumer."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=SHUTDOWN_DRAIN_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(f"Stopping webhook consumer with {self._queue.qsize()} events queued")
+        self._task.cancel()
+        self._task = None
+
+    def stats(self) -> dict[str, int]:
+        """Queue depth and delivery counters."""
+        return {
+            "queued": self._queue.qsize(),
+            "received": self.received,
+            "processed": self.processed,
+            "errors": self.errors,
+            "dropped": self.dropped,
+        }
+
+    def _ensure_consumer(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._consume())
+
+    async def _consume(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._process(batch)
+            except Exception as e:
+                logger.exception(f"Webhook batch of {len(batch)} events failed: {e}")
+                self.errors += len(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _next_batch(self) -> list[dict]:
+        """Wait for one event, then collect more until the batch fills or the window ends."""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + BATCH_WINDOW_SECONDS
+        while len(batch) < BATCH_SIZE:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _process(self, batch: list[dict]) -> None:
+        from src.memecoins.wallet_monitor import WalletMonitor
+
+        async with async_session() as session:
+            result = await WalletMonitor(session).process_batch(batch)
+        self.processed += result["processed"]
+        self.errors += result["errors"]
+
+
+# Module-level singleton
+webhook_ingestor = WebhookIngestor()
@@ -123,7 +123,8 @@ class Snapshot(Base):
 
     __tablename__ = "snapshots"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # BIGSERIAL; composite primary keys need autoincrement spelled out
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     symbol_id: Mapped[int] = mapped_column(Integer, ForeignKey("symbols.id"), nullable=False)
     timeframe: Mapped[str] = mapped_column(String(4), nullable=False)
     bullish_score: Mapped[Decimal] = mapped_column(Numeric(4, 3), nullable=False)
@@ -529,6 +530,37 @@ class NotificationPreference(Base):
 # =============================================================================
 
 
+class BacktestSweep(Base):
+    """A batch of backtests over a strategy x symbol x timeframe x SL/TP grid.
+
+    Each combination is stored as a BacktestRun row pointing back here.
+    """
+
+    __tablename__ = "backtest_sweeps"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    strategies: Mapped[list] = mapped_column(JSONB, nullable=False)
+    symbols: Mapped[list] = mapped_column(JSONB, nullable=False)
+    timeframes: Mapped[list] = mapped_column(JSONB, nullable=False)
+    sl_tp_grid: Mapped[list] = mapped_column(JSONB, nullable=False)  # [[sl, tp], ...]
+    start_date: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    end_date: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    initial_balance: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, server_default="10000.00"
+    )
+    total_combinations: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed_combinations: Mapped[int] = mapped_column(Integer, server_default="0")
+    status: Mapped[str] = mapped_column(String(20), nullable=False, server_default="pending")
+    error_message: Mapped[str | None] = mapped_column(Text)
+    started_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+
+    # Relationships
+    runs: Mapped[list["BacktestRun"]] = relationship(back_populates="sweep")
+
+
 class BacktestRun(Base):
     """A single backtest run with summary metrics."""
 
@@ -557,11 +589,17 @@ class BacktestRun(Base):
         TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
     )
     completed_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+    sweep_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("backtest_sweeps.id", ondelete="CASCADE")
+    )
+    stop_loss_pct: Mapped[Decimal | None] = mapped_column(Numeric(6, 4))
+    take_profit_pct: Mapped[Decimal | None] = mapped_column(Numeric(6, 4))
 
     # Relationships
     trades: Mapped[list["BacktestTrade"]] = relationship(
         back_populates="run", cascade="all, delete-orphan"
     )
+    sweep: Mapped["BacktestSweep | None"] = relationship(back_populates="runs")
 
 
 class BacktestTrade(Base):
@@ -1002,6 +1040,124 @@ class MemecoinTweetSignal(Base):
     )
 
 
+# =============================================================================
+# Token Analysis Tables
+# =============================================================================
+
+
+class TokenAnalysis(Base):
+    """Early-buyer analysis jobs for a token CA (resumable via progress)."""
+
+    __tablename__ = "token_analyses"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    mint_address: Mapped[str] = mapped_column(String(64), nullable=False)
+    token_symbol: Mapped[str | None] = mapped_column(String(20))
+    token_name: Mapped[str | None] = mapped_column(String(200))
+    market_cap_usd: Mapped[Decimal | None] = mapped_column(Numeric(20, 2))
+    requested_buyers: Mapped[int] = mapped_column(Integer, nullable=False)
+    found_buyers: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    status: Mapped[str] = mapped_column(String(20), nullable=False, server_default="pending")
+    progress: Mapped[dict] = mapped_column(JSONB, nullable=False, server_default="{}")
+    error_message: Mapped[str | None] = mapped_column(Text)
+    requested_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+
+    # Relationships
+    entries: Mapped[list["WalletTokenEntry"]] = relationship(back_populates="analysis")
+
+    __table_args__ = (
+        Index("idx_token_analyses_status", "status"),
+        Index("idx_token_analyses_mint", "mint_address"),
+    )
+
+
+class AnalyzedWallet(Base):
+    """Enriched profiles of wallets found by token analyses."""
+
+    __tablename__ = "analyzed_wallets"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    address: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    sol_balance: Mapped[Decimal | None] = mapped_column(Numeric(20, 9))
+    usdc_balance: Mapped[Decimal | None] = mapped_column(Numeric(20, 2))
+    first_tx_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+    total_tx_count: Mapped[int | None] = mapped_column(Integer)
+    estimated_pnl_sol: Mapped[Decimal | None] = mapped_column(Numeric(20, 9))
+    win_rate: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+    tokens_traded: Mapped[int | None] = mapped_column(Integer)
+    current_holdings: Mapped[list] = mapped_column(JSONB, nullable=False, server_default="[]")
+    tags: Mapped[list] = mapped_column(JSONB, nullable=False, server_default="[]")
+    last_enriched_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    # Relationships
+    entries: Mapped[list["WalletTokenEntry"]] = relationship(back_populates="wallet")
+
+    __table_args__ = (
+        Index("idx_analyzed_wallets_address", "address"),
+    )
+
+
+class WalletTokenEntry(Base):
+    """An analyzed wallet's early entry into one analyzed token."""
+
+    __tablename__ = "wallet_token_entries"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    wallet_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("analyzed_wallets.id"), nullable=False
+    )
+    analysis_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("token_analyses.id"), nullable=False
+    )
+    mint_address: Mapped[str] = mapped_column(String(64), nullable=False)
+    token_symbol: Mapped[str | None] = mapped_column(String(20))
+    entry_rank: Mapped[int] = mapped_column(Integer, nullable=False)
+    entry_tx_signature: Mapped[str | None] = mapped_column(String(128))
+    entry_block_time: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+    amount_sol: Mapped[Decimal | None] = mapped_column(Numeric(20, 9))
+    token_mcap_at_entry: Mapped[Decimal | None] = mapped_column(Numeric(20, 2))
+    token_peak_mcap: Mapped[Decimal | None] = mapped_column(Numeric(20, 2))
+
+    # Relationships
+    wallet: Mapped["AnalyzedWallet"] = relationship(back_populates="entries")
+    analysis: Mapped["TokenAnalysis"] = relationship(back_populates="entries")
+
+    __table_args__ = (
+        UniqueConstraint("wallet_id", "mint_address", name="uq_wallet_token_entry"),
+        Index("idx_wte_wallet", "wallet_id"),
+        Index("idx_wte_mint", "mint_address"),
+        Index("idx_wte_analysis", "analysis_id"),
+    )
+
+
+class CrossReferenceCheck(Base):
+    """Log of new tokens checked against analyzed wallets."""
+
+    __tablename__ = "cross_reference_checks"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    mint_address: Mapped[str] = mapped_column(String(64), nullable=False)
+    token_symbol: Mapped[str | None] = mapped_column(String(20))
+    token_name: Mapped[str | None] = mapped_column(String(200))
+    buyers_scanned: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    matches_found: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    top_match_score: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+    results: Mapped[list] = mapped_column(JSONB, nullable=False, server_default="[]")
+    checked_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("idx_xref_checks_time", checked_at.desc()),
+    )
+
+
 # =============================================================================
 # Token Tracker Tables
 # =============================================================================
@@ -4,6 +4,7 @@ Provides the PipelineRunner for executing the full ranking pipeline:
 fetch OHLCV → compute indicators → score → rank → persist.
 """
 
+from src.pipeline.offload import ComputePool
 from src.pipeline.regime import compute_and_persist_regime
 from src.pipeline.runner import (
     PIPELINE_LOCK_ID,
@@ -13,6 +14,7 @@ from src.pipeline.runner import (
 )
 
 __all__ = [
+    "ComputePool",
     "PipelineRunner",
     "default_runner",
     "TIMEFRAME_CONFIG",
@@ -0,0 +1,213 @@
+"""Process-pool offload for CPU-bound pipeline and backtest work.
+
+Indicator math, ranking and backtest simulation are pure CPU work. Running
+them on the asyncio event loop stalls every API endpoint, SSE stream and
+webhook for the duration of a timeframe run. ComputePool ships that work to
+worker processes instead:
+
+- indicators: each equal-length OHLCV batch is copied once into a
+  SharedMemory block of shape (5, symbols, bars); workers attach to it by
+  name and compute their slice of rows, so the candle data is never pickled;
+- ranking and backtests: the inputs are small (indicator outputs, candles)
+  and are sent through the executor as regular arguments.
+
+Workers are started with the ``spawn`` method so they never inherit the
+parent's event loop, DB connections or scheduler threads.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from src.indicators import IndicatorOutput, IndicatorRegistry, OHLCVBatch, create_default_registry
+from src.indicators.batch import OHLCV_COLUMNS, group_frames
+from src.scoring import RankedSnapshot, Ranker, SymbolData
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Per-process registry, built on first use inside each worker
+_worker_registry: IndicatorRegistry | None = None
+
+
+def _registry() -> IndicatorRegistry:
+    global _worker_registry
+    if _worker_registry is None:
+        _worker_registry = create_default_registry()
+    return _worker_registry
+
+
+class _BatchFrames(Mapping[str, pd.DataFrame]):
+    """Lazily rebuilds per-symbol DataFrames from a batch (for non-batched indicators)."""
+
+    def __init__(self, batch: OHLCVBatch) -> None:
+        self._batch = batch
+        self._rows = {symbol: row for row, symbol in enumerate(batch.symbols)}
+
+    def __getitem__(self, symbol: str) -> pd.DataFrame:
+        row = self._rows[symbol]
+        return pd.DataFrame({col: getattr(self._batch, col)[row] for col in OHLCV_COLUMNS})
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._batch.symbols)
+
+    def __len__(self) -> int:
+        return len(self._batch.symbols)
+
+
+def _indicator_job(
+    shm_name: str,
+    shape: tuple[int, int, int],
+    row_start: int,
+    symbols: list[str],
+) -> dict[str, dict[str, IndicatorOutput]]:
+    """Worker entry point: compute indicators for rows of a shared OHLCV block."""
+    shm = SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        rows = slice(row_start, row_start + len(symbols))
+        # Copy the slice out so no view outlives the mapping
+        arrays = {col: block[i, rows].copy() for i, col in enumerate(OHLCV_COLUMNS)}
+        del block
+    finally:
+        shm.close()
+
+    batch = OHLCVBatch(symbols=symbols, **arrays)
+    return _registry().compute_batch(batch, _BatchFrames(batch))
+
+
+def _compute_all_job(df: pd.DataFrame) -> dict[str, IndicatorOutput]:
+    """Worker entry point: per-symbol indicators for frames that cannot be batched."""
+    return _registry().compute_all(df)
+
+
+def _rank_job(
+    ranker: Ranker, symbol_data: list[SymbolData], kwargs: dict[str, Any]
+) -> list[RankedSnapshot]:
+    """Worker entry point: score and rank symbols."""
+    return ranker.rank(symbol_data, **kwargs)
+
+
+class ComputePool:
+    """Lazily started ProcessPoolExecutor for CPU-bound stages.
+
+    Args:
+        max_workers: Worker processes to run.
+        min_rows_per_job: Smallest symbol slice sent to one worker; smaller
+            batches are split into fewer jobs to keep IPC overhead low.
+    """
+
+    def __init__(self, max_workers: int, min_rows_per_job: int = 25) -> None:
+        self.max_workers = max_workers
+        self.min_rows_per_job = min_rows_per_job
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Started compute pool with {self.max_workers} worker processes")
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a picklable module-level function in a worker process."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+
+    async def rank(
+        self, ranker: Ranker, symbol_data: list[SymbolData], **kwargs: Any
+    ) -> list[RankedSnapshot]:
+        """Ranker.rank in a worker process (same arguments)."""
+        return await self.run(_rank_job, ranker, symbol_data, kwargs)
+
+    async def compute_indicators(
+        self, frames: dict[str, pd.DataFrame]
+    ) -> dict[str, dict[str, IndicatorOutput]]:
+        """Compute all indicators for many symbols across worker processes.
+
+        Mirrors IndicatorRegistry.compute_all_batch: equal-length frames are
+        batched (through shared memory), the rest go through compute_all.
+
+        Args:
+            frames: Dict mapping symbol to OHLCV DataFrame.
+
+        Returns:
+            Dict mapping symbol to indicator outputs. Failed symbols are omitted.
+        """
+        results: dict[str, dict[str, IndicatorOutput]] = {}
+        batches, leftovers = group_frames(frames)
+        blocks: list[SharedMemory] = []
+
+        try:
+            jobs: list[tuple[list[str], asyncio.Future]] = []
+            for batch in batches:
+                shm, shape = self._share(batch)
+                blocks.append(shm)
+                for start, chunk in self._chunks(batch.symbols):
+                    future = self.run(_indicator_job, shm.name, shape, start, chunk)
+                    jobs.append((chunk, asyncio.ensure_future(future)))
+
+            single = {
+                symbol: asyncio.ensure_future(self.run(_compute_all_job, df))
+                for symbol, df in leftovers.items()
+            }
+
+            for chunk, future in jobs:
+                try:
+                    results.update(await future)
+                except Exception as e:
+                    logger.warning(
+                        f"Offloaded indicators failed for {len(chunk)} symbols, "
+                        f"falling back per symbol: {e}"
+                    )
+                    for symbol in chunk:
+                        single[symbol] = asyncio.ensure_future(
+                            self.run(_compute_all_job, frames[symbol])
+                        )
+
+            for symbol, future in single.items():
+                try:
+                    results[symbol] = await future
+                except Exception as e:
+                    logger.warning(f"Indicator computation failed for {symbol}: {e}")
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+        return results
+
+    def _share(self, batch: OHLCVBatch) -> tuple[SharedMemory, tuple[int, int, int]]:
+        """Copy a batch into a new shared-memory block of shape (5, symbols, bars)."""
+        shape = (len(OHLCV_COLUMNS), len(batch.symbols), batch.n_bars)
+        shm = SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        for i, col in enumerate(OHLCV_COLUMNS):
+            block[i] = getattr(batch, col)
+        del block
+        return shm, shape
+
+    def _chunks(self, symbols: list[str]) -> Iterator[tuple[int, list[str]]]:
+        """Split rows into at most max_workers contiguous slices."""
+        n_jobs = max(1, min(self.max_workers, len(symbols) // self.min_rows_per_job))
+        size = -(-len(symbols) // n_jobs)
+        for start in range(0, len(symbols), size):
+            yield start, symbols[start:start + size]
+
+    def shutdown(self) -> None:
+        """Stop worker processes (pending jobs are cancelled)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Compute pool stopped")
@@ -13,14 +13,16 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from uuid import UUID
 
+import pandas as pd
 from sqlalchemy import select, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db import async_session
 from src.exchange import BinanceClient, candles_to_dataframe, Symbol as BinanceSymbol
-from src.indicators import create_default_registry
+from src.indicators import IndicatorOutput, IndicatorState, create_default_registry
 from src.models.db import ComputationRun, Snapshot, Symbol
+from src.pipeline.offload import ComputePool
 from src.scoring import Ranker, SymbolData
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,10 @@ TIMEFRAME_CONFIG = {
 # Advisory lock ID for pipeline runs (arbitrary unique number)
 PIPELINE_LOCK_ID = 123456789
 
+# Rows per multi-row snapshot INSERT (9 bind params each, well under
+# Postgres' 65535-parameter limit)
+SNAPSHOT_INSERT_BATCH = 1000
+
 
 class PipelineRunner:
     """Orchestrates the full ranking pipeline.
@@ -50,6 +56,9 @@ class PipelineRunner:
         binance_client: BinanceClient | None = None,
         min_volume_usd: float = 1_000_000,
         top_symbols_limit: int = 0,
+        streaming_indicators: bool = True,
+        checkpoint_bars: int = 96,
+        compute_pool: ComputePool | None = None,
     ):
         """Initialize the pipeline runner.
 
@@ -57,12 +66,25 @@ class PipelineRunner:
             binance_client: Custom Binance client (default: creates new one).
             min_volume_usd: Minimum 24h volume for symbol inclusion.
             top_symbols_limit: Max symbols to process (0 = unlimited).
+            streaming_indicators: Advance per-symbol indicator state with new
+                candles instead of recomputing the full window every run.
+            checkpoint_bars: Candles folded into streaming state before a
+                full rebuild from the fetched window.
+            compute_pool: Worker processes for indicator computation and
+                ranking. When set, indicators are recomputed in full over
+                the fetched window in the pool (streaming state is not used)
+                so the event loop stays free during a run.
         """
         self.client = binance_client or BinanceClient()
         self.min_volume_usd = min_volume_usd
         self.top_symbols_limit = top_symbols_limit
+        self.streaming_indicators = streaming_indicators
+        self.checkpoint_bars = checkpoint_bars
+        self.compute_pool = compute_pool
         self.registry = create_default_registry()
         self.ranker = Ranker()
+        # Streaming indicator state: timeframe -> symbol -> state
+        self._indicator_states: dict[str, dict[str, IndicatorState]] = {}
 
     async def _acquire_lock(self, session: AsyncSession, timeframe: str) -> bool:
         """Try to acquire advisory lock for this timeframe.
@@ -97,6 +119,8 @@ class PipelineRunner:
     ) -> dict[str, int]:
         """Ensure all symbols exist in database, return symbol_id mapping.
 
+        Upserts every symbol in a single INSERT ... ON CONFLICT ... RETURNING.
+
         Args:
             session: Database session.
             binance_symbols: List of symbols from Binance.
@@ -104,27 +128,33 @@ class PipelineRunner:
         Returns:
             Dict mapping symbol name to database ID.
         """
-        symbol_ids: dict[str, int] = {}
-
-        for sym in binance_symbols:
-            # Upsert symbol
-            stmt = insert(Symbol).values(
-                symbol=sym.symbol,
-                base_asset=sym.base_asset,
-                quote_asset=sym.quote_asset,
-                is_active=True,
-                last_seen_at=datetime.now(timezone.utc),
-            ).on_conflict_do_update(
-                index_elements=["symbol"],
-                set_={
-                    "is_active": True,
-                    "last_seen_at": datetime.now(timezone.utc),
-                },
-            ).returning(Symbol.id)
-
-            result = await session.execute(stmt)
-            symbol_id = result.scalar_one()
-            symbol_ids[sym.symbol] = symbol_id
+        if not binance_symbols:
+            return {}
+
+        now = datetime.now(timezone.utc)
+        # Postgres rejects an ON CONFLICT DO UPDATE touching the same row twice
+        rows = {
+            sym.symbol: {
+                "symbol": sym.symbol,
+                "base_asset": sym.base_asset,
+                "quote_asset": sym.quote_asset,
+                "is_active": True,
+                "last_seen_at": now,
+            }
+            for sym in binance_symbols
+        }
+
+        stmt = insert(Symbol).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["symbol"],
+            set_={
+                "is_active": True,
+                "last_seen_at": stmt.excluded.last_seen_at,
+            },
+        ).returning(Symbol.symbol, Symbol.id)
+
+        result = await session.execute(stmt)
+        symbol_ids: dict[str, int] = {symbol: symbol_id for symbol, symbol_id in result.all()}
 
         await session.commit()
         logger.info(f"Ensured {len(symbol_ids)} symbols in database")
@@ -185,6 +215,9 @@ class PipelineRunner:
     ) -> int:
         """Persist ranking snapshots to database.
 
+        Rows are written with multi-row INSERT statements of up to
+        SNAPSHOT_INSERT_BATCH rows each (one statement for a normal run).
+
         Args:
             session: Database session.
             snapshots: List of RankedSnapshot objects.
@@ -193,24 +226,71 @@ class PipelineRunner:
         Returns:
             Number of snapshots persisted.
         """
-        for snap in snapshots:
-            db_snap = Snapshot(
-                symbol_id=snap.symbol_id,
-                timeframe=snap.timeframe,
-                bullish_score=snap.bullish_score,
-                confidence=snap.confidence,
-                rank=snap.rank,
-                highlights=snap.highlights,
-                indicator_signals=snap.indicator_signals,
-                computed_at=snap.computed_at,
-                run_id=run_id,
+        rows = [
+            {
+                "symbol_id": snap.symbol_id,
+                "timeframe": snap.timeframe,
+                "bullish_score": snap.bullish_score,
+                "confidence": snap.confidence,
+                "rank": snap.rank,
+                "highlights": snap.highlights,
+                "indicator_signals": snap.indicator_signals,
+                "computed_at": snap.computed_at,
+                "run_id": run_id,
+            }
+            for snap in snapshots
+        ]
+
+        for start in range(0, len(rows), SNAPSHOT_INSERT_BATCH):
+            await session.execute(
+                insert(Snapshot).values(rows[start:start + SNAPSHOT_INSERT_BATCH])
             )
-            session.add(db_snap)
 
         await session.commit()
         logger.info(f"Persisted {len(snapshots)} snapshots for run {run_id}")
         return len(snapshots)
 
+    def _compute_indicators(
+        self, timeframe: str, frames: dict[str, pd.DataFrame]
+    ) -> dict[str, dict[str, IndicatorOutput]]:
+        """Compute indicators for all symbols of a timeframe.
+
+        Uses per-symbol streaming state when enabled, so steady-state cost
+        is proportional to new candles; otherwise one vectorized batch pass.
+
+        Args:
+            timeframe: Timeframe being processed.
+            frames: Dict mapping symbol to OHLCV DataFrame.
+
+        Returns:
+            Dict mapping symbol to indicator outputs. Failed symbols are omitted.
+        """
+        if not self.streaming_indicators:
+            return self.registry.compute_all_batch(frames)
+
+        states = self._indicator_states.setdefault(timeframe, {})
+        results: dict[str, dict[str, IndicatorOutput]] = {}
+
+        for symbol, df in frames.items():
+            try:
+                state, results[symbol] = self.registry.compute_incremental(
+                    states.get(symbol), df, self.checkpoint_bars
+                )
+            except Exception as e:
+                logger.warning(f"Streaming indicators failed for {symbol}: {e}")
+                state = None
+            if state is None:
+                states.pop(symbol, None)
+            else:
+                states[symbol] = state
+
+        # Forget symbols that dropped out of the universe
+        for symbol in list(states):
+            if symbol not in frames:
+                del states[symbol]
+
+        return results
+
     async def run(self, timeframe: str) -> dict:
         """Execute the full ranking pipeline for a timeframe.
 
@@ -284,6 +364,7 @@ class PipelineRunner:
                 symbol_data_list: list[SymbolData] = []
                 errors = []
 
+                eligible: dict[str, pd.DataFrame] = {}
                 for sym in binance_symbols:
                     if sym.symbol not in ohlcv_data:
                         errors.append(f"{sym.symbol}: no OHLCV data")
@@ -294,9 +375,24 @@ class PipelineRunner:
                         errors.append(f"{sym.symbol}: insufficient data ({len(df)} candles)")
                         continue
 
-                    try:
-                        indicators = self.registry.compute_all(df)
+                    eligible[sym.symbol] = df
+
+                if self.compute_pool is not None:
+                    indicators_by_symbol = await self.compute_pool.compute_indicators(eligible)
+                else:
+                    indicators_by_symbol = self._compute_indicators(timeframe, eligible)
+
+                for sym in binance_symbols:
+                    if sym.symbol not in eligible:
+                        continue
 
+                    df = eligible[sym.symbol]
+                    indicators = indicators_by_symbol.get(sym.symbol)
+                    if indicators is None:
+                        errors.append(f"{sym.symbol}: indicator error")
+                        continue
+
+                    try:
                         # Compute price/volume variation (candle-over-candle)
                         price_change_pct = None
                         volume_change_pct = None
@@ -336,12 +432,17 @@ class PipelineRunner:
 
                 # Rank symbols
                 logger.info(f"Ranking {len(symbol_data_list)} symbols")
-                snapshots = self.ranker.rank(
-                    symbol_data_list,
-                    timeframe=timeframe,
-                    run_id=run_id,
-                    computed_at=started_at,
-                )
+                rank_kwargs = {
+                    "timeframe": timeframe,
+                    "run_id": run_id,
+                    "computed_at": started_at,
+                }
+                if self.compute_pool is not None:
+                    snapshots = await self.compute_pool.rank(
+                        self.ranker, symbol_data_list, **rank_kwargs
+                    )
+                else:
+                    snapshots = self.ranker.rank(symbol_data_list, **rank_kwargs)
 
                 # Persist snapshots
                 persisted = await self._persist_snapshots(session, snapshots, run_id)
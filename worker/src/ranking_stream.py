@@ -0,0 +1,125 @@
+"""Delta-encoded ranking updates for the /sse/rankings stream.
+
+A full ranking list is hundreds of KB per timeframe, yet between two runs
+most symbols only move a few places. RankingStream keeps the last
+published rows per timeframe as a versioned baseline and publishes only
+per-symbol field changes against it:
+
+- ``ranking_update`` — full slim rankings with a ``version``. Registered as
+  the event-bus baseline, so new and lagging subscribers start from it.
+- ``ranking_delta`` — ``baseVersion`` -> ``version`` changes: ``changed``
+  maps symbol to its changed fields, plus ``added`` rows and ``removed``
+  symbols. ``computedAt``/``runId`` apply to every row.
+
+Snapshot ids are per-run row ids used only as client row keys, so deltas
+leave them untouched; rows keep the id of the update that added them.
+"""
+
+import logging
+
+from src.events import EventBus, event_bus
+
+logger = logging.getLogger(__name__)
+
+TOPIC = "rankings"
+
+# Row fields compared between runs (everything else is per-run or static)
+DIFF_FIELDS = (
+    "rank",
+    "bullishScore",
+    "confidence",
+    "highlights",
+    "priceChangePct",
+    "volumeChangePct",
+    "priceChangeAbs",
+    "volumeChangeAbs",
+    "fundingRate",
+    "indicatorCount",
+)
+
+
+class RankingStream:
+    """Publishes ranking changes for each timeframe as versioned diffs.
+
+    Args:
+        bus: Event bus to publish on.
+    """
+
+    def __init__(self, bus: EventBus) -> None:
+        self.bus = bus
+        self._rows: dict[str, dict[str, dict]] = {}
+        self._versions: dict[str, int] = {}
+
+    async def publish(self, timeframe: str, snapshots: list[dict], computed_at: str) -> None:
+        """Publish a new ranking list for a timeframe.
+
+        Args:
+            timeframe: Timeframe the rankings belong to.
+            snapshots: Slim ranking rows in rank order.
+            computed_at: ISO timestamp of the run.
+        """
+        rows = {row["symbol"]: row for row in snapshots}
+        previous = self._rows.get(timeframe)
+        base_version = self._versions.get(timeframe, 0)
+        version = base_version + 1
+
+        if previous is not None:
+            # Keep the ids clients already hold for existing rows
+            for symbol, row in rows.items():
+                if symbol in previous:
+                    row["id"] = previous[symbol]["id"]
+
+        self._rows[timeframe] = rows
+        self._versions[timeframe] = version
+        full = {
+            "type": "ranking_update",
+            "timeframe": timeframe,
+            "version": version,
+            "rankings": snapshots,
+            "computedAt": computed_at,
+        }
+        self.bus.set_baseline(TOPIC, timeframe, full)
+
+        if previous is None:
+            await self.bus.publish(TOPIC, full)
+            return
+
+        delta = diff_rankings(previous, rows)
+        await self.bus.publish(TOPIC, {
+            "type": "ranking_delta",
+            "timeframe": timeframe,
+            "version": version,
+            "baseVersion": base_version,
+            "computedAt": computed_at,
+            "runId": snapshots[0]["runId"] if snapshots else None,
+            **delta,
+        })
+        logger.debug(
+            f"Ranking delta for {timeframe} v{version}: {len(delta['changed'])} changed, "
+            f"{len(delta['added'])} added, {len(delta['removed'])} removed"
+        )
+
+
+def diff_rankings(previous: dict[str, dict], current: dict[str, dict]) -> dict:
+    """Per-symbol field changes between two ranking lists keyed by symbol.
+
+    Returns:
+        Dict with ``changed`` ({symbol: {field: value}}), ``added`` (full
+        rows) and ``removed`` (symbols).
+    """
+    changed: dict[str, dict] = {}
+    added: list[dict] = []
+    for symbol, row in current.items():
+        old = previous.get(symbol)
+        if old is None:
+            added.append(row)
+            continue
+        fields = {f: row.get(f) for f in DIFF_FIELDS if row.get(f) != old.get(f)}
+        if fields:
+            changed[symbol] = fields
+    removed = [symbol for symbol in previous if symbol not in current]
+    return {"changed": changed, "added": added, "removed": removed}
+
+
+# Module-level singleton
+ranking_stream = RankingStream(event_bus)
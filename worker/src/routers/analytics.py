@@ -2,31 +2,34 @@
 
 12 GET endpoints under /analytics for dashboard charts and summary stats.
 All queries use raw SQL via sqlalchemy text() for performance.
-Worker-side Redis caching with 120s TTL on all endpoints.
+Worker-side two-tier (in-process + Redis) caching with 120s TTL on all
+endpoints, in the ``analytics`` namespace, which is bumped after every agent
+cycle and season transition.
 """
 
-import json
 from typing import Any
 
 from fastapi import APIRouter
 from sqlalchemy import text
 
-from src.cache import cache_get, cache_set
+from src.cache import tiered_cache
 from src.db import async_session
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 ANALYTICS_TTL = 120  # seconds
+ANALYTICS_STALE_TTL = 120  # served while a background refresh runs
 
 
 async def _cached(key: str, fn) -> Any:
     """Cache-through wrapper. Returns cached JSON or computes + caches."""
-    hit = await cache_get(f"analytics:{key}")
-    if hit is not None:
-        return json.loads(hit)
-    result = await fn()
-    await cache_set(f"analytics:{key}", json.dumps(result, default=str), ANALYTICS_TTL)
-    return result
+    return await tiered_cache.get_or_load(
+        f"analytics:{key}",
+        fn,
+        ANALYTICS_TTL,
+        namespace="analytics",
+        stale_ttl=ANALYTICS_STALE_TTL,
+    )
 
 
 # ---------------------------------------------------------------------------
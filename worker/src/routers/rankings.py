@@ -1,12 +1,11 @@
 """Rankings router — serves latest ranking snapshots per timeframe."""
 
 import asyncio
-import json
 
 from fastapi import APIRouter, HTTPException
 from sqlalchemy import select, func, text
 
-from src.cache import cache_get, cache_set
+from src.cache import tiered_cache
 from src.db import async_session
 from src.models.db import Snapshot, Symbol
 
@@ -22,6 +21,9 @@ RANKINGS_CACHE_TTL = {
     "4h":  18000,   # 5 hours
     "1d":  90000,   # 25 hours
 }
+# Data is unchanged until the next pipeline run, so expired entries are
+# safe to serve briefly while they are refreshed
+RANKINGS_STALE_TTL = 300
 
 
 def _validate_timeframe(timeframe: str) -> None:
@@ -114,16 +116,23 @@ def _slim_response(data: dict) -> dict:
 
 
 async def _get_rankings_for_timeframe(timeframe: str, slim: bool = False) -> dict:
-    """Fetch latest rankings for a single timeframe (with Redis cache-through)."""
-    cache_key = f"rankings_resp:{timeframe}"
+    """Fetch latest rankings for a single timeframe (two-tier cache-through).
 
-    # Check Redis cache first (always stores full response)
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        data = json.loads(cached)
-        return _slim_response(data) if slim else data
+    The cache always holds the full response and lives in the
+    ``timeframe:<tf>`` namespace, which is bumped when a pipeline run completes.
+    """
+    data = await tiered_cache.get_or_load(
+        f"rankings_resp:{timeframe}",
+        lambda: _query_rankings(timeframe),
+        RANKINGS_CACHE_TTL.get(timeframe, 1200),
+        namespace=f"timeframe:{timeframe}",
+        stale_ttl=RANKINGS_STALE_TTL,
+    )
+    return _slim_response(data) if slim else data
 
-    # Cache miss — query Postgres
+
+async def _query_rankings(timeframe: str) -> dict:
+    """Build the full rankings response for a timeframe from Postgres."""
     async with async_session() as session:
         subquery = (
             select(func.max(Snapshot.computed_at))
@@ -148,22 +157,12 @@ async def _get_rankings_for_timeframe(timeframe: str, slim: bool = False) -> dic
             "computedAt": None,
         }
 
-    computed_at = rows[0][0].computed_at.isoformat()
-    # Always build full response for caching
-    snapshots = [_parse_snapshot(snap, sym) for snap, sym in rows]
-
-    data = {
+    return {
         "timeframe": timeframe,
-        "snapshots": snapshots,
-        "computedAt": computed_at,
+        "snapshots": [_parse_snapshot(snap, sym) for snap, sym in rows],
+        "computedAt": rows[0][0].computed_at.isoformat(),
     }
 
-    # Cache the full result
-    ttl = RANKINGS_CACHE_TTL.get(timeframe, 1200)
-    await cache_set(cache_key, json.dumps(data, default=str), ttl)
-
-    return _slim_response(data) if slim else data
-
 
 # ---------------------------------------------------------------------------
 # GET /rankings — all 6 timeframes in parallel
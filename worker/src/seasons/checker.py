@@ -11,6 +11,8 @@ from dateutil.relativedelta import relativedelta
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agents.leaderboard import leaderboard
+from src.cache import tiered_cache
 from src.db import async_session
 from src.models.db import Agent, TimeframeSeason
 
@@ -51,6 +53,9 @@ async def check_and_advance_seasons() -> None:
             try:
                 await _transition_season(session, tf, season_num)
                 await session.commit()
+                # Forced closes were inserted with raw SQL
+                leaderboard.invalidate()
+                await tiered_cache.invalidate("analytics")
                 logger.info(f"Season {season_num} → {season_num + 1} for {tf} completed")
             except Exception:
                 await session.rollback()
@@ -2,6 +2,11 @@
 
 Streams ranking and agent leaderboard updates to connected browsers.
 Uses the in-memory EventBus — no external dependencies.
+
+Every event carries an SSE ``id``. Reconnecting clients send it back as the
+``Last-Event-ID`` header (native EventSource reconnects) or the
+``lastEventId`` query parameter (manual reconnects) and are replayed the
+events they missed.
 """
 
 import asyncio
@@ -9,7 +14,7 @@ import json
 import logging
 from collections.abc import AsyncGenerator
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 
 from src.events import event_bus
@@ -21,33 +26,49 @@ router = APIRouter(prefix="/sse", tags=["sse"])
 KEEPALIVE_SECONDS = 15
 
 
-async def _event_stream(topic: str) -> AsyncGenerator[str, None]:
+def _format(event_id: str, payload: str) -> str:
+    return f"id: {event_id}\ndata: {payload}\n\n"
+
+
+async def _event_stream(
+    topic: str, last_event_id: str | None = None
+) -> AsyncGenerator[str, None]:
     """Async generator that yields SSE-formatted events from the event bus."""
-    sub_id, queue = event_bus.subscribe(topic)
+    sub, backlog = event_bus.subscribe(topic, last_event_id)
 
     try:
         # Initial connected event
         yield f"data: {json.dumps({'type': 'connected', 'topic': topic})}\n\n"
 
+        for event_id, payload in backlog:
+            yield _format(event_id, payload)
+
         while True:
+            if sub.lagged and sub.queue.empty():
+                for event_id, payload in event_bus.catch_up(sub):
+                    yield _format(event_id, payload)
+                continue
             try:
-                data = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
-                yield f"data: {json.dumps(data)}\n\n"
+                event_id, payload = await asyncio.wait_for(
+                    sub.queue.get(), timeout=KEEPALIVE_SECONDS
+                )
+                yield _format(event_id, payload)
             except asyncio.TimeoutError:
                 # Send keepalive comment to prevent proxy/browser timeout
                 yield ": keepalive\n\n"
 
     except asyncio.CancelledError:
-        logger.debug(f"SSE stream cancelled for topic '{topic}', subscriber {sub_id}")
+        logger.debug(f"SSE stream cancelled for topic '{topic}', subscriber {sub.id}")
     finally:
-        event_bus.unsubscribe(topic, sub_id)
+        event_bus.unsubscribe(sub)
 
 
-@router.get("/rankings")
-async def sse_rankings() -> StreamingResponse:
-    """Stream ranking updates for all timeframes."""
+def _stream_response(topic: str, request: Request) -> StreamingResponse:
+    last_event_id = (
+        request.headers.get("last-event-id") or request.query_params.get("lastEventId")
+    )
     return StreamingResponse(
-        _event_stream("rankings"),
+        _event_stream(topic, last_event_id),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -56,54 +77,31 @@ async def sse_rankings() -> StreamingResponse:
     )
 
 
+@router.get("/rankings")
+async def sse_rankings(request: Request) -> StreamingResponse:
+    """Stream ranking updates for all timeframes."""
+    return _stream_response("rankings", request)
+
+
 @router.get("/agents")
-async def sse_agents() -> StreamingResponse:
+async def sse_agents(request: Request) -> StreamingResponse:
     """Stream agent leaderboard updates."""
-    return StreamingResponse(
-        _event_stream("agents"),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    return _stream_response("agents", request)
 
 
 @router.get("/tweets")
-async def sse_tweets() -> StreamingResponse:
+async def sse_tweets(request: Request) -> StreamingResponse:
     """Stream new tweet ingestion updates."""
-    return StreamingResponse(
-        _event_stream("tweets"),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
-    )
-
+    return _stream_response("tweets", request)
 
 
 @router.get("/trades")
-async def sse_trades() -> StreamingResponse:
+async def sse_trades(request: Request) -> StreamingResponse:
     """Stream live trade open/close events."""
-    return StreamingResponse(
-        _event_stream("trades"),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    return _stream_response("trades", request)
 
 
 @router.get("/memecoins")
-async def sse_memecoins() -> StreamingResponse:
+async def sse_memecoins(request: Request) -> StreamingResponse:
     """Stream memecoin wallet activity and tweet updates."""
-    return StreamingResponse(
-        _event_stream("memecoins"),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    return _stream_response("memecoins", request)
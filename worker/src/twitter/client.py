@@ -13,6 +13,7 @@ import httpx
 
 from src.cache import cache_get, cache_set
 from src.config import settings
+from src.http_pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -67,39 +68,41 @@ class TwitterClient:
         for attempt in range(self.MAX_RETRIES + 1):
             async with self._semaphore:
                 try:
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        response = await client.get(url, params=params, headers=headers)
-
-                        if response.status_code == 200:
-                            return response.json()
-
-                        if response.status_code == 429:
-                            retry_after = int(response.headers.get("Retry-After", 60))
-                            if attempt < self.MAX_RETRIES:
-                                logger.warning(
-                                    f"Twitter rate limited, waiting {retry_after}s"
-                                )
-                                await asyncio.sleep(retry_after)
-                                continue
-                            raise TwitterAPIError(429, "Rate limit exceeded", retry_after)
-
-                        if response.status_code >= 500:
-                            if attempt < self.MAX_RETRIES:
-                                delay = self.BASE_RETRY_DELAY * (2 ** attempt)
-                                logger.warning(
-                                    f"Twitter server error {response.status_code}, "
-                                    f"retrying in {delay}s (attempt {attempt + 1})"
-                                )
-                                await asyncio.sleep(delay)
-                                continue
-
-                        try:
-                            error_data = response.json()
-                            message = error_data.get("detail", response.text)
-                        except Exception:
-                            message = response.text
-
-                        raise TwitterAPIError(response.status_code, message)
+                    client = get_http_client(url)
+                    response = await client.get(
+                        url, params=params, headers=headers, timeout=self.timeout
+                    )
+
+                    if response.status_code == 200:
+                        return response.json()
+
+                    if response.status_code == 429:
+                        retry_after = int(response.headers.get("Retry-After", 60))
+                        if attempt < self.MAX_RETRIES:
+                            logger.warning(
+                                f"Twitter rate limited, waiting {retry_after}s"
+                            )
+                            await asyncio.sleep(retry_after)
+                            continue
+                        raise TwitterAPIError(429, "Rate limit exceeded", retry_after)
+
+                    if response.status_code >= 500:
+                        if attempt < self.MAX_RETRIES:
+                            delay = self.BASE_RETRY_DELAY * (2 ** attempt)
+                            logger.warning(
+                                f"Twitter server error {response.status_code}, "
+                                f"retrying in {delay}s (attempt {attempt + 1})"
+                            )
+                            await asyncio.sleep(delay)
+                            continue
+
+                    try:
+                        error_data = response.json()
+                        message = error_data.get("detail", response.text)
+                    except Exception:
+                        message = response.text
+
+                    raise TwitterAPIError(response.status_code, message)
 
                 except httpx.TimeoutException:
                     if attempt < self.MAX_RETRIES:
@@ -1,18 +1,25 @@
 """Tweet relevance filter — two-tier keyword + LLM filtering at ingestion time.
 
-Tier 1: Free keyword/regex heuristics (tickers, trading terms, crypto terms).
-Tier 2: Cheap Claude Haiku yes/no call for ambiguous tweets (~$0.0001/tweet).
+Tier 1: Free keyword/regex heuristics (tickers, trading terms, crypto terms),
+        compiled into a single regex that classifies a tweet in one pass.
+Tier 2: Cheap Claude Haiku call for ambiguous tweets, batched LLM_BATCH_SIZE
+        per request. Verdicts are cached by normalized text, so retweets and
+        duplicates are classified once.
 
 Irrelevant tweets are discarded entirely — no soft-delete.
 """
 
+import asyncio
+import hashlib
 import logging
 import re
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass
 
 import anthropic
 
 from src.config import settings
+from src.twitter.analyzer import MODEL_PRICING
 
 logger = logging.getLogger(__name__)
 
@@ -75,27 +82,178 @@ PRICE_PCT_RE = re.compile(
 )
 
 # Negative patterns — only checked when no positive matches found
+NEGATIVE_PHRASES = (
+    "good morning",
+    "having lunch",
+    "family dinner",
+    "workout", "gym day", "at the gym",
+    "vacation", "holiday mode",
+    "check out my podcast",
+    "new episode",
+    "subscribe to",
+    "happy birthday",
+    "merry christmas",
+    "happy new year",
+    "just woke up",
+    "movie night",
+    "date night",
+    "cooking dinner",
+    "road trip",
+)
+
 NEGATIVE_PATTERNS = re.compile(
-    r"good\s+morning"
-    r"|having\s+lunch"
-    r"|family\s+dinner"
-    r"|workout|gym\s+day|at\s+the\s+gym"
-    r"|vacation|holiday\s+mode"
-    r"|check\s+out\s+my\s+podcast"
-    r"|new\s+episode"
-    r"|subscribe\s+to"
-    r"|happy\s+birthday"
-    r"|merry\s+christmas"
-    r"|happy\s+new\s+year"
-    r"|just\s+woke\s+up"
-    r"|movie\s+night"
-    r"|date\s+night"
-    r"|cooking\s+dinner"
-    r"|road\s+trip",
+    "|".join(phrase.replace(" ", r"\s+") for phrase in NEGATIVE_PHRASES),
     re.IGNORECASE,
 )
 
 
+# ---------------------------------------------------------------------------
+# Compiled single-pass classifier
+# ---------------------------------------------------------------------------
+
+def _build_trie(words) -> dict:
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return trie
+
+
+def _trie_pattern(words) -> str:
+    """Regex alternation for a word list, factored into a prefix trie.
+
+    Shared prefixes are matched once, so a failed attempt at a position
+    costs one branch per distinct first character rather than one per word.
+    A space in a word matches any run of whitespace.
+    """
+    def emit(node: dict) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + emit(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(_build_trie(words))
+
+
+# is_relevant() used to look up the [a-zA-Z0-9]+ runs of text.lower() in the
+# term sets. Outside ASCII, lower() only produces such characters for the
+# KELVIN SIGN (-> "k") and LATIN CAPITAL LETTER I WITH DOT ABOVE (-> "i" plus
+# a combining dot, which ends the run), so those two are handled explicitly
+# and everything else is matched with ASCII-only case folding.
+_TOKEN_CHARS = "a-zA-Z0-9\u212a"
+
+
+def _term_pattern(terms) -> str:
+    """Trie alternation matching lowercase ASCII terms as whole tokens."""
+    def emit(node: dict) -> str:
+        branches = []
+        for char, child in sorted(node.items()):
+            if not char:
+                continue
+            atom = "[k\u212a]" if char == "k" else re.escape(char)
+            branches.append(atom + emit(child))
+            if char == "i" and "" in child:
+                branches.append("\u0130")  # lowers to "i" + combining dot: token ends
+        if "" in node:
+            branches.append(f"(?![{_TOKEN_CHARS}\u0130])")
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return rf"(?<![{_TOKEN_CHARS}])(?ai:{emit(_build_trie(terms))})"
+
+
+# One scan that stops at the first positive signal. Positives are the
+# shortest forms of the TICKER_RE / PRICE_PCT_RE alternatives (only whether
+# a match exists matters, and e.g. [A-Z]{2,10}USDT occurs exactly where
+# [A-Z]{2}USDT does) plus whole-token terms, matching the tokenized set
+# lookup. Negative phrases are zero-width lookaheads, so they never consume
+# text a positive could start in. Classifies exactly like checking the
+# patterns and term sets one after another.
+CLASSIFIER_RE = re.compile(
+    r"(?P<positive>"
+    r"(?i:\$[A-Z]{2}|[A-Z]{2}(?:USDT|/USD))"       # TICKER_RE
+    r"|\$[\d,]|\d\.?\d*(?:%|x\b)"                  # PRICE_PCT_RE
+    rf"|{_term_pattern(ALL_POSITIVE_TERMS)}"
+    r")"
+    rf"|(?=(?P<negative>(?i:{_trie_pattern(NEGATIVE_PHRASES)})))"
+)
+
+# ---------------------------------------------------------------------------
+# LLM fallback and verdict cache
+# ---------------------------------------------------------------------------
+
+# Normalization for the verdict cache: retweets and reposts of the same text
+# differ only in the RT prefix, t.co links and whitespace
+_RT_PREFIX_RE = re.compile(r"^rt @\w+:\s*")
+_URL_RE = re.compile(r"https?://\S+")
+
+LLM_BATCH_SIZE = 25
+VERDICT_CACHE_SIZE = 10_000
+
+CLASSIFY_TWEETS_TOOL = {
+    "name": "classify_tweets",
+    "description": "Mark which tweets are relevant to crypto markets, trading, or digital assets",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "verdicts": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tweet_number": {"type": "integer"},
+                        "relevant": {"type": "boolean"},
+                    },
+                    "required": ["tweet_number", "relevant"],
+                },
+            },
+        },
+        "required": ["verdicts"],
+    },
+}
+
+LLM_SYSTEM_PROMPT = (
+    "For each numbered tweet, decide whether it is relevant to crypto markets, "
+    "trading, or digital assets. Classify every tweet."
+)
+
+
+def text_key(text: str) -> bytes:
+    """Hash of a tweet's normalized text (verdict cache key)."""
+    normalized = " ".join(_URL_RE.sub("", _RT_PREFIX_RE.sub("", text.lower())).split())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+
+class VerdictCache:
+    """LRU of LLM relevance verdicts keyed by text_key()."""
+
+    def __init__(self, max_entries: int = VERDICT_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._verdicts: OrderedDict[bytes, bool] = OrderedDict()
+
+    def get(self, key: bytes) -> bool | None:
+        verdict = self._verdicts.get(key)
+        if verdict is not None:
+            self._verdicts.move_to_end(key)
+        return verdict
+
+    def put(self, key: bytes, verdict: bool) -> None:
+        self._verdicts[key] = verdict
+        self._verdicts.move_to_end(key)
+        while len(self._verdicts) > self.max_entries:
+            self._verdicts.popitem(last=False)
+
+
+# Shared across polls (a TweetRelevanceFilter is created per poll)
+verdict_cache = VerdictCache()
+
+
 # ---------------------------------------------------------------------------
 # FilterStats
 # ---------------------------------------------------------------------------
@@ -109,6 +267,7 @@ class FilterStats:
     dropped_keyword: int = 0
     dropped_llm: int = 0
     ambiguous_kept: int = 0
+    llm_cached: int = 0
     llm_cost: float = 0.0
 
 
@@ -119,87 +278,116 @@ class FilterStats:
 class TweetRelevanceFilter:
     """Two-tier relevance filter for crypto tweets."""
 
-    def __init__(self, api_key: str | None = None):
-        self._anthropic: anthropic.Anthropic | None = None
+    def __init__(self, api_key: str | None = None, cache: VerdictCache | None = None):
+        self._anthropic: anthropic.AsyncAnthropic | None = None
         self._api_key = api_key or settings.anthropic_api_key
+        self.cache = cache or verdict_cache
 
     @property
-    def anthropic_client(self) -> anthropic.Anthropic:
+    def anthropic_client(self) -> anthropic.AsyncAnthropic:
         if self._anthropic is None:
-            self._anthropic = anthropic.Anthropic(api_key=self._api_key)
+            self._anthropic = anthropic.AsyncAnthropic(api_key=self._api_key)
         return self._anthropic
 
     # -- Tier 1: Keyword / heuristic filter ---------------------------------
 
     @staticmethod
     def is_relevant(text: str) -> bool | None:
-        """Keyword-based relevance check.
+        """Keyword-based relevance check (single pass of CLASSIFIER_RE).
 
         Returns:
             True  — definitely relevant (positive match found)
             False — definitely irrelevant (negative match, no positive)
             None  — ambiguous (no strong signal either way)
         """
-        # Check ticker patterns ($BTC, BTCUSDT, etc.)
-        if TICKER_RE.search(text):
-            return True
+        negative = False
+        for match in CLASSIFIER_RE.finditer(text):
+            if match.lastgroup == "positive":
+                return True
+            negative = True
 
-        # Check price/percentage patterns ($42,000, 15%, 10x)
-        if PRICE_PCT_RE.search(text):
-            return True
-
-        # Tokenize and check against term sets
-        tokens = set(re.findall(r"[a-zA-Z0-9]+", text.lower()))
-        if tokens & ALL_POSITIVE_TERMS:
-            return True
-
-        # No positive match — check negative patterns
-        if NEGATIVE_PATTERNS.search(text):
-            return False
-
-        # Ambiguous
-        return None
+        # No positive match — negative patterns decide, else ambiguous
+        return False if negative else None
 
     # -- Tier 2: LLM fallback -----------------------------------------------
 
-    def check_relevance_llm(self, text: str) -> tuple[bool, float]:
-        """LLM-based relevance check using Claude Haiku.
+    async def check_relevance_llm(self, texts: list[str]) -> tuple[list[bool | None], float]:
+        """Classify a batch of tweets in one Claude Haiku request.
+
+        Args:
+            texts: Up to LLM_BATCH_SIZE tweet texts.
 
         Returns:
-            (is_relevant, cost_usd)
+            (verdicts, cost_usd) — verdicts align with texts; None where the
+            model gave no answer or the call failed (callers fail open).
         """
+        tweet_lines = [f"[{idx}] {text}" for idx, text in enumerate(texts, 1)]
         try:
-            response = self.anthropic_client.messages.create(
+            response = await self.anthropic_client.messages.create(
                 model=settings.tweet_analysis_model,
-                max_tokens=3,
-                system="Is this tweet relevant to crypto markets, trading, or digital assets? Reply only yes or no.",
-                messages=[{"role": "user", "content": text}],
+                max_tokens=40 * len(texts) + 100,
+                system=LLM_SYSTEM_PROMPT,
+                tools=[CLASSIFY_TWEETS_TOOL],
+                tool_choice={"type": "tool", "name": "classify_tweets"},
+                messages=[{"role": "user", "content": "\n\n".join(tweet_lines)}],
             )
-
-            # Calculate cost
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            # Haiku 4.5 pricing: $0.80/1M input, $4.00/1M output
-            cost = (input_tokens * 0.80 + output_tokens * 4.00) / 1_000_000
-
-            answer = response.content[0].text.strip().lower()
-            is_relevant = not answer.startswith("no")
-
-            return is_relevant, cost
-
         except Exception as e:
-            logger.warning(f"LLM relevance check failed (fail-open): {e}")
-            return True, 0.0  # Fail-open: keep the tweet
+            logger.warning(f"LLM relevance check failed for {len(texts)} tweets (fail-open): {e}")
+            return [None] * len(texts), 0.0
+
+        # Calculate cost
+        input_tokens = response.usage.input_tokens
+        output_tokens = response.usage.output_tokens
+        pricing = MODEL_PRICING.get(settings.tweet_analysis_model, {"input": 0.80, "output": 4.00})
+        cost = (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
+
+        verdicts: list[bool | None] = [None] * len(texts)
+        for block in response.content:
+            if block.type == "tool_use" and block.name == "classify_tweets":
+                for item in block.input.get("verdicts", []):
+                    idx = item.get("tweet_number")
+                    if isinstance(idx, int) and 1 <= idx <= len(texts):
+                        verdicts[idx - 1] = bool(item.get("relevant", True))
+        return verdicts, cost
+
+    async def _llm_verdicts(self, texts: dict[bytes, str], stats: FilterStats) -> dict[bytes, bool]:
+        """Verdicts for ambiguous tweets: cached ones first, the rest in concurrent batches."""
+        verdicts: dict[bytes, bool] = {}
+        pending: list[tuple[bytes, str]] = []
+        for key, text in texts.items():
+            cached = self.cache.get(key)
+            if cached is None:
+                pending.append((key, text))
+            else:
+                verdicts[key] = cached
+                stats.llm_cached += 1
+
+        batches = [pending[i:i + LLM_BATCH_SIZE] for i in range(0, len(pending), LLM_BATCH_SIZE)]
+        results = await asyncio.gather(
+            *(self.check_relevance_llm([text for _, text in batch]) for batch in batches)
+        )
+        for batch, (batch_verdicts, cost) in zip(batches, results):
+            stats.llm_cost += cost
+            for (key, _), verdict in zip(batch, batch_verdicts):
+                if verdict is None:
+                    verdicts[key] = True  # Fail-open: keep the tweet, retry next time
+                else:
+                    verdicts[key] = verdict
+                    self.cache.put(key, verdict)
+        return verdicts
 
     # -- Main entry point ----------------------------------------------------
 
-    def filter_tweets(
+    async def filter_tweets(
         self,
         tweets: list[dict],
         llm_enabled: bool = False,
     ) -> tuple[list[dict], FilterStats]:
         """Filter a list of tweet dicts for relevance.
 
+        Ambiguous tweets are deduplicated by normalized text and classified
+        together, so one LLM request covers up to LLM_BATCH_SIZE of them.
+
         Args:
             tweets: List of raw tweet dicts (must have "text" key).
             llm_enabled: Whether to use LLM fallback for ambiguous tweets.
@@ -208,33 +396,40 @@ class TweetRelevanceFilter:
             (kept_tweets, stats)
         """
         stats = FilterStats(total=len(tweets))
-        kept: list[dict] = []
+        results = [self.is_relevant(tweet.get("text", "")) for tweet in tweets]
+
+        keys: dict[int, bytes] = {}
+        llm_verdicts: dict[bytes, bool] = {}
+        if llm_enabled:
+            texts: dict[bytes, str] = {}
+            for i, result in enumerate(results):
+                if result is None:
+                    text = tweets[i].get("text", "")
+                    keys[i] = text_key(text)
+                    texts.setdefault(keys[i], text)
+            if texts:
+                llm_verdicts = await self._llm_verdicts(texts, stats)
 
-        for tweet in tweets:
+        kept: list[dict] = []
+        for i, (tweet, result) in enumerate(zip(tweets, results)):
             text = tweet.get("text", "")
-            result = self.is_relevant(text)
-
             if result is True:
                 kept.append(tweet)
                 stats.passed += 1
             elif result is False:
                 stats.dropped_keyword += 1
                 logger.debug(f"Dropped (keyword): {text[:80]}...")
-            else:
-                # Ambiguous — check LLM if enabled
-                if llm_enabled:
-                    is_rel, cost = self.check_relevance_llm(text)
-                    stats.llm_cost += cost
-                    if is_rel:
-                        kept.append(tweet)
-                        stats.passed += 1
-                    else:
-                        stats.dropped_llm += 1
-                        logger.debug(f"Dropped (LLM): {text[:80]}...")
-                else:
-                    # Fail-open: keep ambiguous tweets
+            elif llm_enabled:
+                if llm_verdicts[keys[i]]:
                     kept.append(tweet)
                     stats.passed += 1
-                    stats.ambiguous_kept += 1
+                else:
+                    stats.dropped_llm += 1
+                    logger.debug(f"Dropped (LLM): {text[:80]}...")
+            else:
+                # Fail-open: keep ambiguous tweets
+                kept.append(tweet)
+                stats.passed += 1
+                stats.ambiguous_kept += 1
 
         return kept, stats
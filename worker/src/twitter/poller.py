@@ -1,10 +1,8 @@
 """Twitter poller — scheduled job that ingests tweets from tracked accounts."""
 
 import logging
-from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, func
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
@@ -12,6 +10,7 @@ from src.events import event_bus
 from src.models.db import Tweet, TwitterAccount
 from src.twitter.client import TwitterClient
 from src.twitter.filter import TweetRelevanceFilter
+from src.twitter.store import insert_new_tweets
 from src.llm_settings import is_enabled
 
 logger = logging.getLogger(__name__)
@@ -62,7 +61,7 @@ class TwitterPoller:
         if settings.tweet_filter_enabled and raw_tweets:
             relevance_filter = TweetRelevanceFilter()
             llm_filter_on = is_enabled("tweet_relevance_filter")
-            raw_tweets, filter_stats = relevance_filter.filter_tweets(
+            raw_tweets, filter_stats = await relevance_filter.filter_tweets(
                 raw_tweets, llm_enabled=llm_filter_on
             )
             logger.info(
@@ -70,53 +69,26 @@ class TwitterPoller:
                 f"({filter_stats.dropped_keyword} keyword, {filter_stats.dropped_llm} LLM)"
             )
 
-        # 4. Persist new tweets (ON CONFLICT DO NOTHING)
-        new_count = 0
-        for tweet_data in raw_tweets:
-            author_handle = tweet_data.get("author_handle", "").lower()
-            account = handle_to_account.get(author_handle)
-            if not account:
-                continue
-
-            metrics = tweet_data.get("metrics", {})
-            media_urls = tweet_data.get("media_urls", [])
-            if media_urls:
-                metrics["media_urls"] = media_urls
-
-            stmt = pg_insert(Tweet).values(
-                twitter_account_id=account.id,
-                tweet_id=tweet_data["tweet_id"],
-                text=tweet_data["text"],
-                created_at=tweet_data["created_at"],
-                metrics=metrics,
-            ).on_conflict_do_nothing(index_elements=["tweet_id"])
-
-            result = await self.session.execute(stmt)
-            if result.rowcount and result.rowcount > 0:
-                new_count += 1
+        # 4. Persist new tweets (one bulk INSERT ... ON CONFLICT DO NOTHING RETURNING)
+        new_tweets = await insert_new_tweets(
+            self.session, Tweet, "twitter_account_id", raw_tweets, handle_to_account
+        )
+        new_count = len(new_tweets)
 
         await self.session.commit()
 
-        # 5. Broadcast via SSE
+        # 5. Broadcast via SSE (built from the inserted rows, newest first)
         if new_count > 0:
-            # Fetch the newly inserted tweets for broadcast
-            cutoff = datetime.now(timezone.utc) - timedelta(minutes=10)
-            recent = await self.session.execute(
-                select(Tweet, TwitterAccount)
-                .join(TwitterAccount, TwitterAccount.id == Tweet.twitter_account_id)
-                .where(Tweet.ingested_at >= cutoff)
-                .order_by(Tweet.created_at.desc())
-                .limit(new_count)
-            )
             broadcast_tweets = []
-            for tweet, account in recent.all():
+            for tweet in sorted(new_tweets, key=lambda t: t.created_at, reverse=True):
+                account = tweet.account
                 broadcast_tweets.append({
                     "id": tweet.id,
-                    "tweetId": tweet.tweet_id,
+                    "tweetId": tweet.data["tweet_id"],
                     "accountHandle": account.handle,
                     "accountDisplayName": account.display_name,
                     "accountCategory": account.category,
-                    "text": tweet.text,
+                    "text": tweet.data["text"],
                     "createdAt": tweet.created_at.isoformat(),
                     "metrics": tweet.metrics,
                 })
@@ -150,6 +122,7 @@ class TwitterPoller:
                 "dropped_keyword": filter_stats.dropped_keyword,
                 "dropped_llm": filter_stats.dropped_llm,
                 "ambiguous_kept": filter_stats.ambiguous_kept,
+                "llm_cached": filter_stats.llm_cached,
                 "llm_cost": round(filter_stats.llm_cost, 6),
             }
         if analysis_result:
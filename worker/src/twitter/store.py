@@ -0,0 +1,83 @@
+"""Bulk tweet persistence shared by the Twitter and memecoin Twitter pollers."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass
+class NewTweet:
+    """A tweet row inserted by this poll."""
+
+    id: int
+    account: Any
+    created_at: datetime
+    metrics: dict
+    data: dict
+
+
+async def insert_new_tweets(
+    session: AsyncSession,
+    model: type,
+    account_column: str,
+    raw_tweets: list[dict],
+    handle_to_account: dict[str, Any],
+) -> list[NewTweet]:
+    """Insert fetched tweets in one statement and return only the new ones.
+
+    Uses INSERT ... ON CONFLICT (tweet_id) DO NOTHING RETURNING, so tweets
+    that were already stored are skipped without a follow-up query.
+
+    Args:
+        session: DB session (the caller commits).
+        model: Tweet table model with tweet_id, text, created_at and metrics.
+        account_column: Name of the model's FK column to the account.
+        raw_tweets: Tweets as returned by TwitterClient.search_recent.
+        handle_to_account: Lower-cased handle -> account row; tweets from
+            other authors are skipped.
+
+    Returns:
+        Newly inserted tweets, in the order they were fetched.
+    """
+    rows: dict[str, dict] = {}
+    fetched: dict[str, tuple[Any, dict, dict]] = {}
+    for tweet_data in raw_tweets:
+        account = handle_to_account.get(tweet_data.get("author_handle", "").lower())
+        if not account or tweet_data["tweet_id"] in rows:
+            continue
+
+        metrics = tweet_data.get("metrics", {})
+        media_urls = tweet_data.get("media_urls", [])
+        if media_urls:
+            metrics["media_urls"] = media_urls
+
+        rows[tweet_data["tweet_id"]] = {
+            account_column: account.id,
+            "tweet_id": tweet_data["tweet_id"],
+            "text": tweet_data["text"],
+            "created_at": tweet_data["created_at"],
+            "metrics": metrics,
+        }
+        fetched[tweet_data["tweet_id"]] = (account, metrics, tweet_data)
+
+    if not rows:
+        return []
+
+    stmt = (
+        pg_insert(model)
+        .values(list(rows.values()))
+        .on_conflict_do_nothing(index_elements=["tweet_id"])
+        .returning(model.id, model.tweet_id, model.created_at)
+    )
+    result = await session.execute(stmt)
+    inserted = {tweet_id: (db_id, created_at) for db_id, tweet_id, created_at in result.all()}
+
+    new_tweets = []
+    for tweet_id, (account, metrics, tweet_data) in fetched.items():
+        if tweet_id in inserted:
+            db_id, created_at = inserted[tweet_id]
+            new_tweets.append(NewTweet(db_id, account, created_at, metrics, tweet_data))
+    return new_tweets
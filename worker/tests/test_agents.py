@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -390,3 +390,518 @@ class TestContextBuilder:
         """Should include rankings in context."""
         # This would need mocked session - placeholder
         pass
+
+
+class TestMarketSnapshot:
+    """Tests for the per-cycle shared market snapshot."""
+
+    @staticmethod
+    def _ranking(symbol: str, score: float, rank: int = 1):
+        from src.agents.schemas import RankingContext
+
+        return RankingContext(
+            symbol=symbol, rank=rank, bullish_score=score, confidence=70,
+            highlights=[], indicator_signals=[],
+        )
+
+    def test_confluence_from_rankings(self):
+        """Confluence is derived from the snapshot rankings without queries."""
+        from src.agents.context import ContextBuilder
+
+        rankings = {
+            "15m": [self._ranking("BTCUSDT", 0.7), self._ranking("ETHUSDT", 0.3)],
+            "30m": [self._ranking("BTCUSDT", 0.8), self._ranking("ETHUSDT", 0.2)],
+            "1h": [self._ranking("BTCUSDT", 0.65), self._ranking("ETHUSDT", 0.35)],
+            "4h": [self._ranking("SOLUSDT", 0.9)],
+        }
+        confluence = ContextBuilder._cross_timeframe_confluence(rankings)
+
+        assert confluence["bullish_confluence"] == ["BTCUSDT"]
+        assert confluence["bearish_confluence"] == ["ETHUSDT"]
+        assert confluence["timeframes_analyzed"] == 5
+        assert confluence["symbol_tf_scores"]["SOLUSDT"] == {"4h": 0.9}
+
+    def test_performance_from_trades(self):
+        """Batched performance matches the per-agent computation."""
+        from src.agents.context import ContextBuilder
+
+        trades = [
+            MagicMock(pnl=Decimal("100"), duration_minutes=60,
+                      closed_at=datetime(2025, 1, 1, tzinfo=timezone.utc)),
+            MagicMock(pnl=Decimal("-50"), duration_minutes=120,
+                      closed_at=datetime(2025, 1, 2, tzinfo=timezone.utc)),
+        ]
+        stats = ContextBuilder._performance_from_trades(trades)
+
+        assert stats.total_trades == 2
+        assert stats.winning_trades == 1
+        assert stats.total_pnl == Decimal("50")
+        assert stats.max_drawdown == pytest.approx(0.5)
+        assert stats.avg_trade_duration_hours == pytest.approx(1.5)
+        assert ContextBuilder._performance_from_trades([]).total_trades == 0
+
+    @pytest.mark.asyncio
+    async def test_build_with_snapshot_only_fetches_portfolio(self):
+        """With a snapshot and history, build() only queries the agent's portfolio."""
+        from src.agents.context import AgentHistory, ContextBuilder, MarketSnapshot
+
+        session = MagicMock()
+        empty = MagicMock()
+        empty.scalar_one_or_none.return_value = None
+        session.execute = AsyncMock(return_value=empty)
+
+        snapshot = MarketSnapshot(
+            rankings={"1h": [self._ranking("BTCUSDT", 0.7)]},
+            confluence={"bullish_confluence": []},
+            regime=None,
+            fleet_lessons={"momentum": ["[entry] wait for volume"]},
+            built_at=datetime.now(timezone.utc),
+        )
+        history = AgentHistory(
+            performance=ContextBuilder._performance_from_trades([]),
+            memory=["cut losers early"],
+        )
+        agent = MagicMock(
+            id=1, timeframe="1h", strategy_archetype="momentum", source="technical"
+        )
+        agent.name = "momentum-1h"
+
+        context = await ContextBuilder(session).build(
+            agent, {}, snapshot=snapshot, history=history
+        )
+
+        assert session.execute.await_count == 1
+        assert [r.symbol for r in context.primary_timeframe_rankings] == ["BTCUSDT"]
+        assert context.fleet_lessons == ["[entry] wait for volume"]
+        assert context.recent_memory == ["cut losers early"]
+        assert context.portfolio.position_count == 0
+
+
+class TestConcurrentCycle:
+    """Tests for concurrent agent processing in the orchestrator."""
+
+    @staticmethod
+    def _orchestrator(session_factory=None):
+        from src.agents.orchestrator import AgentOrchestrator
+
+        session = MagicMock()
+        session.commit = AsyncMock()
+        return AgentOrchestrator(session, session_factory=session_factory, client=MagicMock())
+
+    @staticmethod
+    def _agents(n: int):
+        agents = []
+        for i in range(n):
+            agent = MagicMock(id=i + 1)
+            agent.name = f"agent-{i + 1}"
+            agents.append(agent)
+        return agents
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_and_order_preserved(self):
+        """Agents run in parallel up to the limit; outcomes keep agent order."""
+        import asyncio
+
+        orchestrator = self._orchestrator(session_factory=MagicMock())
+        running = 0
+        peak = 0
+
+        async def process(agent_id, *args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Later agents finish first
+            await asyncio.sleep(0.01 * (10 - agent_id))
+            running -= 1
+            if agent_id == 3:
+                raise RuntimeError("boom")
+            return {"decision": None, "agent_id": agent_id}
+
+        orchestrator._process_agent_in_session = process
+        agents = self._agents(8)
+
+        with patch("src.agents.orchestrator.settings") as mock_settings:
+            mock_settings.agent_cycle_concurrency = 3
+            outcomes = await orchestrator._process_agents(agents, {}, {}, {}, None, {})
+
+        assert peak == 3
+        assert isinstance(outcomes[2], RuntimeError)
+        assert [o["agent_id"] for i, o in enumerate(outcomes) if i != 2] == [
+            1, 2, 4, 5, 6, 7, 8
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sequential_without_session_factory(self):
+        """Without a session factory agents run one by one on the shared session."""
+        orchestrator = self._orchestrator()
+        orchestrator._process_agent = AsyncMock(
+            side_effect=[{"decision": None}, ValueError("bad"), {"decision": None}]
+        )
+        outcomes = await orchestrator._process_agents(
+            self._agents(3), {}, {}, {}, None, {}
+        )
+
+        assert orchestrator._process_agent.await_count == 3
+        assert isinstance(outcomes[1], ValueError)
+        orchestrator.session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("n_agents, bumped", [(2, True), (0, False)])
+    async def test_cycle_invalidates_analytics_cache(self, n_agents, bumped):
+        """A cycle that touched agents bumps the analytics cache namespace."""
+        orchestrator = self._orchestrator()
+        agents = self._agents(n_agents)
+        orchestrator._get_active_agents = AsyncMock(return_value=agents)
+        orchestrator.portfolio_manager.settle_positions = AsyncMock(return_value={})
+        orchestrator._prepare_cycle_context = AsyncMock(return_value=(None, {}))
+        orchestrator._process_agents = AsyncMock(return_value=[{"decision": None}] * n_agents)
+
+        with (
+            patch("src.agents.orchestrator.load_llm_settings", AsyncMock()),
+            patch("src.agents.orchestrator.tiered_cache") as cache,
+        ):
+            cache.invalidate = AsyncMock()
+            await orchestrator.run_cycle("1h", {})
+            await orchestrator.run_tweet_cycle("1h", {})
+
+        if bumped:
+            assert cache.invalidate.await_args_list == [call("analytics")] * 2
+        else:
+            cache.invalidate.assert_not_awaited()
+
+    def test_collect_outcome(self):
+        """Results are aggregated the same way regardless of completion order."""
+        from src.agents.orchestrator import AgentOrchestrator
+
+        results = {
+            "agents_processed": 0, "decisions": [], "executions": [],
+            "memories_generated": 0, "evolutions_triggered": 0, "errors": [],
+            "total_tokens": {"input": 0, "output": 0}, "total_cost_usd": Decimal("0.00"),
+        }
+        decision = MagicMock(
+            input_tokens=100, output_tokens=20, estimated_cost_usd=Decimal("0.01")
+        )
+        agents = self._agents(3)
+        AgentOrchestrator._collect_outcome(
+            results, agents[0], {"decision": decision, "memory_generated": True}
+        )
+        AgentOrchestrator._collect_outcome(results, agents[1], RuntimeError("boom"))
+        AgentOrchestrator._collect_outcome(results, agents[2], {"decision": None})
+
+        assert results["agents_processed"] == 2
+        assert results["memories_generated"] == 1
+        assert results["total_tokens"] == {"input": 100, "output": 20}
+        assert results["total_cost_usd"] == Decimal("0.01")
+        assert results["errors"] == [
+            {"agent_id": 2, "agent_name": "agent-2", "error": "boom"}
+        ]
+
+
+class TestSignalTable:
+    """Tests for the columnar ranking table used by rule strategies."""
+
+    @staticmethod
+    def _ranking(symbol: str, signals: list[dict], score: float = 0.8, confidence: int = 80):
+        from src.agents.schemas import RankingContext
+
+        return RankingContext(
+            symbol=symbol, rank=1, bullish_score=score, confidence=confidence,
+            highlights=[], indicator_signals=signals,
+        )
+
+    @staticmethod
+    def _momentum_long_signals(rsi: float = 60.0) -> list[dict]:
+        return [
+            {"name": "rsi_14", "rawValues": {"value": rsi}},
+            {"name": "macd_12_26_9", "rawValues": {"histogram": 0.5}},
+            {"name": "adx_14", "rawValues": {"adx": 30, "plus_di": 25, "minus_di": 10}},
+            {"name": "obv", "rawValues": {"slope_normalized": 1.0}},
+            {"name": "ema_50", "rawValues": {"price_vs_ema_pct": 2.0}},
+            {"name": "ema_200", "rawValues": {"price_vs_ema_pct": 5.0}},
+        ]
+
+    @staticmethod
+    def _context(rankings, held: list[str] | None = None) -> AgentContext:
+        positions = [
+            PositionInfo(
+                id=i, symbol=symbol, symbol_id=i, direction=Direction.LONG,
+                entry_price=Decimal("1"), position_size=Decimal("100"),
+                stop_loss=None, take_profit=None,
+                opened_at=datetime.now(timezone.utc), unrealized_pnl=Decimal("0"),
+            )
+            for i, symbol in enumerate(held or [])
+        ]
+        return AgentContext(
+            agent_id=1, agent_name="rb-momentum", strategy_archetype="momentum",
+            primary_timeframe="1h",
+            portfolio=PortfolioSummary(
+                agent_id=1, cash_balance=Decimal("10000"), total_equity=Decimal("10000"),
+                total_realized_pnl=Decimal("0"), total_fees_paid=Decimal("0"),
+                open_positions=positions, position_count=len(positions),
+                available_for_new_position=Decimal("2500"),
+            ),
+            performance=PerformanceStats(
+                total_trades=0, winning_trades=0, losing_trades=0, win_rate=0.0,
+                total_pnl=Decimal("0"), avg_pnl_per_trade=Decimal("0"), max_drawdown=0.0,
+            ),
+            primary_timeframe_rankings=rankings,
+            current_prices={},
+        )
+
+    def test_columns_match_raw_lookup(self):
+        """Columns follow BaseRuleStrategy._raw, with NaN where values are missing."""
+        import numpy as np
+
+        from src.agents.strategies import SignalTable
+
+        table = SignalTable([
+            self._ranking("BTCUSDT", [
+                {"name": "rsi_14", "rawValues": {"value": 55.0}},
+                {"name": "rsi_14", "rawValues": {"value": 99.0}},
+            ]),
+            self._ranking("ETHUSDT", [{"name": "rsi_14", "raw": {"value": 20.0}}]),
+            self._ranking("SOLUSDT", [{"name": "obv", "rawValues": {"slope_normalized": None}}]),
+        ])
+
+        rsi = table.raw("rsi_14", "value")
+        assert rsi[:2].tolist() == [55.0, 20.0]
+        assert np.isnan(rsi[2])
+        assert np.isnan(table.raw("obv", "slope_normalized")).all()
+        assert table.has(("rsi_14", "value")).tolist() == [True, True, False]
+        assert table.row("ETHUSDT") == 1
+
+    def test_entry_skips_held_symbols_in_rank_order(self):
+        """The first un-held row with an entry signal is opened."""
+        from src.agents.strategies import MomentumStrategy, SignalTable
+
+        rankings = [
+            self._ranking("BTCUSDT", self._momentum_long_signals(rsi=80.0)),  # RSI too high
+            self._ranking("ETHUSDT", self._momentum_long_signals()),
+            self._ranking("SOLUSDT", self._momentum_long_signals()),
+        ]
+        table = SignalTable(rankings)
+        strategy = MomentumStrategy()
+
+        action = strategy.evaluate_table(self._context(rankings), table)
+        assert action.action == ActionType.OPEN_LONG
+        assert action.symbol == "ETHUSDT"
+        assert action.position_size_pct == 0.15
+
+        action = strategy.evaluate_table(self._context(rankings, held=["ETHUSDT"]), table)
+        assert action.symbol == "SOLUSDT"
+        assert strategy.evaluate(self._context(rankings)) == strategy.evaluate_table(
+            self._context(rankings), table
+        )
+
+    def test_entry_masks_shared_across_agents(self):
+        """Masks are computed once per table, however many agents evaluate it."""
+        from src.agents.strategies import MomentumStrategy, SignalTable
+
+        rankings = [self._ranking("BTCUSDT", self._momentum_long_signals())]
+        table = SignalTable(rankings)
+
+        with patch.object(
+            MomentumStrategy, "_entry_masks", autospec=True,
+            side_effect=MomentumStrategy._entry_masks,
+        ) as masks:
+            for _ in range(5):
+                MomentumStrategy().evaluate_table(self._context(rankings), table)
+
+        assert masks.call_count == 1
+
+    def test_only_scan_strategies_define_entry_masks(self):
+        """Table scanning is opt-in via TableScanStrategy."""
+        from src.agents.strategies import (
+            STRATEGY_REGISTRY,
+            MomentumStrategy,
+            SignalTable,
+            TableScanStrategy,
+        )
+
+        scanners = {
+            name for name, cls in STRATEGY_REGISTRY.items()
+            if issubclass(cls, TableScanStrategy)
+        }
+        assert scanners == {"momentum", "mean_reversion", "breakout", "swing"}
+        assert not hasattr(STRATEGY_REGISTRY["tweet_momentum"], "_entry_masks")
+
+        class NoMasks(TableScanStrategy):
+            def evaluate_table(self, context, table: SignalTable):
+                return self._hold()
+
+            def generate_reasoning(self, context, action) -> str:
+                return ""
+
+        with pytest.raises(TypeError):
+            NoMasks()
+        assert isinstance(MomentumStrategy(), TableScanStrategy)
+
+
+class TestSettlePositions:
+    """Tests for fleet-wide SL/TP and unrealized PnL settlement."""
+
+    @staticmethod
+    def _session(rows, portfolios, seasons):
+        session = MagicMock()
+        position_result = MagicMock()
+        position_result.all.return_value = rows
+        portfolio_result = MagicMock()
+        portfolio_result.scalars.return_value.all.return_value = portfolios
+        season_result = MagicMock()
+        season_result.all.return_value = seasons
+        session.execute = AsyncMock(side_effect=[position_result, portfolio_result, season_result])
+        session.delete = AsyncMock()
+        session.flush = AsyncMock()
+        return session
+
+    @staticmethod
+    def _position(id_, agent_id, direction, entry, stop_loss=None, take_profit=None):
+        from src.models.db import AgentPosition
+
+        return AgentPosition(
+            id=id_, agent_id=agent_id, symbol_id=id_, direction=direction,
+            entry_price=Decimal(entry), position_size=Decimal("1000"),
+            stop_loss=Decimal(stop_loss) if stop_loss else None,
+            take_profit=Decimal(take_profit) if take_profit else None,
+            opened_at=datetime.now(timezone.utc), unrealized_pnl=Decimal("0"),
+        )
+
+    @staticmethod
+    def _portfolio(agent_id):
+        from src.models.db import AgentPortfolio
+
+        return AgentPortfolio(
+            agent_id=agent_id, cash_balance=Decimal("9000"), total_equity=Decimal("10000"),
+            total_realized_pnl=Decimal("0"), total_fees_paid=Decimal("0"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_closes_hits_and_marks_the_rest(self):
+        """SL/TP hits close in one flush; open positions are marked to market."""
+        from src.agents.portfolio import PortfolioManager
+        from src.models.db import AgentTrade
+
+        stopped = self._position(1, agent_id=1, direction="long", entry="100", stop_loss="95")
+        short = self._position(2, agent_id=2, direction="short", entry="50", stop_loss="60")
+        portfolios = [self._portfolio(1), self._portfolio(2)]
+        session = self._session(
+            [(stopped, "BTCUSDT"), (short, "ETHUSDT")], portfolios, [(1, 3)]
+        )
+        candle_data = {
+            "BTCUSDT": {"high": Decimal("101"), "low": Decimal("94"), "close": Decimal("96")},
+            "ETHUSDT": {"high": Decimal("55"), "low": Decimal("44"), "close": Decimal("45")},
+        }
+
+        results = await PortfolioManager(session).settle_positions(
+            [1, 2], candle_data, {"BTCUSDT": Decimal("96"), "ETHUSDT": Decimal("45")}
+        )
+
+        assert [r.details["exit_reason"] for r in results[1]] == ["stop_loss"]
+        assert results[2] == []
+        session.delete.assert_awaited_once_with(stopped)
+        session.flush.assert_awaited_once()
+
+        trade = session.add.call_args.args[0]
+        assert isinstance(trade, AgentTrade)
+        assert trade.exit_price == Decimal("95")
+        assert trade.season == 3
+        # -50 gross, -1 exit fee; equity falls back to cash with no open positions
+        assert portfolios[0].cash_balance == Decimal("9949")
+        assert portfolios[0].total_equity == Decimal("9949")
+
+        # Short from 50 marked at 45: +100 unrealized
+        assert short.unrealized_pnl == Decimal("100")
+        assert portfolios[1].total_equity == Decimal("10100")
+
+    @pytest.mark.asyncio
+    async def test_without_candles_only_updates_equity(self):
+        """With no candle data nothing is closed and seasons are not queried."""
+        from src.agents.portfolio import PortfolioManager
+
+        position = self._position(1, agent_id=1, direction="long", entry="100", stop_loss="95")
+        portfolios = [self._portfolio(1)]
+        session = self._session([(position, "BTCUSDT")], portfolios, [])
+
+        results = await PortfolioManager(session).settle_positions(
+            [1], current_prices={"BTCUSDT": Decimal("90")}
+        )
+
+        assert results == {1: []}
+        assert session.execute.await_count == 2
+        assert position.unrealized_pnl == Decimal("-100")
+        assert portfolios[0].total_equity == Decimal("9900")
+
+
+class TestLeaderboardCache:
+    """Tests for the in-process leaderboard aggregates."""
+
+    @staticmethod
+    def _loaded_session(trades, costs):
+        session = MagicMock()
+        trade_result = MagicMock()
+        trade_result.all.return_value = trades
+        cost_result = MagicMock()
+        cost_result.all.return_value = costs
+        session.execute = AsyncMock(side_effect=[trade_result, cost_result])
+        return session
+
+    @pytest.mark.asyncio
+    async def test_loads_once_then_applies_committed_deltas(self):
+        """Grouped queries seed the cache; committed writes update it in place."""
+        from sqlalchemy.orm import Session
+
+        from src.agents.leaderboard import LeaderboardCache
+
+        cache = LeaderboardCache()
+        with patch("src.agents.leaderboard.leaderboard", cache):
+            loader = self._loaded_session([(1, 4, 3)], [(1, Decimal("0.50")), (2, Decimal("1"))])
+            aggregates = await cache.get_all(loader)
+            assert aggregates[1].trade_count == 4
+            assert aggregates[1].wins == 3
+            assert aggregates[2].token_cost == Decimal("1")
+
+            writer = Session()
+            cache.record_trade(writer, 1, Decimal("-5"))
+            cache.record_trade(writer, 3, Decimal("12"))
+            cache.record_token_cost(writer, 2, Decimal("0.25"))
+            writer.commit()
+
+            aggregates = await cache.get_all(loader)
+
+        assert loader.execute.await_count == 2
+        assert (aggregates[1].trade_count, aggregates[1].wins) == (5, 3)
+        assert (aggregates[3].trade_count, aggregates[3].wins) == (1, 1)
+        assert aggregates[2].token_cost == Decimal("1.25")
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_deltas_are_dropped(self):
+        """Writes from a rolled-back transaction never reach the cache."""
+        from sqlalchemy.orm import Session
+
+        from src.agents.leaderboard import LeaderboardCache
+
+        cache = LeaderboardCache()
+        with patch("src.agents.leaderboard.leaderboard", cache):
+            await cache.get_all(self._loaded_session([], []))
+
+            writer = Session()
+            writer.begin()
+            cache.record_trade(writer, 1, Decimal("10"))
+            writer.rollback()
+            writer.commit()
+
+            aggregates = await cache.get_all(MagicMock())
+
+        assert aggregates == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads(self):
+        """invalidate() forces the next read to query the database again."""
+        from src.agents.leaderboard import LeaderboardCache
+
+        cache = LeaderboardCache()
+        await cache.get_all(self._loaded_session([(1, 1, 0)], []))
+        cache.invalidate()
+        aggregates = await cache.get_all(self._loaded_session([(1, 2, 1)], []))
+
+        assert aggregates[1].trade_count == 2
@@ -0,0 +1,154 @@
+"""Unit tests for the backtest engine and parameter sweeps."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.backtest.engine import BacktestConfig, precompute_rankings, simulate_backtest
+from src.backtest.sweep import BacktestSweepEngine, SweepConfig, simulate_group
+from src.exchange.types import Candle
+
+
+@pytest.fixture
+def candles() -> list[Candle]:
+    """400 hourly candles of a noisy random walk."""
+    np.random.seed(0)
+    close = 40000 + np.cumsum(np.random.randn(400) * 100)
+    t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        Candle(
+            open_time=t0 + timedelta(hours=i),
+            open=Decimal(str(c - 10)),
+            high=Decimal(str(c + 50)),
+            low=Decimal(str(c - 60)),
+            close=Decimal(str(c)),
+            volume=Decimal("100"),
+            close_time=t0 + timedelta(hours=i + 1),
+            quote_volume=Decimal("1000"),
+            trades=10,
+        )
+        for i, c in enumerate(close)
+    ]
+
+
+def _config(**kwargs) -> BacktestConfig:
+    t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    defaults = dict(
+        strategy="breakout", timeframe="1h", symbol="BTCUSDT",
+        start_date=t0, end_date=t0 + timedelta(days=10),
+    )
+    return BacktestConfig(**{**defaults, **kwargs})
+
+
+class TestSweepConfig:
+    """Tests for sweep grid expansion."""
+
+    def test_groups_share_symbol_and_timeframe(self):
+        t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        sweep = SweepConfig(
+            strategies=["breakout", "momentum"],
+            symbols=["BTCUSDT", "ETHUSDT"],
+            timeframes=["1h"],
+            start_date=t0,
+            end_date=t0 + timedelta(days=10),
+            sl_tp_grid=[(None, None), (0.02, 0.04)],
+        )
+
+        groups = sweep.groups()
+        assert sweep.total_combinations == 8
+        assert [(s, tf) for s, tf, _ in groups] == [("BTCUSDT", "1h"), ("ETHUSDT", "1h")]
+        assert all(len(configs) == 4 for _, _, configs in groups)
+        assert {(c.strategy, c.stop_loss_pct) for c in groups[0][2]} == {
+            ("breakout", None), ("breakout", 0.02), ("momentum", None), ("momentum", 0.02),
+        }
+
+
+class TestSimulateGroup:
+    """Tests for simulating many configs over shared precomputed rankings."""
+
+    def test_matches_individual_backtests(self, candles):
+        configs = [_config(), _config(stop_loss_pct=0.01, take_profit_pct=0.01)]
+        rankings = precompute_rankings("BTCUSDT", candles)
+
+        results = simulate_group(configs, candles, rankings)
+
+        for config, outcome in zip(configs, results):
+            expected = simulate_backtest(config, candles).get_stats()
+            assert outcome["stats"]["total_trades"] == expected["total_trades"]
+            assert outcome["stats"]["total_pnl"] == pytest.approx(expected["total_pnl"])
+
+    def test_unknown_strategy_reported_per_config(self, candles):
+        rankings = precompute_rankings("BTCUSDT", candles)
+        results = simulate_group([_config(strategy="nope"), _config()], candles, rankings)
+        assert "error" in results[0]
+        assert "stats" in results[1]
+
+    @pytest.mark.asyncio
+    async def test_in_process_group_yields_to_event_loop(self, candles):
+        engine = BacktestSweepEngine()
+        engine._fetch_candles = AsyncMock(return_value=candles)
+        configs = [_config(), _config(strategy="nope"), _config(stop_loss_pct=0.01)]
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        simulate = engine._simulate
+        spans = []
+
+        def spy(*args):
+            start = ticks
+            yield from simulate(*args)
+            spans.append(ticks - start)
+
+        engine._simulate = spy
+        task = asyncio.create_task(ticker())
+        results = await engine._run_group("BTCUSDT", "1h", configs)
+        task.cancel()
+
+        expected = simulate_group(configs, candles, precompute_rankings("BTCUSDT", candles))
+        assert len(spans) == 2
+        assert all(span > 1 for span in spans)  # the loop ran during each simulation
+        assert "error" in results[1]
+        for outcome, want in zip(results[::2], expected[::2]):
+            assert outcome["stats"]["total_trades"] == want["stats"]["total_trades"]
+            assert outcome["stats"]["total_pnl"] == pytest.approx(want["stats"]["total_pnl"])
+
+
+class TestSweepRequest:
+    """Tests for validation of POST /backtest/sweeps bodies."""
+
+    @pytest.fixture
+    def client(self):
+        from fastapi.testclient import TestClient
+
+        from src.main import app
+
+        return TestClient(app)
+
+    @pytest.mark.parametrize("grid", [
+        [[0.02, 0.04], [150, None]],
+        [[0, 0.04]],
+        [[-0.05, None]],
+        [[None, 0.75]],
+    ])
+    def test_out_of_range_grid_rejected(self, client, grid):
+        body = {
+            "strategies": ["breakout"], "symbols": ["BTCUSDT"], "timeframes": ["1h"],
+            "start_date": "2024-01-01", "end_date": "2024-02-01", "sl_tp_grid": grid,
+        }
+        assert client.post("/backtest/sweeps", json=body).status_code == 422
+
+    def test_non_positive_balance_rejected(self, client):
+        body = {
+            "strategies": ["breakout"], "symbols": ["BTCUSDT"], "timeframes": ["1h"],
+            "start_date": "2024-01-01", "end_date": "2024-02-01", "initial_balance": 0,
+        }
+        assert client.post("/backtest/sweeps", json=body).status_code == 422
@@ -0,0 +1,145 @@
+"""Tests for the two-tier cache and versioned namespaces (Redis tier disabled)."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.cache import TieredCache, bump_namespace, namespace_version
+
+
+class _Loader:
+    """Counts calls and returns an incrementing value."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return {"n": self.calls}
+
+
+@pytest.fixture(autouse=True)
+def _reset_namespaces():
+    with patch.dict("src.cache._namespace_versions", clear=True):
+        yield
+
+
+class TestNamespaces:
+    """Tests for versioned cache namespaces."""
+
+    @pytest.mark.asyncio
+    async def test_bump_advances_only_that_namespace(self):
+        assert await namespace_version("timeframe:1h") == 0
+        assert await bump_namespace("timeframe:1h") == 1
+        assert await namespace_version("timeframe:1h") == 1
+        assert await namespace_version("timeframe:4h") == 0
+
+
+class TestTieredCache:
+    """Tests for TieredCache."""
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_loader(self):
+        cache = TieredCache()
+        loader = _Loader()
+        assert await cache.get_or_load("k", loader, 60) == {"n": 1}
+        assert await cache.get_or_load("k", loader, 60) == {"n": 1}
+        assert loader.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        cache = TieredCache()
+        loader = _Loader(delay=0.01)
+        results = await asyncio.gather(*[cache.get_or_load("k", loader, 60) for _ in range(20)])
+        assert loader.calls == 1
+        assert all(r == {"n": 1} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self):
+        cache = TieredCache()
+        loader = _Loader(delay=0.01)
+        clock = MagicMock()
+        clock.monotonic.return_value = 1000.0
+        with patch("src.cache.time", clock):
+            await cache.get_or_load("k", loader, 10, stale_ttl=30)
+            clock.monotonic.return_value = 1015.0
+            # Expired but within stale window: old value, refresh in background
+            assert await cache.get_or_load("k", loader, 10, stale_ttl=30) == {"n": 1}
+            await asyncio.sleep(0.02)
+            assert await cache.get_or_load("k", loader, 10, stale_ttl=30) == {"n": 2}
+            clock.monotonic.return_value = 1100.0
+            # Past the stale window: caller waits for a fresh load
+            assert await cache.get_or_load("k", loader, 10, stale_ttl=30) == {"n": 3}
+
+    @pytest.mark.asyncio
+    async def test_empty_value_uses_negative_ttl(self):
+        cache = TieredCache()
+        calls = 0
+
+        async def loader() -> list:
+            nonlocal calls
+            calls += 1
+            return []
+
+        clock = MagicMock()
+        clock.monotonic.return_value = 1000.0
+        with patch("src.cache.time", clock):
+            await cache.get_or_load("k", loader, 60, negative_ttl=10)
+            clock.monotonic.return_value = 1005.0
+            await cache.get_or_load("k", loader, 60, negative_ttl=10)
+            assert calls == 1
+            clock.monotonic.return_value = 1011.0
+            await cache.get_or_load("k", loader, 60, negative_ttl=10)
+            assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_namespace(self):
+        cache = TieredCache()
+        loader = _Loader()
+        await cache.get_or_load("a", loader, 60, namespace="timeframe:1h")
+        await cache.get_or_load("b", loader, 60, namespace="timeframe:4h")
+
+        await cache.invalidate("timeframe:1h")
+
+        assert await cache.get_or_load("a", loader, 60, namespace="timeframe:1h") == {"n": 3}
+        assert await cache.get_or_load("b", loader, 60, namespace="timeframe:4h") == {"n": 2}
+        assert len(cache._entries) == 2
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_cached(self):
+        cache = TieredCache()
+        loader = _Loader(delay=0.01)
+        pending = asyncio.create_task(cache.get_or_load("k", loader, 60, namespace="ns"))
+        await asyncio.sleep(0)
+        await cache.invalidate("ns")
+
+        assert await pending == {"n": 1}
+        assert await cache.get_or_load("k", loader, 60, namespace="ns") == {"n": 2}
+        assert len(cache._entries) == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = TieredCache(max_entries=2)
+        loader = _Loader()
+        await cache.get_or_load("a", loader, 60)
+        await cache.get_or_load("b", loader, 60)
+        await cache.get_or_load("a", loader, 60)  # a is now most recent
+        await cache.get_or_load("c", loader, 60)  # evicts b
+
+        assert await cache.get_or_load("a", loader, 60) == {"n": 1}
+        assert await cache.get_or_load("b", loader, 60) == {"n": 4}
+
+    @pytest.mark.asyncio
+    async def test_values_are_json_normalized(self):
+        from decimal import Decimal
+
+        cache = TieredCache()
+
+        async def loader():
+            return {"pnl": Decimal("1.5")}
+
+        assert await cache.get_or_load("k", loader, 60) == {"pnl": "1.5"}
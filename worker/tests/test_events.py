@@ -0,0 +1,178 @@
+"""Tests for the SSE event bus and the delta-encoded ranking stream."""
+
+import json
+
+import pytest
+
+from src.events import QUEUE_SIZE, EventBus
+from src.ranking_stream import RankingStream, diff_rankings
+
+
+def _row(symbol: str, rank: int, score: float = 0.5, snap_id: int = 1) -> dict:
+    return {
+        "id": snap_id,
+        "symbol": symbol,
+        "rank": rank,
+        "bullishScore": score,
+        "confidence": 60,
+        "highlights": [],
+        "runId": "run-1",
+    }
+
+
+class TestEventBus:
+    """Tests for EventBus fan-out, replay and baselines."""
+
+    @pytest.mark.asyncio
+    async def test_publish_serializes_once(self, monkeypatch):
+        bus = EventBus()
+        sub1, _ = bus.subscribe("agents")
+        sub2, _ = bus.subscribe("agents")
+
+        dumps = []
+        real_dumps = json.dumps
+        monkeypatch.setattr(
+            "src.events.json.dumps", lambda obj: dumps.append(obj) or real_dumps(obj)
+        )
+        await bus.publish("agents", {"type": "agent_update"})
+
+        assert len(dumps) == 1
+        assert sub1.queue.get_nowait()[1] is sub2.queue.get_nowait()[1]
+
+    @pytest.mark.asyncio
+    async def test_event_ids_are_monotonic(self):
+        bus = EventBus()
+        sub, _ = bus.subscribe("trades")
+        for i in range(3):
+            await bus.publish("trades", {"n": i})
+        ids = [sub.queue.get_nowait()[0] for _ in range(3)]
+        assert [int(i.rsplit("-", 1)[1]) for i in ids] == [1, 2, 3]
+
+    def test_new_subscriber_receives_baselines(self):
+        bus = EventBus()
+        bus.set_baseline("rankings", "1h", {"type": "ranking_update", "timeframe": "1h"})
+        _, backlog = bus.subscribe("rankings")
+        assert json.loads(backlog[0][1])["timeframe"] == "1h"
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_missed_events(self):
+        bus = EventBus()
+        sub, _ = bus.subscribe("trades")
+        await bus.publish("trades", {"n": 0})
+        last_id, _ = sub.queue.get_nowait()
+        bus.unsubscribe(sub)
+
+        await bus.publish("trades", {"n": 1})
+        await bus.publish("trades", {"n": 2})
+
+        _, backlog = bus.subscribe("trades", last_id)
+        assert [json.loads(p)["n"] for _, p in backlog] == [1, 2]
+        assert bus.stats()["trades"]["replayed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_event_id_falls_back_to_baselines(self):
+        bus = EventBus()
+        bus.set_baseline("rankings", "1h", {"type": "ranking_update"})
+        await bus.publish("rankings", {"type": "ranking_delta"})
+
+        _, backlog = bus.subscribe("rankings", "deadbeef-1")
+        assert [json.loads(p)["type"] for _, p in backlog] == ["ranking_update"]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_catches_up_from_buffer(self):
+        bus = EventBus()
+        sub, _ = bus.subscribe("trades")
+        for i in range(QUEUE_SIZE + 3):
+            await bus.publish("trades", {"n": i})
+
+        assert sub.lagged
+        assert bus.stats()["trades"]["lagging"] == 1
+        received = [json.loads(sub.queue.get_nowait()[1])["n"] for _ in range(QUEUE_SIZE)]
+        received += [json.loads(p)["n"] for _, p in bus.catch_up(sub)]
+
+        assert received == list(range(QUEUE_SIZE + 3))
+        assert not sub.lagged
+        assert bus.stats()["trades"]["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_subscriber_beyond_buffer_is_resynced_to_baselines(self, monkeypatch):
+        monkeypatch.setattr("src.events.REPLAY_SIZE", 4)
+        bus = EventBus()
+        sub, _ = bus.subscribe("rankings")
+        for i in range(QUEUE_SIZE + 5):
+            await bus.publish("rankings", {"type": "ranking_delta", "n": i})
+        bus.set_baseline("rankings", "1h", {"type": "ranking_update", "version": 99})
+
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        backlog = bus.catch_up(sub)
+
+        assert [json.loads(p) for _, p in backlog] == [{"type": "ranking_update", "version": 99}]
+
+    @pytest.mark.asyncio
+    async def test_subscriber_beyond_buffer_without_baselines_counts_drops(self, monkeypatch):
+        monkeypatch.setattr("src.events.REPLAY_SIZE", 4)
+        bus = EventBus()
+        sub, _ = bus.subscribe("trades")
+        for i in range(QUEUE_SIZE + 6):
+            await bus.publish("trades", {"n": i})
+
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        backlog = bus.catch_up(sub)
+
+        assert [json.loads(p)["n"] for _, p in backlog] == [12, 13, 14, 15]
+        assert bus.stats()["trades"]["dropped"] == 2
+
+
+class TestRankingStream:
+    """Tests for RankingStream versioned diffs."""
+
+    def test_diff_rankings(self):
+        previous = {"BTC": _row("BTC", 1), "ETH": _row("ETH", 2), "SOL": _row("SOL", 3)}
+        current = {"BTC": _row("BTC", 2), "ETH": _row("ETH", 1, score=0.7), "XRP": _row("XRP", 3)}
+
+        delta = diff_rankings(previous, current)
+
+        assert delta["changed"] == {"BTC": {"rank": 2}, "ETH": {"rank": 1, "bullishScore": 0.7}}
+        assert [r["symbol"] for r in delta["added"]] == ["XRP"]
+        assert delta["removed"] == ["SOL"]
+
+    @pytest.mark.asyncio
+    async def test_first_publish_is_full_then_deltas(self):
+        bus = EventBus()
+        stream = RankingStream(bus)
+        sub, _ = bus.subscribe("rankings")
+
+        await stream.publish("1h", [_row("BTC", 1), _row("ETH", 2)], "t1")
+        full = json.loads(sub.queue.get_nowait()[1])
+        assert full["type"] == "ranking_update"
+        assert full["version"] == 1
+        assert len(full["rankings"]) == 2
+
+        await stream.publish(
+            "1h", [_row("ETH", 1, snap_id=9), _row("BTC", 2, snap_id=8)], "t2"
+        )
+        delta = json.loads(sub.queue.get_nowait()[1])
+        assert delta["type"] == "ranking_delta"
+        assert (delta["baseVersion"], delta["version"]) == (1, 2)
+        assert delta["changed"] == {"ETH": {"rank": 1}, "BTC": {"rank": 2}}
+        assert "rankings" not in delta
+
+    @pytest.mark.asyncio
+    async def test_baseline_tracks_latest_version(self):
+        bus = EventBus()
+        stream = RankingStream(bus)
+        await stream.publish("1h", [_row("BTC", 1)], "t1")
+        await stream.publish("1h", [_row("BTC", 1, score=0.9, snap_id=5)], "t2")
+        await stream.publish("4h", [_row("ETH", 1)], "t2")
+
+        _, backlog = bus.subscribe("rankings")
+        baselines = [json.loads(payload) for _, payload in backlog]
+
+        by_tf = {b["timeframe"]: b for b in baselines}
+        assert by_tf["1h"]["version"] == 2
+        assert by_tf["1h"]["rankings"][0]["bullishScore"] == 0.9
+        # Existing rows keep the id clients already hold
+        assert by_tf["1h"]["rankings"][0]["id"] == 1
+        assert by_tf["4h"]["version"] == 1
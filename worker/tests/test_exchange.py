@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from src.exchange import BinanceClient, BinanceAPIError, Symbol, Candle, candles_to_dataframe
+from src.exchange.candle_store import CandleStore
 
 
 # Sample exchange info response
@@ -269,6 +270,87 @@ class TestBinanceClient:
             assert "FAILUSDT" not in results
 
 
+def _kline_row(open_ms: int, close: str, interval_ms: int = 3_600_000) -> list:
+    """Build a raw Binance kline row."""
+    return [
+        open_ms, close, close, close, close, "10",
+        open_ms + interval_ms - 1, "100", 5, "0", "0", "0",
+    ]
+
+
+class TestCandleStore:
+    """Tests for the in-process candle store."""
+
+    def test_merge_overwrites_open_candle(self):
+        """Merging should replace candles from the first new open_time onward."""
+        store = CandleStore()
+        store.replace("BTCUSDT", "1h", [_kline_row(0, "1"), _kline_row(3_600_000, "2")])
+
+        store.merge(
+            "BTCUSDT", "1h", [_kline_row(3_600_000, "2.5"), _kline_row(7_200_000, "3")]
+        )
+
+        arr = store.get("BTCUSDT", "1h")
+        assert arr["open_time"].tolist() == [0, 3_600_000, 7_200_000]
+        assert arr["close"].tolist() == [1.0, 2.5, 3.0]
+        assert store.last_open_time("BTCUSDT", "1h") == 7_200_000
+
+    def test_trims_to_max_candles(self):
+        """Only the newest max_candles are retained."""
+        store = CandleStore(max_candles=2)
+        store.replace("BTCUSDT", "1h", [_kline_row(i * 3_600_000, str(i)) for i in range(5)])
+
+        assert store.get("BTCUSDT", "1h")["close"].tolist() == [3.0, 4.0]
+
+
+class TestDeltaFetch:
+    """Tests for delta kline fetching backed by the candle store."""
+
+    @pytest.mark.asyncio
+    async def test_second_fetch_requests_only_new_candles(self):
+        """A warm store should request from the newest stored open_time."""
+        client = BinanceClient(base_url="https://api.binance.com")
+        hour = 3_600_000
+        now_ms = 100 * hour + 60_000
+        window = [_kline_row((95 + i) * hour, str(i)) for i in range(5)]
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request, \
+                patch("src.exchange.client.time.time", return_value=now_ms / 1000):
+            mock_request.return_value = window
+            await client.get_klines("BTCUSDT", "1h", limit=5)
+
+            mock_request.return_value = [
+                _kline_row(99 * hour, "4.5"),
+                _kline_row(100 * hour, "5"),
+            ]
+            candles = await client.get_klines("BTCUSDT", "1h", limit=5)
+
+        params = mock_request.call_args.args[2]
+        assert params["startTime"] == 99 * hour
+        assert params["limit"] == 3
+        assert len(candles) == 5
+        assert candles[-2].close == Decimal("4.5")
+        assert candles[-1].close == Decimal("5")
+        assert candles[0].open_time == datetime.fromtimestamp(96 * 3600, tz=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_stale_store_refetches_full_window(self):
+        """A store too far behind should fall back to a full fetch."""
+        client = BinanceClient(base_url="https://api.binance.com")
+        hour = 3_600_000
+        window = [_kline_row(i * hour, str(i)) for i in range(3)]
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request, \
+                patch("src.exchange.client.time.time", return_value=1000 * hour / 1000):
+            mock_request.return_value = window
+            await client.get_klines("BTCUSDT", "1h", limit=3)
+            await client.get_klines("BTCUSDT", "1h", limit=3)
+
+        assert mock_request.call_args.args[2] == {
+            "symbol": "BTCUSDT", "interval": "1h", "limit": 3,
+        }
+
+
 class TestRetryLogic:
     """Tests for retry and rate limiting logic."""
 
@@ -302,14 +384,83 @@ class TestRetryLogic:
                 return MockResponse(500, {"msg": "Server error"})
             return MockResponse(200, {"symbols": []})
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.exchange.client.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
             mock_client.request = mock_request
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await client._request("GET", "/test")
 
             assert call_count == 3  # 2 failures + 1 success
             assert result == {"symbols": []}
+
+
+class TestHttpPool:
+    """Tests for the shared per-host HTTP client pool."""
+
+    @pytest.mark.asyncio
+    async def test_clients_shared_per_host(self):
+        """Requests to one host reuse a client; other hosts get their own."""
+        from src.http_pool import close_http_clients, get_http_client
+
+        a = get_http_client("https://api.binance.com/api/v3/klines")
+        b = get_http_client("https://API.binance.com/api/v3/ticker/price")
+        c = get_http_client("https://fapi.binance.com/fapi/v1/premiumIndex")
+
+        assert a is b
+        assert a is not c
+
+        await close_http_clients()
+        assert a.is_closed and c.is_closed
+        assert get_http_client("https://api.binance.com") is not a
+        await close_http_clients()
+
+
+class TestWeightRateLimiter:
+    """Tests for the Binance weight-aware token bucket."""
+
+    def test_request_weight(self):
+        from src.exchange.rate_limiter import request_weight
+
+        assert request_weight("/api/v3/klines", {"limit": 50}) == 2
+        assert request_weight("/api/v3/klines", {"limit": 1000}) == 2
+        assert request_weight("/api/v3/exchangeInfo") == 20
+        assert request_weight("/api/v3/unknown") == 1
+
+    @pytest.mark.asyncio
+    async def test_slot_spends_weight(self):
+        from src.exchange.rate_limiter import WeightRateLimiter
+
+        limiter = WeightRateLimiter(weight_limit=1000, safety_ratio=1.0)
+        async with limiter.slot(20):
+            pass
+        assert limiter.tokens == pytest.approx(980, abs=1)
+
+    def test_used_weight_header_throttles(self):
+        from src.exchange.rate_limiter import WeightRateLimiter
+
+        limiter = WeightRateLimiter(
+            weight_limit=1000, max_concurrency=20, min_concurrency=2,
+            safety_ratio=0.9, throttle_ratio=0.5,
+        )
+        limiter.observe({"x-mbx-used-weight-1m": "100"})
+        assert limiter.concurrency == 20
+
+        limiter.observe({"x-mbx-used-weight-1m": "700"})
+        assert limiter.concurrency == 11
+        assert limiter.tokens <= 900 - 700 + 1
+
+        limiter.observe({"x-mbx-used-weight-1m": "950"})
+        assert limiter.concurrency == 2
+        assert limiter.tokens < 1
+
+    @pytest.mark.asyncio
+    async def test_pause_blocks_callers(self):
+        from src.exchange.rate_limiter import WeightRateLimiter
+
+        limiter = WeightRateLimiter(weight_limit=60_000)
+        limiter.pause(0.05)
+        start = asyncio.get_running_loop().time()
+        async with limiter.slot(1):
+            pass
+        assert asyncio.get_running_loop().time() - start >= 0.04
@@ -14,6 +14,7 @@ from src.indicators import (
     compute_stochastic,
     create_default_registry,
     generate_highlights,
+    group_frames,
     normalize_adx,
     normalize_bollinger,
     normalize_ema,
@@ -487,6 +488,160 @@ class TestIndicatorRegistry:
         assert abs(total - 1.0) < 0.01  # Allow small rounding error
 
 
+# =============================================================================
+# Batch Compute Tests
+# =============================================================================
+
+
+def _assert_raw_matches(expected: dict, actual: dict) -> None:
+    """Raw indicator values should match, treating NaN == NaN."""
+    assert expected.keys() == actual.keys()
+    for key, value in expected.items():
+        if np.isnan(value):
+            assert np.isnan(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-8, abs=1e-8), key
+
+
+class TestComputeAllBatch:
+    """Tests for the vectorized cross-symbol compute path."""
+
+    def test_matches_per_symbol_compute(
+        self, sample_ohlcv_df, oversold_df, overbought_df, short_df
+    ):
+        """Batch output should equal compute_all for every symbol and length."""
+        registry = create_default_registry()
+        frames = {
+            "SAMPLE": sample_ohlcv_df,
+            "SAMPLE_TAIL": sample_ohlcv_df.iloc[-200:].reset_index(drop=True),
+            "OVERSOLD": oversold_df,
+            "OVERBOUGHT": overbought_df,
+            "SHORT": short_df,
+        }
+
+        results = registry.compute_all_batch(frames)
+
+        assert results.keys() == frames.keys()
+        for symbol, df in frames.items():
+            expected = registry.compute_all(df)
+            for name, output in expected.items():
+                _assert_raw_matches(output["raw"], results[symbol][name]["raw"])
+                assert results[symbol][name]["signal"]["label"] == output["signal"]["label"]
+
+    def test_flat_prices_match(self):
+        """Zero-range candles exercise the epsilon guards and 0/0 paths."""
+        registry = create_default_registry()
+        flat = pd.DataFrame({
+            "open": [10.0] * 80,
+            "high": [10.0] * 80,
+            "low": [10.0] * 80,
+            "close": [10.0] * 80,
+            "volume": [100.0] * 80,
+        })
+
+        results = registry.compute_all_batch({"FLAT": flat})
+        expected = registry.compute_all(flat)
+
+        for name, output in expected.items():
+            _assert_raw_matches(output["raw"], results["FLAT"][name]["raw"])
+
+    def test_non_finite_frame_falls_back(self, sample_ohlcv_df):
+        """Frames with NaNs should still be computed via the per-symbol path."""
+        registry = create_default_registry()
+        gappy = sample_ohlcv_df.copy()
+        gappy.loc[10, "volume"] = np.nan
+
+        batches, leftovers = group_frames({"OK": sample_ohlcv_df, "GAPPY": gappy})
+        results = registry.compute_all_batch({"OK": sample_ohlcv_df, "GAPPY": gappy})
+
+        assert [b.symbols for b in batches] == [["OK"]]
+        assert list(leftovers) == ["GAPPY"]
+        assert set(results) == {"OK", "GAPPY"}
+
+
+class TestComputeHistory:
+    """Tests for full-history per-bar indicator outputs (backtests)."""
+
+    def test_each_bar_matches_prefix_compute(self, sample_ohlcv_df):
+        """Bar i should equal compute_all over the first i + 1 candles."""
+        registry = create_default_registry()
+        history = registry.compute_history(sample_ohlcv_df, start=40)
+
+        assert len(history) == len(sample_ohlcv_df) - 40
+        for i in (40, 75, len(sample_ohlcv_df) - 1):
+            expected = registry.compute_all(sample_ohlcv_df.iloc[: i + 1])
+            for name, output in expected.items():
+                _assert_raw_matches(output["raw"], history[i - 40][name]["raw"])
+                assert history[i - 40][name]["signal"]["label"] == output["signal"]["label"]
+
+
+class TestComputeIncremental:
+    """Tests for streaming indicator state."""
+
+    @staticmethod
+    def _with_open_time(df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        df["open_time"] = pd.date_range("2024-01-01", periods=len(df), freq="15min")
+        return df
+
+    def test_streaming_matches_full_compute(self, sample_ohlcv_df):
+        """Folding candles one by one should equal recomputing the window."""
+        registry = create_default_registry()
+        full = self._with_open_time(sample_ohlcv_df)
+
+        state = None
+        for end in range(200, 215):
+            window = full.iloc[:end].reset_index(drop=True)
+            state, results = registry.compute_incremental(state, window)
+            expected = registry.compute_all(window)
+            for name, output in expected.items():
+                _assert_raw_matches(output["raw"], results[name]["raw"])
+
+    def test_open_candle_is_not_committed(self, sample_ohlcv_df):
+        """Re-peeking a revised open candle must not advance the state."""
+        registry = create_default_registry()
+        window = self._with_open_time(sample_ohlcv_df.iloc[:200])
+
+        state, _ = registry.compute_incremental(None, window)
+        last_open_time = state.last_open_time
+        revised = window.copy()
+        revised.loc[revised.index[-1], "close"] *= 1.05
+        state, results = registry.compute_incremental(state, revised)
+
+        assert state.last_open_time == last_open_time
+        assert state.bars_since_checkpoint == 0
+        expected = registry.compute_all(revised)
+        _assert_raw_matches(expected["rsi_14"]["raw"], results["rsi_14"]["raw"])
+
+    def test_rebuilds_after_checkpoint(self, sample_ohlcv_df):
+        """State should be rebuilt from the window once the checkpoint is hit."""
+        registry = create_default_registry()
+        full = self._with_open_time(sample_ohlcv_df)
+
+        state, _ = registry.compute_incremental(None, full.iloc[:200], checkpoint_bars=2)
+        state, _ = registry.compute_incremental(
+            state, full.iloc[2:202].reset_index(drop=True), checkpoint_bars=2
+        )
+        assert state.bars_since_checkpoint == 2
+
+        window = full.iloc[3:203].reset_index(drop=True)
+        rebuilt, results = registry.compute_incremental(state, window, checkpoint_bars=2)
+
+        assert rebuilt is not state
+        assert rebuilt.bars_since_checkpoint == 0
+        expected = registry.compute_all(window)
+        for name, output in expected.items():
+            _assert_raw_matches(output["raw"], results[name]["raw"])
+
+    def test_without_open_time_falls_back(self, sample_ohlcv_df):
+        """Frames without open_time can't be aligned and return no state."""
+        registry = create_default_registry()
+        state, results = registry.compute_incremental(None, sample_ohlcv_df)
+
+        assert state is None
+        assert set(results) == set(registry.list_names())
+
+
 # =============================================================================
 # Highlight Tests
 # =============================================================================
@@ -0,0 +1,555 @@
+"""Tests for the memecoin wallet-activity pipeline."""
+
+import asyncio
+import importlib
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import ProgrammingError
+
+from src.memecoins.helius_client import HeliusAPIError, HeliusClient
+from src.memecoins.token_analyzer import TokenAnalyzer
+from src.memecoins.wallet_discovery import UPSERT_UPDATE_COLUMNS, WalletDiscoveryPipeline
+from src.memecoins.watched_wallets import WatchedWallet, WatchedWallets
+from src.memecoins.webhook_ingest import WebhookIngestor
+
+MEMECOIN_MODULES = [
+    "src.memecoins.cross_reference",
+    "src.memecoins.dexscreener_client",
+    "src.memecoins.helius_client",
+    "src.memecoins.token_analyzer",
+    "src.memecoins.token_extractor",
+    "src.memecoins.token_resolver",
+    "src.memecoins.token_tracker",
+    "src.memecoins.tweet_analyzer",
+    "src.memecoins.twitter_poller",
+    "src.memecoins.wallet_discovery",
+    "src.memecoins.wallet_monitor",
+    "src.memecoins.watched_wallets",
+    "src.memecoins.webhook_ingest",
+]
+
+
+class TestImports:
+    """Import smoke tests for modules the API loads lazily."""
+
+    @pytest.mark.parametrize("module", MEMECOIN_MODULES)
+    def test_memecoin_module_imports(self, module):
+        importlib.import_module(module)
+
+    def test_main_imports(self):
+        pytest.importorskip("pandas_ta")
+        main = importlib.import_module("src.main")
+        assert main.app is not None
+
+
+def _ingestor(queue_size: int = 100, fail: bool = False) -> tuple[WebhookIngestor, list]:
+    """Ingestor whose batches are recorded instead of sent to WalletMonitor."""
+    ingestor = WebhookIngestor(queue_size=queue_size)
+    batches: list[list[dict]] = []
+
+    async def process(batch: list[dict]) -> None:
+        batches.append(batch)
+        if fail:
+            raise RuntimeError("boom")
+        ingestor.processed += len(batch)
+
+    ingestor._process = process
+    return ingestor, batches
+
+
+def _session(watched: list[tuple], analyzed: list[str], on_load=None) -> MagicMock:
+    """Session returning ``watched`` rows, then ``analyzed`` addresses, per load."""
+    session = MagicMock()
+
+    async def execute(stmt, *args):
+        result = MagicMock()
+        if "analyzed_wallets" in str(stmt):
+            result.scalars.return_value.all.return_value = analyzed
+        else:
+            if on_load:
+                on_load()
+            result.all.return_value = watched
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    return session
+
+
+class TestWebhookIngestor:
+    """Tests for the micro-batching Helius webhook buffer."""
+
+    @pytest.mark.asyncio
+    async def test_batches_fill_to_batch_size(self, monkeypatch):
+        monkeypatch.setattr("src.memecoins.webhook_ingest.BATCH_SIZE", 3)
+        monkeypatch.setattr("src.memecoins.webhook_ingest.BATCH_WINDOW_SECONDS", 0.05)
+        ingestor, batches = _ingestor()
+
+        assert ingestor.enqueue([{"n": i} for i in range(7)]) == 7
+        await ingestor.stop()
+
+        assert [len(b) for b in batches] == [3, 3, 1]
+        assert [e["n"] for b in batches for e in b] == list(range(7))
+        assert ingestor.stats()["processed"] == 7
+
+    @pytest.mark.asyncio
+    async def test_window_cuts_off_partial_batch(self, monkeypatch):
+        monkeypatch.setattr("src.memecoins.webhook_ingest.BATCH_WINDOW_SECONDS", 0.05)
+        ingestor, batches = _ingestor()
+
+        ingestor.enqueue([{"n": 0}, {"n": 1}])
+        await asyncio.sleep(0.15)
+        ingestor.enqueue([{"n": 2}])
+        await ingestor.stop()
+
+        assert [[e["n"] for e in b] for b in batches] == [[0, 1], [2]]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self):
+        ingestor, batches = _ingestor(queue_size=2)
+
+        assert ingestor.enqueue([{"n": i} for i in range(5)]) == 2
+        stats = ingestor.stats()
+        assert stats["received"] == 2
+        assert stats["dropped"] == 3
+        assert stats["queued"] == 2
+
+        await ingestor.stop()
+        assert [e["n"] for b in batches for e in b] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_still_marks_events_done(self, monkeypatch):
+        monkeypatch.setattr("src.memecoins.webhook_ingest.BATCH_WINDOW_SECONDS", 0.01)
+        ingestor, _ = _ingestor(fail=True)
+
+        ingestor.enqueue([{"n": i} for i in range(3)])
+        await asyncio.wait_for(ingestor._queue.join(), timeout=1.0)
+
+        assert ingestor.stats()["errors"] == 3
+        assert not ingestor._task.done()  # the consumer survives the failure
+        await ingestor.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_queue(self, monkeypatch):
+        monkeypatch.setattr("src.memecoins.webhook_ingest.BATCH_SIZE", 2)
+        monkeypatch.setattr("src.memecoins.webhook_ingest.BATCH_WINDOW_SECONDS", 0.01)
+        ingestor, batches = _ingestor()
+
+        ingestor.enqueue([{"n": i} for i in range(5)])
+        task = ingestor._task
+        await ingestor.stop()
+        await asyncio.sleep(0)
+
+        assert sum(len(b) for b in batches) == 5
+        assert ingestor.stats()["queued"] == 0
+        assert ingestor._task is None
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_stop_without_consumer_is_noop(self):
+        ingestor, _ = _ingestor()
+        await ingestor.stop()
+        assert ingestor._task is None
+
+
+class TestWatchedWallets:
+    """Tests for the in-memory watched/analyzed wallet index."""
+
+    @pytest.mark.asyncio
+    async def test_load_indexes_watched_and_analyzed(self):
+        index = WatchedWallets()
+        assert not index.rejects("ANY")  # nothing is rejected before the first load
+
+        session = _session([(1, "A", "whale", Decimal("7.5"))], ["B"])
+        wallets = await index.get_all(session)
+
+        assert wallets["A"].score == 7.5
+        assert index.rejects("B") and not index.rejects("A")
+        assert index.is_analyzed("B")
+
+        await index.get_all(session)
+        assert session.execute.await_count == 2  # served from memory the second time
+
+    @pytest.mark.asyncio
+    async def test_change_during_load_forces_reload(self):
+        index = WatchedWallets()
+        session = _session([(1, "A", None, Decimal("1"))], [], on_load=index.invalidate)
+
+        await index.get_all(session)
+        assert not index._loaded  # the snapshot may predate the invalidate
+
+        session.execute.side_effect = _session([(1, "A", None, Decimal("1"))], []).execute
+        await index.get_all(session)
+        assert index._loaded
+        assert session.execute.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_incremental_updates(self):
+        index = WatchedWallets()
+        await index.get_all(_session([], []))
+
+        index.add(WatchedWallet(2, "C", None, 3.0))
+        assert not index.rejects("C")
+        index.remove("C")
+        assert index.rejects("C")
+        index.add_analyzed(["D"])
+        assert index.is_analyzed("D")
+
+    @pytest.mark.asyncio
+    async def test_missing_analyzed_table_loads_empty_set(self):
+        index = WatchedWallets()
+        session = _session([(1, "A", None, Decimal("1"))], [])
+        inner = session.execute.side_effect
+
+        async def execute(stmt, *args):
+            if "analyzed_wallets" in str(stmt):
+                raise ProgrammingError(str(stmt), {}, Exception("relation does not exist"))
+            return await inner(stmt, *args)
+
+        session.execute.side_effect = execute
+        wallets = await index.get_all(session)
+
+        assert set(wallets) == {"A"}
+        assert not index.is_analyzed("A")
+
+
+class TestHeliusWebhook:
+    """Tests for the webhook endpoint, which only filters and queues."""
+
+    @pytest.mark.asyncio
+    async def test_queues_watched_events_and_rejects_the_rest(self, monkeypatch):
+        pytest.importorskip("pandas_ta")
+        import src.main as main
+
+        index = WatchedWallets()
+        await index.get_all(_session([(1, "A", None, Decimal("1"))], []))
+        ingestor = MagicMock()
+        ingestor.enqueue.side_effect = lambda events: len(events)
+        monkeypatch.setattr(main, "watched_wallets", index)
+        monkeypatch.setattr(main, "webhook_ingestor", ingestor)
+
+        result = await main.helius_webhook([{"feePayer": "A"}, {"feePayer": "Z"}])
+
+        assert result == {"queued": 1, "rejected": 1, "total": 2}
+        ingestor.enqueue.assert_called_once_with([{"feePayer": "A"}])
+        assert await main.helius_webhook([]) == {"queued": 0}
+
+
+DISCOVERY_TOKENS = [
+    {"mint_address": "M1", "symbol": "AAA", "peak_mcap_usd": 1_000_000},
+    {"mint_address": "M2", "symbol": "BBB", "peak_mcap_usd": 2_000_000},
+    {"mint_address": "M3", "symbol": "CCC", "peak_mcap_usd": None},
+    {"mint_address": "M4", "symbol": "DDD", "peak_mcap_usd": 4_000_000},
+]
+
+EARLY_BUYERS = {
+    "M1": [{"wallet": "W1", "entry_rank": 1}, {"wallet": "W2", "entry_rank": 2}],
+    "M3": [
+        {"wallet": "W2", "entry_rank": 1},
+        {"wallet": "W3", "entry_rank": 2},
+        {"wallet": "W1", "entry_rank": 3},
+    ],
+    "M4": [{"wallet": "W1", "entry_rank": 5}],
+}
+
+
+def _inserted_rows(stmt) -> list[dict]:
+    """Rows of a multi-VALUES INSERT, from its compiled bind parameters."""
+    rows: dict[int, dict] = defaultdict(dict)
+    for key, value in stmt.compile(dialect=postgresql.dialect()).params.items():
+        column, _, index = key.rpartition("_m")
+        rows[int(index)][column] = value
+    return [rows[i] for i in sorted(rows)]
+
+
+def _discovery(monkeypatch, inactive: set[str] = frozenset()):
+    """Pipeline over DISCOVERY_TOKENS where M2's early-buyer lookup raises.
+
+    Returns the pipeline, the executed upserts and the mocked wallet index.
+    """
+    session = MagicMock()
+    session.commit = AsyncMock()
+    upserts = []
+
+    async def execute(stmt, *args):
+        upserts.append(stmt)
+        result = MagicMock()
+        result.all.return_value = [
+            (i, row["address"], None, row["score"], row["address"] not in inactive)
+            for i, row in enumerate(_inserted_rows(stmt), start=len(upserts) * 100)
+        ]
+        return result
+
+    async def early_buyers(mint):
+        if mint == "M2":
+            raise RuntimeError("helius down")
+        return EARLY_BUYERS[mint]
+
+    session.execute = AsyncMock(side_effect=execute)
+    pipeline = WalletDiscoveryPipeline(session, helius=MagicMock(), dex=MagicMock())
+    pipeline._fetch_successful_tokens = AsyncMock(return_value=DISCOVERY_TOKENS)
+    pipeline._get_early_buyers = AsyncMock(side_effect=early_buyers)
+    index = MagicMock()
+    monkeypatch.setattr("src.memecoins.wallet_discovery.watched_wallets", index)
+    return pipeline, upserts, index
+
+
+class TestWalletDiscovery:
+    """Tests for cross-referencing early buyers and upserting smart wallets."""
+
+    @pytest.mark.asyncio
+    async def test_run_upserts_wallets_with_enough_hits(self, monkeypatch):
+        pipeline, upserts, index = _discovery(monkeypatch, inactive={"W2"})
+
+        summary = await pipeline.run()
+
+        assert summary == {
+            "tokens_found": 4, "wallets_scanned": 3,
+            "wallets_discovered": 2, "status": "completed",
+        }
+        [stmt] = upserts
+        rows = _inserted_rows(stmt)
+        assert [row["address"] for row in rows] == ["W1", "W2"]  # W3 has one hit
+
+        w1 = rows[0]
+        assert [e["mint"] for e in w1["tokens_summary"]] == ["M1", "M3", "M4"]
+        assert w1["tokens_summary"][1] == {
+            "symbol": "CCC", "mint": "M3", "entry_rank": 3, "peak_mcap": None,
+        }
+        assert w1["hit_count"] == w1["total_tokens_traded"] == 3
+        assert w1["avg_entry_rank"] == 3
+        assert w1["score"] == Decimal(str(round(
+            WalletDiscoveryPipeline._compute_score(w1["tokens_summary"]), 2
+        )))
+        assert w1["source"] == "on_chain" and w1["is_active"] is True
+
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (address) DO UPDATE SET" in sql
+        set_clause = sql.split("DO UPDATE SET")[1].split("RETURNING")[0]
+        assert [part.split(" = ")[0].strip() for part in set_clause.split(",")] == list(
+            UPSERT_UPDATE_COLUMNS
+        )
+        assert all(f"{col} = excluded.{col}" in set_clause for col in UPSERT_UPDATE_COLUMNS)
+
+        pipeline.session.commit.assert_awaited_once()
+        [call] = index.add.call_args_list  # W2 was deactivated by hand
+        assert call.args[0] == WatchedWallet(100, "W1", None, float(w1["score"]))
+
+    @pytest.mark.asyncio
+    async def test_upserts_are_chunked(self, monkeypatch):
+        monkeypatch.setattr("src.memecoins.wallet_discovery.UPSERT_CHUNK_SIZE", 1)
+        pipeline, upserts, index = _discovery(monkeypatch)
+
+        await pipeline.run()
+
+        assert [[row["address"] for row in _inserted_rows(s)] for s in upserts] == [
+            ["W1"], ["W2"],
+        ]
+        assert [c.args[0].address for c in index.add.call_args_list] == ["W1", "W2"]
+
+    @pytest.mark.asyncio
+    async def test_no_tokens_skips_upsert(self, monkeypatch):
+        pipeline, upserts, _ = _discovery(monkeypatch)
+        pipeline._fetch_successful_tokens.return_value = []
+
+        assert (await pipeline.run())["status"] == "no_tokens"
+        assert upserts == []
+
+
+class _Limiter:
+    """Records slots taken and pauses requested instead of pacing."""
+
+    def __init__(self):
+        self.slots = 0
+        self.pauses: list[float] = []
+
+    @asynccontextmanager
+    async def slot(self, weight: int = 1):
+        self.slots += 1
+        yield
+
+    def pause(self, seconds: float) -> None:
+        self.pauses.append(seconds)
+
+
+def _response(status_code: int, body=None) -> MagicMock:
+    response = MagicMock(status_code=status_code, text="")
+    response.json.return_value = body
+    return response
+
+
+def _helius(monkeypatch, method: str, responses: list) -> tuple[HeliusClient, _Limiter, MagicMock]:
+    """Client whose HTTP ``method`` returns ``responses`` in order, without sleeping."""
+    http = MagicMock()
+    setattr(http, method, AsyncMock(side_effect=responses))
+    monkeypatch.setattr("src.memecoins.helius_client.get_http_client", lambda url: http)
+    monkeypatch.setattr("src.memecoins.helius_client.asyncio.sleep", AsyncMock())
+    monkeypatch.setattr("src.memecoins.helius_client.cache_get", AsyncMock(return_value=None))
+    monkeypatch.setattr("src.memecoins.helius_client.cache_set", AsyncMock())
+    limiter = _Limiter()
+    return HeliusClient(api_key="test", rate_limiter=limiter), limiter, http
+
+
+def _holders_page(count: int, cursor: str | None) -> MagicMock:
+    return _response(200, {"result": {"token_accounts": [{}] * count, "cursor": cursor}})
+
+
+class TestHeliusClient:
+    """Tests for Helius requests sharing one rate budget."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_pauses_shared_limiter_and_retries(self, monkeypatch):
+        client, limiter, _ = _helius(monkeypatch, "get", [
+            _response(429), _response(429), _response(200, [{"signature": "s"}]),
+        ])
+
+        assert await client.get_wallet_transactions("MINT") == [{"signature": "s"}]
+        assert limiter.pauses == [1.0, 2.0]
+        assert limiter.slots == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_gives_up_after_max_retries(self, monkeypatch):
+        client, limiter, _ = _helius(monkeypatch, "get", [_response(429)] * 4)
+
+        with pytest.raises(HeliusAPIError) as exc:
+            await client.get_wallet_transactions("MINT")
+        assert exc.value.status_code == 429
+        assert len(limiter.pauses) == HeliusClient.MAX_RETRIES
+
+    @pytest.mark.asyncio
+    async def test_holder_count_takes_a_slot_per_page(self, monkeypatch):
+        client, limiter, http = _helius(monkeypatch, "post", [
+            _holders_page(1000, "c1"),
+            _response(429),
+            _holders_page(1000, "c2"),
+            _holders_page(250, None),
+        ])
+
+        assert await client.count_token_holders("MINT") == 2250
+        assert limiter.slots == 4
+        assert limiter.pauses == [1.0]
+        cursors = [c.kwargs["json"]["params"].get("cursor") for c in http.post.await_args_list]
+        assert cursors == [None, "c1", "c1", "c2"]
+
+    @pytest.mark.asyncio
+    async def test_holder_count_fails_soft_when_rate_limited_throughout(self, monkeypatch):
+        client, limiter, _ = _helius(monkeypatch, "post", [_response(429)] * 4)
+
+        assert await client.count_token_holders("MINT") is None
+        assert limiter.slots == 4
+
+
+def _tx(payer: str, signature: str, tx_type: str = "SWAP", lamports: int = 0) -> dict:
+    return {
+        "feePayer": payer,
+        "signature": signature,
+        "type": tx_type,
+        "timestamp": 1_700_000_000,
+        "nativeTransfers": [{"fromUserAccount": payer, "amount": lamports}],
+    }
+
+
+class TestTokenAnalyzer:
+    """Tests for early-buyer collection and batched wallet persistence."""
+
+    def test_collect_buyers_ranks_first_time_swappers(self):
+        seen = {"OLD"}
+        buyers: list[dict] = []
+        txs = [
+            _tx("OLD", "s0"),
+            _tx("A", "s1", lamports=1_500_000_000),
+            _tx("A", "s2"),
+            _tx("So11111111111111111111111111111111111111112", "s3"),
+            _tx("B", "s4", tx_type="NFT_SALE"),
+            _tx("C", "s5", tx_type="TRANSFER"),
+            _tx("D", "s6"),
+        ]
+
+        added = TokenAnalyzer._collect_buyers(txs, buyers, seen, target=3)
+
+        assert added == 2
+        assert seen == {"OLD", "A", "C"}  # stopped at the target
+        assert [(b["wallet"], b["entry_rank"], b["tx_signature"]) for b in buyers] == [
+            ("A", 2, "s1"), ("C", 3, "s5"),
+        ]
+        assert buyers[0]["amount_sol"] == Decimal("1.5")
+        assert buyers[0]["block_time"] == datetime.fromtimestamp(1_700_000_000, tz=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_persist_wallets_upserts_wallets_then_entries(self, monkeypatch):
+        index = MagicMock()
+        monkeypatch.setattr("src.memecoins.token_analyzer.watched_wallets", index)
+        statements = []
+
+        async def execute(stmt, *args):
+            statements.append(stmt)
+            result = MagicMock()
+            result.all.return_value = [("A", 11), ("C", 12)]
+            return result
+
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=execute)
+        token_fields = {
+            "analysis_id": 7, "mint_address": "MINT", "token_symbol": "TOK",
+            "token_mcap_at_entry": Decimal("1000"), "token_peak_mcap": Decimal("1000"),
+        }
+        block_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        batch = [
+            ({"wallet": w, "entry_rank": r, "tx_signature": f"s{r}", "block_time": block_time,
+              "amount_sol": Decimal("1")}, {"sol_balance": Decimal("2"), "tags": ["whale"]})
+            for w, r in (("A", 1), ("C", 3))
+        ]
+
+        await TokenAnalyzer._persist_wallets(session, token_fields, batch)
+
+        wallet_stmt, entry_stmt = statements
+        wallets = _inserted_rows(wallet_stmt)
+        assert [(w["address"], w["sol_balance"], w["tags"]) for w in wallets] == [
+            ("A", Decimal("2"), ["whale"]), ("C", Decimal("2"), ["whale"]),
+        ]
+        sql = str(wallet_stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (address) DO UPDATE SET" in sql
+        assert "address = excluded.address" not in sql
+
+        entries = _inserted_rows(entry_stmt)
+        assert [(e["wallet_id"], e["entry_rank"], e["entry_tx_signature"]) for e in entries] == [
+            (11, 1, "s1"), (12, 3, "s3"),
+        ]
+        assert all(e["analysis_id"] == 7 and e["mint_address"] == "MINT" for e in entries)
+        assert "ON CONFLICT ON CONSTRAINT uq_wallet_token_entry DO NOTHING" in str(
+            entry_stmt.compile(dialect=postgresql.dialect())
+        )
+        index.add_analyzed.assert_called_once_with({"A": 11, "C": 12})
+
+    @pytest.mark.asyncio
+    async def test_enrich_buyers_persists_in_batches_and_skips_failures(self, monkeypatch):
+        monkeypatch.setattr("src.memecoins.token_analyzer.ENRICH_BATCH_SIZE", 2)
+        session = MagicMock()
+        session.commit = AsyncMock()
+        analyzer = TokenAnalyzer(session, helius=MagicMock(), dex=MagicMock())
+
+        async def enrich(address):
+            if address == "W2":
+                raise RuntimeError("helius down")
+            return {"tags": []}
+
+        analyzer._enrich_wallet = AsyncMock(side_effect=enrich)
+        persisted: list[list[str]] = []
+
+        async def persist(session, token_fields, batch):
+            persisted.append([buyer["wallet"] for buyer, _ in batch])
+
+        monkeypatch.setattr(TokenAnalyzer, "_persist_wallets", staticmethod(persist))
+        analysis = MagicMock(id=7, found_buyers=0)
+        buyers = [{"wallet": f"W{i}"} for i in range(5)]
+
+        await analyzer._enrich_buyers(session, analysis, buyers, total_found=8)
+
+        assert sorted(w for batch in persisted for w in batch) == ["W0", "W1", "W3", "W4"]
+        assert all(len(batch) <= 2 for batch in persisted)
+        assert analysis.found_buyers == 8
@@ -1,5 +1,6 @@
 """Unit tests for the pipeline module."""
 
+import warnings
 from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -135,6 +136,75 @@ class TestPipelineRunner:
         assert runner.registry is not None
         assert len(runner.registry.list_names()) == 9
 
+    def test_streaming_state_kept_per_timeframe(self, mock_ohlcv_df):
+        """Streaming indicator state should persist and drop departed symbols."""
+        runner = PipelineRunner()
+
+        results = runner._compute_indicators("1h", {"BTCUSDT": mock_ohlcv_df})
+        assert set(results) == {"BTCUSDT"}
+        assert set(runner._indicator_states["1h"]) == {"BTCUSDT"}
+
+        runner._compute_indicators("1h", {"ETHUSDT": mock_ohlcv_df})
+        assert set(runner._indicator_states["1h"]) == {"ETHUSDT"}
+
+    def test_streaming_can_be_disabled(self, mock_ohlcv_df):
+        """With streaming off, indicators come from the batch engine."""
+        runner = PipelineRunner(streaming_indicators=False)
+
+        results = runner._compute_indicators("1h", {"BTCUSDT": mock_ohlcv_df})
+        assert set(results) == {"BTCUSDT"}
+        assert runner._indicator_states == {}
+
+    @pytest.mark.asyncio
+    async def test_ensure_symbols_single_upsert(self, mock_binance_symbol):
+        """All symbols should be upserted in one statement with RETURNING."""
+        from sqlalchemy.dialects import postgresql
+
+        eth = MagicMock(symbol="ETHUSDT", base_asset="ETH", quote_asset="USDT")
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            all=MagicMock(return_value=[("BTCUSDT", 1), ("ETHUSDT", 2)])
+        )
+
+        runner = PipelineRunner()
+        ids = await runner._ensure_symbols(session, [mock_binance_symbol, eth, mock_binance_symbol])
+
+        assert ids == {"BTCUSDT": 1, "ETHUSDT": 2}
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (symbol) DO UPDATE" in sql
+        assert "RETURNING" in sql
+        assert sql.count("last_seen_at_m") == 2  # one bind per distinct symbol
+
+    @pytest.mark.asyncio
+    async def test_persist_snapshots_multi_row_insert(self):
+        """Snapshots should be written with one multi-row INSERT."""
+        from uuid import uuid4
+
+        from sqlalchemy.dialects import postgresql
+
+        snaps = [
+            MagicMock(
+                symbol_id=i, timeframe="1h", bullish_score=Decimal("0.5"),
+                confidence=50, rank=i + 1, highlights=[], indicator_signals={},
+                computed_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+            for i in range(3)
+        ]
+        session = AsyncMock()
+
+        runner = PipelineRunner()
+        assert await runner._persist_snapshots(session, snaps, uuid4()) == 3
+
+        session.execute.assert_awaited_once()
+        stmt = session.execute.call_args.args[0]
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # no SAWarning for the omitted BIGSERIAL id
+            sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO snapshots")
+        assert sql.count("rank_m") == 3  # one VALUES tuple per snapshot
+        session.commit.assert_awaited_once()
+
     def test_runner_has_default_ranker(self):
         """Runner should have default ranker."""
         runner = PipelineRunner()
@@ -233,3 +303,48 @@ class TestLockBehavior:
         lock_4h = PIPELINE_LOCK_ID + hash("4h") % 1000
 
         assert lock_1h != lock_4h
+
+
+# =============================================================================
+# Compute Pool Tests
+# =============================================================================
+
+
+class TestComputePool:
+    """Tests for the process-pool offload of indicators and ranking."""
+
+    @pytest.mark.asyncio
+    async def test_offloaded_indicators_and_rank_match_in_process(self, mock_ohlcv_df):
+        """Pool results should equal the in-process batch path and ranker."""
+        from src.pipeline import ComputePool
+        from src.scoring import Ranker, SymbolData
+
+        frames = {
+            "BTCUSDT": mock_ohlcv_df,
+            "ETHUSDT": mock_ohlcv_df.assign(close=mock_ohlcv_df["close"] * 1.01),
+            "SOLUSDT": mock_ohlcv_df.iloc[:150].reset_index(drop=True),
+        }
+
+        runner = PipelineRunner(streaming_indicators=False)
+        expected = runner._compute_indicators("1h", frames)
+
+        pool = ComputePool(max_workers=2, min_rows_per_job=1)
+        try:
+            results = await pool.compute_indicators(frames)
+            assert set(results) == set(expected)
+            for symbol, outputs in expected.items():
+                for name, output in outputs.items():
+                    assert results[symbol][name]["signal"] == output["signal"]
+
+            symbol_data = [
+                SymbolData(symbol=s, symbol_id=i, indicators=results[s])
+                for i, s in enumerate(sorted(results))
+            ]
+            computed_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+            ranked = await pool.rank(
+                Ranker(), symbol_data, timeframe="1h", computed_at=computed_at
+            )
+            local = Ranker().rank(symbol_data, timeframe="1h", computed_at=computed_at)
+            assert [(r.symbol, r.rank) for r in ranked] == [(r.symbol, r.rank) for r in local]
+        finally:
+            pool.shutdown()
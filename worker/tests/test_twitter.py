@@ -0,0 +1,359 @@
+"""Tests for the tweet relevance filter and the tweet pollers."""
+
+import random
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.memecoins.twitter_poller import MemecoinTwitterPoller
+from src.twitter.filter import (
+    ALL_POSITIVE_TERMS,
+    NEGATIVE_PATTERNS,
+    NEGATIVE_PHRASES,
+    PRICE_PCT_RE,
+    TICKER_RE,
+    TweetRelevanceFilter,
+    VerdictCache,
+    text_key,
+)
+from src.twitter.poller import TwitterPoller
+
+
+def _reference_is_relevant(text: str) -> bool | None:
+    """The pattern-by-pattern classifier CLASSIFIER_RE replaced."""
+    if TICKER_RE.search(text) or PRICE_PCT_RE.search(text):
+        return True
+    if set(re.findall(r"[a-zA-Z0-9]+", text.lower())) & ALL_POSITIVE_TERMS:
+        return True
+    if NEGATIVE_PATTERNS.search(text):
+        return False
+    return None
+
+
+CLASSIFIER_CASES = [
+    "",
+    "hello world",
+    "$BTC to the moon",
+    "$b",
+    "btcusdt",
+    "ETH/USD",
+    "eth/usdt breaking",
+    "$42,000",
+    "$,",
+    "up 15%",
+    "5.%",
+    "2.5x leverage soon",
+    "10xyz",
+    "longer",
+    "long-term",
+    "LONG",
+    "eth_usd",
+    "l2beat",
+    "layer2",
+    "web3",
+    "good morning",
+    "Good   morning",
+    "good\nmorning",
+    "good morning $ETH",
+    "workouts",
+    "at the gym with longs",
+    "happy new year",
+    "date nights",
+    # Characters whose lower() or case folding differs from ASCII
+    "ſell now",
+    "aſk",
+    "bıd",
+    "bİd",
+    "defİ",
+    "defİx",
+    "İlong",
+    "longİ",
+    "oKx",
+    "Klong",
+    "ñlong",
+    "ﬀ",
+]
+
+
+class TestClassifier:
+    """CLASSIFIER_RE must classify exactly like the separate patterns."""
+
+    @pytest.mark.parametrize("text", CLASSIFIER_CASES)
+    def test_matches_reference(self, text):
+        assert TweetRelevanceFilter.is_relevant(text) == _reference_is_relevant(text)
+
+    def test_matches_reference_on_random_text(self):
+        rng = random.Random(1234)
+        fragments = (
+            sorted(ALL_POSITIVE_TERMS) + list(NEGATIVE_PHRASES)
+            + ["$", "%", "x", "usdt", "/usd", ",", ".", "42", "2.5", " ", "\n", "_", "-"]
+            + ["İ", "ı", "ſ", "K", "é"]
+        )
+        chars = "abcdefghijklmnopqrstuvwxyzABC 0123456789$%.,/xİıſK"
+        for _ in range(20_000):
+            text = "".join(
+                rng.choice(fragments) if rng.random() < 0.5 else rng.choice(chars)
+                for _ in range(rng.randint(0, 8))
+            )
+            assert TweetRelevanceFilter.is_relevant(text) == _reference_is_relevant(text), text
+
+
+def _llm_response(content: str, relevant=lambda text: "keep" in text, skip=()) -> SimpleNamespace:
+    """A classify_tweets tool call answering each numbered tweet in ``content``."""
+    verdicts = [
+        {"tweet_number": int(num), "relevant": relevant(text)}
+        for num, text in re.findall(r"^\[(\d+)\] (.*)$", content, re.MULTILINE)
+        if int(num) not in skip
+    ]
+    return SimpleNamespace(
+        usage=SimpleNamespace(input_tokens=1000, output_tokens=100),
+        content=[SimpleNamespace(
+            type="tool_use", name="classify_tweets", input={"verdicts": verdicts},
+        )],
+    )
+
+
+def _filter(create) -> TweetRelevanceFilter:
+    """Filter with its own verdict cache and a mocked AsyncAnthropic client."""
+    filt = TweetRelevanceFilter(api_key="test", cache=VerdictCache())
+    filt._anthropic = MagicMock()
+    filt._anthropic.messages.create = AsyncMock(side_effect=create)
+    return filt
+
+
+def _answer(**kwargs):
+    async def create(**request):
+        return _llm_response(request["messages"][0]["content"], **kwargs)
+    return create
+
+
+class TestLLMFallback:
+    """Tests for batched, cached LLM classification of ambiguous tweets."""
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_tweets_are_batched(self, monkeypatch):
+        monkeypatch.setattr("src.twitter.filter.LLM_BATCH_SIZE", 2)
+        filt = _filter(_answer())
+        tweets = [{"text": f"note {i} keep"} for i in range(3)] + [
+            {"text": "nothing here"}, {"text": "another thought"}, {"text": "$BTC"},
+        ]
+
+        kept, stats = await filt.filter_tweets(tweets, llm_enabled=True)
+
+        create = filt._anthropic.messages.create
+        assert create.await_count == 3
+        sizes = [
+            c.kwargs["messages"][0]["content"].count("\n\n") + 1
+            for c in create.await_args_list
+        ]
+        assert sorted(sizes) == [1, 2, 2]
+        assert [t["text"] for t in kept] == ["note 0 keep", "note 1 keep", "note 2 keep", "$BTC"]
+        assert stats.dropped_llm == 2
+        assert stats.llm_cost > 0
+
+    @pytest.mark.asyncio
+    async def test_duplicates_share_one_verdict(self):
+        filt = _filter(_answer())
+        tweets = [
+            {"text": "what a day keep"},
+            {"text": "RT @someone: What a   day keep https://t.co/abc"},
+            {"text": "what a day keep"},
+        ]
+        assert len({text_key(t["text"]) for t in tweets}) == 1
+
+        kept, stats = await filt.filter_tweets(tweets, llm_enabled=True)
+        create = filt._anthropic.messages.create
+        assert create.await_count == 1
+        assert create.await_args.kwargs["messages"][0]["content"].count("[") == 1
+        assert len(kept) == 3
+
+        kept, stats = await filt.filter_tweets(tweets[:1], llm_enabled=True)
+        assert create.await_count == 1  # answered from the verdict cache
+        assert stats.llm_cached == 1
+        assert len(kept) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_call_keeps_tweets_and_is_not_cached(self):
+        filt = _filter(RuntimeError("overloaded"))
+        tweets = [{"text": "nothing here"}, {"text": "another thought"}]
+
+        kept, stats = await filt.filter_tweets(tweets, llm_enabled=True)
+        assert kept == tweets
+        assert stats.llm_cost == 0.0
+        assert filt.cache.get(text_key("nothing here")) is None
+
+        filt._anthropic.messages.create.side_effect = _answer()
+        kept, _ = await filt.filter_tweets(tweets, llm_enabled=True)
+        assert kept == []
+        assert filt.cache.get(text_key("nothing here")) is False
+
+    @pytest.mark.asyncio
+    async def test_missing_verdict_fails_open_uncached(self):
+        filt = _filter(_answer(skip={2}))
+        tweets = [{"text": "nothing here"}, {"text": "another thought"}]
+
+        kept, stats = await filt.filter_tweets(tweets, llm_enabled=True)
+
+        assert kept == [{"text": "another thought"}]
+        assert stats.dropped_llm == 1
+        assert filt.cache.get(text_key("nothing here")) is False
+        assert filt.cache.get(text_key("another thought")) is None
+
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+ACCOUNTS = [
+    SimpleNamespace(id=1, handle="Alice", display_name="Alice A", category="analyst", is_vip=False),
+    SimpleNamespace(id=2, handle="bob", display_name="Bob B", category="trader", is_vip=False),
+]
+
+RAW_TWEETS = [
+    {"tweet_id": "100", "author_handle": "alice", "text": "already stored",
+     "created_at": T0, "metrics": {"likes": 1}},
+    {"tweet_id": "101", "author_handle": "ALICE", "text": "older",
+     "created_at": T0 + timedelta(minutes=1), "metrics": {"likes": 2}},
+    {"tweet_id": "102", "author_handle": "bob", "text": "newer",
+     "created_at": T0 + timedelta(minutes=5), "metrics": {},
+     "media_urls": ["https://pbs.twimg.com/a.jpg"]},
+    {"tweet_id": "101", "author_handle": "alice", "text": "older (repeat on next page)",
+     "created_at": T0 + timedelta(minutes=1), "metrics": {"likes": 2}},
+    {"tweet_id": "103", "author_handle": "mallory", "text": "not tracked",
+     "created_at": T0, "metrics": {}},
+]
+
+
+def _inserted_rows(stmt) -> list[dict]:
+    """Rows of a multi-VALUES INSERT, from its compiled bind parameters."""
+    rows: dict[int, dict] = defaultdict(dict)
+    for key, value in stmt.compile(dialect=postgresql.dialect()).params.items():
+        column, _, index = key.rpartition("_m")
+        rows[int(index)][column] = value
+    return [rows[i] for i in sorted(rows)]
+
+
+def _poll_session(stored: set[str]) -> tuple[MagicMock, list]:
+    """Session serving ACCOUNTS and inserting all but the ``stored`` tweet ids.
+
+    Returns the session and the rows of every INSERT it executed.
+    """
+    session = MagicMock()
+    session.commit = AsyncMock()
+    inserts: list[list[dict]] = []
+
+    async def execute(stmt, *args):
+        result = MagicMock()
+        if getattr(stmt, "is_insert", False):
+            rows = _inserted_rows(stmt)
+            inserts.append(rows)
+            result.all.return_value = [
+                (1000 + i, row["tweet_id"], row["created_at"])
+                for i, row in enumerate(rows)
+                if row["tweet_id"] not in stored
+            ]
+        else:  # the active accounts, then the since_id lookup
+            result.scalars.return_value.all.return_value = ACCOUNTS
+            result.scalar_one_or_none.return_value = "100"
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    return session, inserts
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.search_recent = AsyncMock(side_effect=lambda *a, **kw: [dict(t) for t in RAW_TWEETS])
+    return client
+
+
+class TestTwitterPoller:
+    """Tests for bulk tweet persistence and the tweet_update broadcast."""
+
+    @pytest.mark.asyncio
+    async def test_poll_inserts_new_tweets_and_broadcasts_them(self, monkeypatch):
+        monkeypatch.setattr("src.twitter.poller.settings.tweet_filter_enabled", False)
+        monkeypatch.setattr("src.twitter.poller.settings.tweet_analysis_enabled", False)
+        publish = AsyncMock()
+        monkeypatch.setattr("src.twitter.poller.event_bus.publish", publish)
+        session, inserts = _poll_session(stored={"100"})
+        client = _client()
+
+        summary = await TwitterPoller(session, client).poll()
+
+        client.search_recent.assert_awaited_once_with(["alice", "bob"], since_id="100")
+        [rows] = inserts
+        assert [(r["tweet_id"], r["twitter_account_id"], r["text"]) for r in rows] == [
+            ("100", 1, "already stored"), ("101", 1, "older"), ("102", 2, "newer"),
+        ]
+        assert rows[2]["metrics"] == {"media_urls": ["https://pbs.twimg.com/a.jpg"]}
+        assert summary["new_tweets"] == 2
+        session.commit.assert_awaited_once()
+
+        publish.assert_awaited_once()
+        channel, event = publish.await_args.args
+        assert channel == "tweets"
+        assert event == {"type": "tweet_update", "tweets": [
+            {
+                "id": 1002, "tweetId": "102", "accountHandle": "bob",
+                "accountDisplayName": "Bob B", "accountCategory": "trader",
+                "text": "newer", "createdAt": (T0 + timedelta(minutes=5)).isoformat(),
+                "metrics": {"media_urls": ["https://pbs.twimg.com/a.jpg"]},
+            },
+            {
+                "id": 1001, "tweetId": "101", "accountHandle": "Alice",
+                "accountDisplayName": "Alice A", "accountCategory": "analyst",
+                "text": "older", "createdAt": (T0 + timedelta(minutes=1)).isoformat(),
+                "metrics": {"likes": 2},
+            },
+        ]}
+
+    @pytest.mark.asyncio
+    async def test_poll_with_nothing_new_skips_broadcast(self, monkeypatch):
+        monkeypatch.setattr("src.twitter.poller.settings.tweet_filter_enabled", False)
+        publish = AsyncMock()
+        monkeypatch.setattr("src.twitter.poller.event_bus.publish", publish)
+        session, _ = _poll_session(stored={"100", "101", "102"})
+
+        summary = await TwitterPoller(session, _client()).poll()
+
+        assert summary["new_tweets"] == 0
+        publish.assert_not_awaited()
+
+
+class TestMemecoinTwitterPoller:
+    """Tests for the memecoin poller's use of the shared bulk insert."""
+
+    @pytest.mark.asyncio
+    async def test_poll_inserts_new_tweets_and_broadcasts_them(self, monkeypatch):
+        monkeypatch.setattr("src.memecoins.twitter_poller.settings.tweet_analysis_enabled", False)
+        publish = AsyncMock()
+        monkeypatch.setattr("src.memecoins.twitter_poller.event_bus.publish", publish)
+        session, inserts = _poll_session(stored={"100"})
+        poller = MemecoinTwitterPoller(session, _client())
+        poller.extractor = MagicMock()
+        poller.extractor.extract_and_match_batch = AsyncMock(return_value={1001: ["mint"]})
+        poller._upsert_tracker_tokens = AsyncMock()
+
+        summary = await poller.poll()
+
+        [rows] = inserts
+        assert [(r["tweet_id"], r["account_id"]) for r in rows] == [
+            ("100", 1), ("101", 1), ("102", 2),
+        ]
+        assert summary["new_tweets"] == 2
+        assert summary["token_matches"] == 1
+        poller.extractor.extract_and_match_batch.assert_awaited_once_with(
+            session, [(1001, "older"), (1002, "newer")]
+        )
+
+        channel, event = publish.await_args.args
+        assert channel == "memecoins"
+        assert event["type"] == "tweet_update"
+        assert [(t["id"], t["tweetId"], t["accountHandle"]) for t in event["tweets"]] == [
+            (1001, "101", "Alice"), (1002, "102", "bob"),
+        ]
+        assert event["tweets"][1]["metrics"] == {"media_urls": ["https://pbs.twimg.com/a.jpg"]}